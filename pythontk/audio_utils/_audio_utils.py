@@ -1,10 +1,8 @@
 # !/usr/bin/python
 # coding=utf-8
 import hashlib
-import array as _array
 import os
 import shutil
-import struct
 import subprocess
 import wave as _wave
 from typing import Dict, List, Optional, Set
@@ -153,6 +151,76 @@ class AudioUtils(HelpMixin):
 
         return output
 
+    #: Output frames mixed per block by :meth:`build_composite_wav`. The
+    #: accumulator is this many frames of float32, so the mix costs a fixed
+    #: buffer however long the sequence runs.
+    MIX_BLOCK_FRAMES = 1 << 16
+
+    #: Where the ``"soft"`` limiter starts bending (fraction of full scale).
+    SOFT_LIMIT_KNEE = 0.9
+
+    @classmethod
+    def _load_clip(cls, path: str, sample_rate: Optional[int] = None):
+        """Decode a PCM WAV once into normalized float32 ``(frames, channels)``.
+
+        Resampled by linear interpolation when *sample_rate* differs from the
+        file's own -- dialogue and SFX libraries routinely mix 44.1 and
+        48 kHz, and skipping the minority rate silently dropped those events
+        from the composite. Returns ``(clip, source_rate)``.
+
+        Raises:
+            ValueError: An unsupported sample width.
+        """
+        import numpy as np
+
+        with _wave.open(path, "rb") as wf:
+            sr, ch, sw = wf.getframerate(), wf.getnchannels(), wf.getsampwidth()
+            if sw not in (1, 2, 3, 4):
+                raise ValueError(f"unsupported {sw * 8}-bit PCM")
+            clip = np.empty((wf.getnframes(), ch), dtype=np.float32)
+            filled = 0
+            for _, raw in cls._iter_wav_chunks(wf):
+                samples, scale = cls._decode_pcm(raw, sw, ch)
+                clip[filled : filled + len(samples)] = samples * scale
+                filled += len(samples)
+            clip = clip[:filled]
+
+        if sample_rate and sr != sample_rate and len(clip):
+            count = max(1, int(round(len(clip) * sample_rate / sr)))
+            src_t = np.arange(len(clip), dtype=np.float64)
+            dst_t = np.arange(count, dtype=np.float64) * (sr / sample_rate)
+            clip = np.stack(
+                [np.interp(dst_t, src_t, clip[:, c]) for c in range(ch)], axis=1
+            ).astype(np.float32)
+        return clip, sr
+
+    @classmethod
+    def _encode_pcm(cls, block, sampwidth: int, limit: str = "clip") -> bytes:
+        """Limit a normalized float block and encode it as interleaved PCM bytes."""
+        import numpy as np
+
+        if limit == "soft":
+            knee = cls.SOFT_LIMIT_KNEE
+            over = np.abs(block) > knee
+            if over.any():
+                block = block.copy()
+                mag = np.abs(block[over])
+                block[over] = np.sign(block[over]) * (
+                    knee + (1.0 - knee) * np.tanh((mag - knee) / (1.0 - knee))
+                )
+        # Scale and clip in float64: float32 cannot hold 2**31 - 1, so a 32-bit
+        # full-scale sample would round up to 2**31 and wrap on the cast.
+        full = float(1 << (sampwidth * 8 - 1))
+        scaled = np.rint(np.asarray(block, dtype=np.float64) * full)
+        ints = np.clip(scaled, -full, full - 1).astype("<i4")
+        if sampwidth == 1:
+            return (ints + 128).astype(np.uint8).tobytes()
+        if sampwidth == 2:
+            return ints.astype("<i2").tobytes()
+        if sampwidth == 3:
+            return ints.reshape(-1, 1).view(np.uint8)[:, :3].tobytes()
+        return ints.tobytes()
+
     @classmethod
     def build_composite_wav(
         cls,
@@ -161,115 +229,127 @@ class AudioUtils(HelpMixin):
         fps: float,
         output_path: str,
         logger=None,
+        sampwidth: int = 2,
+        limit: str = "clip",
     ) -> Optional[str]:
         """Mix source WAV clips into one composite WAV.
 
+        A streaming mixer: each distinct source is decoded once however many
+        events reference it (a 3,000-event shot sequence typically draws on a
+        few dozen clips), events are mixed into a fixed
+        :attr:`MIX_BLOCK_FRAMES` float32 accumulator, and every finished block
+        is limited, encoded and written before the next is mixed -- so memory
+        is the decoded sources plus one block, never the whole composite.
+
+        The first readable clip sets the output's sample rate and channel
+        count. Any 8/16/24/32-bit PCM source mixes; one at another sample rate
+        is resampled to match. A clip with a different channel count is still
+        skipped (with a warning) -- up/down-mixing is a creative decision,
+        not a format conversion.
+
         Parameters:
             events: ``[(frame, label), ...]`` list.
             audio_map: Mapping of lowercase label -> playable file path.
             fps: Scene frames per second.
             output_path: Output WAV path.
             logger: Optional logger with ``warning/info`` methods.
+            sampwidth: Output sample width in bytes (1, 2, 3 or 4).
+            limit: ``"clip"`` (default) hard-clips overs at full scale;
+                ``"soft"`` bends peaks above :attr:`SOFT_LIMIT_KNEE` with a
+                tanh curve so stacked events saturate rather than square off.
 
         Returns:
             Output path on success, else None.
+
+        Raises:
+            ValueError: An unsupported *sampwidth* or *limit*.
         """
+        if sampwidth not in (1, 2, 3, 4):
+            raise ValueError(f"Unsupported output sample width: {sampwidth}")
+        if limit not in ("clip", "soft"):
+            raise ValueError(f"Unknown limit mode: {limit!r}")
         if not events or fps <= 0:
             return None
 
-        clips = []
+        import numpy as np
+
+        sources: Dict[str, Optional[object]] = {}  # path -> clip (None: unusable)
+        placements = []
         sample_rate = None
         channels = None
-        sampwidth = None
 
         for frame, label in events:
             path = audio_map.get(str(label).lower())
             if not path:
                 continue
-
-            try:
-                with _wave.open(path, "rb") as wf:
-                    sr = wf.getframerate()
-                    ch = wf.getnchannels()
-                    sw = wf.getsampwidth()
-
-                    if sw != 2:
-                        if logger:
-                            logger.warning(
-                                f"Skipping '{path}': only 16-bit PCM WAV "
-                                f"is supported (got {sw * 8}-bit)"
-                            )
-                        continue
-
-                    if sample_rate is None:
-                        sample_rate = sr
-                        channels = ch
-                        sampwidth = sw
-                    elif sr != sample_rate:
-                        if logger:
-                            logger.warning(
-                                f"Skipping '{path}': sample rate "
-                                f"{sr} != {sample_rate}"
-                            )
-                        continue
-                    elif ch != channels:
-                        if logger:
-                            logger.warning(
-                                f"Skipping '{path}': channels {ch} != {channels}"
-                            )
-                        continue
-
-                    raw = wf.readframes(wf.getnframes())
-            except Exception as exc:
-                if logger:
-                    logger.warning(f"Cannot read '{path}': {exc}")
+            key = os.path.normpath(path)
+            if key not in sources:
+                try:
+                    clip, sr = cls._load_clip(path, sample_rate)
+                except Exception as exc:
+                    if logger:
+                        logger.warning(f"Cannot read '{path}': {exc}")
+                    sources[key] = None
+                    continue
+                if sample_rate is None:
+                    sample_rate, channels = sr, clip.shape[1]
+                elif clip.shape[1] != channels:
+                    if logger:
+                        logger.warning(
+                            f"Skipping '{path}': channels {clip.shape[1]} != {channels}"
+                        )
+                    clip = None
+                elif sr != sample_rate and logger:
+                    logger.info(f"Resampled '{path}': {sr} -> {sample_rate} Hz")
+                sources[key] = clip
+            clip = sources[key]
+            if clip is None or not len(clip):
                 continue
+            start = int(float(frame) / fps * sample_rate)
+            placements.append((start, clip))
 
-            samples = _array.array("h")
-            samples.frombytes(raw)
-
-            time_sec = float(frame) / fps
-            sample_pos = int(time_sec * sample_rate) * channels
-            clips.append((sample_pos, samples))
-
-        if not clips or sample_rate is None:
+        if not placements or sample_rate is None:
             return None
 
-        # Optional dep — only the mixing path needs numpy.
-        import numpy as np
-
-        total_samples = max(pos + len(s) for pos, s in clips)
-        if total_samples <= 0:
+        total_frames = max(start + len(clip) for start, clip in placements)
+        if total_frames <= 0:
             return None
 
-        composite = np.zeros(total_samples, dtype=np.int32)
-        for pos, samples in clips:
-            arr = np.frombuffer(samples, dtype=np.int16).astype(np.int32)
-            if pos < 0:
-                arr = arr[-pos:]
-                pos = 0
-            if not len(arr):
-                continue
-            end = min(pos + len(arr), total_samples)
-            if pos >= end:
-                continue
-            composite[pos:end] += arr[: end - pos]
-        np.clip(composite, -32768, 32767, out=composite)
-        raw_out = composite.astype(np.int16).tobytes()
-
         output = os.path.normpath(output_path)
         os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
 
+        placements.sort(key=lambda item: item[0])
+        block = max(1, cls.MIX_BLOCK_FRAMES)
+        accumulator = np.zeros((block, channels), dtype=np.float32)
+        active: list = []
+        upcoming = 0
+
         with _wave.open(output, "wb") as wf:
             wf.setnchannels(channels)
             wf.setsampwidth(sampwidth)
             wf.setframerate(sample_rate)
-            wf.writeframes(raw_out)
+            for b0 in range(0, total_frames, block):
+                b1 = min(b0 + block, total_frames)
+                while upcoming < len(placements) and placements[upcoming][0] < b1:
+                    active.append(placements[upcoming])
+                    upcoming += 1
+                acc = accumulator[: b1 - b0]
+                acc.fill(0.0)
+                still_active = []
+                for start, clip in active:
+                    end = start + len(clip)
+                    lo, hi = max(start, b0), min(end, b1)
+                    if lo < hi:
+                        acc[lo - b0 : hi - b0] += clip[lo - start : hi - start]
+                    if end > b1:
+                        still_active.append((start, clip))
+                active = still_active
+                wf.writeframes(cls._encode_pcm(acc, sampwidth, limit))
 
         if logger:
             logger.info(
-                f"Built composite: {total_samples // channels} samples, "
-                f"{total_samples / (channels * sample_rate):.1f}s"
+                f"Built composite: {total_frames} samples, "
+                f"{total_frames / sample_rate:.1f}s"
             )
 
         return output.replace("\\", "/")
@@ -434,6 +514,76 @@ class AudioUtils(HelpMixin):
                 audio_map[stem] = playable
         return audio_map
 
+    # ------------------------------------------------------------------
+    # PCM decoding
+    # ------------------------------------------------------------------
+
+    #: Frames per read when a WAV is streamed rather than loaded whole. ~1M
+    #: frames keeps a 24-bit stereo chunk near 6 MB decoded, so a feature-length
+    #: dialogue track costs a bounded buffer instead of its full size.
+    STREAM_CHUNK_FRAMES = 1 << 20
+
+    @staticmethod
+    def _decode_pcm(raw: bytes, sampwidth: int, channels: int):
+        """Decode interleaved PCM bytes into an ``int32`` ``(frames, channels)`` array.
+
+        Every supported width lands in one integer type so the callers can
+        mix, threshold and bin without branching: 8-bit WAV is unsigned and is
+        re-centred on zero, 24-bit is unpacked from its three little-endian
+        bytes with the sign carried by the top one. Returns ``(samples,
+        scale)`` where *scale* maps a sample onto ``[-1.0, 1.0)``.
+
+        Raises:
+            ValueError: An unsupported sample width.
+        """
+        import numpy as np
+
+        if sampwidth == 1:
+            samples = np.frombuffer(raw, dtype=np.uint8).astype(np.int32) - 128
+        elif sampwidth == 2:
+            samples = np.frombuffer(raw, dtype="<i2").astype(np.int32)
+        elif sampwidth == 3:
+            b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+            samples = (
+                b[:, 0].astype(np.int32)
+                | (b[:, 1].astype(np.int32) << 8)
+                | (b[:, 2].view(np.int8).astype(np.int32) << 16)
+            )
+        elif sampwidth == 4:
+            samples = np.frombuffer(raw, dtype="<i4").astype(np.int32)
+        else:
+            raise ValueError(f"Unsupported PCM sample width: {sampwidth * 8}-bit")
+        scale = 1.0 / float(1 << (sampwidth * 8 - 1))
+        return samples.reshape(-1, channels), scale
+
+    @classmethod
+    def _iter_wav_chunks(
+        cls,
+        wf,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        chunk_frames: Optional[int] = None,
+    ):
+        """Yield ``(frame_offset, raw_bytes)`` over an open ``wave`` reader.
+
+        Streams ``[start_frame, end_frame)`` in *chunk_frames* pieces (default
+        :attr:`STREAM_CHUNK_FRAMES`), so nothing here ever holds more than one
+        chunk of a long file.
+        """
+        n_frames = wf.getnframes()
+        end = n_frames if end_frame is None else max(0, min(end_frame, n_frames))
+        step = max(1, chunk_frames or cls.STREAM_CHUNK_FRAMES)
+        pos = max(0, start_frame)
+        if pos >= end:
+            return
+        wf.setpos(pos)
+        while pos < end:
+            raw = wf.readframes(min(step, end - pos))
+            if not raw:
+                break
+            yield pos, raw
+            pos += len(raw) // (wf.getsampwidth() * wf.getnchannels())
+
     # ------------------------------------------------------------------
     # WAV trimming
     # ------------------------------------------------------------------
@@ -450,6 +600,11 @@ class AudioUtils(HelpMixin):
         Silence is defined as any sample whose absolute value is at or
         below *threshold* (default ``8``, on a 16-bit scale of 0–32767).
 
+        The scan is vectorized and streamed: the head is searched forward and
+        the tail backward a chunk at a time, so a long take with a short
+        silence at each end reads only those ends, and the kept span is copied
+        through without being decoded at all.
+
         Parameters:
             wav_path: Input WAV file path.
             output_path: Destination path.  Defaults to overwriting
@@ -463,52 +618,59 @@ class AudioUtils(HelpMixin):
         Raises:
             ValueError: If the file is not 16-bit PCM WAV.
         """
+        import numpy as np
+
         wav_path = os.path.normpath(wav_path).replace("\\", "/")
         if output_path is None:
             output_path = wav_path
         else:
             output_path = os.path.normpath(output_path).replace("\\", "/")
 
+        def loud_frames(raw: bytes, channels: int):
+            samples, _ = cls._decode_pcm(raw, 2, channels)
+            return np.flatnonzero((np.abs(samples) > threshold).any(axis=1))
+
         with _wave.open(wav_path, "rb") as wf:
             params = wf.getparams()
             if params.sampwidth != 2:
                 raise ValueError(
                     f"Only 16-bit PCM WAV is supported (got {params.sampwidth * 8}-bit)"
                 )
-            raw = wf.readframes(params.nframes)
-
-        samples = _array.array("h")
-        samples.frombytes(raw)
-
-        channels = params.nchannels
-
-        # Find first and last non-silent *frame* (group of `channels` samples)
-        num_frames = len(samples) // channels
-        first_frame = 0
-        for f in range(num_frames):
-            offset = f * channels
-            if any(abs(samples[offset + c]) > threshold for c in range(channels)):
-                first_frame = f
-                break
-        else:
-            # Entire file is silent — write an empty WAV
-            first_frame = 0
-            num_frames = 0
-
-        last_frame = num_frames
-        if num_frames > 0:
-            for f in range(num_frames - 1, first_frame - 1, -1):
-                offset = f * channels
-                if any(abs(samples[offset + c]) > threshold for c in range(channels)):
-                    last_frame = f + 1
+            channels = params.nchannels
+            step = cls.STREAM_CHUNK_FRAMES
+
+            # First non-silent *frame* (group of `channels` samples).
+            first_frame = None
+            for offset, raw in cls._iter_wav_chunks(wf):
+                hits = loud_frames(raw, channels)
+                if hits.size:
+                    first_frame = offset + int(hits[0])
                     break
 
-        trimmed = samples[first_frame * channels : last_frame * channels]
-
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-        with _wave.open(output_path, "wb") as wf:
-            wf.setparams(params)
-            wf.writeframes(trimmed.tobytes())
+            if first_frame is None:
+                # Entire file is silent — write an empty WAV
+                first_frame = last_frame = 0
+            else:
+                last_frame = first_frame + 1
+                end = params.nframes
+                while end > first_frame:
+                    start = max(first_frame, end - step)
+                    wf.setpos(start)
+                    hits = loud_frames(wf.readframes(end - start), channels)
+                    if hits.size:
+                        last_frame = start + int(hits[-1]) + 1
+                        break
+                    end = start
+
+            # Staged beside the destination: trimming in place would otherwise
+            # truncate the very file the kept span is still being read from.
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+            staging = f"{output_path}.part"
+            with _wave.open(staging, "wb") as out:
+                out.setparams(params)
+                for _, raw in cls._iter_wav_chunks(wf, first_frame, last_frame):
+                    out.writeframes(raw)
+        os.replace(staging, output_path)
 
         return output_path
 
@@ -516,16 +678,56 @@ class AudioUtils(HelpMixin):
     # Waveform envelope
     # ------------------------------------------------------------------
 
-    @staticmethod
+    @classmethod
+    def _envelope_bins(cls, wf, start: int, end: int, bin_size: int, num_bins: int):
+        """Stream ``[start, end)`` of an open WAV into per-bin ``(min, max)`` arrays.
+
+        Mono-mixes each chunk (channel mean) and reduces it with
+        ``minimum/maximum.reduceat``. Chunks are a whole number of bins long, so
+        no bin ever straddles two reads and the result is identical to a
+        single pass over the whole span. Returns normalized float arrays.
+        """
+        import numpy as np
+
+        sampwidth, channels = wf.getsampwidth(), wf.getnchannels()
+        chunk = bin_size * max(1, cls.STREAM_CHUNK_FRAMES // bin_size)
+        lows, highs = [], []
+        scale = 1.0
+        for _, raw in cls._iter_wav_chunks(wf, start, end, chunk):
+            samples, scale = cls._decode_pcm(raw, sampwidth, channels)
+            mono = samples[:, 0] if channels == 1 else samples.mean(axis=1)
+            if not mono.size:
+                continue
+            edges = np.arange(0, mono.size, bin_size)
+            lows.append(np.minimum.reduceat(mono, edges))
+            highs.append(np.maximum.reduceat(mono, edges))
+        if not lows:
+            return np.empty(0), np.empty(0)
+        lo = np.concatenate(lows)[:num_bins] * scale
+        hi = np.concatenate(highs)[:num_bins] * scale
+        return lo, hi
+
+    @classmethod
     def compute_waveform_envelope(
+        cls,
         wav_path: str,
         num_bins: int = 512,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
     ) -> List[tuple]:
         """Read a WAV file and return a downsampled min/max envelope.
 
+        Decoded, mixed and binned on numpy and streamed in
+        :attr:`STREAM_CHUNK_FRAMES` reads, and only the frames the returned
+        bins cover are read at all. For repeated zooming over one file see
+        :meth:`waveform_peaks`, which answers from a cached peak file instead.
+
         Parameters:
-            wav_path: Path to a PCM WAV file (8, 16, or 24-bit).
+            wav_path: Path to a PCM WAV file (8, 16, 24 or 32-bit).
             num_bins: Number of (min, max) pairs to return.
+            start_frame: First frame of the window to summarize.
+            end_frame: End of the window (exclusive); ``None`` for the end of
+                the file.
 
         Returns:
             List of ``(min_sample, max_sample)`` tuples normalised to
@@ -533,57 +735,158 @@ class AudioUtils(HelpMixin):
         """
         try:
             with _wave.open(wav_path, "rb") as wf:
-                n_channels = wf.getnchannels()
-                sampwidth = wf.getsampwidth()
                 n_frames = wf.getnframes()
-
-                if sampwidth not in (1, 2, 3) or n_frames == 0:
+                end = n_frames if end_frame is None else min(end_frame, n_frames)
+                start = max(0, start_frame)
+                span = end - start
+                if wf.getsampwidth() not in (1, 2, 3, 4) or span <= 0 or num_bins <= 0:
                     return []
-
-                raw = wf.readframes(n_frames)
+                bin_size = max(1, span // num_bins)
+                lo, hi = cls._envelope_bins(
+                    wf, start, min(end, start + bin_size * num_bins), bin_size, num_bins
+                )
         except Exception:
             return []
+        return list(zip(lo.tolist(), hi.tolist()))
 
-        # Decode samples (mono-mix if stereo)
-        if sampwidth == 2:
-            fmt = f"<{n_frames * n_channels}h"
-            samples = struct.unpack(fmt, raw)
-            scale = 1.0 / 32768.0
-        elif sampwidth == 3:
-            total = n_frames * n_channels
-            samples = []
-            for i in range(total):
-                off = i * 3
-                lo = raw[off]
-                mid = raw[off + 1]
-                hi = raw[off + 2]
-                val = lo | (mid << 8) | (hi << 16)
-                if val >= 0x800000:
-                    val -= 0x1000000
-                samples.append(val)
-            scale = 1.0 / 8388608.0
-        else:
-            samples = [b - 128 for b in raw]
-            scale = 1.0 / 128.0
-
-        # Mono-mix
-        if n_channels > 1:
-            mono = []
-            for i in range(0, len(samples), n_channels):
-                mono.append(sum(samples[i : i + n_channels]) / n_channels)
-            samples = mono
-            n_frames = len(samples)
-
-        if n_frames == 0:
-            return []
+    #: Frames per block at the finest level of a peak file, and the factor
+    #: between successive levels. 256 frames is ~5 ms at 48 kHz -- finer than
+    #: any timeline draws -- and a factor of 4 keeps every zoom within 4x of a
+    #: stored resolution while the whole pyramid stays ~1.33x its finest level.
+    PEAK_BLOCK_FRAMES = 256
+    PEAK_LEVEL_FACTOR = 4
+
+    @classmethod
+    def peak_file_path(cls, wav_path: str, cache_dir: Optional[str] = None) -> str:
+        """Where :meth:`build_peak_file` caches the peak pyramid for *wav_path*.
+
+        Keyed on path, mtime and size, like the converted WAVs of
+        :meth:`ensure_playable_path` beside it, so an edited source never
+        reads a stale pyramid; the default location is the same
+        ``_audio_cache`` folder.
+        """
+        source = os.path.normpath(wav_path).replace("\\", "/")
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(source), "_audio_cache")
+        stat = os.stat(source)
+        token = f"{source}|{stat.st_mtime_ns}|{stat.st_size}"
+        digest = hashlib.md5(token.encode("utf-8")).hexdigest()[:10]
+        stem = os.path.splitext(os.path.basename(source))[0]
+        return os.path.join(cache_dir, f"{stem}_{digest}.peaks.npz").replace("\\", "/")
+
+    @classmethod
+    def build_peak_file(
+        cls, wav_path: str, cache_dir: Optional[str] = None, force: bool = False
+    ) -> str:
+        """Write (or reuse) a multi-resolution min/max pyramid for a WAV.
+
+        The finest level holds one ``(min, max)`` pair per
+        :attr:`PEAK_BLOCK_FRAMES` frames of the mono mix; each coarser level
+        folds :attr:`PEAK_LEVEL_FACTOR` blocks of the one below. The WAV is
+        read once, streamed, and never again until it changes -- which is what
+        lets a timeline zoom redraw from a few kilobytes.
 
-        # Down-sample into bins
-        bin_size = max(1, n_frames // num_bins)
-        envelope = []
-        for i in range(0, n_frames, bin_size):
-            chunk = samples[i : i + bin_size]
-            lo = min(chunk) * scale
-            hi = max(chunk) * scale
-            envelope.append((lo, hi))
+        Stored as float32 in an ``.npz`` (no pickled objects). Returns the
+        peak-file path.
 
-        return envelope[:num_bins]
+        Raises:
+            ValueError: A WAV whose sample width cannot be decoded.
+        """
+        import numpy as np
+
+        peak_path = cls.peak_file_path(wav_path, cache_dir)
+        if not force and os.path.isfile(peak_path):
+            return peak_path
+
+        block = cls.PEAK_BLOCK_FRAMES
+        with _wave.open(wav_path, "rb") as wf:
+            n_frames = wf.getnframes()
+            if wf.getsampwidth() not in (1, 2, 3, 4):
+                raise ValueError(
+                    f"Unsupported PCM sample width: {wf.getsampwidth() * 8}-bit"
+                )
+            lo, hi = cls._envelope_bins(
+                wf, 0, n_frames, block, -(-n_frames // block) or 1
+            )
+
+        levels = {"min_0": lo.astype(np.float32), "max_0": hi.astype(np.float32)}
+        factor, level = cls.PEAK_LEVEL_FACTOR, 0
+        while lo.size > 1:
+            edges = np.arange(0, lo.size, factor)
+            lo = np.minimum.reduceat(lo, edges)
+            hi = np.maximum.reduceat(hi, edges)
+            level += 1
+            levels[f"min_{level}"] = lo.astype(np.float32)
+            levels[f"max_{level}"] = hi.astype(np.float32)
+
+        os.makedirs(os.path.dirname(peak_path) or ".", exist_ok=True)
+        staging = f"{peak_path}.part.npz"
+        np.savez(
+            staging,
+            n_frames=np.int64(n_frames),
+            block=np.int64(block),
+            factor=np.int64(factor),
+            **levels,
+        )
+        os.replace(staging, peak_path)
+        return peak_path
+
+    @classmethod
+    def waveform_peaks(
+        cls,
+        wav_path: str,
+        num_bins: int = 512,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ) -> List[tuple]:
+        """A min/max envelope of a window, answered from the cached peak file.
+
+        The zoom-friendly counterpart of :meth:`compute_waveform_envelope`:
+        the pyramid from :meth:`build_peak_file` (built on first use) is
+        sampled at the coarsest level that still gives every bin at least one
+        block, so redrawing a zoomed timeline never re-reads the WAV. A window
+        narrower than one finest-level block per bin falls through to the WAV
+        itself -- the one case the pyramid cannot answer exactly.
+
+        Envelope bins are aligned to the stored blocks, so their edges can
+        differ from :meth:`compute_waveform_envelope`'s by under one block.
+
+        Returns:
+            List of ``(min, max)`` tuples normalised to [-1.0, 1.0]; empty if
+            the file cannot be read.
+        """
+        import numpy as np
+
+        try:
+            with np.load(cls.build_peak_file(wav_path, cache_dir)) as peaks:
+                n_frames = int(peaks["n_frames"])
+                block = int(peaks["block"])
+                factor = int(peaks["factor"])
+                end = n_frames if end_frame is None else min(end_frame, n_frames)
+                start = max(0, start_frame)
+                span = end - start
+                if span <= 0 or num_bins <= 0:
+                    return []
+                per_bin = span / num_bins
+                if per_bin < block:
+                    return cls.compute_waveform_envelope(
+                        wav_path, num_bins, start, end
+                    )
+                level, size = 0, block
+                while f"min_{level + 1}" in peaks and size * factor <= per_bin:
+                    level, size = level + 1, size * factor
+                lo, hi = peaks[f"min_{level}"], peaks[f"max_{level}"]
+        except Exception:
+            return []
+
+        first, last = start // size, min(-(-end // size), lo.size)
+        blocks = last - first
+        count = min(num_bins, blocks)
+        edges = first + (np.arange(count) * blocks) // count
+        return list(
+            zip(
+                np.minimum.reduceat(lo[:last], edges).astype(float).tolist(),
+                np.maximum.reduceat(hi[:last], edges).astype(float).tolist(),
+            )
+        )
@@ -1,21 +1,57 @@
 # !/usr/bin/python
 # coding=utf-8
+import atexit
 import contextlib
 import functools
 import inspect
 import logging
+import os
+import pickle
+import threading as _threading
 import collections.abc
 from typing import Any, Callable, Tuple, Union
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # from this package:
 from pythontk.iter_utils._iter_utils import IterUtils
 from pythontk.core_utils.help_mixin import HelpMixin
+from pythontk.core_utils.cancel_scope import CancelScope
+
+
+def _listify_process_chunk(call: bytes, chunk: bytes):
+    """Pool-process side of ``listify(threading="process")``: one chunk.
+
+    *call* is the pickled ``(wrapper, args, arg_index, kwargs)`` and *chunk*
+    the pickled items, both serialized once by the parent. *wrapper* travels
+    by reference (module + qualname); the undecorated function behind it
+    does the work, so an item that is itself a list is not listified a
+    second time.
+    """
+    wrapper, args, arg_index, kwargs = pickle.loads(call)
+    chunk = pickle.loads(chunk)
+    func = getattr(wrapper, "__wrapped__", wrapper)
+    return [
+        func(*(args[:arg_index] + (x,) + args[arg_index + 1 :]), **kwargs)
+        for x in chunk
+    ]
 
 
 class CoreUtils(HelpMixin):
     """ """
 
+    #: ``listify(threading=...)`` runs batches smaller than this inline: below
+    #: it, pool dispatch costs more than the per-item work it would spread.
+    LISTIFY_SERIAL_THRESHOLD = 512
+    #: Size limits of the shared listify pools (created on first use).
+    LISTIFY_MAX_THREADS = min(32, (os.cpu_count() or 1) + 4)
+    LISTIFY_MAX_PROCESSES = os.cpu_count() or 1
+    #: Chunks queued per worker; more evens out uneven items, fewer cuts overhead.
+    LISTIFY_CHUNKS_PER_WORKER = 4
+
+    _listify_pools = {}
+    _listify_lock = _threading.Lock()
+    _listify_local = _threading.local()
+
     @staticmethod
     def cached_property(func: Callable) -> Any:
         """Decorator that converts a method with a single self argument into a property
@@ -43,13 +79,21 @@ class CoreUtils(HelpMixin):
         return _cached_property
 
     @staticmethod
-    def listify(func=None, arg_name=None, threading=False):
+    def listify(func=None, arg_name=None, threading=False, serial_threshold=None):
         """A decorator to make a function accept list-like arguments and return a list of results.
 
         Parameters:
             func (callable): The function to be decorated.
             arg_name (str): The name of the argument that should be listified. If None, the first argument is used.
-            threading (bool): Whether to use multi-threading for processing the list.
+            threading (bool/str): Spread a batch over the shared worker pool:
+                ``True`` (or ``"thread"``) for threads, ``"process"`` for the
+                process pool (CPU-heavy, picklable module-level functions;
+                a batch whose function, arguments or items do not pickle
+                falls back to threads).
+            serial_threshold (int): Batches smaller than this run inline.
+                Defaults to ``LISTIFY_SERIAL_THRESHOLD``, which suits cheap
+                per-item work; pass a low value for I/O-bound functions, whose
+                items are worth a worker each.
 
         Returns:
             callable: A wrapper function that takes the same arguments as the original function.
@@ -63,12 +107,17 @@ class CoreUtils(HelpMixin):
             result = my_function([1, 2, 3])  # result will be [2, 4, 6]
             ```
         Notes:
-            - If `threading` is True, the function uses a ThreadPoolExecutor to parallelize the operation.
+            - With `threading`, batches of at least `serial_threshold` items are
+              split into chunks and mapped over a shared, lazily created pool; smaller
+              batches, scalars and calls made from inside a pool worker run inline.
             - The function raises a ValueError if the specified `arg_name` is not found in the function arguments.
         """
         if func is None:
             return lambda f: CoreUtils.listify(
-                f, arg_name=arg_name, threading=threading
+                f,
+                arg_name=arg_name,
+                threading=threading,
+                serial_threshold=serial_threshold,
             )
 
         func_args = inspect.getfullargspec(func)
@@ -104,12 +153,20 @@ class CoreUtils(HelpMixin):
             # one item through it is pure overhead — and not merely slow: spinning
             # a worker thread up and down per call, on a hot path like
             # ``format_path(one_path)``, eventually aborts the interpreter at
-            # ``Thread.start()``. Gate on the flag rather than ``len(arg_list)``:
-            # a genuine iterable may be lazy (generator/zip/map), which
-            # ``executor.map`` accepts but ``len`` would raise on.
+            # ``Thread.start()``. Batches go through the shared pools instead of a
+            # pool per call; lazy iterables (generator/zip/map) are materialized
+            # there, since they have no ``len`` to chunk by.
             if threading and not is_single_item:
-                with ThreadPoolExecutor() as executor:
-                    results = list(executor.map(apply_func, arg_list))
+                results = CoreUtils._listify_map(
+                    apply_func,
+                    arg_list,
+                    threading,
+                    wrapper,
+                    new_args,
+                    arg_index,
+                    kwargs,
+                    serial_threshold,
+                )
             else:
                 results = [apply_func(x) for x in arg_list]
 
@@ -117,6 +174,96 @@ class CoreUtils(HelpMixin):
 
         return wrapper
 
+    @staticmethod
+    def _listify_map(
+        apply_func, items, mode, wrapper, args, arg_index, kwargs, threshold=None
+    ) -> list:
+        """Map a listified batch over the shared pool in chunks (see ``listify``).
+
+        Runs inline below *threshold* (default ``LISTIFY_SERIAL_THRESHOLD``)
+        and when already on a pool worker: a nested batch blocking on the
+        pool it occupies could deadlock it. The caller's ambient
+        ``CancelScope`` is checked between chunks (thread mode).
+
+        Process mode pickles the call and every chunk up front -- the
+        serialization the pool would do anyway -- so an unpicklable item
+        anywhere in the batch falls back to threads before any work starts.
+        """
+        if not isinstance(items, collections.abc.Sequence):
+            items = list(items)
+        count = len(items)
+        local = CoreUtils._listify_local
+        if threshold is None:
+            threshold = CoreUtils.LISTIFY_SERIAL_THRESHOLD
+        if count < threshold or getattr(local, "in_pool", False):
+            return [apply_func(x) for x in items]
+
+        use_processes = mode == "process"
+        kind = "process" if use_processes else "thread"
+        pool, workers = CoreUtils._listify_pool(kind)
+        size = max(1, -(-count // (workers * CoreUtils.LISTIFY_CHUNKS_PER_WORKER)))
+        chunks = [items[i : i + size] for i in range(0, count, size)]
+
+        if use_processes:
+            try:
+                call = pickle.dumps((wrapper, args, arg_index, kwargs))
+                chunks = [pickle.dumps(chunk) for chunk in chunks]
+            except Exception as e:
+                logging.getLogger(__name__).debug(
+                    f"listify: {getattr(wrapper, '__qualname__', wrapper)} batch "
+                    f"is not picklable ({e}); using threads."
+                )
+                return CoreUtils._listify_map(
+                    apply_func, items, "thread", wrapper, args, arg_index, kwargs, 0
+                )
+            run_chunk = functools.partial(_listify_process_chunk, call)
+        else:
+            scope = CancelScope.current()
+
+            def run_chunk(chunk):
+                local.in_pool = True
+                token = CancelScope._ambient.set(scope)
+                try:
+                    if scope is not None:
+                        scope.checkpoint()
+                    return [apply_func(x) for x in chunk]
+                finally:
+                    CancelScope._ambient.reset(token)
+                    local.in_pool = False
+
+        results = []
+        for part in pool.map(run_chunk, chunks):
+            results.extend(part)
+        return results
+
+    @staticmethod
+    def _listify_pool(kind: str):
+        """The shared ``"thread"`` / ``"process"`` listify pool and its size."""
+        with CoreUtils._listify_lock:
+            entry = CoreUtils._listify_pools.get(kind)
+            if entry is None:
+                if kind == "process":
+                    workers = CoreUtils.LISTIFY_MAX_PROCESSES
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                else:
+                    workers = CoreUtils.LISTIFY_MAX_THREADS
+                    pool = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="ptk-listify"
+                    )
+                entry = CoreUtils._listify_pools[kind] = (pool, workers)
+            return entry
+
+    @staticmethod
+    def shutdown_listify_pools(wait: bool = True) -> None:
+        """Shut the shared listify pools down; the next batch starts new ones.
+
+        Call after changing the ``LISTIFY_MAX_*`` limits. Runs at exit.
+        """
+        with CoreUtils._listify_lock:
+            pools, CoreUtils._listify_pools = CoreUtils._listify_pools, {}
+        for pool, _ in pools.values():
+            pool.shutdown(wait=wait)
+
     @classmethod
     def format_return(cls, lst, orig=None):
         """Return the list element if the given iterable only contains a single element.
@@ -392,6 +539,8 @@ class CoreUtils(HelpMixin):
         return instance, node_args
 
 
+atexit.register(CoreUtils.shutdown_listify_pools)
+
 # -----------------------------------------------------------------------------
 
 if __name__ == "__main__":
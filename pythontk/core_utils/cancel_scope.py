@@ -40,14 +40,20 @@ the caller can honour cancellation with no signature churn. Note that a new
 thread starts with an empty context: :meth:`current` returns ``None`` off the
 activating thread, by design — pull sources must never be polled from a
 non-owner thread (a DCC API call from a worker thread crashes the host).
+
+Pools get the scope through :class:`CancellableExecutor`: each task runs with
+the scope ambient (flag reads only) and a cancel drops every queued task at
+once. Process pools share the flag through shared memory.
 """
 from __future__ import annotations
 
 import contextlib
 import contextvars
+import multiprocessing
 import threading
 import time
-from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+from concurrent import futures as _futures
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -67,6 +73,11 @@ class OperationCancelled(BaseException):
         self.scope = scope
         self.reason = reason
 
+    def __reduce__(self):
+        # The scope (locks, listeners) stays behind when a pool process
+        # sends the exception home; message and reason cross.
+        return type(self), (str(self), None, self.reason)
+
 
 class CancelScope:
     """A cancellation flag with pull sources, ambient activation, and metrics.
@@ -446,3 +457,250 @@ class CancelScope:
     def __repr__(self) -> str:
         state = f"cancelled({self.reason})" if self.cancelled else "live"
         return f"<CancelScope {self.name!r} {state} ticks={self._tick_count}>"
+
+
+# ---------------------------------------------------------------------------
+# Worker pools
+# ---------------------------------------------------------------------------
+#: Shared cancel flag of the pool this worker process belongs to.
+_process_flag = None
+
+
+def _process_initializer(flag, initializer, initargs) -> None:
+    """Pool-process start-up: make a flag-backed scope ambient for every task."""
+    global _process_flag
+    _process_flag = flag
+    scope = CancelScope(
+        "worker process", sources=[lambda: flag.value != 0], poll_min_interval=0
+    )
+    CancelScope._ambient.set(scope)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _process_call(fn, args, kwargs):
+    """Run one task in a pool process, unless the pool was cancelled meanwhile."""
+    if _process_flag is not None and _process_flag.value:
+        raise OperationCancelled("Task cancelled before it started")
+    return fn(*args, **kwargs)
+
+
+class CancellableExecutor:
+    """A thread or process pool governed by a :class:`CancelScope`.
+
+    The scope reaches the workers: each task runs with it ambient, so
+    ``CancelScope.check()`` / ``proceed()`` inside the task see the flag.
+    Pull sources are still polled only by the owner thread, inside
+    :meth:`as_completed` / :meth:`map` / :meth:`wait`, which wake every
+    *poll_interval* seconds for that. Process workers get a shared-memory
+    flag instead of the scope object.
+
+    Cancelling the scope, from any thread, cancels every queued future at
+    once. Running tasks stop at their next checkpoint; a task dequeued after
+    the cancel raises :class:`OperationCancelled` without starting. Leaving
+    the ``with`` block waits for running tasks, so nothing keeps writing
+    after the caller has moved on. :attr:`counts` reports what happened.
+
+    Parameters:
+        scope: Governing scope; defaults to the ambient scope, else a new one.
+        max_workers: Pool size (executor default when ``None``).
+        processes: Use a ``ProcessPoolExecutor`` (tasks must be picklable).
+        poll_interval: Owner-thread source-poll period while waiting.
+        **executor_kwargs: Passed to the underlying executor
+            (``thread_name_prefix``, ``initializer``, ``mp_context`` ...).
+
+    Example:
+        with CancellableExecutor(scope, max_workers=8) as pool:
+            for future in pool.as_completed(pool.submit(bake, m) for m in maps):
+                results.append(future.result())
+    """
+
+    def __init__(
+        self,
+        scope: Optional[CancelScope] = None,
+        max_workers: Optional[int] = None,
+        processes: bool = False,
+        poll_interval: float = 0.05,
+        **executor_kwargs,
+    ):
+        self.scope = scope or CancelScope.current() or CancelScope("pool")
+        self.processes = processes
+        self.poll_interval = max(0.001, float(poll_interval))
+        self._lock = threading.Lock()
+        self._futures: List[_futures.Future] = []
+        self._flag = None
+
+        if processes:
+            context = executor_kwargs.pop("mp_context", None)
+            context = context or multiprocessing.get_context()
+            self._flag = context.RawValue("b", 0)
+            initializer = executor_kwargs.pop("initializer", None)
+            initargs = executor_kwargs.pop("initargs", ())
+            self._executor = _futures.ProcessPoolExecutor(
+                max_workers,
+                mp_context=context,
+                initializer=_process_initializer,
+                initargs=(self._flag, initializer, initargs),
+                **executor_kwargs,
+            )
+        else:
+            self._executor = _futures.ThreadPoolExecutor(max_workers, **executor_kwargs)
+        self.scope.add_listener(self._on_cancel)
+        if self.scope.cancelled:
+            self._on_cancel(self.scope)
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+    def submit(self, fn: Callable[..., T], *args, **kwargs) -> _futures.Future:
+        """Schedule ``fn(*args, **kwargs)``; already-cancelled futures when cancelled."""
+        if self.scope.cancelled:
+            future = _futures.Future()
+            future.cancel()
+        elif self.processes:
+            future = self._executor.submit(_process_call, fn, args, kwargs)
+        else:
+            future = self._executor.submit(self._thread_call, fn, args, kwargs)
+        with self._lock:
+            self._futures.append(future)
+        if self.scope.cancelled:
+            future.cancel()  # lost the race with a concurrent cancel
+        return future
+
+    def _thread_call(self, fn, args, kwargs):
+        if self.scope.cancelled:
+            raise OperationCancelled(
+                "Task cancelled before it started", scope=self.scope
+            )
+        token = CancelScope._ambient.set(self.scope)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            CancelScope._ambient.reset(token)
+
+    def map(self, fn: Callable[..., T], *iterables) -> Iterator[T]:
+        """Like ``Executor.map`` (results in order), polling while it waits.
+
+        Raises :class:`OperationCancelled` once the scope is cancelled.
+        """
+        submitted = [self.submit(fn, *args) for args in zip(*iterables)]
+
+        def results():
+            for future in submitted:
+                self._wait_for([future])
+                yield self._result(future)
+
+        return results()
+
+    # ------------------------------------------------------------------
+    # Waiting (owner thread)
+    # ------------------------------------------------------------------
+    def as_completed(self, fs: Optional[Iterable[_futures.Future]] = None):
+        """Yield *fs* (default: everything submitted) as they finish.
+
+        Polls the scope between waits and raises :class:`OperationCancelled`
+        when it is cancelled; futures that finished first are still yielded.
+        """
+        pending = set(self._snapshot() if fs is None else fs)
+        while pending:
+            done, pending = _futures.wait(
+                pending,
+                timeout=self.poll_interval,
+                return_when=_futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                if not future.cancelled():
+                    yield future
+            if pending and self.scope.poll():
+                self._raise_cancelled()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for everything submitted; ``False`` on *timeout* or cancel."""
+        try:
+            return self._wait_for(self._snapshot(), timeout)
+        except OperationCancelled:
+            return False
+
+    def _wait_for(self, fs, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = set(fs)
+        while pending:
+            step = self.poll_interval
+            if deadline is not None:
+                step = min(step, deadline - time.monotonic())
+                if step <= 0:
+                    return False
+            _, pending = _futures.wait(pending, timeout=step)
+            if pending and self.scope.poll():
+                self._raise_cancelled()
+        return True
+
+    def _result(self, future: _futures.Future):
+        if future.cancelled():
+            self._raise_cancelled()
+        return future.result()
+
+    def _raise_cancelled(self):
+        self._on_cancel(self.scope)
+        raise OperationCancelled(
+            f"'{self.scope.name}' cancelled", scope=self.scope, reason=self.scope.reason
+        )
+
+    # ------------------------------------------------------------------
+    # Cancel / shutdown
+    # ------------------------------------------------------------------
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """Cancel the governing scope (and with it, this pool)."""
+        self.scope.cancel(reason)
+
+    def _on_cancel(self, scope: CancelScope) -> None:
+        if self._flag is not None:
+            self._flag.value = 1
+        for future in self._snapshot():
+            future.cancel()
+
+    def _snapshot(self) -> List[_futures.Future]:
+        with self._lock:
+            return list(self._futures)
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """``submitted`` / ``completed`` / ``failed`` / ``cancelled`` / ``running``.
+
+        ``cancelled`` covers futures dropped from the queue and tasks that
+        stopped with :class:`OperationCancelled`.
+        """
+        counts = dict(submitted=0, completed=0, failed=0, cancelled=0, running=0)
+        for future in self._snapshot():
+            counts["submitted"] += 1
+            if future.cancelled():
+                counts["cancelled"] += 1
+            elif not future.done():
+                counts["running"] += 1
+            elif isinstance(future.exception(), OperationCancelled):
+                counts["cancelled"] += 1
+            elif future.exception() is not None:
+                counts["failed"] += 1
+            else:
+                counts["completed"] += 1
+        return counts
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the pool down, dropping queued tasks if the scope was cancelled."""
+        if self.scope.cancelled:
+            self._on_cancel(self.scope)
+        self.scope.remove_listener(self._on_cancel)
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "CancellableExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if exc_type is not None and issubclass(exc_type, OperationCancelled):
+            self._on_cancel(self.scope)
+        self.shutdown(wait=True)
+        return False
+
+    def __repr__(self) -> str:
+        kind = "processes" if self.processes else "threads"
+        return f"<CancellableExecutor {kind} {self.scope!r} {self.counts}>"
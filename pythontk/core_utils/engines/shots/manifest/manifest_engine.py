@@ -117,6 +117,11 @@ class ShotManifest(_ShotManifestInternal):
         # per-build/-assess cache lifecycle without re-implementing the clears.
         self._animated_transforms: Optional[Dict[str, List[str]]] = None
         self._curve_data: Optional[Dict[str, Tuple[list, list]]] = None
+        # Last synced snapshot: step_id -> (step digest, shot_id, start, end,
+        # locked, objects).  Drives ``update(incremental=True)``.
+        self._synced: Dict[str, tuple] = {}
+        #: What the last :meth:`update` planned and what it reused unplanned.
+        self.last_sync_report: Optional[Dict[str, Any]] = None
 
     @staticmethod
     def _step_metadata(
@@ -305,6 +310,7 @@ class ShotManifest(_ShotManifestInternal):
         fit_mode: FitMode = DEFAULT_FIT_MODE,
         initial_shot_length: float = DEFAULT_INITIAL_SHOT_LENGTH,
         skip_scene_discovery: bool = False,
+        incremental: bool = False,
     ) -> Tuple[Dict[str, str], Dict[str, list], List[StepStatus]]:
         """Full build pipeline: plan -> commit -> apply behaviors -> assess.
 
@@ -328,6 +334,8 @@ class ShotManifest(_ShotManifestInternal):
                 selected-keys build only considers the selected keys'
                 objects instead of discovering every animated scene
                 object in each shot's range.
+            incremental: Forwarded to :meth:`update` -- plan only the steps
+                that changed since this engine's last sync.
 
         Returns:
             ``(actions, behavior_result, assessment)`` tuple.
@@ -339,6 +347,7 @@ class ShotManifest(_ShotManifestInternal):
             zero_duration_fallback=zero_duration_fallback,
             fit_mode=fit_mode,
             initial_shot_length=initial_shot_length,
+            incremental=incremental,
         )
 
         behavior_result: Dict[str, list] = {"applied": [], "skipped": []}
@@ -362,6 +371,7 @@ class ShotManifest(_ShotManifestInternal):
         zero_duration_fallback: bool = False,
         fit_mode: FitMode = DEFAULT_FIT_MODE,
         initial_shot_length: float = DEFAULT_INITIAL_SHOT_LENGTH,
+        incremental: bool = False,
     ) -> Dict[str, str]:
         """Sync parsed steps to the ShotStore (data only, no behaviors).
 
@@ -370,6 +380,15 @@ class ShotManifest(_ShotManifestInternal):
         audio-grow, ripple deltas) happens on :class:`PlannedShot`
         objects before any store mutation occurs.
 
+        With *incremental*, each step's :meth:`BuilderStep.content_hash`
+        (plus its range) is diffed against this engine's last sync: a step
+        whose row is unchanged and whose shot still has the recorded
+        position, lock state and objects is carried over unplanned -- unless
+        an edited step upstream rippled it.  New, edited and removed steps
+        are planned as usual.  Scene-side drift on an unchanged row (e.g. an
+        audio clip that got longer) is only picked up by a full update.
+        :attr:`last_sync_report` lists what was planned and what was reused.
+
         Returns:
             Dict mapping ``step_id`` -> action taken
             (``"created"`` | ``"patched"`` | ``"skipped"``
@@ -378,6 +397,9 @@ class ShotManifest(_ShotManifestInternal):
         self._fps_cache = None
         self._animated_transforms = None
         self._curve_data = None
+        digests = {
+            step.step_id: ShotManifest._step_digest(step, ranges) for step in steps
+        }
         plan = self._compute_plan(
             steps,
             ranges=ranges,
@@ -385,8 +407,61 @@ class ShotManifest(_ShotManifestInternal):
             zero_duration_fallback=zero_duration_fallback,
             fit_mode=fit_mode,
             initial_shot_length=initial_shot_length,
+            previous=self._synced if incremental else None,
+            digests=digests,
         )
-        return self._execute_plan(plan, remove_missing=remove_missing)
+        actions = self._execute_plan(plan, remove_missing=remove_missing)
+
+        reused = [ps.step.step_id for ps in plan if ps.reused]
+        self.last_sync_report = {
+            "incremental": incremental,
+            "planned": [
+                ps.step.step_id
+                for ps in plan
+                if not ps.reused and ps.action != "removed"
+            ],
+            "reused": reused,
+            "removed": [ps.step.step_id for ps in plan if ps.action == "removed"],
+        }
+        if reused:
+            log.debug(
+                "incremental manifest update: planned %d step(s), reused %d",
+                len(plan) - len(reused),
+                len(reused),
+            )
+        self._record_sync(steps, digests)
+        return actions
+
+    @staticmethod
+    def _step_digest(
+        step: BuilderStep, ranges: Optional[Dict[str, Tuple[float, float]]]
+    ) -> str:
+        """Row hash of *step* plus the caller range that pins it (if any)."""
+        rng = ranges.get(step.step_id) if ranges else None
+        return f"{step.content_hash()}:{rng!r}"
+
+    @staticmethod
+    def _shot_signature(shot, digest: str) -> tuple:
+        """Snapshot entry for *shot* as built from a step hashing to *digest*."""
+        return (
+            digest,
+            shot.shot_id,
+            shot.start,
+            shot.end,
+            shot.locked,
+            tuple(shot.objects),
+        )
+
+    def _record_sync(self, steps: List[BuilderStep], digests: Dict[str, str]) -> None:
+        """Snapshot each step's digest and shot for the next incremental update."""
+        synced: Dict[str, tuple] = {}
+        for step in steps:
+            shot = self.store.shot_by_name(step.step_id)
+            if shot is not None:
+                synced[step.step_id] = ShotManifest._shot_signature(
+                    shot, digests[step.step_id]
+                )
+        self._synced = synced
 
     # ---- compute-then-commit internals -----------------------------------
 
@@ -398,6 +473,8 @@ class ShotManifest(_ShotManifestInternal):
         zero_duration_fallback: bool = False,
         fit_mode: FitMode = DEFAULT_FIT_MODE,
         initial_shot_length: float = DEFAULT_INITIAL_SHOT_LENGTH,
+        previous: Optional[Dict[str, tuple]] = None,
+        digests: Optional[Dict[str, str]] = None,
     ) -> List[PlannedShot]:
         """Pure planning pass: compute final positions without touching the store.
 
@@ -406,6 +483,11 @@ class ShotManifest(_ShotManifestInternal):
         (create, patch, skip, lock, remove).  All cursor advancement,
         audio-grow, and ripple arithmetic happens here on plan data.
 
+        With a *previous* sync snapshot (and the current step *digests*), an
+        existing shot whose snapshot entry still matches -- and that no
+        upstream ripple has displaced -- becomes a ``reused`` entry without
+        being planned.
+
         Returns:
             Ordered list of :class:`PlannedShot` instructions.
         """
@@ -443,6 +525,27 @@ class ShotManifest(_ShotManifestInternal):
 
         for step in steps:
             existing = built_map.get(step.step_id)
+            if (
+                previous
+                and existing is not None
+                and not cumulative_ripple
+                and previous.get(step.step_id)
+                == ShotManifest._shot_signature(existing, digests[step.step_id])
+            ):
+                plan.append(
+                    PlannedShot(
+                        step=step,
+                        action="locked" if existing.locked else "skipped",
+                        start=existing.start,
+                        end=existing.end,
+                        objects=list(existing.objects),
+                        metadata=existing.metadata,
+                        description=existing.description,
+                        existing_shot_id=existing.shot_id,
+                        reused=True,
+                    )
+                )
+                continue
             meta = self._step_metadata(
                 step, pass_through=getattr(step, "_pass_through", None)
             )
@@ -679,6 +782,9 @@ class ShotManifest(_ShotManifestInternal):
             for ps in plan:
                 if ps.action == "removed":
                     continue
+                if ps.reused:
+                    actions[ps.step.step_id] = ps.action
+                    continue
 
                 if ps.action == "created":
                     # Store resolved (long / unique) names; missing objects
@@ -11,11 +11,22 @@ key emission (which reach a scene) live in the hooked engine layer, not here.
 from __future__ import annotations
 
 import csv
+import hashlib
 import io
 import logging
 import re
 from dataclasses import dataclass, field, fields
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
 
 from pythontk import SchemaSpec
 from pythontk.core_utils.engines.shots.shot_model import ShotStore
@@ -90,70 +101,51 @@ class _ManifestModelInternal(object):
         """Strip whitespace from a CSV cell."""
         return (cell or "").strip()
 
-    @staticmethod
-    def _read_csv_rows(filepath: str) -> List[List[str]]:
-        """Read all CSV rows, tolerating non-UTF-8 encodings.
-
-        Production manifests frequently come out of Excel as cp1252; a
-        UTF-8-only read used to fail the entire load on the first accented
-        character.  The UTF-8 BOM is stripped from the raw bytes up front —
-        otherwise a BOM'd file that falls back to cp1252 (or the lossy
-        read) leaks it into the first header cell and the header never
-        resolves.  Tries UTF-8 first, then cp1252, then a lossy UTF-8 read
-        as a last resort so a stray byte can't kill the manifest.
-        """
-        with open(filepath, "rb") as fh:
-            raw = fh.read()
-        if raw.startswith(b"\xef\xbb\xbf"):
-            raw = raw[3:]
-        for encoding in ("utf-8", "cp1252"):
-            try:
-                text = raw.decode(encoding)
-                break
-            except UnicodeDecodeError:
-                continue
-        else:
-            text = raw.decode("utf-8", errors="replace")
-        return list(csv.reader(io.StringIO(text, newline="")))
-
-
-class ManifestModel(_ManifestModelInternal):
-    """ManifestModel — module namespace."""
+    #: Tried in order by :meth:`ManifestModel.parse_csv`.  Production
+    #: manifests frequently come out of Excel as cp1252, and the last entry
+    #: is lossy so a stray byte can't kill the manifest.
+    _CSV_ENCODINGS: Tuple[Tuple[str, str], ...] = (
+        ("utf-8", "strict"),
+        ("cp1252", "strict"),
+        ("utf-8", "replace"),
+    )
 
     @staticmethod
-    def detect_behaviors(text: str) -> List[str]:
-        """Return behavior names inferred from descriptive *text*.
-
-        Each pattern is tested independently so text mentioning both
-        "fades in" and "fades out" yields ``["fade_in", "fade_out"]``.
+    def _iter_csv_rows(
+        filepath: str, encoding: str = "utf-8", errors: str = "strict"
+    ) -> Iterator[List[str]]:
+        """Yield CSV rows one at a time, decoding the file as it is read.
+
+        The UTF-8 BOM is skipped on the raw bytes whatever *encoding* is --
+        otherwise a BOM'd file read as cp1252 leaks it into the first header
+        cell and the header never resolves.  A strict decode that hits a bad
+        byte raises ``UnicodeDecodeError`` mid-iteration; the caller restarts
+        with the next encoding.
         """
-        found = []
-        for pattern, name in _BEHAVIOR_PATTERNS:
-            if pattern.search(text):
-                found.append(name)
-        return found
+        with open(filepath, "rb") as fh:
+            if fh.read(3) != b"\xef\xbb\xbf":
+                fh.seek(0)
+            with io.TextIOWrapper(
+                fh, encoding=encoding, errors=errors, newline=""
+            ) as text:
+                yield from csv.reader(text)
 
     @staticmethod
-    def parse_csv(
+    def _steps_from_rows(
+        rows: Iterable[List[str]],
+        col_map: ColumnMap,
         filepath: str,
-        columns: Optional[ColumnMap] = None,
-        post_process: Optional[Callable[[BuilderStep], None]] = None,
+        warnings: Optional[List[tuple]] = None,
     ) -> List[BuilderStep]:
-        """Parse a structured CSV into a list of :class:`BuilderStep`.
-
-        Parameters:
-            filepath: Path to the CSV file.
-            columns: Optional header-name mapping.  Defaults cover the
-                common sequence-document layouts.
-            post_process: Optional callable invoked on each step after
-                assembly.  Use to compute derived fields (e.g.
-                audio objects) from the parsed data.
+        """Assemble :class:`BuilderStep` objects from CSV *rows*, one pass.
 
-        Returns:
-            Ordered list of steps, each carrying its objects and detected
-            behaviors.
+        The body of :meth:`ManifestModel.parse_csv`; *rows* may be a lazy
+        reader, so only the current row and the steps built so far are held.
+        Warnings are logged directly, or appended to *warnings* as
+        ``log.warning`` argument tuples when given -- a decode attempt that
+        fails part-way must not log what its retry will log again.
         """
-        col_map = columns or ColumnMap()
+        warn = log.warning if warnings is None else (lambda *a: warnings.append(a))
         cols: Optional[_ResolvedColumns] = None
         steps: List[BuilderStep] = []
         seen_ids: set = set()
@@ -165,10 +157,11 @@ class ManifestModel(_ManifestModelInternal):
         # Per-step accumulator for metadata_pass values (first-row-wins)
         step_pass: Dict[str, str] = {}
 
-        rows = _ManifestModelInternal._read_csv_rows(filepath)
+        saw_rows = False
         for row in rows:
             if not row:
                 continue
+            saw_rows = True
 
             first = _ManifestModelInternal._strip_cell(row[0])
 
@@ -233,7 +226,7 @@ class ManifestModel(_ManifestModelInternal):
             if step_match:
                 step_id = step_match.group(1)
                 if step_id in seen_ids:
-                    log.warning("Duplicate step_id '%s' — skipping.", step_id)
+                    warn("Duplicate step_id '%s' — skipping.", step_id)
                     current_step = None
                     continue
                 seen_ids.add(step_id)
@@ -290,13 +283,72 @@ class ManifestModel(_ManifestModelInternal):
 
         # A missing header row used to fail silently: every data row was
         # skipped and the caller saw 0 steps with no explanation.
-        if cols is None and rows:
-            log.warning(
+        if cols is None and saw_rows:
+            warn(
                 "No header row found in '%s' — 0 steps parsed. Expected a "
                 "column named one of %s.",
                 filepath,
                 sorted(step_id_aliases),
             )
+        return steps
+
+
+class ManifestModel(_ManifestModelInternal):
+    """ManifestModel — module namespace."""
+
+    @staticmethod
+    def detect_behaviors(text: str) -> List[str]:
+        """Return behavior names inferred from descriptive *text*.
+
+        Each pattern is tested independently so text mentioning both
+        "fades in" and "fades out" yields ``["fade_in", "fade_out"]``.
+        """
+        found = []
+        for pattern, name in _BEHAVIOR_PATTERNS:
+            if pattern.search(text):
+                found.append(name)
+        return found
+
+    @staticmethod
+    def parse_csv(
+        filepath: str,
+        columns: Optional[ColumnMap] = None,
+        post_process: Optional[Callable[[BuilderStep], None]] = None,
+    ) -> List[BuilderStep]:
+        """Parse a structured CSV into a list of :class:`BuilderStep`.
+
+        The file is decoded and parsed a row at a time, so memory follows
+        the steps built rather than the file size.  A file that is not
+        valid UTF-8 is re-read as cp1252, then as lossy UTF-8.
+
+        Parameters:
+            filepath: Path to the CSV file.
+            columns: Optional header-name mapping.  Defaults cover the
+                common sequence-document layouts.
+            post_process: Optional callable invoked on each step after
+                assembly.  Use to compute derived fields (e.g.
+                audio objects) from the parsed data.
+
+        Returns:
+            Ordered list of steps, each carrying its objects and detected
+            behaviors.
+        """
+        col_map = columns or ColumnMap()
+        for encoding, errors in _ManifestModelInternal._CSV_ENCODINGS:
+            warnings: List[tuple] = []
+            try:
+                steps = _ManifestModelInternal._steps_from_rows(
+                    _ManifestModelInternal._iter_csv_rows(filepath, encoding, errors),
+                    col_map,
+                    filepath,
+                    warnings,
+                )
+                break
+            except UnicodeDecodeError:
+                continue
+        # Only the attempt that decoded the whole file reports.
+        for args in warnings:
+            log.warning(*args)
 
         # Apply exclude list
         if col_map.exclude_steps:
@@ -340,6 +392,24 @@ class BuilderStep:
         """Text shown in the tree Description column."""
         return self.description
 
+    def content_hash(self) -> str:
+        """Digest of every field the manifest planner reads from this step.
+
+        Two parses of an unedited CSV row yield the same hash, so an
+        incremental :meth:`ShotManifest.update` can tell edited steps apart
+        without re-planning the rest.
+        """
+        payload = (
+            self.step_id,
+            self.section,
+            self.section_title,
+            self.description,
+            self.audio,
+            [(o.name, o.kind, o.source_path, o.behaviors) for o in self.objects],
+            sorted(self._pass_through.items()),
+        )
+        return hashlib.sha1(repr(payload).encode("utf-8")).hexdigest()
+
     @classmethod
     def from_detection(
         cls,
@@ -409,6 +479,9 @@ class PlannedShot:
     description: str = ""
     existing_shot_id: Optional[int] = None
     ripple_delta: float = 0.0  # shift applied to later shots
+    # Carried over from the last sync unplanned (incremental update): the
+    # step and its shot are unchanged, so there is nothing to commit.
+    reused: bool = False
 
 
 FitMode = Literal["extend_only", "fit_contents"]
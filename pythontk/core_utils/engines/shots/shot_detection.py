@@ -11,11 +11,25 @@ inputs and call the functions here.
 
 Candidate shape (returned by both functions):
     ``{"name": str, "start": float, "end": float, "objects": list[str]}``
+
+Dense scenes (mocap, baked simulation) can yield hundreds of thousands of
+segments / keys, so each function also has an array-in / array-out form
+(:meth:`ShotDetection.cluster_segment_arrays`,
+:meth:`ShotDetection.boundaries_from_key_arrays`) that segments with a sort,
+a diff and a cumulative max instead of per-item Python loops.  The
+dict-returning functions are built on those when numpy is available.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as error:
+    logging.getLogger(__name__).debug(f"# ImportError: {__file__}\n\t{error}")
+    np = None  # type: ignore
 
 
 STANDARD_TRANSFORM_ATTRS: frozenset = frozenset(
@@ -42,37 +56,81 @@ from custom trigger/marker attributes.
 __all__ = ["STANDARD_TRANSFORM_ATTRS", "ShotDetection"]
 
 
-class ShotDetection:
-    """ShotDetection — module namespace."""
+class _ShotDetectionInternal(object):
+    """Internal helpers for ShotDetection."""
 
     @staticmethod
-    def cluster_segments_by_gap(
-        segments: List[Dict[str, Any]],
-        gap_threshold: float = 5.0,
-        min_duration: float = 2.0,
-    ) -> List[Dict[str, Any]]:
-        """Cluster per-object animation segments into shot-region candidates.
+    def _factorize(objs: Iterable[Any]) -> Tuple[List[str], "np.ndarray"]:
+        """Object names (sorted, unique, as ``str``) and each item's id into them.
 
-        Given *segments* (each a dict with ``"start"``, ``"end"``, ``"obj"`` —
-        already gathered from a scene by the DCC layer), groups contiguous
-        segments into regions separated by gaps of at least *gap_threshold*
-        frames.  Each cluster becomes one candidate spanning ``[min start,
-        max end]`` with the sorted set of contributing objects; clusters shorter
-        than *min_duration* are discarded.
+        Ids follow name order, so sorting ids sorts names.
+        """
+        keys = [str(o) for o in objs]
+        names = sorted(set(keys))
+        index = {name: i for i, name in enumerate(names)}
+        ids = np.fromiter((index[k] for k in keys), dtype=np.intp, count=len(keys))
+        return names, ids
 
-        Parameters:
-            segments: Segment dicts with ``"start"``, ``"end"``, ``"obj"`` keys.
-            gap_threshold: Minimum gap (frames) between clusters.
-            min_duration: Minimum shot duration in frames.  Clusters shorter
-                than this are discarded.
+    @staticmethod
+    def _group_members(
+        groups: "np.ndarray", obj_ids: "np.ndarray", n_groups: int
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """CSR ``(offsets, objects)`` of the unique object ids in each group.
 
-        Returns:
-            List of candidate dicts with ``"name"``, ``"start"``, ``"end"``, and
-            ``"objects"`` keys, ordered by cluster (ascending start time).
+        Items with a negative group are ignored.
         """
-        if not segments:
-            return []
+        valid = groups >= 0
+        if not valid.any():
+            return np.zeros(n_groups + 1, dtype=np.intp), np.empty(0, dtype=np.intp)
+        obj_ids = obj_ids[valid].astype(np.int64)
+        stride = int(obj_ids.max()) + 1
+        # One int64 key per (group, object); sort + diff dedupes them far
+        # faster than ``np.unique(..., axis=1)`` on the pair.
+        keys = np.sort(groups[valid].astype(np.int64) * stride + obj_ids)
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        offsets = np.searchsorted(keys // stride, np.arange(n_groups + 1))
+        return offsets, (keys % stride).astype(np.intp)
+
+    @staticmethod
+    def _empty_candidates(like: "np.ndarray") -> Tuple["np.ndarray", ...]:
+        empty = np.empty(0, dtype=np.result_type(like, float))
+        return (
+            empty,
+            empty.copy(),
+            np.zeros(1, dtype=np.intp),
+            np.empty(0, dtype=np.intp),
+        )
+
+    @staticmethod
+    def _to_candidates(
+        starts: "np.ndarray",
+        ends: "np.ndarray",
+        offsets: "np.ndarray",
+        objects: "np.ndarray",
+        names: List[str],
+    ) -> List[Dict[str, Any]]:
+        """Candidate dicts from the array forms' output."""
+        offsets = offsets.tolist()
+        objects = objects.tolist()
+        return [
+            {
+                "name": f"Shot {k + 1}",
+                "start": start,
+                "end": end,
+                "objects": [names[i] for i in objects[offsets[k] : offsets[k + 1]]],
+            }
+            for k, (start, end) in enumerate(zip(starts.tolist(), ends.tolist()))
+        ]
+
+    # ---- pure-Python fallbacks (no numpy) --------------------------------
 
+    @staticmethod
+    def _cluster_segments_loop(
+        segments: List[Dict[str, Any]],
+        gap_threshold: float,
+        min_duration: float,
+    ) -> List[Dict[str, Any]]:
+        """Sequential-scan :meth:`ShotDetection.cluster_segments_by_gap`."""
         # Do not mutate the caller's list — a pure function sorts a copy.
         segments = sorted(segments, key=lambda s: s["start"])
 
@@ -108,40 +166,12 @@ class ShotDetection:
         return candidates
 
     @staticmethod
-    def boundaries_from_key_entries(
+    def _boundaries_loop(
         entries: List[Tuple[float, float, str]],
-        gap_threshold: float = 5.0,
-        key_filter: str = "all",
+        gap_threshold: float,
+        key_filter: str,
     ) -> List[Dict[str, Any]]:
-        """Build shot-region candidates from ``(time, value, object)`` key entries.
-
-        Each unique key time is treated as an explicit shot boundary; keys closer
-        than *gap_threshold* frames merge into one boundary.  Designed for stepped
-        / marker keys (e.g. audio triggers) where each key marks the start of a
-        shot rather than continuous animation.
-
-        Parameters:
-            entries: ``(time, value, object)`` triples gathered from a scene's
-                selected keys by the DCC layer.
-            gap_threshold: Keys within this many frames merge into one boundary.
-            key_filter: How to interpret key values:
-
-                ``"all"``
-                    Every key is a boundary (contiguous shots).
-                ``"skip_zero"``
-                    Keys with value 0 are ignored; only non-zero keys become
-                    boundaries.
-                ``"zero_as_end"``
-                    Non-zero keys start shots; zero-value keys end the preceding
-                    shot (allows gaps between shots).
-
-        Returns:
-            List of candidate dicts with ``"name"``, ``"start"``, ``"end"``, and
-            ``"objects"`` keys.  Unlike the DCC caller, no flat-object filtering
-            is applied here — that needs scene queries and stays in the DCC layer.
-        """
-        if not entries:
-            return []
+        """Sequential-scan :meth:`ShotDetection.boundaries_from_key_entries`."""
 
         def _is_zero(v) -> bool:
             """Treat None and near-zero floats as 'zero'."""
@@ -231,3 +261,223 @@ class ShotDetection:
                 }
             )
         return candidates
+
+
+class ShotDetection(_ShotDetectionInternal):
+    """ShotDetection — module namespace."""
+
+    @staticmethod
+    def cluster_segments_by_gap(
+        segments: List[Dict[str, Any]],
+        gap_threshold: float = 5.0,
+        min_duration: float = 2.0,
+    ) -> List[Dict[str, Any]]:
+        """Cluster per-object animation segments into shot-region candidates.
+
+        Given *segments* (each a dict with ``"start"``, ``"end"``, ``"obj"`` —
+        already gathered from a scene by the DCC layer), groups contiguous
+        segments into regions separated by gaps of at least *gap_threshold*
+        frames.  Each cluster becomes one candidate spanning ``[min start,
+        max end]`` with the sorted set of contributing objects; clusters shorter
+        than *min_duration* are discarded.
+
+        Parameters:
+            segments: Segment dicts with ``"start"``, ``"end"``, ``"obj"`` keys.
+            gap_threshold: Minimum gap (frames) between clusters.
+            min_duration: Minimum shot duration in frames.  Clusters shorter
+                than this are discarded.
+
+        Returns:
+            List of candidate dicts with ``"name"``, ``"start"``, ``"end"``, and
+            ``"objects"`` keys, ordered by cluster (ascending start time).
+        """
+        if not segments:
+            return []
+        if np is None:
+            return _ShotDetectionInternal._cluster_segments_loop(
+                segments, gap_threshold, min_duration
+            )
+        names, obj_ids = _ShotDetectionInternal._factorize(s["obj"] for s in segments)
+        arrays = ShotDetection.cluster_segment_arrays(
+            np.asarray([s["start"] for s in segments]),
+            np.asarray([s["end"] for s in segments]),
+            obj_ids,
+            gap_threshold=gap_threshold,
+            min_duration=min_duration,
+        )
+        return _ShotDetectionInternal._to_candidates(*arrays, names)
+
+    @staticmethod
+    def boundaries_from_key_entries(
+        entries: List[Tuple[float, float, str]],
+        gap_threshold: float = 5.0,
+        key_filter: str = "all",
+    ) -> List[Dict[str, Any]]:
+        """Build shot-region candidates from ``(time, value, object)`` key entries.
+
+        Each unique key time is treated as an explicit shot boundary; keys closer
+        than *gap_threshold* frames merge into one boundary.  Designed for stepped
+        / marker keys (e.g. audio triggers) where each key marks the start of a
+        shot rather than continuous animation.
+
+        Parameters:
+            entries: ``(time, value, object)`` triples gathered from a scene's
+                selected keys by the DCC layer.
+            gap_threshold: Keys within this many frames merge into one boundary.
+            key_filter: How to interpret key values:
+
+                ``"all"``
+                    Every key is a boundary (contiguous shots).
+                ``"skip_zero"``
+                    Keys with value 0 are ignored; only non-zero keys become
+                    boundaries.
+                ``"zero_as_end"``
+                    Non-zero keys start shots; zero-value keys end the preceding
+                    shot (allows gaps between shots).
+
+        Returns:
+            List of candidate dicts with ``"name"``, ``"start"``, ``"end"``, and
+            ``"objects"`` keys.  Unlike the DCC caller, no flat-object filtering
+            is applied here — that needs scene queries and stays in the DCC layer.
+        """
+        if not entries:
+            return []
+        if np is None:
+            return _ShotDetectionInternal._boundaries_loop(
+                entries, gap_threshold, key_filter
+            )
+        names, obj_ids = _ShotDetectionInternal._factorize(e[2] for e in entries)
+        arrays = ShotDetection.boundaries_from_key_arrays(
+            np.asarray([e[0] for e in entries]),
+            np.asarray([0.0 if e[1] is None else e[1] for e in entries], dtype=float),
+            obj_ids,
+            gap_threshold=gap_threshold,
+            key_filter=key_filter,
+        )
+        return _ShotDetectionInternal._to_candidates(*arrays, names)
+
+    # ---- array forms -----------------------------------------------------
+
+    @staticmethod
+    def cluster_segment_arrays(
+        starts: "np.ndarray",
+        ends: "np.ndarray",
+        obj_ids: "np.ndarray",
+        gap_threshold: float = 5.0,
+        min_duration: float = 2.0,
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Array form of :meth:`cluster_segments_by_gap`.
+
+        Segments are stably sorted by start; a running maximum of their ends
+        marks where a start clears everything before it by more than
+        *gap_threshold*, which is where a new cluster begins (for segments
+        with ``end >= start`` this is exactly the sequential scan).
+
+        Parameters:
+            starts, ends: Per-segment frame ranges.
+            obj_ids: Per-segment integer object ids (the caller keeps the
+                id -> name table).
+            gap_threshold: Minimum gap (frames) between clusters.
+            min_duration: Clusters shorter than this are discarded.
+
+        Returns:
+            ``(start, end, offsets, objects)`` -- one ``start`` / ``end`` per
+            candidate, ordered by start; candidate ``k``'s sorted, unique
+            object ids are ``objects[offsets[k]:offsets[k + 1]]``.
+        """
+        if np is None:
+            raise RuntimeError("numpy is required for the array detection forms.")
+        starts = np.asarray(starts)
+        ends = np.asarray(ends)
+        obj_ids = np.asarray(obj_ids, dtype=np.intp)
+        if not starts.size:
+            return _ShotDetectionInternal._empty_candidates(starts)
+
+        order = np.argsort(starts, kind="stable")
+        starts, ends, obj_ids = starts[order], ends[order], obj_ids[order]
+        reach = np.maximum.accumulate(ends)
+        breaks = np.flatnonzero(starts[1:] - reach[:-1] > gap_threshold) + 1
+        first = np.concatenate(([0], breaks))
+        last = np.concatenate((breaks, [starts.size])) - 1
+        cl_start = starts[first]
+        cl_end = reach[last]
+
+        keep = (cl_end - cl_start) >= min_duration
+        # Map each segment's cluster to its rank among the kept ones (-1 = dropped).
+        rank = np.where(keep, np.cumsum(keep) - 1, -1)
+        cluster = rank[np.repeat(np.arange(first.size), last - first + 1)]
+        offsets, objects = _ShotDetectionInternal._group_members(
+            cluster, obj_ids, int(keep.sum())
+        )
+        return cl_start[keep], cl_end[keep], offsets, objects
+
+    @staticmethod
+    def boundaries_from_key_arrays(
+        times: "np.ndarray",
+        values: "np.ndarray",
+        obj_ids: "np.ndarray",
+        gap_threshold: float = 5.0,
+        key_filter: str = "all",
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Array form of :meth:`boundaries_from_key_entries`.
+
+        Keys are sorted by ``(time, non-zero)`` (a closing zero precedes an
+        opening key at the same frame), then segmented without a Python
+        loop: in ``"all"`` / ``"skip_zero"`` mode a boundary starts wherever
+        the step to the previous key exceeds *gap_threshold*; in
+        ``"zero_as_end"`` mode a shot opens at a non-zero key that follows a
+        zero (or leads) and closes at the next zero.  A value is "zero" when
+        ``abs(value) < 1e-9``.
+
+        Parameters:
+            times, values: Per-key time and value.
+            obj_ids: Per-key integer object ids.
+            gap_threshold: Keys within this many frames merge into one boundary.
+            key_filter: ``"all"``, ``"skip_zero"`` or ``"zero_as_end"``.
+
+        Returns:
+            ``(start, end, offsets, objects)`` as for
+            :meth:`cluster_segment_arrays`.
+        """
+        if np is None:
+            raise RuntimeError("numpy is required for the array detection forms.")
+        times = np.asarray(times)
+        values = np.asarray(values, dtype=float)
+        obj_ids = np.asarray(obj_ids, dtype=np.intp)
+        if not times.size:
+            return _ShotDetectionInternal._empty_candidates(times)
+
+        zero = np.abs(values) < 1e-9
+        order = np.lexsort((~zero, times))
+        times, zero, obj_ids = times[order], zero[order], obj_ids[order]
+
+        if key_filter == "zero_as_end":
+            prev_zero = np.concatenate(([True], zero[:-1]))
+            opens = np.flatnonzero(~zero & prev_zero)
+            closes = np.flatnonzero(zero & ~prev_zero)
+            if not opens.size:
+                return _ShotDetectionInternal._empty_candidates(times)
+            # Opens and closes alternate; only the last shot may be unclosed.
+            start = times[opens]
+            end = start + 1.0
+            end[: closes.size] = times[closes]
+            shot = np.where(zero, -1, np.cumsum(~zero & prev_zero) - 1)
+            offsets, objects = _ShotDetectionInternal._group_members(
+                shot, obj_ids, opens.size
+            )
+            return start, end, offsets, objects
+
+        if key_filter == "skip_zero":
+            times, obj_ids = times[~zero], obj_ids[~zero]
+            if not times.size:
+                return _ShotDetectionInternal._empty_candidates(times)
+
+        new = np.concatenate(([True], np.diff(times) > gap_threshold))
+        start = times[new]
+        end = np.empty_like(start, dtype=np.result_type(start, float))
+        end[:-1] = start[1:]
+        end[-1] = start[-1] + 1.0
+        offsets, objects = _ShotDetectionInternal._group_members(
+            np.cumsum(new) - 1, obj_ids, start.size
+        )
+        return start, end, offsets, objects
@@ -18,13 +18,22 @@ the store runs in pure in-memory mode.
 
 from __future__ import annotations
 
+import atexit
+import bisect
+import functools
+import json
 import logging
+import os
+import threading
+import time
+import weakref
 from dataclasses import dataclass, field
 from typing import (
     Any,
     Callable,
     ClassVar,
     Dict,
+    Iterable,
     List,
     Optional,
     Protocol,
@@ -52,6 +61,8 @@ __all__ = [
     "BatchComplete",
     "StoreInvalidated",
     "ScenePersistence",
+    "JournalPersistence",
+    "JsonJournalPersistence",
 ]
 
 
@@ -69,6 +80,167 @@ class ScenePersistence(Protocol):
     def load(self) -> Optional[Dict[str, Any]]: ...
 
 
+@runtime_checkable
+class JournalPersistence(ScenePersistence, Protocol):
+    """A :class:`ScenePersistence` that can also append per-shot deltas.
+
+    ``append(records)`` receives ``{"op": "put", "shot": {...}}`` /
+    ``{"op": "del", "shot_id": n}`` records; ``load()`` must return the
+    snapshot with them replayed.  A backend may expose a truthy
+    ``needs_compaction`` attribute to ask the store for a full ``save`` next.
+    """
+
+    def append(self, records: List[Dict[str, Any]]) -> None: ...
+
+
+class JsonJournalPersistence:
+    """JSON snapshot plus an append-only JSON-lines journal of shot deltas.
+
+    ``save(data)`` atomically rewrites the snapshot at *path* and drops the
+    journal; ``append(records)`` adds one line per record to
+    ``<path>.journal``, so a single-shot edit writes O(1) data however large
+    the store is.  :meth:`load` replays the journal over the snapshot.  Once
+    the journal holds more than *compact_after* records, or outgrows the
+    snapshot, :attr:`needs_compaction` asks the store for a full snapshot
+    instead.
+
+    Crash safety: a torn trailing line (a crash mid-append) is ignored on
+    load and cut off before the next append, so it can't swallow the record
+    written after it.  Each snapshot carries a generation that every journal
+    record is stamped with; a crash between writing a snapshot and dropping
+    the journal leaves records of an older generation, which load skips
+    rather than replaying stale shots over the newer snapshot.
+
+    Parameters:
+        path: Snapshot file.  Its parent directory must exist.
+        compact_after: Journal record count that triggers compaction.
+    """
+
+    JOURNAL_SUFFIX = ".journal"
+    #: Snapshot key holding its generation (stripped from :meth:`load`).
+    GENERATION_KEY = "journal_generation"
+
+    def __init__(self, path: str, compact_after: int = 500):
+        self.path = os.fspath(path)
+        self.journal_path = self.path + self.JOURNAL_SUFFIX
+        self.compact_after = int(compact_after)
+        self._records: Optional[int] = None
+        self._generation: Optional[int] = None
+        # Whether the journal is known to end on a line boundary.
+        self._tail_clean = False
+
+    @property
+    def needs_compaction(self) -> bool:
+        if self._records is None:
+            self._records = len(self._read_journal())
+        if self._records > self.compact_after:
+            return True
+        try:
+            return os.path.getsize(self.journal_path) > os.path.getsize(self.path)
+        except OSError:
+            # No journal (nothing to compact) or no snapshot (write one).
+            return not os.path.exists(self.path)
+
+    def save(self, data: Dict[str, Any]) -> None:
+        from pythontk.file_utils._file_utils import FileUtils
+
+        generation = self._current_generation() + 1
+        FileUtils.atomic_write_text(
+            self.path,
+            json.dumps({**data, self.GENERATION_KEY: generation}, indent=1),
+        )
+        self._generation = generation
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        self._records = 0
+        self._tail_clean = True
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        generation = self._current_generation()
+        lines = "".join(
+            json.dumps({**r, "gen": generation}, separators=(",", ":")) + "\n"
+            for r in records
+        )
+        if not self._tail_clean:
+            self._trim_torn_tail()
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._tail_clean = True
+        if self._records is not None:
+            self._records += len(records)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        data = None
+        generation = 0
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            generation = int(data.pop(self.GENERATION_KEY, 0))
+        self._generation = generation
+        records = self._read_journal()
+        self._records = len(records)
+        records = [r for r in records if r.get("gen", 0) >= generation]
+        if not records:
+            return data
+        data = dict(data or {})
+        shots = {d["shot_id"]: d for d in data.get("shots", [])}
+        for record in records:
+            if record.get("op") == "put":
+                shots[record["shot"]["shot_id"]] = record["shot"]
+            elif record.get("op") == "del":
+                shots.pop(record.get("shot_id"), None)
+        data["shots"] = list(shots.values())
+        return data
+
+    def _current_generation(self) -> int:
+        """The snapshot's generation, read once if neither load nor save ran."""
+        if self._generation is None:
+            self._generation = 0
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._generation = int(json.load(f).get(self.GENERATION_KEY, 0))
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._generation
+
+    def _trim_torn_tail(self) -> None:
+        """Cut the journal back to its last complete line."""
+        try:
+            with open(self.journal_path, "rb+") as f:
+                data = f.read()
+                end = data.rfind(b"\n") + 1
+                if end != len(data):
+                    _log.warning("dropping torn final line of %s", self.journal_path)
+                    f.truncate(end)
+        except FileNotFoundError:
+            pass
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.journal_path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for i, line in enumerate(lines):
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # A torn final line is an append that never completed;
+                # anywhere else it is damage worth reporting.
+                if i < len(lines) - 1:
+                    _log.warning(
+                        "skipping corrupt line %d of %s", i + 1, self.journal_path
+                    )
+        return records
+
+
 # ---------------------------------------------------------------------------
 # Shared shot palette (single source of truth for both UIs)
 # ---------------------------------------------------------------------------
@@ -122,6 +294,31 @@ class ShotBlock:
     locked: bool = False
     description: str = ""
 
+    #: Fields the owning store indexes; a write to one re-keys the shot there.
+    _INDEXED: ClassVar[frozenset] = frozenset(
+        {"shot_id", "name", "start", "end", "objects"}
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        store_ref = self.__dict__.get("_store")
+        if store_ref is None or name not in self._INDEXED:
+            object.__setattr__(self, name, value)
+            return
+        old = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        store = store_ref()
+        if store is not None:
+            store._index.changed(self, name, old)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # A copy or unpickled shot belongs to no store.
+        state = dict(self.__dict__)
+        state.pop("_store", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+
     @property
     def duration(self) -> float:
         return self.end - self.start
@@ -164,6 +361,196 @@ class ShotBlock:
         return result
 
 
+# ---------------------------------------------------------------------------
+# Store indexes
+# ---------------------------------------------------------------------------
+
+
+class _ShotIndex(object):
+    """Lookups a :class:`ShotStore` maintains over its shots.
+
+    Every query the store answers used to be a scan of ``store.shots`` --
+    ``shot_by_id`` per planned move, ``max(shot_id)`` per define, a full sort
+    per ``sorted_shots()`` call -- which is quadratic for a manifest sync of a
+    long-form sequence (5k shots, 50k tracked objects).  These are updated in
+    place by the store's own mutators and, through :meth:`ShotBlock.__setattr__`,
+    by any direct field write on an owned shot (``ShotApply`` commits moves that
+    way), so they never need a rebuild.
+
+    * ``by_id`` / ``by_name`` -- the FIRST shot in list order for a key, as the
+      scans returned.  Insertion order is tracked by a sequence number because
+      ``store.shots`` only ever appends and pops.
+    * ``ordered`` / ``keys`` -- the shots sorted by ``(start, sequence)``,
+      which is ``sorted(shots, key=start)`` including its tie order.  Interval
+      queries add a running maximum of ``end`` over that order, rebuilt lazily.
+    * ``by_object`` -- object name -> the shots listing it.  Kept from the
+      ``objects`` list a shot had when indexed; in-place edits of that list
+      are not seen (assign ``shot.objects`` or use :meth:`ShotStore.update_shot`).
+    """
+
+    def __init__(self, shots: Iterable[ShotBlock] = ()):
+        self.by_id: Dict[int, ShotBlock] = {}
+        #: How many indexed shots hold each id -- a duplicate (possible only
+        #: through ``from_dict`` data) is what makes a rebind scan necessary.
+        self._id_count: Dict[int, int] = {}
+        self.by_name: Dict[str, List[ShotBlock]] = {}
+        self.by_object: Dict[str, Dict[int, ShotBlock]] = {}
+        self.keys: List[Tuple[float, int]] = []
+        self.ordered: List[ShotBlock] = []
+        #: ``id(shot)`` -> insertion sequence.  Also the membership test.
+        self.seq: Dict[int, int] = {}
+        #: ``id(shot)`` -> the objects it is indexed under.
+        self._objects: Dict[int, Tuple[str, ...]] = {}
+        self._counter = 0
+        self._reach: Optional[List[float]] = None
+        self._next_id: Optional[int] = 0
+        for shot in shots:
+            self.add(shot)
+
+    def __len__(self) -> int:
+        return len(self.seq)
+
+    def __contains__(self, shot: ShotBlock) -> bool:
+        return id(shot) in self.seq
+
+    @property
+    def next_id(self) -> int:
+        """``max(shot_id) + 1`` (0 when empty), recomputed only after the max left."""
+        if self._next_id is None:
+            self._next_id = max((s.shot_id for s in self.ordered), default=-1) + 1
+        return self._next_id
+
+    # ---- maintenance -----------------------------------------------------
+
+    def add(self, shot: ShotBlock) -> None:
+        seq = self._counter
+        self._counter += 1
+        self.seq[id(shot)] = seq
+        self.by_id.setdefault(shot.shot_id, shot)
+        self._id_count[shot.shot_id] = self._id_count.get(shot.shot_id, 0) + 1
+        # The newest shot has the highest sequence, so appending keeps order.
+        self.by_name.setdefault(shot.name, []).append(shot)
+        self._index_objects(shot, shot.objects)
+        key = (shot.start, seq)
+        position = bisect.bisect_right(self.keys, key)
+        self.keys.insert(position, key)
+        self.ordered.insert(position, shot)
+        self._reach = None
+        if self._next_id is not None:
+            self._next_id = max(self._next_id, shot.shot_id + 1)
+
+    def discard(self, shot: ShotBlock) -> None:
+        seq = self.seq.pop(id(shot), None)
+        if seq is None:
+            return
+        position = bisect.bisect_left(self.keys, (shot.start, seq))
+        del self.keys[position]
+        del self.ordered[position]
+        self._reach = None
+        self._release_id(shot, shot.shot_id)
+        self._unlist(self.by_name, shot.name, shot)
+        self._unindex_objects(shot)
+        if self._next_id is not None and shot.shot_id + 1 >= self._next_id:
+            self._next_id = None
+
+    def changed(self, shot: ShotBlock, field_name: str, old: Any) -> None:
+        """Re-key *shot* after its *field_name* changed from *old*."""
+        seq = self.seq.get(id(shot))
+        if seq is None:
+            return
+        if field_name == "start":
+            position = bisect.bisect_left(self.keys, (old, seq))
+            del self.keys[position]
+            del self.ordered[position]
+            key = (shot.start, seq)
+            position = bisect.bisect_right(self.keys, key)
+            self.keys.insert(position, key)
+            self.ordered.insert(position, shot)
+            self._reach = None
+        elif field_name == "end":
+            self._reach = None
+        elif field_name == "name":
+            self._unlist(self.by_name, old, shot)
+            names = self.by_name.setdefault(shot.name, [])
+            names.append(shot)
+            names.sort(key=lambda s: self.seq[id(s)])
+        elif field_name == "objects":
+            self._unindex_objects(shot)
+            self._index_objects(shot, shot.objects)
+        elif field_name == "shot_id":
+            self._release_id(shot, old)
+            new = shot.shot_id
+            self._id_count[new] = self._id_count.get(new, 0) + 1
+            holder = self.by_id.get(new)
+            if holder is None or self.seq[id(holder)] > seq:
+                self.by_id[new] = shot
+            self._next_id = None
+
+    def _release_id(self, shot: ShotBlock, shot_id: int) -> None:
+        """Drop *shot*'s claim on *shot_id*, handing it to the next holder."""
+        remaining = self._id_count.get(shot_id, 1) - 1
+        if remaining:
+            self._id_count[shot_id] = remaining
+        else:
+            self._id_count.pop(shot_id, None)
+        if self.by_id.get(shot_id) is not shot:
+            return
+        if not remaining:
+            del self.by_id[shot_id]
+            return
+        owners = [s for s in self.ordered if s.shot_id == shot_id and s is not shot]
+        self.by_id[shot_id] = min(owners, key=lambda s: self.seq[id(s)])
+
+    def _index_objects(self, shot: ShotBlock, objects: Iterable[str]) -> None:
+        indexed = tuple(objects)
+        self._objects[id(shot)] = indexed
+        for obj in indexed:
+            self.by_object.setdefault(obj, {})[id(shot)] = shot
+
+    def _unindex_objects(self, shot: ShotBlock) -> None:
+        for obj in self._objects.pop(id(shot), ()):
+            holders = self.by_object.get(obj)
+            if holders is not None:
+                holders.pop(id(shot), None)
+                if not holders:
+                    del self.by_object[obj]
+
+    @staticmethod
+    def _unlist(table: Dict[str, List[ShotBlock]], key: str, shot: ShotBlock) -> None:
+        """Remove *shot* from ``table[key]`` by identity (dataclass ``==`` is by value)."""
+        entries = table.get(key)
+        if not entries:
+            return
+        for i, entry in enumerate(entries):
+            if entry is shot:
+                del entries[i]
+                break
+        if not entries:
+            del table[key]
+
+    # ---- queries ---------------------------------------------------------
+
+    def overlapping(self, start: float, end: float) -> List[ShotBlock]:
+        """Shots with ``s.start < end and s.end > start``, in start order."""
+        if self._reach is None:
+            reach, running = [], float("-inf")
+            for shot in self.ordered:
+                running = max(running, shot.end)
+                reach.append(running)
+            self._reach = reach
+        # Every shot before ``lo`` ends at or before *start* (the running max
+        # is non-decreasing); every shot from ``hi`` on starts at or after *end*.
+        lo = bisect.bisect_right(self._reach, start)
+        hi = bisect.bisect_left(self.keys, (end, -1))
+        return [s for s in self.ordered[lo:hi] if s.end > start]
+
+    def within(self, start: float, end: float) -> List[ShotBlock]:
+        """Shots with ``start <= s.start and s.end <= end``, in start order."""
+        lo = bisect.bisect_left(self.keys, (start, -1))
+        hi = bisect.bisect_right(self.keys, (end, float("inf")))
+        return [s for s in self.ordered[lo:hi] if s.end <= end]
+
+
 # ---------------------------------------------------------------------------
 # Export-view helpers (shot → FBX takes + Unity metadata)
 # ---------------------------------------------------------------------------
@@ -249,11 +636,46 @@ class StoreInvalidated(StoreEvent):
     name: ClassVar[str] = "store_invalidated"
 
 
+# ---------------------------------------------------------------------------
+# Deferred flushes
+# ---------------------------------------------------------------------------
+
+#: Stores with a debounced flush still pending; written out at interpreter exit.
+_PENDING_FLUSHES: "weakref.WeakSet[ShotStore]" = weakref.WeakSet()
+
+
+def _flush_pending_stores() -> None:
+    """Write every store whose deferred flush has not run yet (``atexit``)."""
+    for store in list(_PENDING_FLUSHES):
+        try:
+            store.flush()
+        except Exception:
+            _log.warning("shot store flush at exit failed", exc_info=True)
+
+
+atexit.register(_flush_pending_stores)
+
+
 # ---------------------------------------------------------------------------
 # ShotStore
 # ---------------------------------------------------------------------------
 
 
+def _under_save_lock(method: Callable) -> Callable:
+    """Run a :class:`ShotStore` mutator holding the store's save lock.
+
+    A deferred flush serializes the store on a timer thread; holding the
+    same lock for every mutation means it never sees one half-applied.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._save_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class _ShotStoreInternal(object):
     """Internal helpers for ShotStore."""
 
@@ -275,6 +697,10 @@ class ShotStore(_ShotStoreInternal):
     :meth:`_resolve_long_names`, :meth:`_schedule_flush`), each with a pure
     default; mayatk / blendertk subclass this and override them.
 
+    Saves are immediate by default.  Set :attr:`flush_delay` to coalesce a
+    burst of mutations into one write (see :meth:`_schedule_flush`), and use a
+    :class:`JournalPersistence` backend to write single-shot edits as deltas.
+
     Parameters:
         shots: Initial shot list.  Copied on construction.
     """
@@ -292,12 +718,23 @@ class ShotStore(_ShotStoreInternal):
     DEFAULT_INITIAL_SHOT_LENGTH: float = 200.0
     DEFAULT_FIT_MODE: str = "extend_only"
     DEFAULT_SNAP_WHOLE_FRAMES: bool = True
+    DEFAULT_FLUSH_DELAY: float = 0.0
+    DEFAULT_MAX_FLUSH_LATENCY: float = 2.0
 
     def __init__(
         self,
         shots: Optional[List[ShotBlock]] = None,
     ):
-        self.shots: List[ShotBlock] = list(shots) if shots else []
+        # Held by every mutator and by save(), so a deferred flush on the
+        # timer thread serializes a consistent store.
+        self._save_lock = threading.RLock()
+        self._shots: List[ShotBlock] = []
+        self._index = _ShotIndex()
+        #: Shots :meth:`remove_shot` dropped from the index but not yet from
+        #: :attr:`shots` (by ``id``; held so the ids stay unique), compacted
+        #: on next access -- N removals cost one pass, not N.
+        self._removed: Dict[int, ShotBlock] = {}
+        self.shots = list(shots) if shots else []
         self.hidden_objects: set = set()
         self.pinned_objects: set = set()
         self.markers: List[Dict[str, Any]] = []
@@ -331,6 +768,23 @@ class ShotStore(_ShotStoreInternal):
         self._batch_depth: int = 0
         self._batch_events: List[tuple] = []
         self._dirty: bool = False
+        # Save coalescing (session-only, not persisted).  ``flush_delay`` 0
+        # keeps the write-per-mutation behaviour; otherwise writes wait for
+        # that much quiet, but never more than ``max_flush_latency`` seconds.
+        self.flush_delay: float = self.DEFAULT_FLUSH_DELAY
+        self.max_flush_latency: float = self.DEFAULT_MAX_FLUSH_LATENCY
+        self._flush_timer: Any = None
+        self._flush_deadline: Optional[float] = None
+        self._dirty_since: Optional[float] = None
+        # Bumped by every mutation so a save racing one can't clear ``_dirty``.
+        self._dirty_gen: int = 0
+        # Journal deltas since the last write: shot_id -> shot (``None`` =
+        # removed).  ``_full_save`` marks a change deltas can't express; a
+        # journal is only appended to the backend the last write went to.
+        self._pending_shots: Dict[int, Optional[ShotBlock]] = {}
+        self._full_save: bool = False
+        self._saved_backend: Optional[ScenePersistence] = None
+        self._saved_prefs: Optional[Dict[str, Any]] = None
 
     # ---- scene hooks (overridable; pure defaults) ------------------------
 
@@ -406,11 +860,82 @@ class ShotStore(_ShotStoreInternal):
     def _schedule_flush(self) -> None:
         """Flush the dirty store to persistence (overridable hook).
 
-        Pure default: flush immediately.  DCC subclasses may override to
-        coalesce rapid mutations into a single deferred write (e.g. Maya's
-        ``cmds.evalDeferred``).
+        Pure default: with :attr:`flush_delay` ``0`` flush immediately.
+        Otherwise debounce -- each mutation pushes the write ``flush_delay``
+        seconds out, capped at ``max_flush_latency`` after the first unsaved
+        change, so a drag of N edits costs one write.  The wait runs on
+        :meth:`_defer_flush`; :meth:`flush` and interpreter exit write any
+        pending change.  DCC subclasses may instead override this to coalesce
+        on their own idle loop (e.g. Maya's ``cmds.evalDeferred``).
+        """
+        if self.flush_delay <= 0:
+            self._flush_dirty()
+            return
+        with self._save_lock:
+            now = time.monotonic()
+            if self._dirty_since is None:
+                self._dirty_since = now
+            self._flush_deadline = min(
+                now + self.flush_delay, self._dirty_since + self.max_flush_latency
+            )
+            _PENDING_FLUSHES.add(self)
+            if self._flush_timer is None:
+                self._flush_timer = self._defer_flush(self._flush_deadline - now)
+
+    def _defer_flush(self, delay: float) -> Any:
+        """Call :meth:`_on_flush_timer` after *delay* seconds (overridable hook).
+
+        Returns a handle with ``cancel()``.  Pure default: a daemon
+        ``threading.Timer``, so the write happens off the calling thread;
+        :meth:`save` serializes under the save lock every mutator holds.
+        DCC subclasses whose scene may only be touched from the main thread
+        override this to use their own timer (``QTimer.singleShot``, Blender's
+        ``bpy.app.timers``).
         """
-        self._flush_dirty()
+        timer = threading.Timer(max(delay, 0.0), self._on_flush_timer)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def _on_flush_timer(self) -> None:
+        """Timer callback: flush, or re-arm if mutations moved the deadline."""
+        with self._save_lock:
+            self._flush_timer = None
+            if self._flush_deadline is None:
+                return
+            remaining = self._flush_deadline - time.monotonic()
+            if remaining > 0.001:
+                self._flush_timer = self._defer_flush(remaining)
+                return
+        try:
+            self.flush()
+        except Exception:
+            # Still dirty: the next mutation, flush() or exit retries.
+            _log.warning("deferred shot store flush failed", exc_info=True)
+
+    def _cancel_flush(self) -> None:
+        """Drop any pending deferred flush without writing."""
+        with self._save_lock:
+            timer, self._flush_timer = self._flush_timer, None
+            self._flush_deadline = None
+            _PENDING_FLUSHES.discard(self)
+        if timer is not None:
+            timer.cancel()
+
+    def flush(self) -> bool:
+        """Write pending changes now, cancelling any deferred flush.
+
+        Hosts call this from their before-save / shutdown hooks; it also runs
+        at interpreter exit for every store with a flush still pending.
+
+        Returns:
+            ``True`` if a save ran, ``False`` if the store was clean.
+        """
+        self._cancel_flush()
+        if not self._dirty:
+            return False
+        self.save()
+        return True
 
     # ---- active shot (session state, not persisted) ----------------------
 
@@ -479,23 +1004,26 @@ class ShotStore(_ShotStoreInternal):
         """Defer listener notifications until the block exits.
 
         On exit a single ``"batch_complete"`` event is fired instead of
-        the individual events that were accumulated.
+        the individual events that were accumulated.  The block holds the
+        store's save lock, so direct :class:`ShotBlock` edits made inside it
+        are never serialized half-done by a deferred flush.
         """
-        self._batch_depth += 1
-        try:
-            yield
-        finally:
-            self._batch_depth -= 1
-            if self._batch_depth == 0:
-                if self._batch_events:
-                    self._batch_events.clear()
-                    self._notify(BatchComplete())
-                # Synchronous flush — batch = single atomic write.
-                # Runs even with no accumulated events: mark_dirty
-                # inside a batch defers its flush to here, and mutators
-                # that don't notify (pin/hide/gap-lock) would otherwise
-                # leave the dirty store unscheduled for save.
-                self._flush_dirty()
+        with self._save_lock:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    if self._batch_events:
+                        self._batch_events.clear()
+                        self._notify(BatchComplete())
+                    # Synchronous flush — batch = single atomic write.
+                    # Runs even with no accumulated events: mark_dirty
+                    # inside a batch defers its flush to here, and mutators
+                    # that don't notify (pin/hide/gap-lock) would otherwise
+                    # leave the dirty store unscheduled for save.
+                    self._flush_dirty()
 
     # ---- gap locking -----------------------------------------------------
 
@@ -503,6 +1031,7 @@ class ShotStore(_ShotStoreInternal):
         """Return whether the gap between two adjacent shots is locked."""
         return (left_id, right_id) in self.locked_gaps
 
+    @_under_save_lock
     def lock_gap(self, left_id: int, right_id: int) -> None:
         """Lock a gap so its width is preserved during global respace."""
         key = (left_id, right_id)
@@ -510,12 +1039,14 @@ class ShotStore(_ShotStoreInternal):
             self.locked_gaps.add(key)
             self.mark_dirty()
 
+    @_under_save_lock
     def unlock_gap(self, left_id: int, right_id: int) -> None:
         """Unlock a gap so it follows the global gap value."""
         if (left_id, right_id) in self.locked_gaps:
             self.locked_gaps.discard((left_id, right_id))
             self.mark_dirty()
 
+    @_under_save_lock
     def lock_all_gaps(self) -> None:
         """Lock every adjacent gap."""
         sorted_shots = self.sorted_shots()
@@ -525,6 +1056,7 @@ class ShotStore(_ShotStoreInternal):
         if len(self.locked_gaps) != before:
             self.mark_dirty()
 
+    @_under_save_lock
     def unlock_all_gaps(self) -> None:
         """Unlock every gap."""
         if self.locked_gaps:
@@ -555,6 +1087,9 @@ class ShotStore(_ShotStoreInternal):
             data = persistence.load() if persistence is not None else None
             if data:
                 cls._active = cls.from_dict(data)
+                # The backend already holds exactly this state, so the
+                # first edit may go to its journal as a delta.
+                cls._active._saved_backend = persistence
                 # Reconcile FPS: if the scene was saved at a different
                 # framerate, rescale shot timings to match the current one.
                 current_fps = cls._active._scene_fps()
@@ -570,12 +1105,26 @@ class ShotStore(_ShotStoreInternal):
 
     @classmethod
     def set_active(cls, store: "ShotStore") -> None:
-        """Replace the active store instance."""
+        """Replace the active store instance.
+
+        A deferred flush still pending on the outgoing store is written first,
+        so it can't land on the shared backend after the new store's saves.
+        """
+        old = cls._active
+        if old is not None and old is not store:
+            old.flush()
         cls._active = store
 
     @classmethod
     def clear_active(cls) -> None:
-        """Reset the active store and persistence backend."""
+        """Reset the active store and persistence backend.
+
+        A deferred flush still pending on the discarded store is cancelled,
+        not written: by now the host may already be in another scene (call
+        :meth:`flush` from the host's before-close hook to keep it).
+        """
+        if cls._active is not None:
+            cls._active._cancel_flush()
         cls._active = None
         if cls._persistence is not None:
             # Tear down the backend's scene callbacks — dropping the
@@ -646,8 +1195,6 @@ class ShotStore(_ShotStoreInternal):
         file is absent or unreadable.  A DCC adapter may override this (and
         :meth:`_save_user_prefs`) to use its own store — pythontk stays zero-dep.
         """
-        import json
-
         try:
             path = self._prefs_path()
             if not path.exists():
@@ -681,28 +1228,28 @@ class ShotStore(_ShotStoreInternal):
             self.snap_whole_frames = bool(data.get("snap_whole_frames"))
 
     def _save_user_prefs(self) -> None:
-        """Persist detection preferences to the cross-scene prefs file (zero-dep JSON)."""
-        import json
+        """Persist detection preferences to the cross-scene prefs file (zero-dep JSON).
 
+        Skipped when the preferences are unchanged since this store last
+        wrote them -- most saves are shot edits that don't touch them.
+        """
+        prefs = {
+            "detection_mode": self.detection_mode,
+            "select_on_load": self.select_on_load,
+            "detection_threshold": self.detection_threshold,
+            "fit_mode": self.fit_mode,
+            "initial_shot_length": self.initial_shot_length,
+            "snap_whole_frames": self.snap_whole_frames,
+        }
+        if prefs == self._saved_prefs:
+            return
         try:
             path = self._prefs_path()
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(
-                json.dumps(
-                    {
-                        "detection_mode": self.detection_mode,
-                        "select_on_load": self.select_on_load,
-                        "detection_threshold": self.detection_threshold,
-                        "fit_mode": self.fit_mode,
-                        "initial_shot_length": self.initial_shot_length,
-                        "snap_whole_frames": self.snap_whole_frames,
-                    },
-                    indent=2,
-                ),
-                encoding="utf-8",
-            )
+            path.write_text(json.dumps(prefs, indent=2), encoding="utf-8")
         except Exception:
-            pass
+            return
+        self._saved_prefs = prefs
 
     # ---- frame snapping --------------------------------------------------
 
@@ -738,25 +1285,77 @@ class ShotStore(_ShotStoreInternal):
         median = gaps[mid] if len(gaps) % 2 else round((gaps[mid - 1] + gaps[mid]) / 2)
         return float(median)
 
+    # ---- indexes ---------------------------------------------------------
+
+    @property
+    def shots(self) -> List[ShotBlock]:
+        """The shots, in definition order.
+
+        Add and remove through :meth:`define_shot` / :meth:`remove_shot` (or
+        assign a new list); the lookups below are indexed off this list.  A
+        direct ``append``/``pop`` is detected and triggers a full reindex.
+        """
+        if self._removed:
+            removed, self._removed = self._removed, {}
+            self._shots[:] = [s for s in self._shots if id(s) not in removed]
+        return self._shots
+
+    @shots.setter
+    @_under_save_lock
+    def shots(self, shots: List[ShotBlock]) -> None:
+        for shot in self._shots:
+            shot.__dict__.pop("_store", None)
+        self._shots = list(shots)
+        self._removed = {}
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild :class:`_ShotIndex` from :attr:`shots` and claim every shot."""
+        ref = weakref.ref(self)
+        for shot in self.shots:
+            shot.__dict__["_store"] = ref
+        self._index = _ShotIndex(self._shots)
+
+    def _indexed(self) -> _ShotIndex:
+        """The index, rebuilt first if :attr:`shots` was edited behind it."""
+        if len(self._index) != len(self._shots) - len(self._removed):
+            self._reindex()
+        return self._index
+
+    def shots_overlapping(self, start: float, end: float) -> List[ShotBlock]:
+        """Shots whose range overlaps ``(start, end)``, ordered by start.
+
+        Overlap is strict (``s.start < end and s.end > start``), so shots that
+        merely touch at a boundary frame are not included.
+        """
+        return self._indexed().overlapping(start, end)
+
+    def shots_within(self, start: float, end: float) -> List[ShotBlock]:
+        """Shots lying entirely inside ``[start, end]``, ordered by start."""
+        return self._indexed().within(start, end)
+
+    def shots_with_object(self, obj_name: str) -> List[ShotBlock]:
+        """Shots whose object list contains *obj_name*, ordered by start."""
+        index = self._indexed()
+        holders = index.by_object.get(obj_name) or {}
+        shots = [s for s in holders.values() if obj_name in s.objects]
+        return sorted(shots, key=lambda s: (s.start, index.seq[id(s)]))
+
     # ---- CRUD ------------------------------------------------------------
 
     def sorted_shots(self) -> List[ShotBlock]:
         """Return shots ordered by start time."""
-        return sorted(self.shots, key=lambda s: s.start)
+        return list(self._indexed().ordered)
 
     def shot_by_id(self, shot_id: int) -> Optional[ShotBlock]:
-        for s in self.shots:
-            if s.shot_id == shot_id:
-                return s
-        return None
+        return self._indexed().by_id.get(shot_id)
 
     def shot_by_name(self, name: str) -> Optional[ShotBlock]:
         """Return the first shot whose name matches *name*, or ``None``."""
-        for s in self.shots:
-            if s.name == name:
-                return s
-        return None
+        named = self._indexed().by_name.get(name)
+        return named[0] if named else None
 
+    @_under_save_lock
     def define_shot(
         self,
         name: str,
@@ -786,7 +1385,7 @@ class ShotStore(_ShotStoreInternal):
             # Preserve the caller's name form (short or long).  Live path
             # reconciliation is a DCC concern handled by subclasses.
             objects = list(objects)
-        new_id = max((s.shot_id for s in self.shots), default=-1) + 1
+        new_id = self._indexed().next_id
         block = ShotBlock(
             shot_id=new_id,
             name=name,
@@ -797,11 +1396,14 @@ class ShotStore(_ShotStoreInternal):
             locked=locked,
             description=description,
         )
-        self.shots.append(block)
+        self._shots.append(block)
+        block.__dict__["_store"] = weakref.ref(self)
+        self._index.add(block)
         self._notify(ShotDefined(shot=block))
-        self.mark_dirty()
+        self._mark_shot_dirty(block.shot_id, block)
         return block
 
+    @_under_save_lock
     def update_shot(
         self,
         shot_id: int,
@@ -842,18 +1444,21 @@ class ShotStore(_ShotStoreInternal):
         if metadata is not None:
             shot.metadata = dict(metadata)
         self._notify(ShotUpdated(shot=shot))
-        self.mark_dirty()
+        self._mark_shot_dirty(shot.shot_id, shot)
         return shot
 
+    @_under_save_lock
     def remove_shot(self, shot_id: int) -> bool:
         """Remove a shot by ID.  Returns ``True`` if found."""
-        for i, s in enumerate(self.shots):
-            if s.shot_id == shot_id:
-                self.shots.pop(i)
-                self._notify(ShotRemoved(shot_id=shot_id))
-                self.mark_dirty()
-                return True
-        return False
+        shot = self.shot_by_id(shot_id)
+        if shot is None:
+            return False
+        self._index.discard(shot)
+        self._removed[id(shot)] = shot
+        shot.__dict__.pop("_store", None)
+        self._notify(ShotRemoved(shot_id=shot_id))
+        self._mark_shot_dirty(shot_id, None)
+        return True
 
     def append_shot(
         self,
@@ -900,6 +1505,7 @@ class ShotStore(_ShotStoreInternal):
         """Return True if *obj_name* is hidden in the sequencer UI."""
         return obj_name in self.hidden_objects
 
+    @_under_save_lock
     def set_object_hidden(self, obj_name: str, hidden: bool = True) -> None:
         """Show or hide *obj_name* in the sequencer UI."""
         if hidden == (obj_name in self.hidden_objects):
@@ -916,6 +1522,7 @@ class ShotStore(_ShotStoreInternal):
         """Return True if *obj_name* is pinned (kept even when missing)."""
         return obj_name in self.pinned_objects
 
+    @_under_save_lock
     def set_object_pinned(self, obj_name: str, pinned: bool = True) -> None:
         """Pin or unpin *obj_name*.
 
@@ -933,13 +1540,14 @@ class ShotStore(_ShotStoreInternal):
 
     # ---- object removal --------------------------------------------------
 
+    @_under_save_lock
     def remove_object_from_shots(self, obj_name: str) -> None:
         """Remove *obj_name* from every shot's object list."""
         changed = False
-        for shot in self.shots:
-            if obj_name in shot.objects:
-                shot.objects.remove(obj_name)
-                changed = True
+        for shot in self.shots_with_object(obj_name):
+            # Assigned, not edited in place, so the index sees the change.
+            shot.objects = [o for o in shot.objects if o != obj_name]
+            changed = True
         if obj_name in self.pinned_objects:
             self.pinned_objects.discard(obj_name)
             changed = True
@@ -954,19 +1562,7 @@ class ShotStore(_ShotStoreInternal):
     def to_dict(self) -> Dict[str, Any]:
         """Serialise shots and settings to a plain dict."""
         return {
-            "shots": [
-                {
-                    "shot_id": s.shot_id,
-                    "name": s.name,
-                    "start": s.start,
-                    "end": s.end,
-                    "objects": list(s.objects),
-                    "metadata": dict(s.metadata) if s.metadata else {},
-                    "locked": s.locked,
-                    "description": s.description,
-                }
-                for s in self.sorted_shots()
-            ],
+            "shots": [self._shot_to_dict(s) for s in self.sorted_shots()],
             "hidden_objects": sorted(self.hidden_objects),
             "pinned_objects": sorted(self.pinned_objects),
             "markers": list(self.markers),
@@ -985,6 +1581,20 @@ class ShotStore(_ShotStoreInternal):
             "clip_name_strategy": self.clip_name_strategy,
         }
 
+    @staticmethod
+    def _shot_to_dict(shot: ShotBlock) -> Dict[str, Any]:
+        """Serialise one shot (a :meth:`to_dict` entry / journal record)."""
+        return {
+            "shot_id": shot.shot_id,
+            "name": shot.name,
+            "start": shot.start,
+            "end": shot.end,
+            "objects": list(shot.objects),
+            "metadata": dict(shot.metadata) if shot.metadata else {},
+            "locked": shot.locked,
+            "description": shot.description,
+        }
+
     def to_export_view(self, strategy: str = "name") -> Dict[str, Any]:
         """Build the FBX/Unity export view from the current shots.
 
@@ -1141,6 +1751,7 @@ class ShotStore(_ShotStoreInternal):
 
     # ---- persistence convenience -----------------------------------------
 
+    @_under_save_lock
     def rescale_to_fps(self, new_fps: float) -> None:
         """Scale all shot timings from the current ``scene_fps`` to *new_fps*.
 
@@ -1166,14 +1777,31 @@ class ShotStore(_ShotStoreInternal):
         self.mark_dirty()
         self._notify(BatchComplete())
 
+    @_under_save_lock
     def mark_dirty(self) -> None:
         """Flag the store as needing a save.
 
         Inside a :meth:`batch_update` block the flush is deferred to the block
         exit.  Otherwise the flush is scheduled via :meth:`_schedule_flush`
-        (immediate in the pure core; DCC subclasses may coalesce).
+        (immediate unless :attr:`flush_delay` is set; DCC subclasses may
+        coalesce).  The next save writes a full snapshot -- the store can't
+        tell what an outside caller changed.
+        """
+        self._full_save = True
+        self._set_dirty()
+
+    def _mark_shot_dirty(self, shot_id: int, shot: Optional[ShotBlock]) -> None:
+        """:meth:`mark_dirty` for a change confined to one shot (``None`` = removed).
+
+        Recorded as a delta, so a :class:`JournalPersistence` backend can
+        append it instead of rewriting the store.
         """
+        self._pending_shots[shot_id] = shot
+        self._set_dirty()
+
+    def _set_dirty(self) -> None:
         self._dirty = True
+        self._dirty_gen += 1
         if self._batch_depth > 0:
             return
         self._schedule_flush()
@@ -1192,11 +1820,24 @@ class ShotStore(_ShotStoreInternal):
         them — installs the before-export preparer so any DCC export ships the
         current export view (see :meth:`enable_auto_export`).
         """
-        if self._persistence is not None:
-            self._persistence.save(self.to_dict())
-        # Clear only after a successful write — clearing first would
-        # silently discard the pending changes if the backend raises.
-        self._dirty = False
+        with self._save_lock:
+            generation = self._dirty_gen
+            pending, self._pending_shots = self._pending_shots, {}
+            full, self._full_save = self._full_save, False
+            try:
+                self._write(pending, full)
+            except Exception:
+                # Keep the deltas (newer ones win) for the retry.
+                for shot_id, shot in pending.items():
+                    self._pending_shots.setdefault(shot_id, shot)
+                self._full_save = self._full_save or full
+                raise
+            # Clear only after a successful write — clearing first would
+            # silently discard the pending changes if the backend raises —
+            # and only if no mutation landed while it was being written.
+            if generation == self._dirty_gen:
+                self._dirty = False
+                self._dirty_since = None
         if self.auto_publish_export:
             try:
                 self.publish_export_view()
@@ -1206,6 +1847,32 @@ class ShotStore(_ShotStoreInternal):
             type(self)._register_export_preparer()
         self._save_user_prefs()
 
+    def _write(self, pending: Dict[int, Optional[ShotBlock]], full: bool) -> None:
+        """Write *pending* shot deltas, or a full snapshot when they can't do."""
+        persistence = self._persistence
+        if persistence is None:
+            return
+        if (
+            pending
+            and not full
+            and persistence is self._saved_backend
+            and isinstance(persistence, JournalPersistence)
+            and not getattr(persistence, "needs_compaction", False)
+        ):
+            persistence.append(
+                [
+                    (
+                        {"op": "put", "shot": self._shot_to_dict(shot)}
+                        if shot is not None
+                        else {"op": "del", "shot_id": shot_id}
+                    )
+                    for shot_id, shot in pending.items()
+                ]
+            )
+            return
+        persistence.save(self.to_dict())
+        self._saved_backend = persistence
+
     # ---- detection convenience -------------------------------------------
 
     @property
@@ -1219,12 +1886,7 @@ class ShotStore(_ShotStoreInternal):
 
     def _overlaps_existing(self, candidate: Dict[str, Any]) -> bool:
         """True if *candidate* overlaps any existing shot's range."""
-        c_start = candidate["start"]
-        c_end = candidate["end"]
-        for shot in self.shots:
-            if c_start < shot.end and c_end > shot.start:
-                return True
-        return False
+        return bool(self.shots_overlapping(candidate["start"], candidate["end"]))
 
     def detect_and_define(self, overwrite: bool = False) -> List[ShotBlock]:
         """Detect shot regions and define them in the store.
@@ -39,6 +39,7 @@ if TYPE_CHECKING:
     from PIL import Image
 
 # From this package:
+from pythontk.core_utils.cancel_scope import CancelScope, CancellableExecutor
 from pythontk.core_utils.class_property import ClassProperty
 from pythontk.core_utils.logging_mixin import LoggingMixin
 from pythontk.img_utils._img_utils import ImgUtils
@@ -1488,6 +1489,7 @@ class MapFactory(LoggingMixin):
         return extracted
 
     @classmethod
+    @LoggingMixin.traced()
     def prepare_maps(
         cls,
         source: Union[str, List[str]],
@@ -1612,7 +1614,6 @@ class MapFactory(LoggingMixin):
                 logger.info(f"Found {total_sets} texture sets. Processing batch...")
 
         if max_workers > 1 and total_sets > 1:
-            import concurrent.futures
 
             def process_set(args):
                 i, base_name, textures = args
@@ -1635,9 +1636,9 @@ class MapFactory(LoggingMixin):
                     traceback.print_exc()
                     return base_name, []
 
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=max_workers
-            ) as executor:
+            # Sets see the caller's ambient CancelScope; a cancel drops the
+            # queued sets at once and raises OperationCancelled here.
+            with CancellableExecutor(max_workers=max_workers) as executor:
                 tasks = [
                     (i, base_name, textures)
                     for i, (base_name, textures) in enumerate(texture_sets.items(), 1)
@@ -1647,7 +1648,7 @@ class MapFactory(LoggingMixin):
                 }
 
                 completed_count = 0
-                for future in concurrent.futures.as_completed(future_to_set):
+                for future in executor.as_completed(future_to_set):
                     completed_count += 1
                     # Retrieve the original task arguments
                     _, base_name_task, _ = future_to_set[future]
@@ -1662,6 +1663,7 @@ class MapFactory(LoggingMixin):
                         results[base_name] = generated
         else:
             for i, (base_name, textures) in enumerate(texture_sets.items(), 1):
+                CancelScope.check()
                 if progress_callback:
                     progress_callback(i, total_sets, f"Processing {base_name}")
 
@@ -1690,6 +1692,7 @@ class MapFactory(LoggingMixin):
         return results
 
     @classmethod
+    @LoggingMixin.traced()
     def _process_map_set(
         cls,
         textures: List[str],
@@ -1735,7 +1738,8 @@ class MapFactory(LoggingMixin):
             for handler_class in MapFactory._workflow_handlers:
                 handler = handler_class()
                 if handler.can_handle(context):
-                    result = handler.process(context)
+                    with MapFactory.trace_span(handler_class.__name__):
+                        result = handler.process(context)
                     if result:
                         if isinstance(result, list):
                             output_maps.extend(result)
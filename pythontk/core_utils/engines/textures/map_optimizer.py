@@ -16,8 +16,11 @@ Architecture:
 from __future__ import annotations
 
 import os
+import json
 import math
+import hashlib
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Tuple, Dict, Any, Optional
 
@@ -30,6 +33,7 @@ except ImportError as e:
 # From this package:
 from pythontk.core_utils.help_mixin import HelpMixin
 from pythontk.file_utils._file_utils import FileUtils
+from pythontk.file_utils.metadata import Metadata
 from pythontk.img_utils._img_utils import ImgUtils
 from pythontk.core_utils.engines.textures.map_factory import MapFactory
 from pythontk.core_utils.engines.textures.map_registry import MapRegistry
@@ -38,6 +42,7 @@ from pythontk.core_utils.engines.textures.output_template import (
     OutputSpec,
     OutputTemplates,
 )
+from pythontk.core_utils.engines.textures.mat_report import MatReport
 
 
 # Modes that are a target mode's channel layout at HIGHER precision.
@@ -1009,6 +1014,55 @@ class MapOptimizer(HelpMixin):
         Returns:
             str: Path to the optimized texture.
         """
+        return cls._optimize_map_record(
+            texture_path,
+            output_dir=output_dir,
+            output_type=output_type,
+            max_size=max_size,
+            force_pot=force_pot,
+            suffix_old=suffix_old,
+            suffix_opt=suffix_opt,
+            old_files_folder=old_files_folder,
+            optimize_bit_depth=optimize_bit_depth,
+            check_existing=check_existing,
+            map_type=map_type,
+            allow_palette=allow_palette,
+            output_profile=output_profile,
+            enforce_budget=enforce_budget,
+            lossy_quality=lossy_quality,
+            pot_mode=pot_mode,
+        )["output"]
+
+    @classmethod
+    def _optimize_map_record(
+        cls,
+        texture_path: str,
+        output_dir: str = None,
+        output_type: str = None,
+        max_size: int = None,
+        force_pot: Optional[bool] = None,
+        suffix_old: str = None,
+        suffix_opt: str = None,
+        old_files_folder: str = None,
+        optimize_bit_depth: bool = True,
+        check_existing: bool = False,
+        map_type: str = None,
+        allow_palette: bool = False,
+        output_profile: str = None,
+        enforce_budget: bool = False,
+        lossy_quality: int = None,
+        pot_mode: Optional[str] = None,
+        stamp: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """:meth:`optimize_map`, returning what it did as a record.
+
+        ``{source, output, skipped, bytes_before, bytes_after, dims_before,
+        dims_after, ops, warnings}`` -- ``skipped`` is None, ``"existing"``
+        (*check_existing* found a newer output) or ``"unchanged"`` (the
+        output's :attr:`STAMP_KEY` sidecar matches *stamp*; see
+        :meth:`batch_optimize_maps`). Every warning is printed as well as
+        recorded. With *stamp*, a written output is stamped with it.
+        """
         ImgUtils.assert_pathlike(texture_path, "texture_path")
 
         if output_dir is None:
@@ -1053,22 +1107,45 @@ class MapOptimizer(HelpMixin):
         # container written, not of the requested one.
         out_ext = os.path.splitext(final_output_path)[1]
 
+        # Read the source's on-disk size before any archive/overwrite step can
+        # move or replace it — it's the "from" half of the size report below.
+        size_before = (
+            os.path.getsize(texture_path) if os.path.isfile(texture_path) else None
+        )
+        record: Dict[str, Any] = {
+            "source": texture_path,
+            "output": final_output_path,
+            "skipped": None,
+            "bytes_before": size_before,
+            "bytes_after": None,
+            "dims_before": None,
+            "dims_after": None,
+            "ops": [],
+            "warnings": [],
+        }
+
+        def warn(message: str) -> None:
+            print(message)
+            record["warnings"].append(message.lstrip("# "))
+
         if check_existing and os.path.exists(final_output_path):
             if os.path.getmtime(final_output_path) > os.path.getmtime(texture_path):
                 print(
                     f"Skipping optimization (existing/newer): "
                     f"{os.path.basename(final_output_path)}"
                 )
-                return final_output_path
+                record["skipped"] = "existing"
+                return record
 
-        # Read the source's on-disk size before any archive/overwrite step can
-        # move or replace it — it's the "from" half of the size report below.
-        size_before = (
-            os.path.getsize(texture_path) if os.path.isfile(texture_path) else None
-        )
+        if stamp and cls._stamp_matches(texture_path, final_output_path, stamp):
+            record["skipped"] = "unchanged"
+            record["bytes_after"] = os.path.getsize(final_output_path)
+            return record
+        source_stat = cls._file_stat(texture_path)
 
         image = ImgUtils.ensure_image(texture_path)
         dims_before = image.size
+        record["dims_before"] = dims_before
 
         plan = cls.plan(
             image,
@@ -1090,8 +1167,9 @@ class MapOptimizer(HelpMixin):
                 f"to {max_size}x{max_size} .."
             )
 
+        record["ops"] = [op.description for op in plan]
         for message in cls._plan_warnings(plan):
-            print(f"# Warning: {os.path.basename(final_output_path)}: {message}")
+            warn(f"# Warning: {os.path.basename(final_output_path)}: {message}")
 
         image = cls.apply(image, plan)
 
@@ -1122,7 +1200,7 @@ class MapOptimizer(HelpMixin):
         container_mode = ImgUtils.effective_mode(image.mode, out_ext)
         if container_mode != image.mode:
             lost = cls.channel_loss_warning(image, out_ext)
-            print(
+            warn(
                 f"# {os.path.basename(final_output_path)}: "
                 f"'{out_ext.lstrip('.')}' cannot store {image.mode}; "
                 f"written as {container_mode}."
@@ -1141,7 +1219,7 @@ class MapOptimizer(HelpMixin):
             spec,
         )
         if quality_skipped:
-            print(
+            warn(
                 f"# {os.path.basename(final_output_path)}: {quality_skipped}"
             )
 
@@ -1153,7 +1231,7 @@ class MapOptimizer(HelpMixin):
             cls.resolve_compression(map_type_key, out_ext, spec)
         )
         if compression_note:
-            print(f"# {os.path.basename(final_output_path)}: {compression_note}")
+            warn(f"# {os.path.basename(final_output_path)}: {compression_note}")
 
         # Route through the capability-aware writer (single save SSoT) so the
         # correct backend handles each format (PIL for most, cv2 for EXR/HDR).
@@ -1182,11 +1260,20 @@ class MapOptimizer(HelpMixin):
         # it is the aspect ratio not being paid for - and saying so is the point.
         if budget:
             for message in budget.check(*image.size):
-                print(
+                warn(
                     f"# Warning: {os.path.basename(final_output_path)} "
                     f"[{output_profile}]: {message}"
                 )
-        return final_output_path
+
+        record["dims_after"] = image.size
+        record["bytes_after"] = (
+            os.path.getsize(final_output_path)
+            if os.path.isfile(final_output_path)
+            else None
+        )
+        if stamp:
+            cls._write_stamp(final_output_path, stamp, source_stat)
+        return record
 
     @staticmethod
     def channel_loss_warning(image: "Image.Image", ext: str) -> Optional[str]:
@@ -1264,21 +1351,138 @@ class MapOptimizer(HelpMixin):
 
         return f"{dims}, {ImgUtils.format_bit_depth(image)}, {sizes}"
 
+    #: Sidecar key (``<output>.metadata.json``, see :class:`Metadata`) under
+    #: which :meth:`batch_optimize_maps` stamps each output it writes.
+    STAMP_KEY = "MapOptimizerStamp"
+    #: Folded into every settings digest — bump when optimize_map's output for
+    #: the same settings changes, so existing stamps stop matching.
+    STAMP_VERSION = 1
+
     @classmethod
-    def batch_optimize_maps(cls, directory: str, **kwargs):
+    def batch_optimize_maps(
+        cls,
+        directory: str,
+        workers: int = 0,
+        skip_unchanged: bool = True,
+        report: bool = True,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
         """Batch optimizes all maps in a directory.
 
         Parameters:
             directory (str): Directory containing the maps to optimize.
+            workers (int): Process-pool size. 0 (default) runs in-process --
+                embedded DCC interpreters can't always spawn workers.
+            skip_unchanged (bool): Stamp every written output with a digest of
+                the settings plus the source/output size and mtime, and skip a
+                map whose output still carries a matching stamp. A changed
+                source, a touched output or any different kwarg re-runs it.
+            report (bool): Print :meth:`MatReport.format_optimize_batch_text`
+                over the records.
             **kwargs: Forwarded to :meth:`optimize_map`.
+
+        Returns:
+            (list) One record per map, in directory order -- see
+            :meth:`_optimize_map_record`. A map that raised carries its
+            message under ``"error"`` instead of aborting the batch.
         """
         ImgUtils.assert_pathlike(directory, "directory")
 
-        textures = ImgUtils.get_images(directory)
+        # Paths only: ImgUtils.get_images would decode every map up front, in
+        # this process, just to hand the path to a job that decodes it again.
+        textures = FileUtils.get_dir_contents(
+            directory,
+            "filepath",
+            inc_files=[f"*.{ext}" for ext in ImgUtils.readable],
+        )
         print(f"Optimizing maps in: {directory}")
-        for texture_path in textures.keys():
-            cls.optimize_map(texture_path, **kwargs)
-        print(f"{len(textures)} maps optimized.")
+        stamp = cls._settings_stamp(kwargs) if skip_unchanged else None
+        jobs = [(path, stamp, kwargs) for path in textures]
+        if workers > 0 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                records = list(pool.map(cls._batch_job, *zip(*jobs)))
+        else:
+            records = [cls._batch_job(*job) for job in jobs]
+
+        written = sum(1 for r in records if not r.get("skipped") and not r.get("error"))
+        print(f"{written} maps optimized.")
+        if report:
+            print(MatReport.format_optimize_batch_text(records))
+        return records
+
+    @classmethod
+    def _batch_job(
+        cls, texture_path: str, stamp: Optional[str], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """One :meth:`batch_optimize_maps` map. Process-pool safe; an exception
+        becomes the record's ``"error"``."""
+        try:
+            return cls._optimize_map_record(texture_path, stamp=stamp, **kwargs)
+        except Exception as e:
+            print(f"# Error: {os.path.basename(texture_path)}: {e}")
+            return {
+                "source": texture_path,
+                "output": None,
+                "skipped": None,
+                "error": f"{type(e).__name__}: {e}",
+            }
+
+    @classmethod
+    def _settings_stamp(cls, kwargs: Dict[str, Any]) -> str:
+        """Digest of the optimize_map settings a stamp is valid for."""
+        blob = json.dumps(
+            [cls.STAMP_VERSION, sorted(kwargs.items())], sort_keys=True, default=str
+        )
+        return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _file_stat(path: str) -> Optional[List[int]]:
+        """``[size, mtime_ns]`` of *path*, None when it isn't a file."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
+
+    @classmethod
+    def _stamp_matches(cls, source: str, output: str, stamp: str) -> bool:
+        """Whether *output* was written by a run with settings *stamp* from the
+        *source* now on disk, and hasn't been touched since. A source archived
+        away (or overwritten in place) leaves only the output to compare."""
+        output_stat = cls._file_stat(output)
+        if output_stat is None:
+            return False
+        saved = Metadata.get(output, cls.STAMP_KEY, mode="sidecar")[cls.STAMP_KEY]
+        if not isinstance(saved, dict) or saved.get("settings") != stamp:
+            return False
+        if saved.get("output") != output_stat:
+            return False
+        if os.path.normcase(os.path.abspath(source)) == os.path.normcase(
+            os.path.abspath(output)
+        ):
+            return True
+        source_stat = cls._file_stat(source)
+        return source_stat is None or saved.get("source") == source_stat
+
+    @classmethod
+    def _write_stamp(
+        cls, output: str, stamp: str, source_stat: Optional[List[int]]
+    ) -> None:
+        """Record *stamp* in *output*'s sidecar (see :meth:`_stamp_matches`)."""
+        output_stat = cls._file_stat(output)
+        if output_stat is None:
+            return
+        Metadata.set(
+            output,
+            mode="sidecar",
+            **{
+                cls.STAMP_KEY: {
+                    "settings": stamp,
+                    "source": source_stat,
+                    "output": output_stat,
+                }
+            },
+        )
 
     @classmethod
     def assess(
@@ -1296,6 +1500,7 @@ class MapOptimizer(HelpMixin):
         enforce_budget: bool = False,
         lossy_quality: int = None,
         pot_mode: Optional[str] = None,
+        probe_max_pixels: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Predict whether :meth:`optimize_map` would change ``texture_path``.
 
@@ -1317,8 +1522,8 @@ class MapOptimizer(HelpMixin):
                 compression is reflected in the prediction rather than silently
                 ignored.
             predict_size: Also report the resulting *byte* count. Costs a real
-                encode (the plan is applied to a copy and written to a scratch
-                file that is immediately discarded), so it is opt-in — bulk
+                encode (the plan is applied to a copy and encoded into an
+                in-memory buffer that is immediately discarded), so it is opt-in — bulk
                 report callers assessing every texture in a scene shouldn't
                 pay for it. Compression ratios can't be derived from
                 dimensions and mode, so this is the only honest way to
@@ -1333,6 +1538,10 @@ class MapOptimizer(HelpMixin):
             pot_mode: Same semantics as :meth:`optimize_map` — an explicit
                 "nearest"/"down" outranks the profile-derived behavior, so a
                 dry run predicts the same snap the caller's real run will make.
+            probe_max_pixels: With *predict_size*, a planned image larger than
+                this many pixels has its size extrapolated from full-resolution
+                tiles instead of encoded whole (see :meth:`_encoded_size`), and
+                ``predicted["size_estimated"]`` is True. None encodes in full.
 
         Returns:
             dict with:
@@ -1532,10 +1741,13 @@ class MapOptimizer(HelpMixin):
                 compression=compression,
                 quality=quality,
                 colorspace=ktx2_colorspace,
+                probe_max_pixels=probe_max_pixels,
             )
             predicted["size_bytes"] = predicted_bytes
             if size_error:
                 predicted["size_error"] = size_error
+            elif probe_max_pixels and new_width * new_height > probe_max_pixels:
+                predicted["size_estimated"] = True
 
         return {
             "recommended": bool(ops),
@@ -1649,6 +1861,9 @@ class MapOptimizer(HelpMixin):
             "target_mode": None,
         }
 
+    #: Edge of each full-resolution tile an extrapolated size probe encodes.
+    PROBE_TILE = 512
+
     @classmethod
     def _encoded_size(
         cls,
@@ -1659,6 +1874,7 @@ class MapOptimizer(HelpMixin):
         compression: Optional[str] = None,
         quality: Optional[int] = None,
         colorspace: Optional[str] = None,
+        probe_max_pixels: Optional[int] = None,
     ) -> Tuple[Optional[int], Optional[str]]:
         """Byte count ``plan`` would produce, measured by a throwaway encode.
 
@@ -1666,33 +1882,63 @@ class MapOptimizer(HelpMixin):
         :meth:`optimize_map` uses, with the same profile-driven bit depth and
         compression — so format dispatch (Pillow / cv2 / DDS) and mode fixups
         are identical to the real run instead of an approximation that could
-        drift from it.
+        drift from it. The encode goes into an in-memory buffer, so a dry run
+        over thousands of maps never touches the temp filesystem (``.ktx2``
+        still stages through one: its encoder only writes files).
 
         The caller's image is passed through uncopied: every op in
         :meth:`apply` rebinds rather than mutating in place, which is the same
         invariant :meth:`optimize_map` already relies on, and copying an 8K
         texture just to throw it away is a real cost on the dry-run path.
 
+        With ``probe_max_pixels``, a planned image larger than that is not
+        encoded whole: an evenly spaced grid of :attr:`PROBE_TILE` crops
+        covering about that many pixels is, and their bytes-per-pixel is
+        scaled to the full size. Crops rather than a downscale because they
+        keep the texel-level detail the codec's ratio depends on; the result
+        is an estimate (container headers count once per tile).
+
         Returns:
             tuple: ``(size_bytes, error)`` — exactly one is non-None.
         """
-        import shutil
-        from pythontk.file_utils.temp_artifacts import TempArtifacts
+        import io
 
-        scratch = TempArtifacts("map_optimizer_dryrun").dir_path()
-        try:
-            probe = os.path.join(scratch, f"probe.{ext}")
+        def encode(im) -> int:
+            buf = io.BytesIO()
             ImgUtils.save_image(
-                cls.apply(image, plan),
-                probe,
+                im,
+                buf,
+                ext=ext,
                 optimize=True,
                 bit_depth=bit_depth,
                 compression=compression,
                 quality=quality,
                 colorspace=colorspace,
             )
-            return os.path.getsize(probe), None
+            return buf.tell()
+
+        try:
+            planned = cls.apply(image, plan)
+            width, height = planned.size
+            if not probe_max_pixels or width * height <= probe_max_pixels:
+                return encode(planned), None
+            tile = min(cls.PROBE_TILE, width, height)
+            per_axis = max(1, int(math.sqrt(probe_max_pixels / float(tile * tile))))
+            xs = cls._probe_offsets(width, tile, per_axis)
+            ys = cls._probe_offsets(height, tile, per_axis)
+            sampled = encoded = 0
+            for y in ys:
+                for x in xs:
+                    encoded += encode(planned.crop((x, y, x + tile, y + tile)))
+                    sampled += tile * tile
+            return int(round(encoded * (width * height) / float(sampled))), None
         except Exception as e:
             return None, str(e)
-        finally:
-            shutil.rmtree(scratch, ignore_errors=True)
+
+    @staticmethod
+    def _probe_offsets(extent: int, tile: int, count: int) -> List[int]:
+        """*count* tile origins spread evenly across *extent* (deduplicated)."""
+        if count <= 1 or extent <= tile:
+            return [max(0, (extent - tile) // 2)]
+        span = extent - tile
+        return sorted({round(span * i / (count - 1)) for i in range(count)})
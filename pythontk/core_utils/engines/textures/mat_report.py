@@ -16,8 +16,12 @@ Record schema (all keys optional unless noted):
   "error": str}, "error": str}``
 - **texture-info record** (``get_texture_info``): ``{"name", "path", "size", "width",
   "height", "mode", "format"}``
+- **optimize record** (``MapOptimizer.batch_optimize_maps``): ``{"source", "output",
+  "skipped", "bytes_before", "bytes_after", "dims_before", "dims_after", "ops": [str],
+  "warnings": [str], "error": str}``
 """
 import html as _html
+import os
 import urllib.parse as _urlparse
 from typing import Any, Dict, List
 
@@ -84,6 +88,54 @@ class MatReport:
         body = _html.escape(cls.format_texture_info_text(info_list))
         return head + "<pre style='font-family:monospace; color:#ddd;'>" + body + "</pre>"
 
+    # ---- batch optimize ----------------------------------------------------
+    @classmethod
+    def format_optimize_batch_text(cls, records: List[Dict[str, Any]]) -> str:
+        """Render ``MapOptimizer.batch_optimize_maps`` records as a plain-text summary
+        table: one row per map (size transition + what was done), then totals over the
+        maps that were actually written."""
+        rows = []
+        for rec in records:
+            name = os.path.basename(rec.get("output") or rec.get("source") or "")
+            if rec.get("error"):
+                status = f"error: {rec['error']}"
+            elif rec.get("skipped"):
+                status = f"skipped ({rec['skipped']})"
+            else:
+                status = ", ".join(rec.get("ops") or []) or "re-encoded"
+                if rec.get("warnings"):
+                    status += f"  [{len(rec['warnings'])} warning(s)]"
+            size = (
+                FileUtils.format_bytes_delta(rec.get("bytes_before"), rec.get("bytes_after"))
+                if not rec.get("skipped") and not rec.get("error")
+                else cls._fmt_size_auto(rec.get("bytes_after") or rec.get("bytes_before"))
+            )
+            rows.append((name, size, status))
+
+        written = [r for r in records if not r.get("skipped") and not r.get("error")]
+        skipped = sum(1 for r in records if r.get("skipped"))
+        errors = sum(1 for r in records if r.get("error"))
+        name_w = max([len(r[0]) for r in rows] + [4])
+        size_w = max([len(r[1]) for r in rows] + [4])
+        sep = "=" * 60
+        lines: List[str] = [
+            sep,
+            f"Optimize Maps — {len(records)} map(s): {len(written)} written, "
+            f"{skipped} skipped, {errors} error(s)",
+            sep,
+        ]
+        for name, size, status in rows:
+            lines.append(f"{name:<{name_w}}  {size:<{size_w}}  {status}")
+        if written:
+            try:
+                before = sum(r["bytes_before"] for r in written)
+                after = sum(r["bytes_after"] for r in written)
+            except (KeyError, TypeError):  # a side unknown — no meaningful total
+                before = after = None
+            lines.append("-" * 40)
+            lines.append(f"Total: {FileUtils.format_bytes_delta(before, after)}")
+        return "\n".join(lines)
+
     # ---- material info -----------------------------------------------------
     @classmethod
     def format_mat_info_text(cls, records: List[Dict[str, Any]]) -> str:
@@ -12,6 +12,8 @@ import subprocess
 import tempfile
 from functools import wraps
 
+from pythontk.core_utils.execution_monitor._shared_watchdog import SharedWatchdog
+
 
 class _EscapeHoldDetector:
     """Stateful Esc-hold probe: ``True`` once Esc is held for *hold_seconds*.
@@ -72,6 +74,10 @@ class ExecutionMonitor:
     _x11_lib = None
     _x11_display = None
 
+    #: Default for ``external_watchdog(shared=None)``: lease a slot in the
+    #: session-wide watchdog process instead of spawning one per call.
+    SHARED_WATCHDOG = False
+
     @staticmethod
     def escape_hold_source(hold_seconds: float = 0.4, require_foreground: bool = True):
         """Build an Esc-hold probe for use as a ``CancelScope`` pull source.
@@ -693,6 +699,8 @@ class ExecutionMonitor:
         indicator: bool | str | None = None,
         cancel_scope=None,
         escape_hold_seconds: float = 0.4,
+        watchdog_shared: bool | None = None,
+        watchdog_auto_heartbeat: bool = True,
     ):
         """
         Decorator that monitors execution time and (optionally) prompts the user via a native
@@ -723,6 +731,10 @@ class ExecutionMonitor:
                 button and by Esc, instead of interrupting the main thread. Also lets
                 the dialog tell the truth about whether cancelling can take effect.
             escape_hold_seconds (float): Sustained Esc hold required to request cancel.
+            watchdog_shared (bool|None): Use the session-wide watchdog process
+                (see :meth:`external_watchdog`).
+            watchdog_auto_heartbeat (bool): With the shared watchdog, False counts only
+                explicit :meth:`heartbeat` calls as progress (see :meth:`external_watchdog`).
         """
 
         _dialog_shown = [False]
@@ -795,6 +807,8 @@ class ExecutionMonitor:
                     kill_tree=bool(watchdog_kill_tree),
                     logger=logger,
                     heartbeat_path=watchdog_heartbeat_path,
+                    shared=watchdog_shared,
+                    auto_heartbeat=watchdog_auto_heartbeat,
                 )(monitored)
 
             @wraps(func)
@@ -808,6 +822,15 @@ class ExecutionMonitor:
 
         return decorator
 
+    @staticmethod
+    def heartbeat() -> None:
+        """Report progress to the shared watchdog from a monitored hot loop.
+
+        Beats every shared-watchdog lease entered on this thread — one
+        shared-memory store each — and is a no-op when none is active.
+        """
+        SharedWatchdog.heartbeat()
+
     @staticmethod
     def _default_heartbeat_path(tag: str = "execution_monitor") -> str:
         safe_tag = "".join(
@@ -1013,6 +1036,8 @@ while True:
         kill_tree: bool = True,
         logger=None,
         heartbeat_path: str | None = None,
+        shared: bool | None = None,
+        auto_heartbeat: bool = True,
     ):
         """Decorator that starts an OS-level watchdog for the current process.
 
@@ -1020,6 +1045,14 @@ while True:
         watchdog runs in a separate process and will force-kill this process if the heartbeat
         file stops updating for longer than `timeout`.
 
+        With ``shared=True`` (default: :attr:`SHARED_WATCHDOG`) the call instead leases a
+        slot in one session-wide watchdog process (started on first use) and beats it
+        through shared memory, which costs microseconds per call rather than a process
+        launch. ``auto_heartbeat=False`` then makes only explicit
+        :meth:`heartbeat` calls from the monitored code count, so a loop that stops
+        progressing is caught too. An explicit *heartbeat_path* keeps the per-call
+        file-based watchdog.
+
         Notes:
             - Works on Windows and Linux.
             - If the entire process is frozen, the watchdog can still kill it.
@@ -1029,6 +1062,25 @@ while True:
         def decorator(func):
             @wraps(func)
             def wrapper(*args, **kwargs):
+                # Resolved per call so toggling SHARED_WATCHDOG also reaches
+                # functions decorated before the toggle (e.g. at import).
+                use_shared = (
+                    ExecutionMonitor.SHARED_WATCHDOG if shared is None else shared
+                )
+                if use_shared and heartbeat_path is None:
+                    watchdog = SharedWatchdog.session(check_interval, logger=logger)
+                    lease = watchdog and watchdog.lease(
+                        timeout,
+                        kill_tree=kill_tree,
+                        auto_beat=auto_heartbeat,
+                        beat_interval=heartbeat_interval,
+                    )
+                    if lease is not None:
+                        with lease:
+                            return func(*args, **kwargs)
+                    if logger:
+                        logger.debug("Shared watchdog unavailable; spawning one.")
+
                 hb_path = heartbeat_path or ExecutionMonitor._default_heartbeat_path(
                     "watchdog"
                 )
@@ -0,0 +1,383 @@
+# !/usr/bin/python
+# coding=utf-8
+"""One long-lived watchdog process per session, leased by monitored calls.
+
+The per-call watchdog (``ExecutionMonitor._spawn_watchdog_subprocess`` plus a
+heartbeat thread rewriting a file) costs an interpreter launch and a thread
+per monitored call — hundreds of milliseconds — which rules it out for
+wrapping many short operations. Here the process is started once and
+shares a small memory-mapped slot table with the host:
+
+    header  [stop, host_pid]
+    slot i  [state, kill_tree, timeout, last_beat]      (all float64)
+
+A monitored call *leases* a slot (a lock, a few stores), beats it, and frees
+it on exit: microseconds. A beat is one store of ``time.monotonic()`` into
+the map. The watchdog scans active slots every *check_interval* and kills the
+host when a slot's last beat is older than its timeout. ``time.monotonic``
+is system-wide on the supported platforms, so both sides share the clock.
+
+Leases beat either from one shared in-process thread (``auto_beat``, which
+catches a hard-hung host exactly like the heartbeat file did) or only when
+the monitored code calls :meth:`WatchdogLease.beat` /
+:meth:`SharedWatchdog.heartbeat` from its own loop, which also catches a loop
+that stopped making progress.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+_log = logging.getLogger(__name__)
+
+_HEADER = 2  # doubles: stop flag, host pid
+_FIELDS = 4  # doubles per slot: state, kill_tree, timeout, last_beat
+
+# Inline program (like the per-call watchdog) so the child needs no PYTHONPATH.
+# Args: pid map_path slots check_interval
+_WATCHDOG_CODE = r"""
+import mmap, os, sys, time, subprocess, signal
+
+pid = int(sys.argv[1])
+path = sys.argv[2]
+slots = int(sys.argv[3])
+check_interval = float(sys.argv[4])
+is_win = sys.platform == "win32"
+
+def process_alive(p):
+    if is_win:
+        try:
+            import ctypes
+            handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, p)
+            if handle:
+                ctypes.windll.kernel32.CloseHandle(handle)
+                return True
+            return False
+        except Exception:
+            return True
+    try:
+        os.kill(p, 0)
+        return True
+    except Exception:
+        return False
+
+def kill_process(p, kill_tree):
+    if is_win:
+        cmd = ["taskkill", "/PID", str(p), "/F"]
+        if kill_tree:
+            cmd.insert(3, "/T")
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except Exception:
+            pass
+        return
+    try:
+        if kill_tree:
+            try:
+                os.killpg(os.getpgid(p), signal.SIGKILL)
+                return
+            except Exception:
+                pass
+        os.kill(p, signal.SIGKILL)
+    except Exception:
+        pass
+
+with open(path, "r+b") as f:
+    mm = mmap.mmap(f.fileno(), 0)
+view = memoryview(mm).cast("d")
+try:
+    while view[0] == 0 and process_alive(pid):
+        now = time.monotonic()
+        for base in range(2, 2 + 4 * slots, 4):
+            if view[base] == 1.0 and now - view[base + 3] > view[base + 2]:
+                kill_process(pid, view[base + 1] != 0)
+                sys.exit(0)
+        time.sleep(check_interval)
+finally:
+    view.release()
+    mm.close()
+    try:
+        os.remove(path)
+    except Exception:
+        pass
+"""
+
+
+class WatchdogLease(object):
+    """One monitored call's slot in a :class:`SharedWatchdog`.
+
+    Use as a context manager (or call :meth:`release`). :meth:`beat` is the
+    hot-loop heartbeat: a single store into the shared map.
+    """
+
+    __slots__ = ("watchdog", "index", "auto_beat", "_view", "_beat_at", "released")
+
+    def __init__(self, watchdog: "SharedWatchdog", index: int, auto_beat: bool):
+        self.watchdog = watchdog
+        self.index = index
+        self.auto_beat = auto_beat
+        self._view = watchdog._view
+        self._beat_at = _HEADER + _FIELDS * index + 3
+        self.released = False
+
+    def beat(self, _now=time.monotonic) -> None:
+        """Report progress (safe from any thread; a no-op once stopped)."""
+        try:
+            self._view[self._beat_at] = _now()
+        except ValueError:  # the watchdog was stopped and its map released
+            pass
+
+    def release(self) -> None:
+        """Free the slot; the watchdog stops watching this call."""
+        if not self.released:
+            self.released = True
+            self.watchdog._release(self)
+
+    def __enter__(self) -> "WatchdogLease":
+        self.watchdog._push(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.watchdog._pop(self)
+        self.release()
+        return False
+
+
+class SharedWatchdog(object):
+    """A session-wide watchdog process and the slot table it watches.
+
+    Parameters:
+        pid: Process to kill on a stall (default: this one).
+        slots: Concurrent leases supported; :meth:`lease` returns ``None``
+            when all are taken, and callers fall back to the per-call path.
+        check_interval: Watchdog scan period in seconds.
+        logger: Optional logger for start-up failures.
+
+    Use :meth:`session` for the shared per-process instance.
+    """
+
+    SLOTS = 64
+    _session: Optional["SharedWatchdog"] = None
+    _session_lock = threading.Lock()
+    _local = threading.local()
+
+    def __init__(
+        self,
+        pid: Optional[int] = None,
+        slots: int = SLOTS,
+        check_interval: float = 0.25,
+        logger=None,
+    ):
+        self.pid = int(pid or os.getpid())
+        self.slots = int(slots)
+        self.check_interval = max(0.01, float(check_interval))
+        self._lock = threading.Lock()
+        self._free: List[int] = list(range(self.slots - 1, -1, -1))
+        self._auto: Dict[int, float] = {}  # slot -> beat interval
+        self._wake = threading.Event()
+        self._beater: Optional[threading.Thread] = None
+        self._closed = False
+        self._mismatch_warned: set = set()
+
+        fd, self.path = tempfile.mkstemp(prefix=f"ptk_watchdog_{self.pid}_")
+        with os.fdopen(fd, "r+b") as f:
+            f.write(b"\0" * (8 * (_HEADER + _FIELDS * self.slots)))
+            f.flush()
+            self._mmap = mmap.mmap(f.fileno(), 0)
+        self._view = memoryview(self._mmap).cast("d")
+        self._view[1] = float(self.pid)
+
+        creationflags = 0
+        if sys.platform == "win32":
+            creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        try:
+            self.process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-c",
+                    _WATCHDOG_CODE,
+                    str(self.pid),
+                    self.path,
+                    str(self.slots),
+                    str(self.check_interval),
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=creationflags,
+            )
+        except Exception as e:
+            if logger:
+                logger.warning(f"Failed to start shared watchdog: {e}")
+            self._close_map()
+            raise
+
+    @classmethod
+    def session(cls, check_interval: float = 0.25, logger=None):
+        """The per-process shared watchdog, started on first use (or ``None``).
+
+        The first caller's *check_interval* fixes the session's scan period;
+        a later call asking for a different one gets the running session
+        and a warning (once per interval), not a second watchdog.
+        """
+        with cls._session_lock:
+            current = cls._session
+            if current is None or not current.alive:
+                try:
+                    cls._session = cls(check_interval=check_interval, logger=logger)
+                except Exception:
+                    cls._session = None
+                else:
+                    atexit.register(cls._session.stop)
+            else:
+                requested = max(0.01, float(check_interval))
+                if (
+                    requested != current.check_interval
+                    and requested not in current._mismatch_warned
+                ):
+                    current._mismatch_warned.add(requested)
+                    (logger or _log).warning(
+                        f"Shared watchdog already runs with check_interval="
+                        f"{current.check_interval}s; ignoring {requested}s."
+                    )
+            return cls._session
+
+    @property
+    def alive(self) -> bool:
+        return not self._closed and self.process.poll() is None
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+    def lease(
+        self,
+        timeout: float,
+        kill_tree: bool = True,
+        auto_beat: bool = True,
+        beat_interval: float = 1.0,
+    ) -> Optional[WatchdogLease]:
+        """Start watching a call; ``None`` when no slot is free.
+
+        Parameters:
+            timeout: Seconds without a beat before the host is killed.
+            kill_tree: Kill the host's process tree/group, not just the host.
+            auto_beat: Beat from the shared thread every *beat_interval*
+                seconds (hang detection). ``False``: only explicit beats
+                count (progress detection).
+        """
+        with self._lock:
+            if self._closed or not self._free:
+                return None
+            index = self._free.pop()
+            base = _HEADER + _FIELDS * index
+            view = self._view
+            view[base + 1] = 1.0 if kill_tree else 0.0
+            view[base + 2] = float(timeout)
+            view[base + 3] = time.monotonic()
+            view[base] = 1.0  # last: the watchdog reads state first
+            if auto_beat:
+                self._auto[index] = max(0.01, float(beat_interval))
+        lease = WatchdogLease(self, index, auto_beat)
+        if auto_beat:
+            self._ensure_beater()
+            self._wake.set()
+        return lease
+
+    def _release(self, lease: WatchdogLease) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._view[_HEADER + _FIELDS * lease.index] = 0.0
+            self._auto.pop(lease.index, None)
+            self._free.append(lease.index)
+
+    def _push(self, lease: WatchdogLease) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(lease)
+
+    def _pop(self, lease: WatchdogLease) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack and stack[-1] is lease:
+            stack.pop()
+
+    @classmethod
+    def heartbeat(cls) -> None:
+        """Beat every lease entered on the calling thread (no-op without one)."""
+        stack = getattr(cls._local, "stack", None)
+        if stack:
+            for lease in stack:
+                lease.beat()
+
+    # ------------------------------------------------------------------
+    # Shared beater thread (auto_beat leases)
+    # ------------------------------------------------------------------
+    def _ensure_beater(self) -> None:
+        with self._lock:
+            if self._beater is not None and self._beater.is_alive():
+                return
+            self._beater = threading.Thread(
+                target=self._beat_loop, name="SharedWatchdogHeartbeat", daemon=True
+            )
+            self._beater.start()
+
+    def _beat_loop(self) -> None:
+        view = self._view
+        while not self._closed:
+            with self._lock:
+                if self._closed:
+                    return
+                now = time.monotonic()
+                for index in self._auto:
+                    view[_HEADER + _FIELDS * index + 3] = now
+                interval = min(self._auto.values(), default=None)
+            self._wake.wait(interval)
+            self._wake.clear()
+
+    # ------------------------------------------------------------------
+    # Shutdown
+    # ------------------------------------------------------------------
+    def stop(self, timeout: float = 2.0) -> None:
+        """Tell the watchdog process to exit and release the map."""
+        with self._lock:
+            if self._closed:
+                return
+            self._view[0] = 1.0
+            self._closed = True
+        self._wake.set()
+        try:
+            self.process.wait(timeout=timeout)
+        except Exception:
+            try:
+                self.process.terminate()
+            except Exception:
+                pass
+        self._close_map()
+        if SharedWatchdog._session is self:
+            SharedWatchdog._session = None
+
+    def _close_map(self) -> None:
+        self._closed = True
+        try:
+            self._view.release()
+            self._mmap.close()
+        except Exception:
+            pass
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except Exception:
+            pass
+
+    def __repr__(self) -> str:
+        state = "alive" if self.alive else "stopped"
+        used = self.slots - len(self._free)
+        return f"<SharedWatchdog pid={self.pid} {state} leases={used}/{self.slots}>"
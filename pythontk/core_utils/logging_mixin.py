@@ -5,17 +5,27 @@
 ``LoggerExt`` patches stdlib loggers with custom levels (PROGRESS/SUCCESS/
 RESULT/NOTICE), HTML color presets, raw block output (boxes, groups,
 dividers, tables), a managed file tee, and a capped in-memory ring buffer.
-``LoggingMixin`` exposes one such patched logger per class.
+``LoggingMixin`` exposes one such patched logger per class.  An opt-in
+async mode (``set_async``) moves handler work onto a listener thread, and
+:class:`Tracer` records timing spans (off by default) for Chrome trace export.
 """
 from __future__ import annotations
 
 import os
 import sys
+import atexit
+import functools
+import json
 import logging as internal_logging
+import queue
 import re
+import threading
+import time
 import unicodedata
+import weakref
 from collections import deque
-from typing import Union, List, Optional, Any
+from contextlib import nullcontext
+from typing import Union, List, Optional, Any, Callable, Dict, Iterable, Tuple
 from pythontk.core_utils.class_property import ClassProperty
 
 
@@ -269,6 +279,8 @@ class LoggerExt:
             "add_stream_handler": LoggerExt._add_stream_handler,
             "add_text_widget_handler": LoggerExt._add_text_widget_handler,
             "set_log_file": LoggerExt._set_log_file,
+            "set_async": LoggerExt._set_async,
+            "flush_async": LoggerExt._flush_async,
             "enable_log_buffer": LoggerExt._enable_log_buffer,
             "disable_log_buffer": LoggerExt._disable_log_buffer,
             "clear_log_buffer": LoggerExt._clear_log_buffer,
@@ -409,6 +421,8 @@ class LoggerExt:
                 handler_kwargs["monospace"] = kwargs.get("monospace", True)
             if "use_html" in sig.parameters:
                 handler_kwargs["use_html"] = kwargs.get("use_html", True)
+            if kwargs.get("dispatch") is not None and "dispatch" in sig.parameters:
+                handler_kwargs["dispatch"] = kwargs["dispatch"]
 
             handler = handler_cls(**handler_kwargs)
 
@@ -452,14 +466,22 @@ class LoggerExt:
         text_widget: object,
         level: int = internal_logging.WARNING,
         monospace: bool = True,
+        dispatch: Optional[Callable[[Callable[[], None]], Any]] = None,
     ) -> None:
-        """Add a text widget handler to the logger."""
+        """Add a text widget handler to the logger.
+
+        *dispatch* is passed to :class:`DefaultTextLogHandler`: the host's
+        main-thread scheduler, which lets the handler run on the async
+        listener (see ``set_async``).  Without it the handler stays on the
+        logging thread even in async mode.
+        """
         LoggerExt._add_handler(
             self,
             handler_type="text_widget",
             widget=text_widget,
             level=level,
             monospace=monospace,
+            dispatch=dispatch,
         )
 
     @staticmethod
@@ -513,8 +535,24 @@ class LoggerExt:
     @staticmethod
     def _log_raw(self, message: str) -> None:
         """Write a raw message without level, prefix, or formatting."""
+        listener = getattr(self, "_async_listener", None)
+        if listener is not None and not listener.on_listener_thread():
+            # Keep raw blocks in order with the queued records; handlers
+            # that must not leave this thread get theirs now.
+            LoggerExt._write_raw(
+                self, message, [h for h in self.handlers if listener.stays_on_caller(h)]
+            )
+            listener.enqueue_raw(message)
+            return
+        LoggerExt._write_raw(self, message)
+
+    @staticmethod
+    def _write_raw(
+        self, message: str, handlers: Optional[List[internal_logging.Handler]] = None
+    ) -> None:
+        """Write *message* straight to *handlers* (default: all; see ``_log_raw``)."""
         # Write directly to all handler streams (console, files)
-        for handler in self.handlers:
+        for handler in self.handlers if handlers is None else handlers:
             stream = getattr(handler, "stream", None)
             if stream:
                 try:
@@ -1214,6 +1252,8 @@ class LoggerExt:
         """
         existing = getattr(logger, "_managed_file_handler", None)
         if existing is not None:
+            # Let queued records reach the old file first (async mode).
+            LoggerExt._flush_async(logger)
             # Detach before closing: a concurrent emit must never reach a
             # handler whose stream is already closed (I/O on closed file).
             logger.removeHandler(existing)
@@ -1232,6 +1272,65 @@ class LoggerExt:
         logger._managed_file_handler = handler
         return handler
 
+    # ------------------------------------------------------------------
+    # Async dispatch (optional, off by default)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _set_async(
+        logger: internal_logging.Logger,
+        enabled: bool = True,
+        capacity: int = 10000,
+        policy: str = "drop",
+        batch_size: int = 256,
+    ) -> Optional["AsyncLogListener"]:
+        """Run this logger's handlers on a listener thread (or stop doing so).
+
+        When enabled, a logging call on any thread only merges the message
+        arguments and queues the record; formatting, stream / file writes
+        and widget appends happen on one listener thread, in batches, so
+        worker threads stop contending on handler locks.  Handlers are still
+        managed as usual (``add_file_handler``, ``set_log_level`` ...).
+        A :class:`DefaultTextLogHandler` without a *dispatch* hook is the
+        exception: a widget must not be touched from the listener, so it
+        keeps running synchronously on the logging thread.
+
+        Parameters:
+            enabled: ``False`` drains the queue, stops the listener and
+                returns to synchronous handling.
+            capacity: Queue bound (records).
+            policy: What a full queue does to the caller -- ``"drop"`` the
+                record (counted, and reported as one WARNING once the
+                listener catches up) or ``"block"`` until there is room.
+            batch_size: Most records handled per listener wake-up; widget
+                handlers get one append per batch.
+
+        Returns:
+            The listener, or ``None`` when disabled.  Re-enabling replaces
+            a running listener.  Pending records are flushed at exit.
+        """
+        existing = getattr(logger, "_async_listener", None)
+        if existing is not None:
+            existing.stop()
+        if not enabled:
+            return None
+        return AsyncLogListener(
+            logger, capacity=capacity, policy=policy, batch_size=batch_size
+        )
+
+    @staticmethod
+    def _flush_async(
+        logger: internal_logging.Logger, timeout: Optional[float] = None
+    ) -> bool:
+        """Wait until every queued record has been handled (async mode).
+
+        Returns ``False`` if *timeout* seconds passed first; ``True``
+        otherwise, including when async mode is off.
+        """
+        listener = getattr(logger, "_async_listener", None)
+        if listener is None:
+            return True
+        return listener.flush(timeout)
+
     @staticmethod
     def _enable_log_buffer(
         logger: internal_logging.Logger,
@@ -1372,14 +1471,46 @@ class DefaultTextLogHandler(internal_logging.Handler):
     thread should register a marshaling handler class via
     ``set_text_handler`` instead — e.g. uitk's ``TextEditLogHandler``,
     which posts cross-thread records through a queued Qt signal.
+
+    Under an :class:`AsyncLogListener` the handler runs on the listener
+    thread and the records of one batch become a single append
+    (:meth:`begin_batch` / :meth:`end_batch`).  *dispatch*, when given,
+    receives each append as a zero-argument callable to run — pass the
+    host's main-thread scheduler (``maya.utils.executeDeferred``,
+    ``bpy.app.timers.register``) to keep widget access on the UI thread.
+    Without it the handler is not :attr:`listener_safe` and the listener
+    leaves it on the logging thread.
     """
 
-    def __init__(self, widget: object, use_html: bool = True, monospace: bool = False):
+    def __init__(
+        self,
+        widget: object,
+        use_html: bool = True,
+        monospace: bool = False,
+        dispatch: Optional[Callable[[Callable[[], None]], Any]] = None,
+    ):
         super().__init__()
         self.widget = widget
         self.setLevel(internal_logging.NOTSET)
         self.use_html = use_html
         self.monospace = monospace
+        self.dispatch = dispatch
+        self._batch: Optional[List[str]] = None
+
+    @property
+    def listener_safe(self) -> bool:
+        """Whether an :class:`AsyncLogListener` may run this handler."""
+        return self.dispatch is not None
+
+    def begin_batch(self) -> None:
+        """Collect appends until :meth:`end_batch`."""
+        self._batch = []
+
+    def end_batch(self) -> None:
+        """Write the collected appends as one."""
+        batch, self._batch = self._batch, None
+        if batch:
+            self._deliver(("<br>" if self.use_html else "\n").join(batch))
 
     def emit(self, record: internal_logging.LogRecord) -> None:
         try:
@@ -1402,6 +1533,21 @@ class DefaultTextLogHandler(internal_logging.Handler):
             print(f"DefaultTextLogHandler emit error: {e}")
 
     def _safe_append(self, formatted_msg: str) -> None:
+        if self._batch is not None:
+            self._batch.append(formatted_msg)
+            return
+        self._deliver(formatted_msg)
+
+    def _deliver(self, formatted_msg: str) -> None:
+        if self.dispatch is not None:
+            try:
+                self.dispatch(lambda: self._write_widget(formatted_msg))
+            except Exception as e:
+                print(f"DefaultTextLogHandler dispatch error: {e}")
+            return
+        self._write_widget(formatted_msg)
+
+    def _write_widget(self, formatted_msg: str) -> None:
         try:
             if hasattr(self.widget, "append"):
                 self.widget.append(formatted_msg)
@@ -1454,6 +1600,449 @@ class RingBufferHandler(internal_logging.Handler):
         return "\n".join(lines)
 
 
+class AsyncLogListener:
+    """Bounded queue + listener thread that runs a logger's handlers.
+
+    Installed by ``logger.set_async()``: the logger's ``callHandlers`` is
+    replaced by :meth:`enqueue`, and the listener thread hands each record
+    to the logger's *current* handlers (``logging.Logger.callHandlers``), so
+    handler management is unchanged.  The calling thread only merges the
+    message arguments (they may be mutated after the call) and renders any
+    traceback (so frames are not kept alive in the queue); everything else —
+    formatting, I/O, widget appends — is the listener's.
+
+    Records are handled in batches of up to *batch_size*; handlers with
+    ``begin_batch`` / ``end_batch`` (:class:`DefaultTextLogHandler`) are
+    bracketed around each batch.  A handler whose ``listener_safe`` is false
+    (a widget handler with no *dispatch*) is called on the logging thread
+    instead, as in synchronous mode.  A full queue drops the record
+    (``policy="drop"``, counted in :attr:`dropped` and reported once the
+    listener catches up) or blocks the caller (``policy="block"``).
+    Listeners still running at interpreter exit are drained.
+    """
+
+    POLICIES = ("drop", "block")
+    _STOP = object()
+    _live: "weakref.WeakSet[AsyncLogListener]" = weakref.WeakSet()
+    _exc_formatter = internal_logging.Formatter()
+
+    def __init__(
+        self,
+        logger: internal_logging.Logger,
+        capacity: int = 10000,
+        policy: str = "drop",
+        batch_size: int = 256,
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f"Unknown async log policy {policy!r}; expected one of {self.POLICIES}."
+            )
+        self.logger = logger
+        self.policy = policy
+        self.batch_size = max(1, int(batch_size))
+        self.queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(capacity)))
+        self.dropped = 0
+        self._reported = 0
+        self._thread = threading.Thread(
+            target=self._run, name=f"async-log:{logger.name}", daemon=True
+        )
+        self._thread.start()
+        logger._async_listener = self
+        logger.callHandlers = self.enqueue
+        AsyncLogListener._live.add(self)
+
+    def on_listener_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    @staticmethod
+    def stays_on_caller(handler: internal_logging.Handler) -> bool:
+        """Whether *handler* must run on the logging thread, not the listener."""
+        return not getattr(handler, "listener_safe", True)
+
+    def _call_handlers(
+        self, record: internal_logging.LogRecord, listener: bool
+    ) -> None:
+        """``Logger.callHandlers`` over the listener's or the caller's share.
+
+        *listener* selects the handlers the listener runs; otherwise only
+        those that :meth:`stays_on_caller`.
+        """
+        found = 0
+        logger = self.logger
+        while logger:
+            for handler in logger.handlers:
+                found += 1
+                if self.stays_on_caller(handler) == listener:
+                    continue
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            logger = logger.parent if logger.propagate else None
+        if listener and not found:
+            internal_logging.Logger.callHandlers(self.logger, record)
+
+    def enqueue(self, record: internal_logging.LogRecord) -> None:
+        """Queue *record* for the listener (the logger's ``callHandlers``)."""
+        if self.on_listener_thread():
+            # A handler logging from the listener: handle inline -- queueing
+            # could deadlock against a full queue under "block".
+            internal_logging.Logger.callHandlers(self.logger, record)
+            return
+        self._call_handlers(record, listener=False)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        self._put(record)
+
+    def enqueue_raw(self, message: str) -> None:
+        """Queue a ``log_raw`` block so it keeps its place among the records."""
+        record = internal_logging.LogRecord(
+            self.logger.name, internal_logging.INFO, "", 0, message, None, None
+        )
+        record.raw = True
+        record._raw_block = True
+        self._put(record)
+
+    def _put(self, record) -> None:
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until the queue is drained; ``False`` if *timeout* ran out."""
+        if self.on_listener_thread():
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Drain the queue, stop the thread and restore synchronous handling."""
+        if self.logger.__dict__.get("callHandlers") == self.enqueue:
+            del self.logger.callHandlers
+        if getattr(self.logger, "_async_listener", None) is self:
+            self.logger._async_listener = None
+        AsyncLogListener._live.discard(self)
+        if self._thread.is_alive():
+            self.queue.put(self._STOP)
+            if not self.on_listener_thread():
+                self._thread.join(timeout)
+
+    @classmethod
+    def _stop_all(cls) -> None:
+        """Drain every running listener (``atexit``)."""
+        for listener in list(cls._live):
+            try:
+                listener.stop()
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        q = self.queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                stopping = self._handle_batch(batch)
+            finally:
+                for _ in batch:
+                    q.task_done()
+            if stopping:
+                return
+
+    def _handle_batch(self, batch: list) -> bool:
+        logger = self.logger
+        handlers = [h for h in logger.handlers if not self.stays_on_caller(h)]
+        for handler in handlers:
+            begin = getattr(handler, "begin_batch", None)
+            if begin is not None:
+                begin()
+        stopping = False
+        try:
+            if self.dropped != self._reported:
+                lost, self._reported = self.dropped - self._reported, self.dropped
+                self._call_handlers(
+                    logger.makeRecord(
+                        logger.name,
+                        internal_logging.WARNING,
+                        "",
+                        0,
+                        f"{lost} log record(s) dropped: async log queue full.",
+                        None,
+                        None,
+                    ),
+                    listener=True,
+                )
+            for record in batch:
+                if record is self._STOP:
+                    stopping = True
+                elif getattr(record, "_raw_block", False):
+                    LoggerExt._write_raw(logger, record.msg, handlers)
+                else:
+                    try:
+                        self._call_handlers(record, listener=True)
+                    except Exception:
+                        pass  # handlers report their own errors (handleError)
+        finally:
+            for handler in handlers:
+                end = getattr(handler, "end_batch", None)
+                if end is not None:
+                    try:
+                        end()
+                    except Exception as e:
+                        print(f"Async log batch flush error: {e}")
+        return stopping
+
+
+atexit.register(AsyncLogListener._stop_all)
+
+
+# ---- tracing ----
+class TraceBuffer:
+    """Capped in-memory store of trace events -- ``RingBufferHandler`` for spans.
+
+    Events are plain tuples ``(ph, name, cat, ts_us, dur_us, pid, tid, args)``
+    (``ph`` is the Chrome phase: ``"X"`` span, ``"C"`` counter) so they are
+    cheap to append and picklable: worker processes can return
+    :meth:`events` for the parent to :meth:`extend` before export.  Once
+    ``capacity`` is exceeded the oldest event is dropped.
+    """
+
+    def __init__(self, capacity: int = 100000):
+        self.capacity = capacity
+        self.buffer: deque = deque(maxlen=capacity)
+        self.thread_names: Dict[Tuple[int, int], str] = {}
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def add(self, event: tuple) -> None:
+        self.buffer.append(event)
+
+    def extend(self, events: Iterable[tuple]) -> None:
+        self.buffer.extend(events)
+
+    def events(self) -> List[tuple]:
+        return list(self.buffer)
+
+    def clear(self) -> None:
+        self.buffer.clear()
+        self.thread_names.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per span name: ``count`` and ``total`` / ``mean`` / ``max`` seconds."""
+        stats: Dict[str, Dict[str, float]] = {}
+        for ph, name, _cat, _ts, dur, *_ in list(self.buffer):
+            if ph != "X":
+                continue
+            entry = stats.get(name)
+            if entry is None:
+                entry = stats[name] = {"count": 0, "total": 0.0, "max": 0.0}
+            seconds = dur / 1e6
+            entry["count"] += 1
+            entry["total"] += seconds
+            if seconds > entry["max"]:
+                entry["max"] = seconds
+        for entry in stats.values():
+            entry["mean"] = entry["total"] / entry["count"]
+        return stats
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """The events as a Chrome trace (``chrome://tracing`` / Perfetto) dict."""
+        trace = []
+        for (pid, tid), name in list(self.thread_names.items()):
+            trace.append(
+                {
+                    "ph": "M",
+                    "name": "thread_name",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        for ph, name, cat, ts, dur, pid, tid, args in list(self.buffer):
+            event = {"ph": ph, "name": name, "cat": cat, "ts": ts}
+            event["pid"], event["tid"] = pid, tid
+            if ph == "X":
+                event["dur"] = dur
+            if args:
+                event["args"] = args
+            trace.append(event)
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> str:
+        """Write :meth:`to_chrome_trace` to *path* as JSON; returns *path*."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+        return path
+
+
+class _Span(object):
+    """One timed region; appended to the buffer on exit."""
+
+    __slots__ = ("buffer", "name", "cat", "args", "start")
+
+    def __init__(self, buffer: TraceBuffer, name: str, cat: str, args: dict):
+        self.buffer = buffer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self) -> "_Span":
+        stack = Tracer._stack()
+        self.args["depth"] = len(stack)
+        stack.append(self.name)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end = time.perf_counter_ns()
+        Tracer._stack().pop()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        Tracer._record(
+            self.buffer,
+            "X",
+            self.name,
+            self.cat,
+            self.start / 1000.0,
+            (end - self.start) / 1000.0,
+            self.args,
+        )
+        return False
+
+
+class Tracer(object):
+    """Process-wide span/counter recorder; disabled (and near free) by default.
+
+    A profiling run spans many classes, so there is one recorder rather than
+    one per logger; the span *category* names the emitting class.  While
+    disabled, :meth:`span` returns a shared no-op context and :meth:`traced`
+    wrappers call straight through -- one attribute test per call.
+
+    Spans nest per thread (each records its ``depth``) and carry the process
+    and thread ids, so a Chrome trace shows worker threads as separate lanes.
+    Timestamps are ``time.perf_counter_ns`` (system-wide monotonic on the
+    supported platforms), so events from worker processes line up when merged.
+
+    Example:
+        Tracer.enable()
+        with Tracer.span("bake", cat="MapFactory", maps=4):
+            ...
+        Tracer.export_chrome_trace("run.trace.json")
+    """
+
+    buffer: Optional[TraceBuffer] = None
+    _local = threading.local()
+    _null = nullcontext()
+
+    @classmethod
+    def enable(cls, capacity: int = 100000) -> TraceBuffer:
+        """Start recording (keeps an existing buffer of the same capacity)."""
+        if cls.buffer is None or cls.buffer.capacity != capacity:
+            cls.buffer = TraceBuffer(capacity)
+        return cls.buffer
+
+    @classmethod
+    def disable(cls) -> Optional[TraceBuffer]:
+        """Stop recording; returns the buffer so it can still be exported."""
+        buffer, cls.buffer = cls.buffer, None
+        return buffer
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls.buffer is not None
+
+    @classmethod
+    def span(cls, name: str, cat: str = "", **args):
+        """Context manager timing the enclosed block as *name*."""
+        buffer = cls.buffer
+        if buffer is None:
+            return cls._null
+        return _Span(buffer, name, cat, args)
+
+    @classmethod
+    def count(cls, name: str, cat: str = "", **values) -> None:
+        """Record counter sample(s), e.g. ``Tracer.count("cache", hits=3)``."""
+        buffer = cls.buffer
+        if buffer is None:
+            return
+        cls._record(
+            buffer, "C", name, cat, time.perf_counter_ns() / 1000.0, 0.0, values
+        )
+
+    @classmethod
+    def traced(cls, name: Optional[str] = None, cat: Optional[str] = None):
+        """Decorator: time every call of the function as a span.
+
+        *name* defaults to the function's ``__qualname__`` and *cat* to its
+        owning class name.  Place it under ``@classmethod`` /
+        ``@staticmethod``.
+        """
+
+        def decorator(func: Callable) -> Callable:
+            qualname = func.__qualname__
+            span_name = name or qualname
+            span_cat = cat if cat is not None else qualname.rpartition(".")[0]
+
+            @functools.wraps(func)
+            def wrapper(*a, **kw):
+                buffer = cls.buffer
+                if buffer is None:
+                    return func(*a, **kw)
+                with _Span(buffer, span_name, span_cat, {}):
+                    return func(*a, **kw)
+
+            return wrapper
+
+        return decorator
+
+    @classmethod
+    def summary(cls) -> Dict[str, Dict[str, float]]:
+        return cls.buffer.summary() if cls.buffer is not None else {}
+
+    @classmethod
+    def export_chrome_trace(cls, path: str) -> Optional[str]:
+        """Write the recorded events to *path*; ``None`` when never enabled."""
+        if cls.buffer is None:
+            return None
+        return cls.buffer.export_chrome_trace(path)
+
+    @classmethod
+    def _stack(cls) -> list:
+        try:
+            return cls._local.stack
+        except AttributeError:
+            cls._local.stack = []
+            return cls._local.stack
+
+    @staticmethod
+    def _record(buffer, ph, name, cat, ts, dur, args) -> None:
+        pid, thread = os.getpid(), threading.current_thread()
+        tid = thread.ident
+        if buffer.thread_names.get((pid, tid)) != thread.name:
+            buffer.thread_names[(pid, tid)] = thread.name  # idents get reused
+        buffer.add((ph, name, cat, ts, dur, pid, tid, args))
+
+
 class TableMixin:
     """Mixin for formatting data as ASCII tables."""
 
@@ -1650,6 +2239,7 @@ class LoggingMixin(TableMixin):
         log_level: Optional[Union[int, str]] = None,
         log_file: Optional[str] = None,
         log_buffer: Union[bool, int, None] = None,
+        log_async: Optional[bool] = None,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -1664,6 +2254,8 @@ class LoggingMixin(TableMixin):
                 self.enable_log_buffer(capacity=log_buffer)
             else:
                 self.enable_log_buffer()
+        if log_async is not None:
+            self.set_log_async(log_async)
 
     @ClassProperty
     def logger(cls) -> internal_logging.Logger:
@@ -1754,6 +2346,63 @@ class LoggingMixin(TableMixin):
         """
         cls.logger.set_log_file(filename, level)
 
+    @classmethod
+    def set_log_async(
+        cls,
+        enabled: bool = True,
+        capacity: int = 10000,
+        policy: str = "drop",
+        batch_size: int = 256,
+    ) -> None:
+        """Hand this class's log output to a listener thread (or stop).
+
+        For hot loops logging from worker threads: callers only queue the
+        record.  Off by default.  See ``LoggerExt._set_async``.
+        """
+        cls.logger.set_async(enabled, capacity, policy, batch_size)
+
+    @classmethod
+    def flush_log(cls, timeout: Optional[float] = None) -> bool:
+        """Wait for queued async records to be written; ``False`` on timeout."""
+        return cls.logger.flush_async(timeout)
+
+    # ---- tracing (process-wide, see Tracer) ----
+    traced = staticmethod(Tracer.traced)
+
+    @classmethod
+    def trace_span(cls, name: str, **args):
+        """Time a block as a span in this class's category (no-op when off).
+
+        Example:
+            with self.trace_span("resize", size=2048):
+                ...
+        """
+        return Tracer.span(name, cls.__name__, **args)
+
+    @classmethod
+    def trace_count(cls, name: str, **values) -> None:
+        """Record counter sample(s) in this class's category (no-op when off)."""
+        Tracer.count(name, cls.__name__, **values)
+
+    @staticmethod
+    def enable_tracing(capacity: int = 100000) -> None:
+        """Start recording spans/counters for every class (see ``Tracer``)."""
+        Tracer.enable(capacity)
+
+    @staticmethod
+    def disable_tracing() -> None:
+        Tracer.disable()
+
+    @staticmethod
+    def export_trace(path: str) -> Optional[str]:
+        """Write recorded spans as Chrome trace JSON (``chrome://tracing``)."""
+        return Tracer.export_chrome_trace(path)
+
+    @staticmethod
+    def trace_summary() -> Dict[str, Dict[str, float]]:
+        """Per span name: call count and total / mean / max seconds."""
+        return Tracer.summary()
+
     @classmethod
     def enable_log_buffer(
         cls, capacity: int = 2000, level: Union[int, str] = internal_logging.NOTSET
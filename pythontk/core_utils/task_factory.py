@@ -9,26 +9,69 @@ management, and processes check results. It knows nothing about any DCC -- the
 scene-exporter ``TaskManager`` in mayatk and blendertk each subclass it and
 supply the host-specific task/check methods it discovers by name.
 
+Methods marked with :meth:`TaskFactory.task_spec` may declare prerequisites and
+thread safety; the runner then schedules them as a dependency graph, running
+thread-safe ones concurrently on a pool while everything else stays on the
+caller's thread.
+
 Like :mod:`pythontk.core_utils.app_handoff`, this is a *general* orchestration
 base (no domain model or planner), so it lives in ``core_utils`` beside the other
 shared infrastructure rather than in ``core_utils/engines/``. Formerly vendored
 byte-identical in mayatk and blendertk; now the single source of truth.
 """
 import contextlib
+import os
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from inspect import signature
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Iterable, Optional, Set
+
+from pythontk.core_utils.logging_mixin import Tracer
 
 
 class TaskFactory:
     """A factory class for managing and executing tasks in a scene export pipeline."""
 
+    #: Pool size for tasks marked ``thread_safe`` (``None``: min(8, CPUs)).
+    #: ``1`` runs everything on the caller's thread, in order.
+    MAX_WORKERS: Optional[int] = None
+
     def __init__(self, logger):
         self.logger = logger
         self._method_cache = {}
         #: Restores registered by :meth:`stage_deferred_restore`, keyed so the
         #: first stager of a given state wins. Insertion-ordered; run LIFO.
         self._deferred_restores: Dict[str, Callable] = {}
+        #: Seconds per task/check of the last run, in completion order.
+        self._last_task_timings: Dict[str, float] = {}
+        self._last_wall_time = 0.0
+
+    @staticmethod
+    def task_spec(
+        thread_safe: bool = False, depends_on: Iterable[str] = ()
+    ) -> Callable:
+        """Declare scheduling metadata on a ``task_*`` / ``check_*`` method.
+
+        Parameters:
+            thread_safe: The method only reads shared state (or guards its own
+                writes), so it may run on a worker thread concurrently with
+                other thread-safe methods. Anything touching a host API that
+                is main-thread-only must leave this ``False``.
+            depends_on: Names of tasks/checks that must finish first. Names
+                not part of the current run are ignored.
+
+        Example:
+            @TaskFactory.task_spec(thread_safe=True, depends_on=["check_ngons"])
+            def check_uv_sets(self, value): ...
+        """
+        depends_on = tuple(depends_on)
+
+        def decorator(method: Callable) -> Callable:
+            method._task_thread_safe = bool(thread_safe)
+            method._task_depends_on = depends_on
+            return method
+
+        return decorator
 
     # ------------------------------------------------------------------
     # Deferred restores — the counterpart to the set_/revert_ pair
@@ -112,7 +155,14 @@ class TaskFactory:
 
     @contextlib.contextmanager
     def _manage_context(self, tasks: Dict[str, Any]) -> Dict[str, Any]:
-        """Manage task states by setting them once and reverting after, returning task results."""
+        """Manage task states by setting them once and reverting after, returning task results.
+
+        Tasks run in the given order unless :meth:`task_spec` says otherwise:
+        a task waits for its ``depends_on`` prerequisites, and ``thread_safe``
+        tasks whose prerequisites are met go to a worker pool while the
+        remaining tasks keep running, in order, on the caller's thread.
+        Results are returned in the given order.
+        """
         original_states = {}
         task_results = {}
 
@@ -130,50 +180,164 @@ class TaskFactory:
             return
 
         # self.logger.info(f"Running {len(valid_tasks)} tasks")
+        dependencies = self._task_dependencies(valid_tasks)
 
         # Revert in a finally: a task raising mid-loop, or an exception thrown
         # into the generator at the yield (from the with-body), must not leave
         # set_* state applied to the host scene.
         try:
-            for index, (task_name, value) in enumerate(valid_tasks.items(), start=1):
-                method = self._method_cache[task_name]  # Already cached
-                self.logger.info(
-                    f"Executing Task #{index}/{len(valid_tasks)}: {task_name}"
-                )
+            self._run_task_graph(
+                valid_tasks, dependencies, task_results, original_states
+            )
+            yield {name: task_results[name] for name in valid_tasks}
+        finally:
+            self._revert_states(original_states)
 
-                # Get revert method BEFORE executing the task
-                revert_method = self._get_revert_method(task_name)
-
-                try:
-                    t0 = time.perf_counter()
-                    result = self._execute_task_method(method, value)
-                    elapsed = time.perf_counter() - t0
-                    self.logger.success(f"  Completed {task_name} in {elapsed:.3f}s")
-                    task_results[task_name] = result
-
-                    # Store original state for reversion if this is a "set_" task
-                    if revert_method and result is not None:
-                        original_states[task_name] = {
-                            "revert_method": revert_method,
-                            "original_value": result,
-                        }
-                        self.logger.debug(
-                            f"Stored original state for {task_name}: {result}"
-                        )
+    def _task_dependencies(self, tasks: Dict[str, Any]) -> Dict[str, Set[str]]:
+        """Declared prerequisites of each task, limited to *tasks*.
 
-                    # Handle check failures efficiently
-                    if task_name.startswith("check_") and not self._is_success(result):
-                        self._log_check_failed(
-                            task_name, self._get_log_messages(result)
-                        )
+        Raises:
+            ValueError: The declarations form a cycle.
+        """
+        dependencies = {}
+        for name in tasks:
+            declared = getattr(self._method_cache[name], "_task_depends_on", ())
+            dependencies[name] = {d for d in declared if d in tasks and d != name}
+
+        # Kahn's algorithm: whatever cannot be peeled off is on a cycle.
+        remaining = {name: set(deps) for name, deps in dependencies.items()}
+        while remaining:
+            free = [name for name, deps in remaining.items() if not deps]
+            if not free:
+                raise ValueError(
+                    f"Task dependency cycle among: {', '.join(sorted(remaining))}"
+                )
+            for name in free:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(free)
+        return dependencies
 
-                except Exception as e:
-                    self.logger.error(f"Error during task {task_name}: {e}")
-                    raise
+    def _run_task_graph(
+        self,
+        tasks: Dict[str, Any],
+        dependencies: Dict[str, Set[str]],
+        task_results: Dict[str, Any],
+        original_states: Dict[str, Any],
+    ) -> None:
+        """Dispatch *tasks* in dependency order, filling the two result dicts.
+
+        Results are recorded on the caller's thread as tasks finish. When a
+        task raises, no new task starts; tasks already on the pool are
+        allowed to finish (and their ``set_*`` states recorded so they
+        revert) before the error propagates.
+        """
+        workers = self.MAX_WORKERS or min(8, os.cpu_count() or 1)
+        pending = list(tasks)
+        done: Set[str] = set()
+        running = {}
+        pool = None
+        error = None
+        total = len(tasks)
+        started = 0
+        wall_start = time.perf_counter()
+
+        def start_message(name):
+            nonlocal started
+            started += 1
+            self.logger.info(f"Executing Task #{started}/{total}: {name}")
 
-            yield task_results
+        try:
+            while pending or running:
+                ready = [n for n in pending if dependencies[n] <= done]
+                if error is None and workers > 1:
+                    for name in ready:
+                        if getattr(self._method_cache[name], "_task_thread_safe", 0):
+                            if pool is None:
+                                pool = ThreadPoolExecutor(
+                                    workers, thread_name_prefix="task-factory"
+                                )
+                            start_message(name)
+                            future = pool.submit(self._timed_task, name, tasks[name])
+                            running[future] = name
+                            pending.remove(name)
+                    ready = [n for n in ready if n in pending]
+
+                if ready and error is None:
+                    name = ready[0]
+                    pending.remove(name)
+                    start_message(name)
+                    try:
+                        outcome = self._timed_task(name, tasks[name])
+                    except Exception as e:
+                        error = e
+                    else:
+                        self._record_task_result(
+                            name, outcome, task_results, original_states
+                        )
+                        done.add(name)
+                    continue
+
+                if not running:
+                    break  # only reached after an error
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        if error is None:
+                            error = e
+                        continue
+                    self._record_task_result(
+                        name, outcome, task_results, original_states
+                    )
+                    done.add(name)
         finally:
-            self._revert_states(original_states)
+            if pool is not None:
+                pool.shutdown(wait=True)
+            self._last_wall_time += time.perf_counter() - wall_start
+        if error is not None:
+            raise error
+
+    def _timed_task(self, task_name: str, value: Any):
+        """Run one task; returns ``(result, seconds)`` (any thread)."""
+        method = self._method_cache[task_name]  # Already cached
+        try:
+            with Tracer.span(task_name, type(self).__name__):
+                t0 = time.perf_counter()
+                result = self._execute_task_method(method, value)
+                elapsed = time.perf_counter() - t0
+        except Exception as e:
+            self.logger.error(f"Error during task {task_name}: {e}")
+            raise
+        self.logger.success(f"  Completed {task_name} in {elapsed:.3f}s")
+        return result, elapsed
+
+    def _record_task_result(
+        self,
+        task_name: str,
+        outcome: tuple,
+        task_results: Dict[str, Any],
+        original_states: Dict[str, Any],
+    ) -> None:
+        """Store a finished task's result, revert state and timing (caller's thread)."""
+        result, elapsed = outcome
+        task_results[task_name] = result
+        self._last_task_timings[task_name] = elapsed
+
+        # Store original state for reversion if this is a "set_" task
+        revert_method = self._get_revert_method(task_name)
+        if revert_method and result is not None:
+            original_states[task_name] = {
+                "revert_method": revert_method,
+                "original_value": result,
+            }
+            self.logger.debug(f"Stored original state for {task_name}: {result}")
+
+        # Handle check failures efficiently
+        if task_name.startswith("check_") and not self._is_success(result):
+            self._log_check_failed(task_name, self._get_log_messages(result))
 
     def _execute_task_method(self, method, value: Any):
         """Execute a task method with proper parameter handling."""
@@ -257,6 +421,8 @@ class TaskFactory:
         """Execute tasks and checks with unified logic."""
         failed_checks = []
         all_checks_passed = True
+        self._last_task_timings = {}
+        self._last_wall_time = 0.0
 
         # Run tasks first
         if tasks_only:
@@ -353,6 +519,7 @@ class TaskFactory:
         checks_count: int,
     ) -> None:
         """Log the execution summary."""
+        self._log_task_timings()
         if not all_checks_passed:
             self.logger.log_box(
                 "SUMMARY OF FAILED CHECKS",
@@ -363,6 +530,22 @@ class TaskFactory:
         else:
             self._log_checks_passed(tasks_count, checks_count, len(failed_checks))
 
+    def _log_task_timings(self, limit: int = 10) -> None:
+        """Log the slowest tasks/checks of the last run and the wall time."""
+        timings = self._last_task_timings
+        if not timings:
+            return
+        busy = sum(timings.values())
+        slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+        items = [f"{name}: {seconds:.3f}s" for name, seconds in slowest[:limit]]
+        if len(slowest) > limit:
+            items.append(f"... {len(slowest) - limit} more")
+        self.logger.log_group(
+            f"Timings: {self._last_wall_time:.3f}s wall, {busy:.3f}s in "
+            f"{len(timings)} task(s)",
+            items,
+        )
+
     def _log_checks_passed(
         self, tasks_count: int, checks_count: int, failed_checks_count: int
     ) -> None:
@@ -29,6 +29,7 @@ import json
 import logging
 import os
 import platform
+import time
 from pathlib import Path
 from typing import Any, Mapping, Optional, Union
 
@@ -38,6 +39,8 @@ logger = logging.getLogger(__name__)
 # name* (a documented string convention, not an import) with uitk's
 # ``preset_manager.PresetManager.get_presets_root()`` so one override moves both stores.
 CONFIG_ROOT_ENV_VAR = "UITK_PRESETS_ROOT"
+# Env var that redirects the per-user cache root (see ``user_cache_root``).
+CACHE_ROOT_ENV_VAR = "UITK_CACHE_ROOT"
 _ECOSYSTEM_WRAPPER = "uitk"
 
 
@@ -184,3 +187,75 @@ class UserConfig:
                 os.path.expanduser("~"), ".config"
             )
         return Path(base) / _ECOSYSTEM_WRAPPER
+
+    @staticmethod
+    def user_cache_root() -> Path:
+        """The ecosystem per-user cache directory, resolved **without Qt**.
+
+        For derived, disposable data (scan and stats caches) that must not be
+        written beside the files it describes -- a source folder may be
+        read-only or under version control. Honors ``$UITK_CACHE_ROOT``
+        (used as given; ``~`` and ``%VAR%`` expanded). Otherwise:
+
+        * Windows: ``%LOCALAPPDATA%/uitk/cache``
+        * macOS:   ``~/Library/Caches/uitk``
+        * Linux:   ``$XDG_CACHE_HOME/uitk`` (else ``~/.cache/uitk``)
+        """
+        override = os.environ.get(CACHE_ROOT_ENV_VAR)
+        if override:
+            p = Path(os.path.expandvars(override)).expanduser()
+            return p if p.is_absolute() else p.absolute()
+
+        system = platform.system().lower()
+        if system == "windows":
+            base = os.environ.get("LOCALAPPDATA") or os.path.join(
+                os.path.expanduser("~"), "AppData", "Local"
+            )
+            return Path(base) / _ECOSYSTEM_WRAPPER / "cache"
+        if system == "darwin":
+            base = os.path.join(os.path.expanduser("~"), "Library", "Caches")
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+                os.path.expanduser("~"), ".cache"
+            )
+        return Path(base) / _ECOSYSTEM_WRAPPER
+
+    @staticmethod
+    def prune_cache_dir(
+        directory: Union[str, Path],
+        max_files: Optional[int] = None,
+        max_age_days: Optional[float] = None,
+        pattern: str = "*.json",
+    ) -> int:
+        """Bound a per-user cache directory written one file per key.
+
+        Removes *pattern* files not modified within *max_age_days*, then the
+        least recently modified beyond *max_files*. Callers run this after a
+        write, so the file just written is the newest and always survives.
+        Unremovable files are skipped. Returns the number of files removed.
+        """
+        now = time.time()
+        entries = []
+        for p in Path(directory).glob(pattern):
+            try:
+                entries.append((p.stat().st_mtime, p))
+            except OSError:
+                continue
+        entries.sort(reverse=True)  # newest first
+
+        doomed = []
+        if max_age_days is not None:
+            cutoff = now - max_age_days * 86400.0
+            doomed = [p for mtime, p in entries if mtime < cutoff]
+            entries = [(m, p) for m, p in entries if m >= cutoff]
+        if max_files is not None and len(entries) > max_files:
+            doomed += [p for _, p in entries[max(max_files, 0) :]]
+
+        removed = 0
+        for p in doomed:
+            try:
+                p.unlink()
+                removed += 1
+            except OSError as e:
+                logger.debug(f"UserConfig: cache entry not pruned {p}: {e}")
+        return removed
@@ -6,6 +6,8 @@ import hashlib
 import io
 import json
 import logging
+import math
+import mmap
 import os
 import platform as _platform
 import shlex
@@ -13,11 +15,20 @@ import shutil
 import struct
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
+from pythontk.core_utils.cancel_scope import CancelScope, CancellableExecutor
 from pythontk.core_utils.help_mixin import HelpMixin
+from pythontk.core_utils.logging_mixin import Tracer
+
+try:  # optional: typed accessor views (GlbEdit.accessor)
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
@@ -267,6 +278,14 @@ class MeshConvert(HelpMixin):
         - :attr:`bin_data` is a ``memoryview`` into :attr:`rest`, not a slice
           of it. A slice copies, which put peak memory at twice the file size
           to gain nothing: every consumer here only ever reads it.
+
+        :attr:`rest` itself is a view over a read-only ``mmap`` of the file,
+        so even a pass that does reach into the BIN -- hashing image payloads
+        in :meth:`MeshConvert.verify_glb`, probing alpha in
+        :meth:`MeshConvert.check_glb_materials` -- pages in only the
+        bufferViews it inspects rather than reading the whole geometry.
+        :meth:`buffer_view` and :meth:`accessor` hand out the same zero-copy
+        views per bufferView and per typed accessor.
         """
 
         #: Byte offset of the JSON chunk's payload -- the 12-byte file header
@@ -293,8 +312,10 @@ class MeshConvert(HelpMixin):
             #: leaving the OLD BIN on disk -- offsets pointing into bytes that
             #: no longer exist.
             self.rest_dirty = False
-            self._rest: Optional[bytes] = None
+            self._rest: Optional[Union[bytes, memoryview]] = None
             self._bin: Optional[memoryview] = None
+            #: The read-only map :attr:`rest` views, until :meth:`close`.
+            self._map: Optional[mmap.mmap] = None
             #: ``(image index, channel)`` -> that channel's ``(min, max)``.
             #: Keyed by channel so the alpha probes and the ORM probe share one
             #: decode of an atlas rather than one cache each.
@@ -318,14 +339,43 @@ class MeshConvert(HelpMixin):
             self._image_digests: Optional[Dict[str, int]] = None
 
         @property
-        def rest(self) -> bytes:
-            """Every byte after the JSON chunk, read on first use and cached."""
+        def rest(self) -> Union[bytes, memoryview]:
+            """Every byte after the JSON chunk, mapped on first use and cached.
+
+            A read-only view over an ``mmap`` of the file: nothing is read
+            until a consumer touches it, and then only the pages it touches.
+            Falls back to reading the bytes where the file cannot be mapped.
+            """
             if self._rest is None:
-                with open(self.path, "rb") as f:
-                    f.seek(self.JSON_OFFSET + self.json_len)
-                    self._rest = f.read()
+                start = self.JSON_OFFSET + self.json_len
+                try:
+                    with open(self.path, "rb") as f:
+                        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._rest = memoryview(self._map)[start:]
+                except (OSError, ValueError):  # unmappable fs / empty file
+                    with open(self.path, "rb") as f:
+                        f.seek(start)
+                        self._rest = f.read()
             return self._rest
 
+        def close(self) -> None:
+            """Release the map behind :attr:`rest`; it is re-mapped on next use.
+
+            Views handed out earlier (a caller's :attr:`bin_data`) keep the
+            map alive: closing it under them would invalidate memory they
+            still address, so while any remain the map is left for the
+            garbage collector instead.
+            """
+            self._bin = None
+            if not self.rest_dirty:
+                self._rest = None
+            if self._map is not None:
+                try:
+                    self._map.close()
+                except BufferError:  # exported views still alive
+                    pass
+                self._map = None
+
         def replace_rest(self, new_bin: bytes) -> None:
             """Swap the BIN chunk's payload for *new_bin* (repack support).
 
@@ -369,12 +419,133 @@ class MeshConvert(HelpMixin):
         def buffer_views(self) -> list:
             return self.gltf.get("bufferViews", []) or []
 
-        def _image_payload(self, image: dict) -> Optional[bytes]:
+        #: glTF accessor ``componentType`` -> numpy dtype (little-endian).
+        COMPONENT_DTYPES = {
+            5120: "<i1",
+            5121: "<u1",
+            5122: "<i2",
+            5123: "<u2",
+            5125: "<u4",
+            5126: "<f4",
+        }
+        #: glTF accessor ``type`` -> components per element.
+        TYPE_WIDTHS = {
+            "SCALAR": 1,
+            "VEC2": 2,
+            "VEC3": 3,
+            "VEC4": 4,
+            "MAT2": 4,
+            "MAT3": 9,
+            "MAT4": 16,
+        }
+
+        def buffer_view(self, index: int) -> Optional[memoryview]:
+            """A bufferView's bytes as a zero-copy view into the BIN chunk.
+
+            ``None`` for an index out of range, a view on an external
+            (``uri``) buffer, or a view reaching past the chunk -- the cases
+            where this file does not hold the bytes the JSON promises.
+            """
+            views = self.buffer_views
+            if not isinstance(index, int) or not 0 <= index < len(views):
+                return None
+            view = views[index]
+            buffers = self.gltf.get("buffers") or []
+            buffer_index = view.get("buffer", 0)
+            if 0 <= buffer_index < len(buffers) and buffers[buffer_index].get("uri"):
+                return None
+            blob = self.bin_data
+            start, length = view.get("byteOffset", 0), view.get("byteLength", 0)
+            if blob is None or start + length > len(blob):
+                return None
+            return blob[start : start + length]
+
+        def accessor(self, index: int) -> Any:
+            """Accessor *index* as a read-only numpy array over the BIN chunk.
+
+            Shaped ``(count,)`` for ``SCALAR`` and ``(count, width)`` otherwise,
+            typed by ``componentType`` and strided by the bufferView's
+            ``byteStride`` -- a view, not a copy, so scanning one attribute of
+            an interleaved vertex buffer pages in nothing else. An accessor
+            without a bufferView reads as zeros and a ``sparse`` one is
+            materialized with its substitutions applied, both per the spec;
+            those two are copies.
+
+            Raises:
+                ImportError: numpy is not installed.
+                ValueError: The accessor is malformed or addresses bytes this
+                    file does not hold.
+            """
+            if np is None:
+                raise ImportError("GlbEdit.accessor requires numpy.")
+            accessors = self.gltf.get("accessors") or []
+            if not isinstance(index, int) or not 0 <= index < len(accessors):
+                raise ValueError(f"accessor {index} out of range ({self.path})")
+            acc = accessors[index]
+            dtype = np.dtype(self.COMPONENT_DTYPES.get(acc.get("componentType"), "V"))
+            width = self.TYPE_WIDTHS.get(acc.get("type"))
+            count = acc.get("count", 0)
+            if dtype.kind == "V" or width is None:
+                raise ValueError(f"accessor {index} has an unknown layout ({self.path})")
+            shape = (count,) if width == 1 else (count, width)
+
+            view_index = acc.get("bufferView")
+            if view_index is None:
+                array = np.zeros(shape, dtype=dtype)
+            else:
+                blob = self.buffer_view(view_index)
+                if blob is None:
+                    raise ValueError(
+                        f"accessor {index}: bufferView {view_index} is not in "
+                        f"this file ({self.path})"
+                    )
+                element = dtype.itemsize * width
+                stride = self.buffer_views[view_index].get("byteStride") or element
+                offset = acc.get("byteOffset", 0)
+                if count and offset + stride * (count - 1) + element > len(blob):
+                    raise ValueError(
+                        f"accessor {index} reaches past bufferView {view_index} "
+                        f"({self.path})"
+                    )
+                strides = (stride,) if width == 1 else (stride, dtype.itemsize)
+                array = np.ndarray(
+                    shape, dtype=dtype, buffer=blob, offset=offset, strides=strides
+                )
+
+            sparse = acc.get("sparse")
+            if sparse:
+                array = array.copy()
+                indices = sparse["indices"]
+                positions = self._sparse_part(
+                    indices,
+                    np.dtype(self.COMPONENT_DTYPES[indices["componentType"]]),
+                    sparse["count"],
+                )
+                values = self._sparse_part(
+                    sparse["values"], dtype, sparse["count"] * width
+                )
+                array[positions.astype(np.int64)] = values.reshape((-1,) + shape[1:])
+            if array.flags.writeable:
+                array.flags.writeable = False
+            return array
+
+        def _sparse_part(self, part: dict, dtype: Any, count: int) -> Any:
+            """A sparse accessor's ``indices``/``values`` block (tightly packed)."""
+            blob = self.buffer_view(part.get("bufferView"))
+            if blob is None:
+                raise ValueError(f"sparse accessor block not in this file ({self.path})")
+            return np.frombuffer(
+                blob, dtype=dtype, count=count, offset=part.get("byteOffset", 0)
+            )
+
+        def _image_payload(self, image: dict) -> Optional[Union[bytes, memoryview]]:
             """An image's encoded bytes, or ``None`` when they are not in the file.
 
             Reads :attr:`bin_data` only for an image that actually uses a
             ``bufferView``, so a file whose images are all data URIs or external
-            keeps this class's "never read past the JSON chunk" property.
+            keeps this class's "never read past the JSON chunk" property. A
+            bufferView payload is a view, not a copy: hashing it pages in that
+            image's bytes and nothing else.
             """
             view_index = image.get("bufferView")
             if view_index is not None:
@@ -384,7 +555,7 @@ class MeshConvert(HelpMixin):
                     return None
                 view = views[view_index]
                 start = view.get("byteOffset", 0)
-                return bytes(blob[start : start + view["byteLength"]])
+                return blob[start : start + view["byteLength"]]
             uri = image.get("uri") or ""
             if uri.startswith("data:") and "," in uri:
                 try:
@@ -501,13 +672,14 @@ class MeshConvert(HelpMixin):
             entry = images[img_idx] if 0 <= img_idx < len(images) else {}
             return entry.get("name") or entry.get("uri") or f"image[{img_idx}]"
 
-        def image_bytes(self, img_entry: dict) -> Optional[bytes]:
+        def image_bytes(self, img_entry: dict) -> Optional[Union[bytes, memoryview]]:
             """Raw bytes for a glTF image entry, or ``None`` if unavailable.
 
             Resolves all three ways an image can be stored: inline as a
             ``data:`` URI, as a file beside the GLB, or as a slice of the BIN
             chunk. Only the last touches :attr:`bin_data`, so a GLB whose
-            images are all external never reads the geometry.
+            images are all external never reads the geometry; that one comes
+            back as a view into the map rather than a copy.
             """
             uri = img_entry.get("uri")
             if uri:
@@ -563,6 +735,11 @@ class MeshConvert(HelpMixin):
             by twenty materials is decoded once across *every* probe here (both
             alpha repairs and the ORM check) rather than once inside each.
 
+            An ``A`` probe on a JPEG, or on a PNG whose header declares no
+            alpha (colour type without alpha, no ``tRNS`` before ``IDAT``), is
+            answered from those header bytes without decoding -- the common
+            case for a delivered base colour map.
+
             Pillow is imported here rather than at module scope; the public
             entry points check for it up front and raise something actionable.
             """
@@ -578,6 +755,8 @@ class MeshConvert(HelpMixin):
             images = self.images
             if img_idx < len(images):
                 raw = self.image_bytes(images[img_idx])
+                if raw and channel == "A" and self._declares_alpha(raw) is False:
+                    raw = None
                 if raw:
                     try:
                         with Image.open(BytesIO(raw)) as im:
@@ -608,6 +787,31 @@ class MeshConvert(HelpMixin):
             self._channel_extrema[key] = result
             return result
 
+        @staticmethod
+        def _declares_alpha(raw: Union[bytes, memoryview]) -> Optional[bool]:
+            """Whether an encoded image can carry alpha, from its header alone.
+
+            ``False`` for JPEG and for a PNG that is neither grey+alpha nor
+            RGBA and has no ``tRNS`` chunk (which the spec places before the
+            first ``IDAT``); ``True`` when it may; ``None`` for anything else.
+            Walks chunk headers only -- never the pixel data.
+            """
+            if bytes(raw[:3]) == b"\xff\xd8\xff":
+                return False
+            if bytes(raw[:8]) != b"\x89PNG\r\n\x1a\n" or len(raw) < 26:
+                return None
+            if raw[25] in (4, 6):  # grey+alpha, RGBA
+                return True
+            pos = 8
+            while pos + 8 <= len(raw):
+                length, kind = struct.unpack(">I4s", raw[pos : pos + 8])
+                if kind == b"tRNS":
+                    return True
+                if kind in (b"IDAT", b"IEND"):
+                    return False
+                pos += 12 + length
+            return None
+
     @classmethod
     def _platform_exe_name(cls) -> str:
         """Return the FBX2glTF binary name for the current platform."""
@@ -2385,6 +2589,718 @@ class MeshConvert(HelpMixin):
 
         return fixes
 
+    # ------------------------------------------------------------------ #
+    # Batch QA: a chain of passes over many GLBs, one session per file
+    # ------------------------------------------------------------------ #
+
+    #: :meth:`batch_glb` stage name -> the pass it runs. Every pass takes a
+    #: path or an open :class:`GlbEdit`, which is what lets a chain share one.
+    BATCH_STAGES = {
+        "verify": "verify_glb",
+        "check_materials": "check_glb_materials",
+        "fix_alpha": "fix_glb_phantom_opaque_alpha",
+        "prune_textures": "prune_glb_unreferenced_textures",
+        "optimize_textures": "optimize_glb_textures",
+    }
+    #: Stages whose result is a finding list rather than a repair record.
+    #: Findings set the file's ``ok`` False; repairs never do.
+    _BATCH_CHECKS = ("verify", "check_materials")
+
+    @classmethod
+    def batch_glb(
+        cls,
+        glbs: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]],
+        stages: Sequence[Union[str, Tuple[str, Dict[str, Any]]]] = (
+            "verify",
+            "check_materials",
+        ),
+        workers: int = 0,
+        report_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Run a chain of checks/repairs over many GLBs, one session per file.
+
+        The QA gate over a delivery used to call each pass on each path in a
+        Python loop: five passes meant five parses of every JSON chunk, up to
+        five rewrites, and one file at a time. Here every file is opened once
+        (:meth:`open_glb`), the whole chain runs on that session, and it is
+        written at most once at the end -- only if some repair changed it.
+
+        Parameters:
+            glbs: A directory (its ``*.glb`` files, sorted) or an iterable of
+                GLB paths.
+            stages: Stage names from :attr:`BATCH_STAGES`, in run order, each
+                optionally paired with the pass's keyword arguments --
+                ``("fix_alpha", ("optimize_textures", {"max_size": 1024}))``.
+            workers: Process-pool size. 0 (default) runs in-process --
+                embedded DCC interpreters can't always spawn workers.
+            report_path: Also write the report here: ``.json`` (the full
+                report) or ``.csv`` (one row per file with per-stage seconds
+                and finding counts).
+
+        Returns:
+            ``{"files": [record, ...], "totals": {...}}``. A record (see
+            :meth:`_batch_glb_job`) carries ``path``, ``ok``, ``error``,
+            ``written``, ``seconds`` and per-stage ``seconds``/``findings``/
+            ``result``; ``read`` and ``write`` are timed as stages of their
+            own. A stage that raises stops that file's chain and nothing is
+            written for it -- its earlier repairs included, as with any body
+            that raises inside :meth:`open_glb` -- while the batch moves on.
+            ``totals``: ``files``, ``ok``, ``failed``, ``errors``,
+            ``written``, wall ``seconds`` and summed ``stage_seconds``.
+
+        Raises:
+            ValueError: An unknown stage name, or a *report_path* that is
+                neither ``.json`` nor ``.csv``.
+        """
+        chain: List[Tuple[str, Dict[str, Any]]] = []
+        for stage in stages:
+            name, options = (stage, {}) if isinstance(stage, str) else stage
+            if name not in cls.BATCH_STAGES:
+                raise ValueError(
+                    f"Unknown batch stage {name!r}; expected one of "
+                    f"{sorted(cls.BATCH_STAGES)}"
+                )
+            chain.append((name, dict(options or {})))
+        if report_path is not None:
+            if os.path.splitext(report_path)[1].lower() not in (".json", ".csv"):
+                raise ValueError(
+                    f"report_path must end in .json or .csv: {report_path}"
+                )
+
+        paths = cls._glb_paths(glbs)
+        start = time.perf_counter()
+        if workers > 0 and len(paths) > 1:
+            chunksize = max(1, len(paths) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                records = list(
+                    pool.map(
+                        cls._batch_glb_job,
+                        paths,
+                        [chain] * len(paths),
+                        chunksize=chunksize,
+                    )
+                )
+        else:
+            records = [cls._batch_glb_job(path, chain) for path in paths]
+
+        stage_seconds: Dict[str, float] = {}
+        for record in records:
+            for name, stage in record["stages"].items():
+                stage_seconds[name] = stage_seconds.get(name, 0.0) + stage["seconds"]
+        report = {
+            "files": records,
+            "totals": {
+                "files": len(records),
+                "ok": sum(1 for r in records if r["ok"]),
+                "failed": sum(1 for r in records if not r["ok"]),
+                "errors": sum(1 for r in records if r["error"]),
+                "written": sum(1 for r in records if r["written"]),
+                "seconds": round(time.perf_counter() - start, 4),
+                "stage_seconds": {k: round(v, 4) for k, v in stage_seconds.items()},
+            },
+        }
+        logger.info(
+            "batch_glb: %(files)d file(s), %(ok)d ok, %(failed)d failed, "
+            "%(written)d written in %(seconds).1fs",
+            report["totals"],
+        )
+        if report_path is not None:
+            cls._write_batch_report(report, [name for name, _ in chain], report_path)
+        return report
+
+    @classmethod
+    def _batch_glb_job(
+        cls, path: str, chain: List[Tuple[str, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """One :meth:`batch_glb` file: the whole chain on one session.
+
+        Process-pool safe and never raises -- an exception becomes the
+        record's ``error`` (``"<stage>: <Type>: <message>"``).
+        """
+        record: Dict[str, Any] = {
+            "path": path,
+            "ok": True,
+            "error": None,
+            "written": False,
+            "seconds": 0.0,
+            "stages": {},
+        }
+        start = time.perf_counter()
+        current = "read"
+        try:
+            with cls.open_glb(path) as edit:
+                record["stages"]["read"] = {
+                    "seconds": round(time.perf_counter() - start, 4)
+                }
+                for name, options in chain:
+                    current = name
+                    began = time.perf_counter()
+                    result = getattr(cls, cls.BATCH_STAGES[name])(edit, **options)
+                    stage = {"seconds": round(time.perf_counter() - began, 4)}
+                    if name == "verify":
+                        stage["findings"] = len(result["problems"])
+                    elif name in cls._BATCH_CHECKS:
+                        stage["findings"] = len(result)
+                    if stage.get("findings"):
+                        record["ok"] = False
+                    stage["result"] = result
+                    record["stages"][name] = stage
+                current = "write"
+                record["written"] = edit.dirty
+                began = time.perf_counter()
+            record["stages"]["write"] = {
+                "seconds": round(time.perf_counter() - began, 4)
+            }
+        except Exception as exc:  # noqa: BLE001 — one bad file must not stop QA
+            record["ok"] = False
+            record["written"] = False
+            record["error"] = f"{current}: {type(exc).__name__}: {exc}"
+            logger.warning("batch_glb: %s: %s", path, record["error"])
+        record["seconds"] = round(time.perf_counter() - start, 4)
+        return record
+
+    @staticmethod
+    def _write_batch_report(
+        report: Dict[str, Any], stage_names: List[str], report_path: str
+    ) -> None:
+        """Write :meth:`batch_glb`'s report as JSON, or one CSV row per file."""
+        directory = os.path.dirname(os.path.abspath(report_path))
+        os.makedirs(directory, exist_ok=True)
+        if report_path.lower().endswith(".json"):
+            with open(report_path, "w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2, default=str)
+            return
+
+        import csv
+
+        columns = ["path", "ok", "error", "written", "seconds", "read_seconds"]
+        for name in stage_names:
+            columns.append(f"{name}_seconds")
+            if name in MeshConvert._BATCH_CHECKS:
+                columns.append(f"{name}_findings")
+        columns.append("write_seconds")
+        with open(report_path, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=columns)
+            writer.writeheader()
+            for record in report["files"]:
+                row = {key: record[key] for key in columns[:5]}
+                for name, stage in record["stages"].items():
+                    row[f"{name}_seconds"] = stage["seconds"]
+                    if "findings" in stage:
+                        row[f"{name}_findings"] = stage["findings"]
+                writer.writerow(row)
+
+    @staticmethod
+    def _glb_paths(
+        glbs: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]]
+    ) -> List[str]:
+        """A directory's ``*.glb`` files (sorted), or the given paths as strings."""
+        if isinstance(glbs, (str, os.PathLike)):
+            directory = os.fspath(glbs)
+            return sorted(
+                os.path.join(directory, name)
+                for name in os.listdir(directory)
+                if name.lower().endswith(".glb")
+            )
+        return [os.fspath(p) for p in glbs]
+
+    # ------------------------------------------------------------------ #
+    # Delivery sets: texture work shared across many GLBs
+    # ------------------------------------------------------------------ #
+
+    #: Core material slots :meth:`_atlas_glb_images` may rebind -- the ones
+    #: whose ``textureInfo`` a ``KHR_texture_transform`` can ride.
+    ATLAS_SLOTS = (
+        "baseColorTexture",
+        "metallicRoughnessTexture",
+        "normalTexture",
+        "occlusionTexture",
+        "emissiveTexture",
+    )
+
+    #: Pixel margin :meth:`_atlas_glb_images` frees around every atlas tile
+    #: and fills from the tile's own edge, so bilinear taps at full
+    #: resolution never average in a neighbour. The margin halves with each
+    #: mip level: 4 px keeps mips 1 and 2 clean, while smaller mips still
+    #: blend adjacent tiles at their edges, as any atlas does.
+    ATLAS_GUTTER = 4
+
+    @classmethod
+    def optimize_glb_delivery(
+        cls,
+        glbs: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]],
+        shared_dir: Optional[str] = None,
+        min_shared: int = 2,
+        atlas_max_edge: int = 0,
+        atlas_size: int = 2048,
+        **optimize_opts: Any,
+    ) -> Dict[str, Any]:
+        """Optimize a set of GLBs' textures together, encoding each unique image once.
+
+        A delivery is rarely one file: the props of a room are exported one
+        GLB each, and every one of them carries its own embedded copy of the
+        trim sheet, the tiling concrete, the shared decal. Per file,
+        :meth:`optimize_glb_textures` dedupes within the file only, so the
+        same 4K source was decoded, resized and re-encoded once per GLB that
+        holds it -- and shipped once per GLB too.
+
+        Pass one indexes every image payload across the set by SHA-256
+        (read-only; nothing is written). Pass two then opens each file once
+        and, in that one session:
+
+        1. **Atlas** (``atlas_max_edge`` > 0): small images -- longest edge at
+           most *atlas_max_edge* -- are packed per slot semantic into one
+           atlas texture (:meth:`_atlas_glb_images`).
+        2. **Re-encode** through :meth:`optimize_glb_textures` with one
+           encode cache for the whole set, so an image already encoded for an
+           earlier file is reused, not re-encoded.
+        3. **Externalize** (*shared_dir* given): every image whose source
+           bytes appear in at least *min_shared* files is written once to
+           *shared_dir*, named by the digest of its delivered bytes, and the
+           GLB references it by relative URI instead of embedding it. A
+           viewer streaming the set then fetches (and caches) it once.
+
+        Shared images are never atlased -- the atlas is per file, and packing
+        a shared image into it would turn one cacheable file into a private
+        copy per GLB.
+
+        Parameters:
+            glbs: A directory (its ``*.glb`` files, sorted) or an iterable of
+                GLB paths. Modified in place.
+            shared_dir: Where shared images are written. ``None`` (default)
+                keeps every image embedded; the encode is still shared.
+            min_shared: How many files must hold an image for it to be
+                externalized.
+            atlas_max_edge: Longest edge (pixels) an image may have to be
+                packed into an atlas. 0 (default) disables atlasing.
+            atlas_size: Largest atlas edge, in pixels.
+            **optimize_opts: Passed on to :meth:`optimize_glb_textures`
+                (``max_size``, ``image_format``, ``quality``, ...).
+
+        Returns:
+            ``{"files": [record, ...], "totals": {...}}``. A record carries
+            ``path``, ``error``, ``bytes_before`` / ``bytes_after`` (file
+            size) and the ``atlas``, ``optimize`` and ``externalized``
+            results. ``totals``: ``files``, ``images`` (unique payloads),
+            ``references`` (embedded images across the set),
+            ``duplicate_bytes`` (payload a per-file pass would have carried
+            more than once), ``encodes`` (unique encode jobs), ``reused``
+            (jobs served from the shared cache), ``shared`` / ``shared_bytes``
+            (files written to *shared_dir*), ``bytes_before`` /
+            ``bytes_after`` and wall ``seconds``.
+        """
+        start = time.perf_counter()
+        paths = cls._glb_paths(glbs)
+
+        files_by_digest: Dict[str, Set[str]] = {}
+        size_by_digest: Dict[str, int] = {}
+        references = 0
+        for path in paths:
+            try:
+                with cls.open_glb(path) as edit:
+                    for image in edit.images:
+                        payload = edit._image_payload(image)
+                        if not payload:
+                            continue
+                        digest = hashlib.sha256(payload).hexdigest()
+                        references += 1
+                        files_by_digest.setdefault(digest, set()).add(path)
+                        size_by_digest[digest] = len(payload)
+            except Exception as exc:  # noqa: BLE001 — reported in pass two
+                logger.warning("optimize_glb_delivery: cannot index %s: %s", path, exc)
+        duplicate_bytes = sum(
+            size_by_digest[digest] * (len(files) - 1)
+            for digest, files in files_by_digest.items()
+        )
+        shared: Set[str] = (
+            {d for d, files in files_by_digest.items() if len(files) >= min_shared}
+            if shared_dir
+            else set()
+        )
+        if shared:
+            os.makedirs(shared_dir, exist_ok=True)
+
+        encode_cache: Dict[Any, Any] = {}
+        written: Dict[str, str] = {}
+        records: List[Dict[str, Any]] = []
+        for path in paths:
+            record: Dict[str, Any] = {
+                "path": path,
+                "error": None,
+                "bytes_before": os.path.getsize(path) if os.path.isfile(path) else 0,
+                "bytes_after": 0,
+                "atlas": {},
+                "optimize": {},
+                "externalized": 0,
+            }
+            try:
+                with cls.open_glb(path) as edit:
+                    if atlas_max_edge:
+                        record["atlas"] = cls._atlas_glb_images(
+                            edit, atlas_max_edge, atlas_size, skip=shared
+                        )
+                        if record["atlas"]:
+                            cls.prune_glb_unreferenced_textures(edit)
+                    # Indices survive the re-encode (fallbacks are appended),
+                    # so the SOURCE digest is what decides sharing afterwards.
+                    source_digests = {}
+                    for index, image in enumerate(edit.images):
+                        payload = edit._image_payload(image)
+                        if payload:
+                            source_digests[index] = hashlib.sha256(payload).hexdigest()
+                    record["optimize"] = cls.optimize_glb_textures(
+                        edit, encode_cache=encode_cache, **optimize_opts
+                    )
+                    if shared:
+                        record["externalized"] = cls._externalize_glb_images(
+                            edit,
+                            [i for i, d in source_digests.items() if d in shared],
+                            shared_dir,
+                            written,
+                        )
+                        if record["externalized"]:
+                            cls.prune_glb_unreferenced_textures(edit)
+            except Exception as exc:  # noqa: BLE001 — one bad file must not stop the set
+                record["error"] = f"{type(exc).__name__}: {exc}"
+                logger.warning("optimize_glb_delivery: %s: %s", path, record["error"])
+            record["bytes_after"] = os.path.getsize(path) if os.path.isfile(path) else 0
+            records.append(record)
+
+        report = {
+            "files": records,
+            "totals": {
+                "files": len(records),
+                "errors": sum(1 for r in records if r["error"]),
+                "images": len(files_by_digest),
+                "references": references,
+                "duplicate_bytes": duplicate_bytes,
+                "encodes": len(encode_cache),
+                "reused": sum(r["optimize"].get("reused", 0) for r in records),
+                "shared": len(written),
+                "shared_bytes": sum(os.path.getsize(p) for p in written.values()),
+                "bytes_before": sum(r["bytes_before"] for r in records),
+                "bytes_after": sum(r["bytes_after"] for r in records),
+                "seconds": round(time.perf_counter() - start, 4),
+            },
+        }
+        logger.info(
+            "optimize_glb_delivery: %(files)d file(s), %(images)d unique of "
+            "%(references)d image(s), %(encodes)d encode(s), %(shared)d shared.",
+            report["totals"],
+        )
+        return report
+
+    @classmethod
+    def _externalize_glb_images(
+        cls,
+        edit: "MeshConvert.GlbEdit",
+        indices: Iterable[int],
+        shared_dir: str,
+        written: Dict[str, str],
+    ) -> int:
+        """Move images *indices* out to *shared_dir*, referenced by relative URI.
+
+        Each payload is written once, as ``<sha256[:16]><ext>`` of the bytes
+        it now holds -- *written* (digest -> path) spans the whole delivery,
+        and a file already on disk under that name is the same bytes. The
+        image is not edited in place: a NEW external image is appended and
+        every texture source (plain and extension) repointed to it, which
+        leaves the embedded original unreferenced for
+        :meth:`prune_glb_unreferenced_textures` to drop with its bufferView.
+
+        A texture binding one of *indices* through an extension (a KTX2
+        ``KHR_texture_basisu`` source) takes its plain ``source`` -- the
+        core-readable fallback :meth:`optimize_glb_textures` appended --
+        along: the fallback is derived from the same shared image, so left
+        embedded it would be a private copy per GLB.
+
+        Returns:
+            The number of images externalized.
+        """
+        from urllib.parse import quote
+
+        gltf = edit.gltf
+        images = gltf.get("images") or []
+        base = os.path.dirname(os.path.abspath(edit.path))
+        indices = set(indices)
+        for texture in gltf.get("textures") or []:
+            if isinstance(texture.get("source"), int) and any(
+                isinstance(ext, dict) and ext.get("source") in indices
+                for ext in (texture.get("extensions") or {}).values()
+            ):
+                indices.add(texture["source"])
+        moved: Dict[int, int] = {}
+        for index in sorted(indices):
+            if not 0 <= index < len(images):
+                continue
+            image = images[index]
+            payload = edit._image_payload(image)
+            if not payload:
+                continue
+            mime = image.get("mimeType") or "image/png"
+            extension = ".jpg" if mime == "image/jpeg" else "." + mime.split("/")[-1]
+            digest = hashlib.sha256(payload).hexdigest()
+            target = written.get(digest)
+            if target is None:
+                target = os.path.join(shared_dir, digest[:16] + extension)
+                if not os.path.isfile(target):
+                    # Sibling temp + rename: a reader of the shared directory
+                    # never sees half an image.
+                    fd, tmp = tempfile.mkstemp(dir=shared_dir, suffix=".tmp")
+                    try:
+                        with os.fdopen(fd, "wb") as fh:
+                            fh.write(payload)
+                        os.replace(tmp, target)
+                    except BaseException:
+                        if os.path.exists(tmp):
+                            os.remove(tmp)
+                        raise
+                written[digest] = target
+            try:
+                uri = os.path.relpath(target, base).replace(os.sep, "/")
+            except ValueError:  # another drive (Windows): no relative form
+                logger.warning(
+                    "optimize_glb_delivery: %s is not reachable relative to %s; "
+                    "image %d stays embedded.",
+                    target,
+                    edit.path,
+                    index,
+                )
+                continue
+            entry: Dict[str, Any] = {"uri": quote(uri), "mimeType": mime}
+            if image.get("name"):
+                entry["name"] = image["name"]
+            images.append(entry)
+            moved[index] = len(images) - 1
+
+        if not moved:
+            return 0
+        for texture in gltf.get("textures") or []:
+            if texture.get("source") in moved:
+                texture["source"] = moved[texture["source"]]
+            for ext in (texture.get("extensions") or {}).values():
+                if isinstance(ext, dict) and ext.get("source") in moved:
+                    ext["source"] = moved[ext["source"]]
+        edit._image_digests = None
+        edit.dirty = True
+        return len(moved)
+
+    @classmethod
+    def _atlas_glb_images(
+        cls,
+        edit: "MeshConvert.GlbEdit",
+        max_edge: int,
+        atlas_size: int = 2048,
+        skip: Optional[Set[str]] = None,
+    ) -> Dict[str, int]:
+        """Pack a GLB's small images into one atlas per slot semantic.
+
+        Each small image stops being its own texture -- its own request, its
+        own GPU bind, its own mip chain -- and becomes a rect of a shared
+        atlas. Rather than rewriting TEXCOORD accessors (the other textures
+        of the same material sample that UV set unchanged), every rebound
+        ``textureInfo`` carries the rect as a glTF-standard
+        ``KHR_texture_transform``, the same idiom the lightmap applier uses.
+        The atlas samples CLAMP_TO_EDGE.
+
+        Conservative by construction -- an image is a candidate only when:
+
+        * its longest edge is at most *max_edge* and its digest is not in
+          *skip*;
+        * every texture reading it samples it plainly (no extension
+          binding), and every ``textureInfo`` naming those textures is a
+          core slot (:attr:`ATLAS_SLOTS`) with no transform of its own and
+          not a texCoord-1 occlusion/emissive lightmap;
+        * every primitive drawing those materials has that TEXCOORD set
+          inside [0, 1] -- a repeating UV would sample its atlas neighbours.
+
+        Images group by :meth:`_image_semantics`, so colour and data never
+        share an atlas (they encode differently downstream); a group needs
+        two members. Cells are sized by pixel area in a power-of-two atlas
+        capped at *atlas_size*; each tile is inset by :attr:`ATLAS_GUTTER`
+        px and the freed border filled from its nearest tile texel, so
+        filtering at a tile edge does not reach a neighbour at full
+        resolution or in the first mips; the smallest mips still blend
+        across tile edges. Requires numpy, Pillow and cv2; skipped with a
+        warning otherwise.
+
+        Returns:
+            ``{"atlases": n, "images": n}`` -- atlases embedded and images
+            packed into them; empty when nothing was packed.
+        """
+        try:
+            import cv2  # noqa: F401 — ImgUtils.assemble_atlas resizes with it
+            from PIL import Image
+        except ImportError:
+            logger.warning("_atlas_glb_images: Pillow/cv2 unavailable; skipped.")
+            return {}
+        if np is None:
+            logger.warning("_atlas_glb_images: numpy unavailable; skipped.")
+            return {}
+        from pythontk.img_utils._img_utils import ImgUtils
+
+        gltf = edit.gltf
+        images = gltf.get("images") or []
+        textures = gltf.get("textures") or []
+        materials = gltf.get("materials") or []
+        if len(images) < 2:
+            return {}
+        skip = skip or set()
+
+        # Every textureInfo in the material tree, with its owner and slot.
+        refs: List[Tuple[int, str, dict]] = []
+
+        def _walk(node: Any, material: int) -> None:
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if (
+                        key.endswith("Texture")
+                        and isinstance(value, dict)
+                        and isinstance(value.get("index"), int)
+                    ):
+                        refs.append((material, key, value))
+                    _walk(value, material)
+            elif isinstance(node, list):
+                for item in node:
+                    _walk(item, material)
+
+        for m_index, material in enumerate(materials):
+            _walk(material, m_index)
+
+        # Primitive UV sets by material, checked once per (material, set).
+        prims_by_material: Dict[int, List[dict]] = {}
+        for mesh in gltf.get("meshes") or []:
+            for prim in mesh.get("primitives") or []:
+                if isinstance(prim.get("material"), int):
+                    prims_by_material.setdefault(prim["material"], []).append(prim)
+        uv_ok: Dict[Tuple[int, int], bool] = {}
+
+        def _uvs_in_unit(material: int, texcoord: int) -> bool:
+            key = (material, texcoord)
+            if key not in uv_ok:
+                ok = True
+                for prim in prims_by_material.get(material, []):
+                    acc_index = (prim.get("attributes") or {}).get(
+                        f"TEXCOORD_{texcoord}"
+                    )
+                    if acc_index is None or prim.get("targets"):
+                        ok = False
+                        break
+                    accessor = gltf["accessors"][acc_index]
+                    if accessor.get("normalized"):
+                        continue  # integer UVs normalized to [0, 1] already
+                    try:
+                        uv = edit.accessor(acc_index)
+                    except ValueError:
+                        ok = False
+                        break
+                    if uv.size and (uv.min() < -1e-4 or uv.max() > 1 + 1e-4):
+                        ok = False
+                        break
+                uv_ok[key] = ok
+            return uv_ok[key]
+
+        # Image -> the refs reaching it; disqualify on any unsafe reader.
+        refs_by_image: Dict[int, List[dict]] = {}
+        rejected: Set[int] = set()
+        for t_index, texture in enumerate(textures):
+            source = texture.get("source")
+            if not isinstance(source, int) or not 0 <= source < len(images):
+                continue
+            if texture.get("extensions"):
+                rejected.add(source)
+        for material, slot, ref in refs:
+            t_index = ref["index"]
+            if not 0 <= t_index < len(textures):
+                continue
+            source = textures[t_index].get("source")
+            if not isinstance(source, int) or not 0 <= source < len(images):
+                continue
+            texcoord = ref.get("texCoord", 0)
+            if (
+                slot not in cls.ATLAS_SLOTS
+                or ref.get("extensions")
+                or (texcoord == 1 and slot in ("occlusionTexture", "emissiveTexture"))
+                or not _uvs_in_unit(material, texcoord)
+            ):
+                rejected.add(source)
+                continue
+            refs_by_image.setdefault(source, []).append(ref)
+
+        semantics = cls._image_semantics(edit)
+        groups: Dict[str, List[Tuple[int, Any]]] = {}
+        for index in sorted(refs_by_image):
+            if index in rejected or index not in semantics:
+                continue
+            payload = edit._image_payload(images[index])
+            if not payload or hashlib.sha256(payload).hexdigest() in skip:
+                continue
+            try:
+                pil = Image.open(io.BytesIO(payload))
+                if max(pil.size) > max_edge:
+                    continue
+                pil.load()
+            except Exception as error:  # noqa: BLE001 — an unreadable image stays
+                logger.warning("_atlas_glb_images: unreadable image %d: %s", index, error)
+                continue
+            groups.setdefault(semantics[index], []).append((index, pil))
+
+        packed = atlases = 0
+        for semantic, members in sorted(groups.items()):
+            if len(members) < 2:
+                continue
+            alpha = any(
+                "A" in pil.getbands() or pil.info.get("transparency") is not None
+                for _, pil in members
+            )
+            mode = "RGBA" if alpha else "RGB"
+            arrays = [np.asarray(pil.convert(mode)) for _, pil in members]
+            areas = [a.shape[0] * a.shape[1] for a in arrays]
+            edge = 1 << max(0, math.ceil(math.log2(math.sqrt(sum(areas)))))
+            edge = min(edge, atlas_size)
+            rects = ImgUtils.snap_atlas_rects(
+                ImgUtils.inset_atlas_rects(
+                    ImgUtils.compute_atlas_layout(areas), edge, cls.ATLAS_GUTTER
+                ),
+                edge,
+            )
+            atlas = ImgUtils.assemble_atlas(arrays, rects, edge)
+            covered = np.zeros(atlas.shape[:2], dtype=bool)
+            for row0, row1, col0, col1 in ImgUtils.atlas_pixel_rects(rects, edge):
+                covered[row0:row1, col0:col1] = True
+            atlas = ImgUtils.fill_empty_texels(atlas, covered)
+            buffer = io.BytesIO()
+            Image.fromarray(atlas, mode).save(buffer, format="PNG")
+            t_atlas = cls._embed_image_bytes(
+                edit,
+                f"atlas:{semantic}",
+                buffer.getvalue(),
+                name=f"atlas_{semantic}.png",
+                clamp=True,
+            )
+            for (index, _), rect in zip(members, rects):
+                g_rect = ImgUtils.flip_rect_v(rect)
+                for ref in refs_by_image[index]:
+                    ref["index"] = t_atlas
+                    ref["extensions"] = {
+                        "KHR_texture_transform": {
+                            "offset": [g_rect[2], g_rect[3]],
+                            "scale": [g_rect[0], g_rect[1]],
+                        }
+                    }
+            packed += len(members)
+            atlases += 1
+        if not atlases:
+            return {}
+        used = gltf.setdefault("extensionsUsed", [])
+        if "KHR_texture_transform" not in used:
+            used.append("KHR_texture_transform")
+        edit.dirty = True
+        logger.info(
+            "_atlas_glb_images: packed %d image(s) into %d atlas(es).", packed, atlases
+        )
+        return {"atlases": atlases, "images": packed}
+
     @classmethod
     @contextmanager
     def open_glb(cls, glb: GlbTarget):
@@ -2407,15 +3323,109 @@ class MeshConvert(HelpMixin):
             yield glb
             return
         edit = cls._read_glb(os.fspath(glb))
-        yield edit
-        if edit.dirty:
-            # Once, here, rather than per writer: composed repairs each embed
-            # into the JSON chunk and the BIN is rebuilt a single time for all
-            # of them. Runs on the OWNER's close only -- a session handed in by
-            # a caller is relocated when that caller closes it, after its own
-            # writers have finished embedding.
-            cls._relocate_embedded_images(edit)
-            cls._write_glb(edit)
+        try:
+            yield edit
+            if edit.dirty:
+                # Once, here, rather than per writer: composed repairs each
+                # embed into the JSON chunk and the BIN is rebuilt a single time
+                # for all of them. Runs on the OWNER's close only -- a session
+                # handed in by a caller is relocated when that caller closes
+                # it, after its own writers have finished embedding.
+                cls._relocate_embedded_images(edit)
+                cls._write_glb(edit)
+        finally:
+            edit.close()
+
+    @classmethod
+    def split_glb(
+        cls, glb: GlbTarget, uri_prefix: str = ""
+    ) -> Tuple[dict, Dict[str, bytes]]:
+        """Split a GLB into a ``.gltf`` document plus content-addressed buffers.
+
+        Every ``bufferView`` on the embedded BIN chunk becomes a buffer of its
+        own, named by the SHA-256 of its bytes -- so two publishes of a scene
+        in which one material's texture changed share every part except that
+        image and the JSON. That is what lets a consumer which already holds
+        the previous revision's parts fetch only the difference (see
+        :meth:`PreviewServer.publish_parts`). Image views reuse
+        :attr:`GlbEdit.image_digests` rather than hashing the same payload a
+        second time; identical views collapse onto one buffer.
+
+        The rewritten document is otherwise the file's own: accessors,
+        strides and images keep addressing their ``bufferView`` (now at
+        ``byteOffset`` 0 of a dedicated buffer), and buffers that were already
+        external keep their URI.
+
+        Parameters:
+            glb: The GLB to split -- a path or an open :class:`GlbEdit`. Read
+                only; nothing is written back.
+            uri_prefix: Prepended to each part's ``<digest>.bin`` URI, e.g.
+                ``"parts/"`` when the parts are served from a subdirectory.
+
+        Returns:
+            ``(gltf, parts)`` -- the rewritten glTF JSON object and
+            ``{digest: payload}`` for every distinct part. The payloads are
+            copies, so the source is unmapped on return and may be replaced
+            or deleted while they are still held.
+        """
+        with cls.open_glb(glb) as edit:
+            gltf = copy.deepcopy(edit.gltf)
+            blob = edit.bin_data
+            views = gltf.get("bufferViews") or []
+            # The GLB-stored buffer is the one with no URI (spec: index 0).
+            buffers = gltf.get("buffers") or []
+            embedded = {
+                index for index, buffer in enumerate(buffers) if not buffer.get("uri")
+            }
+            known: Dict[int, str] = {}
+            for digest, image_index in edit.image_digests.items():
+                view_index = edit.images[image_index].get("bufferView")
+                if view_index is not None:
+                    known[view_index] = digest
+
+            new_buffers: List[dict] = []
+            remap: Dict[int, int] = {}
+            for index, buffer in enumerate(buffers):
+                if index not in embedded:
+                    remap[index] = len(new_buffers)
+                    new_buffers.append(buffer)
+
+            parts: Dict[str, bytes] = {}
+            slots: Dict[str, int] = {}
+            for view_index, view in enumerate(views):
+                buffer_index = view.get("buffer", 0)
+                if buffer_index not in embedded:
+                    view["buffer"] = remap.get(buffer_index, buffer_index)
+                    continue
+                if blob is None:
+                    raise ValueError(
+                        f"bufferView {view_index} addresses a BIN chunk the file "
+                        f"does not carry ({edit.path})"
+                    )
+                start = view.get("byteOffset", 0)
+                with blob[start : start + view["byteLength"]] as payload:
+                    digest = (
+                        known.get(view_index) or hashlib.sha256(payload).hexdigest()
+                    )
+                    if digest not in slots:
+                        slots[digest] = len(new_buffers)
+                        parts[digest] = payload.tobytes()
+                        new_buffers.append(
+                            {
+                                "byteLength": len(payload),
+                                "uri": f"{uri_prefix}{digest}.bin",
+                            }
+                        )
+                view["buffer"] = slots[digest]
+                view.pop("byteOffset", None)
+            # A live view of the BIN chunk would keep close() from unmapping.
+            blob = None
+
+            if new_buffers:
+                gltf["buffers"] = new_buffers
+            else:
+                gltf.pop("buffers", None)
+        return gltf, parts
 
     @classmethod
     def _read_glb(cls, glb_path: str) -> "MeshConvert.GlbEdit":
@@ -2491,18 +3501,34 @@ class MeshConvert(HelpMixin):
             return
 
         new_json += b" " * ((4 - (len(new_json) % 4)) % 4)
-        # Resolved before the truncating open, not inside it: `rest` is lazy,
-        # and reading it back out of a file we have just emptied would hand the
-        # writer nothing.
+        # Written beside the original and swapped in, never truncated in
+        # place: `rest` is a view over a map of the very file being replaced,
+        # and emptying that file under it would turn the copy into a fault
+        # (SIGBUS) rather than a short read. The swap also means a crash
+        # mid-write leaves the old GLB intact.
         rest = edit.rest
-        with open(edit.path, "wb") as f:
-            f.write(b"glTF")
-            f.write(edit.version_bytes)
-            f.write(struct.pack("<I", 12 + 8 + len(new_json) + len(rest)))
-            f.write(struct.pack("<I", len(new_json)))
-            f.write(b"JSON")
-            f.write(new_json)
-            f.write(rest)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".glb_", suffix=".tmp", dir=os.path.dirname(edit.path) or "."
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"glTF")
+                f.write(edit.version_bytes)
+                f.write(struct.pack("<I", 12 + 8 + len(new_json) + len(rest)))
+                f.write(struct.pack("<I", len(new_json)))
+                f.write(b"JSON")
+                f.write(new_json)
+                f.write(rest)
+            shutil.copymode(edit.path, tmp_path)
+            del rest
+            edit.close()  # Windows refuses to replace a file that is mapped
+            os.replace(tmp_path, edit.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
         edit.json_len = len(new_json)
 
     @staticmethod
@@ -2630,6 +3656,7 @@ class MeshConvert(HelpMixin):
         return semantics
 
     @classmethod
+    @Tracer.traced()
     def optimize_glb_textures(
         cls,
         glb: GlbTarget,
@@ -2638,6 +3665,7 @@ class MeshConvert(HelpMixin):
         quality: int = 85,
         workers: Optional[int] = None,
         ktx2_fallback: bool = True,
+        encode_cache: Optional[Dict[Any, Any]] = None,
     ) -> Dict[str, Any]:
         """Downsize and re-encode a GLB's embedded images for web delivery.
 
@@ -2737,11 +3765,18 @@ class MeshConvert(HelpMixin):
                 everywhere (extension in ``extensionsUsed``). ``False`` ships
                 KTX2 alone and hard-requires a basisu-capable viewer
                 (``extensionsRequired``).
+            encode_cache: Optional dict shared across calls, keyed by the
+                encode settings plus each job's (payload digest, exemption,
+                semantic). A job already present is reused instead of
+                re-encoded -- what lets :meth:`optimize_glb_delivery` encode
+                a texture shared by twenty GLBs once. Owned by the caller;
+                this pass only adds to it.
 
         Returns:
             Summary dict: ``images`` (converted count), ``bytes_before`` /
-            ``bytes_after`` (image payload totals). Empty when Pillow is
-            unavailable or there is nothing to do.
+            ``bytes_after`` (image payload totals), plus ``reused`` (jobs
+            served from *encode_cache*) when a cache was passed. Empty when
+            Pillow is unavailable or there is nothing to do.
         """
         try:
             from PIL import Image
@@ -2856,8 +3891,10 @@ class MeshConvert(HelpMixin):
                 jobs.setdefault(key, payload)
                 labels.setdefault(key, image.get("name") or index)
 
+            @Tracer.traced("optimize_glb_textures.encode", "MeshConvert")
             def _encode(key: Tuple[str, bool, Optional[str]]) -> Optional[bytes]:
                 """Decode, resize and re-encode one job; ``None`` keeps the original."""
+                CancelScope.check()
                 payload, is_exempt, semantic = jobs[key], key[1], key[2]
                 try:
                     pil = Image.open(io.BytesIO(payload))
@@ -2997,20 +4034,36 @@ class MeshConvert(HelpMixin):
             # encode buffers, and this routinely runs inside a DCC that is
             # already holding the scene the export came from -- so the ceiling
             # is host memory, not cores.
+            #
+            # A shared *encode_cache* narrows the batch to the jobs no earlier
+            # call has already encoded under the same settings.
+            settings = (image_format, max_size, quality, ktx2_fallback)
+            encoded_by_key: Dict[Tuple[str, bool, Optional[str]], Any] = {}
+            if encode_cache is not None:
+                for key in jobs:
+                    if (settings, key) in encode_cache:
+                        encoded_by_key[key] = encode_cache[(settings, key)]
+            reused = len(encoded_by_key)
+            pending = [key for key in jobs if key not in encoded_by_key]
             count = max(
                 1,
                 min(
                     workers or min(cls.OPTIMIZE_WORKERS, os.cpu_count() or 1),
-                    len(jobs),
+                    len(pending) or 1,
                 ),
             )
             if count > 1:
-                with ThreadPoolExecutor(
+                # Cancelling the caller's scope drops the queued encodes; the
+                # GLB is only rewritten after every encode has returned.
+                with CancellableExecutor(
                     max_workers=count, thread_name_prefix="ptk-glb-optimize"
                 ) as pool:
-                    encoded_by_key = dict(zip(jobs, pool.map(_encode, list(jobs))))
+                    encoded_by_key.update(zip(pending, pool.map(_encode, pending)))
             else:
-                encoded_by_key = {key: _encode(key) for key in jobs}
+                encoded_by_key.update((key, _encode(key)) for key in pending)
+            if encode_cache is not None:
+                for key in pending:
+                    encode_cache[(settings, key)] = encoded_by_key[key]
 
             # Phase C (serial): fan the per-job results back out to the image
             # indices that share them. ``replacements`` keys the image INDEX to
@@ -3232,6 +4285,8 @@ class MeshConvert(HelpMixin):
             "bytes_before": before,
             "bytes_after": after,
         }
+        if encode_cache is not None:
+            summary["reused"] = reused
         logger.info(
             "optimize_glb_textures: %d image(s), %.1f MB -> %.1f MB.",
             summary["images"],
@@ -422,11 +422,13 @@ class Metadata(MetadataInternal):
         Args:
             file_path: Single path (str) or list of paths.
             *keys: Metadata keys or Tag keys to retrieve.
-            mode: 'metadata' (default) or 'tag'.
+            mode: 'metadata' (default), 'tag', or 'sidecar' (the JSON sidecar
+                only, whatever :attr:`enable_sidecar` says; values keep their
+                JSON types).
 
         Returns:
             - If file_path is list: NamedTupleContainer (batch operation)
-            - If file_path is str and mode='metadata': Dict of metadata
+            - If file_path is str and mode='metadata' or 'sidecar': Dict of metadata
             - If file_path is str and mode='tag':
                 - If single key: str value
                 - If multiple keys: Dict of {key: value}
@@ -441,6 +443,9 @@ class Metadata(MetadataInternal):
             return cls._batch_get(file_path, *keys)
 
         # Handle single file operation
+        if mode == "sidecar":
+            sidecar_data = cls._load_sidecar(file_path)
+            return {k: sidecar_data.get(k) for k in keys}
         if mode == "tag":
             if len(keys) == 1:
                 return cls._get_tag(file_path, keys[0])
@@ -457,12 +462,16 @@ class Metadata(MetadataInternal):
 
         Args:
             file_path: Single path (str) or list of paths.
-            mode: 'metadata' (default) or 'tag'.
+            mode: 'metadata' (default), 'tag', or 'sidecar' (merge into the
+                JSON sidecar only; values may be any JSON type, None removes).
             **kwargs: Key-value pairs to set.
         """
         # Handle batch operation
         if isinstance(file_path, (list, tuple)):
-            if mode == "tag":
+            if mode == "sidecar":
+                for fp in file_path:
+                    cls._save_sidecar(fp, kwargs)
+            elif mode == "tag":
                 for fp in file_path:
                     for k, v in kwargs.items():
                         cls._set_tag(fp, k, v)
@@ -471,7 +480,9 @@ class Metadata(MetadataInternal):
             return
 
         # Handle single file operation
-        if mode == "tag":
+        if mode == "sidecar":
+            cls._save_sidecar(file_path, kwargs)
+        elif mode == "tag":
             for k, v in kwargs.items():
                 cls._set_tag(file_path, k, v)
         else:
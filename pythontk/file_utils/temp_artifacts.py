@@ -28,10 +28,11 @@ import atexit
 import hashlib
 import os
 import shutil
+import socket
 import tempfile
 import threading
 import time
-from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
 
 from pythontk.core_utils.logging_mixin import LoggingMixin
 
@@ -268,14 +269,32 @@ class CachedArtifact(LoggingMixin):
         >>> if got.scratch:          # a miss produced it — clean up on success
         ...     got.scratch.cleanup()
 
+    Shared caches (several farm nodes on one *dir*) get two more guarantees. A miss
+    claims the slot with a ``<slot>.lock`` file (``O_EXCL``, heartbeated while held),
+    so a concurrent miss of the same key waits for the first producer and is then
+    served its result instead of re-running a multi-minute conversion. A lock whose
+    heartbeat stopped (holder crashed) goes stale after *lock_stale_seconds* and is
+    broken; ``os.replace`` remains the backstop, so a lost race costs duplicate work,
+    never a torn file. And every hit re-stamps the slot's mtime, which makes both the
+    age sweep and the *max_bytes* budget least-recently-*used*: after each promote the
+    oldest-stamped slots are evicted until the cache fits (see :meth:`evict`).
+
     Parameters:
         name: Prefix shared by the cache (``<name>_cache_*``) and scratch (``<name>_*``)
             stores; also the sweep scope of each.
         extension: Artifact file extension, e.g. ``".fbx"``.
         dir: Base directory for both stores (default: the system temp dir).
-        max_age_days: Stale-sweep threshold for the cache store.
+        max_age_days: Stale-sweep threshold for the cache store (age since last use).
+        max_bytes: Byte budget for the cache store (artifacts + sidecars); None for
+            no bound.
+        lock_timeout: Seconds a miss waits on another producer's live lock before
+            producing anyway (logged); None waits as long as the holder heartbeats.
+        lock_stale_seconds: Age of an un-heartbeated lock after which it is broken.
     """
 
+    #: Seconds between checks while waiting on another producer's slot lock.
+    LOCK_POLL_SECONDS = 0.25
+
     class Result(NamedTuple):
         """What :meth:`CachedArtifact.get` hands back.
 
@@ -288,6 +307,51 @@ class CachedArtifact(LoggingMixin):
         hit: bool
         scratch: Optional[TempArtifacts]
 
+    class _SlotLock:
+        """Exclusive cross-process claim on one cache slot: an ``O_EXCL`` lock file,
+        its mtime refreshed by a daemon thread while held so that only a dead
+        holder's claim ever ages past *stale_seconds*."""
+
+        def __init__(self, path: str, stale_seconds: float):
+            self.path = path
+            self.stale_seconds = stale_seconds
+            self._stop = threading.Event()
+            self._beat: Optional[threading.Thread] = None
+
+        def try_acquire(self) -> bool:
+            """Claim the slot; on contention break the lock if stale and return False."""
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    age = time.time() - os.stat(self.path).st_mtime
+                    if age > self.stale_seconds:
+                        os.remove(self.path)  # holder died -- next attempt claims it
+                except OSError:
+                    pass
+                return False
+            with os.fdopen(fd, "w") as fh:
+                fh.write(f"{socket.gethostname()} {os.getpid()}\n")
+            self._beat = threading.Thread(target=self._heartbeat, daemon=True)
+            self._beat.start()
+            return True
+
+        def _heartbeat(self) -> None:
+            while not self._stop.wait(self.stale_seconds / 4):
+                try:
+                    os.utime(self.path)
+                except OSError:
+                    return
+
+        def release(self) -> None:
+            self._stop.set()
+            if self._beat is not None:
+                self._beat.join()
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
     def __init__(
         self,
         name: str,
@@ -295,6 +359,9 @@ class CachedArtifact(LoggingMixin):
         extension: str,
         dir: Optional[str] = None,  # noqa: A002 - matches TempArtifacts' own param name
         max_age_days: float = 7,
+        max_bytes: Optional[int] = None,
+        lock_timeout: Optional[float] = None,
+        lock_stale_seconds: float = 120,
         log_level: str = "WARNING",
     ):
         super().__init__()
@@ -305,6 +372,15 @@ class CachedArtifact(LoggingMixin):
         self.extension = extension
         self.dir = dir
         self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self.lock_timeout = lock_timeout
+        self.lock_stale_seconds = lock_stale_seconds
+        #: Counters for this instance: ``hits``, ``misses``, ``waited`` (hits served
+        #: after waiting on another producer), ``bytes_saved`` (artifact bytes served
+        #: instead of produced), ``evicted`` / ``bytes_evicted`` (budget evictions).
+        self.stats: Dict[str, int] = dict.fromkeys(
+            ("hits", "misses", "waited", "bytes_saved", "evicted", "bytes_evicted"), 0
+        )
 
     @staticmethod
     def key(*parts: Any, files: Sequence[str] = (), length: int = 16) -> str:
@@ -344,9 +420,11 @@ class CachedArtifact(LoggingMixin):
                 entirely (the result's ``path`` is then the scratch path).
 
         Returns:
-            CachedArtifact.Result: ``(path, hit, scratch)``.
+            CachedArtifact.Result: ``(path, hit, scratch)``. A miss that found the
+            slot locked waits for that producer and, once it promotes, returns its
+            artifact as a hit (counted in ``stats["waited"]``).
         """
-        cache_path = None
+        cache_path = lock = None
         if use_cache:
             store = TempArtifacts(
                 f"{self.name}_cache",
@@ -355,32 +433,157 @@ class CachedArtifact(LoggingMixin):
                 max_age_days=self.max_age_days,
             )
             cache_path = store.path(extension=self.extension, name=key)
-            if os.path.isfile(cache_path) and os.path.getsize(cache_path) > 0:
-                self.logger.info(
-                    f"Cache hit ({os.path.basename(cache_path)}) -- skipping production."
-                )
-                return self.Result(cache_path, True, None)
-
-        scratch = TempArtifacts(self.name, policy="scoped", dir=self.dir)
-        out_path = scratch.path(extension=self.extension)
-        for suffix in sidecars:
-            scratch.register(out_path + suffix)
+            if self._is_filled(cache_path):
+                return self._serve_hit(cache_path, sidecars)
+            lock, waited = self._claim(cache_path)
+            if self._is_filled(cache_path):  # another producer finished it meanwhile
+                if lock is not None:
+                    lock.release()
+                return self._serve_hit(cache_path, sidecars, waited=waited)
+
+        self.stats["misses"] += 1
         try:
-            produce(out_path)
-        except Exception:
-            if os.path.isfile(out_path):
-                self.logger.warning(f"Keeping partial artifact for debugging: {out_path}")
-            raise
-        if cache_path is None:
-            return self.Result(out_path, False, scratch)
-
-        os.replace(out_path, cache_path)
-        for suffix in sidecars:
-            if os.path.isfile(out_path + suffix):
-                os.replace(out_path + suffix, cache_path + suffix)
-            elif os.path.isfile(cache_path + suffix):
-                os.remove(cache_path + suffix)  # stale sidecar from a partial promote
+            scratch = TempArtifacts(self.name, policy="scoped", dir=self.dir)
+            out_path = scratch.path(extension=self.extension)
+            for suffix in sidecars:
+                scratch.register(out_path + suffix)
+            try:
+                produce(out_path)
+            except Exception:
+                if os.path.isfile(out_path):
+                    self.logger.warning(
+                        f"Keeping partial artifact for debugging: {out_path}"
+                    )
+                raise
+            if cache_path is None:
+                return self.Result(out_path, False, scratch)
+
+            os.replace(out_path, cache_path)
+            for suffix in sidecars:
+                if os.path.isfile(out_path + suffix):
+                    os.replace(out_path + suffix, cache_path + suffix)
+                elif os.path.isfile(cache_path + suffix):
+                    os.remove(cache_path + suffix)  # stale sidecar from a partial promote
+        finally:
+            if lock is not None:
+                lock.release()
+        if self.max_bytes is not None:
+            self.evict(keep=(cache_path,))
         return self.Result(cache_path, False, scratch)
 
+    @staticmethod
+    def _is_filled(cache_path: str) -> bool:
+        return os.path.isfile(cache_path) and os.path.getsize(cache_path) > 0
+
+    def _serve_hit(
+        self, cache_path: str, sidecars: Sequence[str], waited: bool = False
+    ) -> "CachedArtifact.Result":
+        """Stamp the slot as just used (LRU order for :meth:`evict` and the age
+        sweep) and count the hit."""
+        for path in [cache_path] + [cache_path + s for s in sidecars]:
+            try:
+                os.utime(path)
+            except OSError:  # missing sidecar / read-only share: order is best-effort
+                pass
+        self.stats["hits"] += 1
+        self.stats["waited"] += int(waited)
+        self.stats["bytes_saved"] += os.path.getsize(cache_path)
+        self.logger.info(
+            f"Cache hit ({os.path.basename(cache_path)}) -- skipping production."
+        )
+        return self.Result(cache_path, True, None)
+
+    def _claim(self, cache_path: str):
+        """``(lock, waited)`` -- the slot lock, or None once *lock_timeout* ran out
+        or the slot was filled while waiting."""
+        lock = self._SlotLock(cache_path + ".lock", self.lock_stale_seconds)
+        deadline = (
+            None if self.lock_timeout is None else time.monotonic() + self.lock_timeout
+        )
+        waited = False
+        while not lock.try_acquire():
+            waited = True
+            if self._is_filled(cache_path):
+                return None, waited
+            if deadline is not None and time.monotonic() >= deadline:
+                self.logger.warning(
+                    f"Slot {os.path.basename(cache_path)} still locked after "
+                    f"{self.lock_timeout}s -- producing without it."
+                )
+                return None, waited
+            time.sleep(self.LOCK_POLL_SECONDS)
+        return lock, waited
+
+    def evict(
+        self, max_bytes: Optional[int] = None, keep: Sequence[str] = ()
+    ) -> List[str]:
+        """Remove least-recently-used cache slots until the store fits *max_bytes*
+        (default :attr:`max_bytes`); return the artifact paths removed.
+
+        A slot is its artifact plus any sidecars, ordered by the artifact's mtime
+        (re-stamped on every hit). Slots in *keep* and slots currently locked by a
+        producer are never removed; a file another process holds open on Windows
+        just survives until the next eviction.
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        if budget is None:
+            return []
+        base = self.dir or tempfile.gettempdir()
+        prefix = f"{self.name}_cache_"
+        slots: Dict[str, List[Any]] = {}  # artifact name -> [mtime, bytes, paths]
+        locked = set()
+        try:
+            entries = list(os.scandir(base))
+        except OSError:
+            return []
+        files = []
+        for entry in entries:
+            if not entry.name.startswith(prefix) or not entry.is_file():
+                continue
+            if entry.name.endswith(".lock"):
+                locked.add(entry.name[: -len(".lock")])
+                continue
+            try:
+                files.append((entry.name, entry.path, entry.stat()))
+            except OSError:
+                continue
+        for name, _path, stat in files:
+            if self.extension and name.endswith(self.extension):
+                slots[name] = [stat.st_mtime, 0, []]
+        for name, path, stat in files:
+            owner = name
+            if self.extension:
+                cut = name.find(self.extension, len(prefix))
+                owner = name[: cut + len(self.extension)] if cut >= 0 else name
+            slot = slots.setdefault(owner, [stat.st_mtime, 0, []])
+            slot[1] += stat.st_size
+            slot[2].append(path)
+
+        total = sum(slot[1] for slot in slots.values())
+        protected = {os.path.basename(p) for p in keep if p} | locked
+        removed = []
+        for name, (_mtime, size, paths) in sorted(
+            slots.items(), key=lambda item: item[1][0]
+        ):
+            if total <= budget:
+                break
+            if name in protected:
+                continue
+            try:
+                for path in sorted(paths, key=len, reverse=True):  # sidecars first
+                    os.remove(path)
+            except OSError as e:
+                self.logger.debug(f"Could not evict {name}: {e}")
+                continue
+            total -= size
+            removed.append(os.path.join(base, name))
+            self.stats["evicted"] += 1
+            self.stats["bytes_evicted"] += size
+        if removed:
+            self.logger.info(
+                f"Evicted {len(removed)} cache slot(s) to fit {budget} bytes."
+            )
+        return removed
+
 
 __all__ = ["TempArtifacts", "CachedArtifact"]
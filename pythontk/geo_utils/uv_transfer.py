@@ -55,6 +55,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from pythontk.core_utils.help_mixin import HelpMixin
+from pythontk.core_utils.logging_mixin import Tracer
 
 try:
     import numpy as np
@@ -347,6 +348,7 @@ class UvTransfer(HelpMixin):
 
     # --------------------------------------------------------------- transfer
     @classmethod
+    @Tracer.traced()
     def transfer(
         cls,
         table: TransferTable,
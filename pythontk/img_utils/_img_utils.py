@@ -626,6 +626,7 @@ class ImgUtils(HelpMixin):
         compression: str = None,
         quality: int = None,
         colorspace: str = None,
+        ext: str = None,
         **kwargs,
     ):
         """Save an image to ``name``, dispatching on the file extension.
@@ -636,9 +637,16 @@ class ImgUtils(HelpMixin):
         :meth:`_save_ktx2`. A recognized but read-only format raises
         ``ValueError``.
 
+        ``name`` may also be a writable binary buffer (``io.BytesIO``, an open
+        file), with the container named by *ext*: the Pillow and OpenCV paths
+        encode straight into it, and the paths whose encoder only writes files
+        (``.ktx2``, a registered BC7/BC6H codec) stage through a scoped temp
+        file. This is what lets a size probe skip the filesystem.
+
         Parameters:
             image (str | PIL.Image.Image): Image object or file path.
-            name (str): Output path including filename and extension (e.g., "output.png").
+            name (str | file-like): Output path including filename and extension
+                (e.g., "output.png"), or a writable binary buffer.
             mode (str, optional): Converts the image to the specified mode before saving (e.g., "RGB", "L").
             bit_depth (int, optional): Target per-channel bit depth. 16 writes a
                 16-bit PNG/TIFF (8-bit sources are promoted); other containers fall
@@ -656,25 +664,42 @@ class ImgUtils(HelpMixin):
                 that carry one — currently ``.ktx2`` ("sRGB"/"linear"; None =
                 sRGB). A label, not a conversion: the loader samples by it, so
                 linear data maps must say so. Ignored by the PIL/cv2 paths.
+            ext (str, optional): Container extension ("png", ".jpg") when
+                *name* is a buffer. Defaults to the buffer's own ``name``
+                attribute (an open file); required otherwise.
             **kwargs: Additional arguments forwarded to PIL.Image.save (e.g.,
                 optimize=True, compress_level=9). Ignored for OpenCV-backed formats.
         """
         im = cls.ensure_image(image, mode)  # Now allows optional mode conversion
 
-        ext = os.path.splitext(name)[1].lstrip(".").lower()
+        buffered = cls._is_buffer(name)
+        if buffered:
+            ext = (ext or os.path.splitext(str(getattr(name, "name", "")))[1]).lstrip(
+                "."
+            ).lower()
+            if not ext:
+                raise ValueError("save_image to a buffer needs ext= (e.g. 'png').")
+            label = f"<buffer>.{ext}"
+        else:
+            ext = os.path.splitext(name)[1].lstrip(".").lower()
+            label = name
 
         # KTX2/Basis routes to the external encoder before every PIL concern:
         # bit depth (Basis is 8-bit), lossy kwargs, and encoder buffers do not
         # apply, and the mode fixup happens against the staged PNG instead.
         if ext in cls.DELIVERY_FORMATS:
-            cls._save_ktx2(im, name, compression, quality, colorspace)
+            cls._through_file(
+                name,
+                ext,
+                lambda path: cls._save_ktx2(im, path, compression, quality, colorspace),
+            )
             return
 
         fmt = cls.image_formats.get(ext)
 
         if fmt is not None and not fmt.write:
             raise ValueError(
-                f"Cannot save {name!r}: {ext!r} is a read-only format in ImgUtils."
+                f"Cannot save {label!r}: {ext!r} is a read-only format in ImgUtils."
             )
 
         # GPU block-compressed DDS (DXT/BC5 via Pillow; BC7/BC6H via registered codec).
@@ -684,7 +709,7 @@ class ImgUtils(HelpMixin):
 
         # Route float formats (EXR, HDR) through OpenCV — Pillow cannot write them.
         if fmt is not None and fmt.backend == "cv2":
-            cls._save_via_cv2(im, name)
+            cls._save_via_cv2(im, name, ext)
             return
 
         # 16-bit precision for PIL container formats (PNG/TIFF). Returns False when
@@ -692,7 +717,7 @@ class ImgUtils(HelpMixin):
         if (
             bit_depth
             and int(bit_depth) >= 16
-            and cls._save_high_bit_depth(im, name, int(bit_depth))
+            and cls._save_high_bit_depth(im, name, int(bit_depth), ext)
         ):
             return
 
@@ -721,19 +746,64 @@ class ImgUtils(HelpMixin):
                 im = im.convert(effective)
 
         if ext == "webp":
-            cls._assert_webp_dimensions(im, name)
+            cls._assert_webp_dimensions(im, label)
 
         if ext in cls.LOSSY_FORMATS:
             kwargs = cls._apply_lossy_kwargs(ext, quality, kwargs)
         elif quality is not None:
             print(
                 f"# ImgUtils: '{ext}' is a lossless container; ignoring "
-                f"quality={quality} for {name}."
+                f"quality={quality} for {label}."
             )
+        if buffered:
+            kwargs.setdefault("format", cls._pil_format(ext))
 
         with cls._sized_encoder_buffer(im, ext, kwargs):
             im.save(name, **kwargs)
 
+    @staticmethod
+    def _is_buffer(target) -> bool:
+        """True when a save target is a writable file object, not a path."""
+        return hasattr(target, "write")
+
+    @staticmethod
+    def _pil_format(ext: str) -> str:
+        """Pillow's format name for an extension -- what a buffer save needs,
+        having no filename to infer it from."""
+        fmt = Image.registered_extensions().get("." + ext.lstrip(".").lower())
+        if fmt is None:
+            raise ValueError(f"Pillow has no writer registered for {ext!r}.")
+        return fmt
+
+    @staticmethod
+    def _through_file(target, ext: str, write) -> None:
+        """Run ``write(path)`` against *target* -- directly for a path, and
+        for a buffer via a scoped temp file whose bytes are then copied in.
+        For the encoders that only accept a filename."""
+        if not ImgUtils._is_buffer(target):
+            write(target)
+            return
+        import shutil
+        from pythontk.file_utils.temp_artifacts import TempArtifacts
+
+        with TempArtifacts("img_encode", policy="scoped") as tmp:
+            path = tmp.path(extension="." + ext)
+            write(path)
+            with open(path, "rb") as f:
+                shutil.copyfileobj(f, target)
+
+    @staticmethod
+    def _cv2_write(target, arr, ext: str) -> bool:
+        """``cv2.imwrite`` for a path, ``cv2.imencode`` into a buffer."""
+        import cv2
+
+        if not ImgUtils._is_buffer(target):
+            return bool(cv2.imwrite(target, arr))
+        ok, encoded = cv2.imencode("." + ext, arr)
+        if ok:
+            target.write(encoded.tobytes())
+        return bool(ok)
+
     @classmethod
     @contextmanager
     def _sized_encoder_buffer(cls, im: "Image.Image", ext: str, kwargs: dict):
@@ -848,11 +918,11 @@ class ImgUtils(HelpMixin):
                 im = im.convert("RGB") if im.mode != "RGB" else im
             elif im.mode not in ("RGB", "RGBA"):
                 im = im.convert("RGBA")
-            im.save(name, pixel_format=comp)
+            im.save(name, format="DDS", pixel_format=comp)
             return
 
         if cls._dds_codec is not None:
-            cls._dds_codec(im, name, comp)
+            cls._through_file(name, "dds", lambda path: cls._dds_codec(im, path, comp))
             return
 
         raise ValueError(
@@ -886,7 +956,9 @@ class ImgUtils(HelpMixin):
         encoder.encode(im, name, codec=codec, srgb=srgb, mipmaps=True, quality=quality)
 
     @staticmethod
-    def _save_high_bit_depth(im: "Image.Image", name: str, bit_depth: int) -> bool:
+    def _save_high_bit_depth(
+        im: "Image.Image", name, bit_depth: int, ext: Optional[str] = None
+    ) -> bool:
         """Write *im* at 16-bit. Returns True when handled, False when the request
         can't be honored (unsupported depth or container) — the caller then falls
         back to an 8-bit save. Either way the degrade is announced, never silent.
@@ -894,15 +966,18 @@ class ImgUtils(HelpMixin):
         Grayscale uses Pillow's ``I;16``; RGB(A) routes through OpenCV ``uint16``.
         8-bit sources are promoted (value*257); existing 16-bit data is preserved.
         """
+        buffered = ImgUtils._is_buffer(name)
+        if ext is None:
+            ext = os.path.splitext(name)[1].lstrip(".").lower()
+        label = f"<buffer>.{ext}" if buffered else name
         if bit_depth != 16:  # only 16 is supported here; 32-bit float = EXR/HDR.
             print(
-                f"# ImgUtils: {bit_depth}-bit unsupported for {name}; saving as 8-bit."
+                f"# ImgUtils: {bit_depth}-bit unsupported for {label}; saving as 8-bit."
             )
             return False
 
-        ext = os.path.splitext(name)[1].lstrip(".").lower()
         if ext not in ("png", "tiff", "tif"):
-            print(f"# ImgUtils: '{ext}' cannot store 16-bit; saving {name} as 8-bit.")
+            print(f"# ImgUtils: '{ext}' cannot store 16-bit; saving {label} as 8-bit.")
             return False
 
         if im.mode in ("L", "P", "1", "I", "I;16"):
@@ -910,7 +985,10 @@ class ImgUtils(HelpMixin):
             if im.mode in ("L", "P", "1"):  # promote 8-bit range to 16-bit
                 arr = arr * 257
             arr = np.clip(arr, 0, 65535).astype(np.uint16)
-            Image.fromarray(arr).save(name)  # uint16 array → "I;16" natively
+            # uint16 array → "I;16" natively
+            Image.fromarray(arr).save(
+                name, **({"format": ImgUtils._pil_format(ext)} if buffered else {})
+            )
             return True
 
         # RGB / RGBA — Pillow has no 16-bit colour mode, so use OpenCV uint16.
@@ -921,22 +999,24 @@ class ImgUtils(HelpMixin):
         rgb = im.convert("RGBA") if im.mode == "RGBA" else im.convert("RGB")
         arr = np.asarray(rgb, dtype=np.uint16) * 257
         code = cv2.COLOR_RGBA2BGRA if rgb.mode == "RGBA" else cv2.COLOR_RGB2BGR
-        cv2.imwrite(name, cv2.cvtColor(arr, code))
+        ImgUtils._cv2_write(name, cv2.cvtColor(arr, code), ext)
         return True
 
     @staticmethod
-    def _save_via_cv2(im: "Image.Image", name: str) -> None:
+    def _save_via_cv2(im: "Image.Image", name, ext: Optional[str] = None) -> None:
         """Write a PIL image to a float format (EXR, HDR) via OpenCV.
 
         Pillow cannot encode these. The source PIL image is 8-bit, so values
         are normalized to 0-1 float32 (the inverse of :meth:`_load_via_cv2`).
         OpenEXR is enabled at module import (``OPENCV_IO_ENABLE_OPENEXR``).
         """
+        if ext is None:
+            ext = os.path.splitext(name)[1].lstrip(".").lower()
         try:
             import cv2
         except ImportError as e:
             raise ImportError(
-                f"OpenCV (cv2) is required to save '{os.path.splitext(name)[1]}' files."
+                f"OpenCV (cv2) is required to save '.{ext}' files."
             ) from e
 
         img_np = np.array(im)
@@ -947,7 +1027,7 @@ class ImgUtils(HelpMixin):
         # "L" (grayscale) passes through unchanged.
 
         img_np = img_np.astype(np.float32) / 255.0
-        cv2.imwrite(name, img_np)
+        ImgUtils._cv2_write(name, img_np, ext)
 
     @classmethod
     def load_image(cls, filepath):
@@ -1462,7 +1542,7 @@ class ImgUtils(HelpMixin):
         return Image.merge(dest_order, tuple(out_bands))
 
     @classmethod
-    @CoreUtils.listify(threading=True)
+    @CoreUtils.listify(threading=True, serial_threshold=2)
     def create_mask(
         cls, image, mask, background=(0, 0, 0, 255), foreground=(255, 255, 255, 255)
     ):
@@ -12,10 +12,15 @@ Uses cv2 (already an optional dep for ``FrameExtractor``); no
 matching per channel in LAB space — cheap, robust, and orientation-
 independent.
 """
+import hashlib
+import json
 import logging
 import os
 import shutil
-from typing import List, Optional, Sequence
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
 
 try:
     import cv2
@@ -28,6 +33,7 @@ except ImportError:
     CV2_AVAILABLE = False
 
 # From this package:
+from pythontk.core_utils.user_config import UserConfig
 from pythontk.img_utils._img_utils import ImgUtils
 
 logger = logging.getLogger(__name__)
@@ -56,6 +62,32 @@ class ExposureEqualizer:
     #: dir is decoded twice.
     _stats_cache: Optional[dict] = None
 
+    #: Per-file LAB stats persist per capture directory (see
+    #: :meth:`_stats_cache_path`), so a re-run at another ``strength`` /
+    #: ``reference_strategy`` re-samples nothing. Entries are keyed on file
+    #: name + mtime + size. This is the file name used inside the capture
+    #: with :attr:`STATS_CACHE_IN_SOURCE` (hidden, not an image extension).
+    STATS_CACHE_NAME = ".exposure_stats_cache.json"
+    #: Opt-in: write the stats cache into each capture directory instead of
+    #: the per-user cache root. Capture folders may be read-only or under
+    #: version control, so the default leaves them untouched.
+    STATS_CACHE_IN_SOURCE = False
+    #: Bump when :meth:`_image_stats` changes what it computes.
+    STATS_CACHE_VERSION = 1
+    #: Bounds on the per-user ``exposure_equalizer`` cache directory (one
+    #: file per sampled capture): files untouched for
+    #: :attr:`STATS_CACHE_MAX_AGE_DAYS` go first, then the oldest beyond
+    #: :attr:`STATS_CACHE_MAX_FILES`. ``None`` disables a bound.
+    STATS_CACHE_MAX_FILES = 256
+    STATS_CACHE_MAX_AGE_DAYS = 90
+    #: Whether :meth:`_sample_stats` reads/writes :attr:`STATS_CACHE_NAME`;
+    #: :meth:`equalize_directories` sets it per run from ``stats_cache``.
+    use_stats_cache: bool = True
+
+    #: Per-directory throughput of the last :meth:`equalize_directories` run:
+    #: ``[{"dir", "images", "seconds", "images_per_sec", "mb_per_sec"}, ...]``.
+    last_report: Optional[List[dict]] = None
+
     def is_available(self) -> bool:
         return CV2_AVAILABLE
 
@@ -72,6 +104,9 @@ class ExposureEqualizer:
         preserve_exif: bool = True,
         per_image: bool = False,
         overwrite_output: bool = True,
+        workers: int = 0,
+        stats_cache: bool = True,
+        progress: Optional[callable] = None,
     ) -> List[str]:
         """Equalize every image in ``source_dirs`` against the reference set.
 
@@ -122,6 +157,19 @@ class ExposureEqualizer:
         Check :attr:`last_fallback_count` after a run: nonzero means that
         many frames were written without EXIF (cv2 fallback or EXIF read
         failure — see :meth:`_save_image`).
+
+        ``workers`` > 0 runs the convert/re-encode pass on that many worker
+        processes (e.g. ``os.cpu_count()``), with at most twice that many
+        images in flight so decoded 24 MP frames never pile up in memory.
+        The default 0 stays in-process -- a process pool is not safe to
+        spawn from every embedding host (a DCC's interpreter re-launches
+        the whole application as the child).
+
+        ``stats_cache`` (default True) keeps each sampled frame's LAB
+        mean/std in a per-user cache file per directory (see
+        :meth:`_stats_cache_path`); False neither reads nor writes it. ``progress`` is called as
+        ``progress("equalize", done, total, src_dir)``; per-directory
+        throughput is logged and kept in :attr:`last_report`.
         """
         if not self.is_available():
             logger.error("cv2 not available; cannot equalize exposures.")
@@ -132,6 +180,8 @@ class ExposureEqualizer:
         self._exif_loss_warned = False
         self._cv2_fallback_warned = False
         self._stats_cache = {}
+        self.use_stats_cache = stats_cache
+        self.last_report = []
 
         if reference_dir is not None:
             if not os.path.isdir(reference_dir):
@@ -155,15 +205,16 @@ class ExposureEqualizer:
         stems = ImgUtils.unique_dir_stems(source_dirs)
         for src, stem in zip(source_dirs, stems):
             out_dir = os.path.join(output_root, stem + suffix)
+            in_place = os.path.normcase(os.path.normpath(out_dir)) == os.path.normcase(
+                os.path.normpath(src)
+            )
             if overwrite_output and os.path.isdir(out_dir):
                 # Purge stale survivors from any previous run over a
                 # different (e.g. more tightly curated) input set — unless
                 # the output resolves onto the source dir itself (e.g.
                 # output_root=parent + suffix=""), where the purge would
                 # delete the capture before it is ever read.
-                if os.path.normcase(os.path.normpath(out_dir)) == os.path.normcase(
-                    os.path.normpath(src)
-                ):
+                if in_place:
                     logger.warning(
                         f"Output dir resolves onto the source dir ({out_dir}); "
                         f"skipping purge and overwriting in place."
@@ -176,12 +227,36 @@ class ExposureEqualizer:
                 src_stats = self._sample_stats(src, sample_count)
                 if src_stats[0] is None:
                     src_stats = None  # unreadable dir → per-image fallback
-            count = self._equalize_dir(
+            started = time.perf_counter()
+            count, nbytes = self._equalize_dir(
                 src, out_dir, ref_mean, ref_std, strength, quality,
-                preserve_exif, src_stats=src_stats,
+                preserve_exif, src_stats=src_stats, workers=workers,
+                progress=progress,
+            )
+            elapsed = max(time.perf_counter() - started, 1e-9)
+            if in_place:
+                # Every frame was just rewritten, so every cached stat is
+                # stale by construction; leave the capture as it was found
+                # rather than carrying a dead cache file.
+                try:
+                    os.remove(self._stats_cache_path(src))
+                except OSError:
+                    pass
+            self.last_report.append(
+                {
+                    "dir": src,
+                    "images": count,
+                    "seconds": round(elapsed, 3),
+                    "images_per_sec": round(count / elapsed, 2),
+                    "mb_per_sec": round(nbytes / elapsed / (1024 * 1024), 2),
+                }
             )
             out_dirs.append(out_dir)
-            logger.info(f"Equalized {count} images from {src} → {out_dir}")
+            logger.info(
+                f"Equalized {count} images from {src} → {out_dir} "
+                f"({elapsed:.1f}s, {count / elapsed:.1f} img/s, "
+                f"{nbytes / elapsed / (1024 * 1024):.1f} MB/s read)"
+            )
         if self.last_fallback_count:
             logger.error(
                 f"{self.last_fallback_count} frame(s) were written without "
@@ -241,68 +316,218 @@ class ExposureEqualizer:
             cache[key] = result
         return result
 
+    def _stats_cache_path(self, directory: str) -> str:
+        """Stats cache file for *directory*: one JSON per capture under
+        ``UserConfig.user_cache_root()/exposure_equalizer``, named by a hash
+        of the directory's absolute path (or :attr:`STATS_CACHE_NAME` inside
+        it with :attr:`STATS_CACHE_IN_SOURCE`)."""
+        if self.STATS_CACHE_IN_SOURCE:
+            return os.path.join(directory, self.STATS_CACHE_NAME)
+        key = os.path.normcase(os.path.abspath(directory)).encode("utf-8")
+        digest = hashlib.sha1(key).hexdigest()[:16]
+        root = UserConfig.user_cache_root() / "exposure_equalizer"
+        return str(root / f"{digest}.json")
+
+    def _load_stats_cache(self, directory: str) -> Dict[str, list]:
+        """``{name: [mtime_ns, size, mean3, std3]}`` from *directory*'s
+        cache file, or ``{}`` when absent/unreadable/stale."""
+        try:
+            with open(self._stats_cache_path(directory), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.STATS_CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_stats_cache(self, directory: str, entries: Dict[str, list]) -> None:
+        """Write *entries* to :meth:`_stats_cache_path` (staged, then
+        ``os.replace``) and prune the per-user cache directory to
+        :attr:`STATS_CACHE_MAX_FILES` / :attr:`STATS_CACHE_MAX_AGE_DAYS`; an
+        unwritable cache location just goes uncached."""
+        path = self._stats_cache_path(directory)
+        staging = path + ".part"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(staging, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": self.STATS_CACHE_VERSION, "entries": entries},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(staging, path)
+        except OSError as e:
+            logger.debug(f"Stats cache not written for {directory}: {e}")
+            try:
+                os.remove(staging)
+            except OSError:
+                pass
+            return
+        if not self.STATS_CACHE_IN_SOURCE:
+            UserConfig.prune_cache_dir(
+                os.path.dirname(path),
+                max_files=self.STATS_CACHE_MAX_FILES,
+                max_age_days=self.STATS_CACHE_MAX_AGE_DAYS,
+            )
+
+    @staticmethod
+    def _image_stats(path: str):
+        """LAB ``(mean, std)`` of one image as float lists, or None."""
+        img = cv2.imread(path)
+        if img is None:
+            return None
+        flat = cv2.cvtColor(img, cv2.COLOR_BGR2LAB).astype("float32").reshape(-1, 3)
+        return flat.mean(axis=0).tolist(), flat.std(axis=0).tolist()
+
     def _compute_sample_stats(self, directory: str, sample_count: int):
         files = self._list_images(directory)
         if not files:
             return None, None
         sampled = files[:: max(1, len(files) // sample_count)][:sample_count]
+        cached = self._load_stats_cache(directory) if self.use_stats_cache else {}
+        changed = False
         means, stds = [], []
         for path in sampled:
-            img = cv2.imread(path)
-            if img is None:
+            name = os.path.basename(path)
+            try:
+                st = os.stat(path)
+            except OSError:
                 continue
-            lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB).astype("float32")
-            means.append(lab.reshape(-1, 3).mean(axis=0))
-            stds.append(lab.reshape(-1, 3).std(axis=0))
+            entry = cached.get(name)
+            if (
+                isinstance(entry, list)
+                and len(entry) == 4
+                and entry[:2] == [st.st_mtime_ns, st.st_size]
+            ):
+                mean, std = entry[2], entry[3]
+            else:
+                stats = self._image_stats(path)
+                if stats is None:
+                    continue
+                mean, std = stats
+                cached[name] = [st.st_mtime_ns, st.st_size, mean, std]
+                changed = True
+            means.append(mean)
+            stds.append(std)
+        if changed and self.use_stats_cache:
+            # Entries accumulate across sample counts; frames that no longer
+            # exist are pruned on the way out.
+            present = {os.path.basename(p) for p in files}
+            self._save_stats_cache(
+                directory, {k: v for k, v in cached.items() if k in present}
+            )
         if not means:
             return None, None
-        return np.mean(means, axis=0), np.mean(stds, axis=0)
+        return (
+            np.mean(np.asarray(means, dtype="float32"), axis=0),
+            np.mean(np.asarray(stds, dtype="float32"), axis=0),
+        )
 
     def _equalize_dir(
         self, src_dir: str, out_dir: str, ref_mean, ref_std, strength: float = 1.0,
         quality: int = 100, preserve_exif: bool = True, src_stats=None,
-    ) -> int:
+        workers: int = 0, progress: Optional[callable] = None,
+    ):
         """Equalize one directory. With ``src_stats`` (the capture's sampled
         ``(mean, std)``) a single affine map is applied to every frame
         (per-capture mode); without it each frame is normalized by its own
-        stats (legacy per-image mode)."""
+        stats (legacy per-image mode). Returns ``(written, bytes_read)``.
+
+        ``workers`` > 0 fans the frames out to a process pool (see
+        :meth:`equalize_directories`); EXIF-loss accounting and its log
+        messages stay in this process either way."""
         strength = float(np.clip(strength, 0.0, 1.0))
         if src_stats is not None:
             cap_mu, cap_sigma = src_stats
-            cap_sigma = np.where(cap_sigma < 1e-3, 1.0, cap_sigma)
-        count = 0
-        for path in self._list_images(src_dir):
-            # Read the *stored* pixels (don't let cv2 bake in EXIF orientation):
-            # _save_image copies the source EXIF verbatim, so the saved pixels must
-            # stay in the same frame as the copied Orientation tag. Otherwise cv2
-            # would right the image while the tag still says "rotate", and an
-            # EXIF-aware consumer (RealityScan / Metashape) rotates a second time.
-            img = cv2.imread(path, cv2.IMREAD_IGNORE_ORIENTATION | cv2.IMREAD_COLOR)
-            if img is None:
-                continue
-            lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB).astype("float32")
-            flat = lab.reshape(-1, 3)
-            if src_stats is not None:
-                mu, sigma = cap_mu, cap_sigma
-            else:
-                mu = flat.mean(axis=0)
-                sigma = flat.std(axis=0)
-                sigma = np.where(sigma < 1e-3, 1.0, sigma)
-            normalized = (flat - mu) / sigma
-            mapped = normalized * ref_std + ref_mean
-            if strength < 1.0:
-                # Blend toward the match, preserving each frame's own
-                # local contrast in proportion to (1 - strength).
-                mapped = flat * (1.0 - strength) + mapped * strength
-            # rint before the cast: a bare astype() truncates, biasing every
-            # channel ~0.5 LSB down per pass and worsening banding.
-            mapped = np.rint(np.clip(mapped, 0, 255)).reshape(lab.shape)
-            mapped = mapped.astype("uint8")
-            bgr = cv2.cvtColor(mapped, cv2.COLOR_LAB2BGR)
-            out_path = os.path.join(out_dir, os.path.basename(path))
-            if self._save_image(out_path, bgr, path, quality, preserve_exif):
+            src_stats = (cap_mu, np.where(cap_sigma < 1e-3, 1.0, cap_sigma))
+        files = self._list_images(src_dir)
+        for path in files:
+            if os.path.splitext(path)[1].lower() in (".tif", ".tiff"):
+                self._warn_tiff(path, preserve_exif)
+                break
+        jobs = (
+            (
+                path, os.path.join(out_dir, os.path.basename(path)),
+                ref_mean, ref_std, strength, quality, preserve_exif, src_stats,
+            )
+            for path in files
+        )
+        count = nbytes = 0
+        for done, (job, result) in enumerate(self._run_jobs(jobs, workers), 1):
+            ok, losses = result
+            self._record_exif_losses(job[0], losses)
+            if ok:
                 count += 1
-        return count
+                try:
+                    nbytes += os.path.getsize(job[0])
+                except OSError:
+                    pass
+            if progress is not None:
+                try:
+                    progress("equalize", done, len(files), src_dir)
+                except Exception:
+                    pass
+        return count, nbytes
+
+    @staticmethod
+    def _run_jobs(jobs, workers: int):
+        """Yield ``(job, _equalize_image(*job))`` in job order. With
+        ``workers`` > 0 the calls run on a process pool, at most
+        ``2 * workers`` submitted ahead of the one being collected."""
+        if workers <= 0:
+            for job in jobs:
+                yield job, ExposureEqualizer._equalize_image(*job)
+            return
+        window = 2 * workers
+        pending: deque = deque()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for job in jobs:
+                pending.append((job, pool.submit(ExposureEqualizer._equalize_image, *job)))
+                if len(pending) >= window:
+                    job_done, future = pending.popleft()
+                    yield job_done, future.result()
+            while pending:
+                job_done, future = pending.popleft()
+                yield job_done, future.result()
+
+    @staticmethod
+    def _equalize_image(
+        path, out_path, ref_mean, ref_std, strength, quality, preserve_exif, src_stats
+    ):
+        """Read, LAB-match and write one frame. Process-pool safe: touches no
+        instance state. Returns ``(written, losses)`` -- see
+        :meth:`_write_equalized`."""
+        # Read the *stored* pixels (don't let cv2 bake in EXIF orientation):
+        # _save_image copies the source EXIF verbatim, so the saved pixels must
+        # stay in the same frame as the copied Orientation tag. Otherwise cv2
+        # would right the image while the tag still says "rotate", and an
+        # EXIF-aware consumer (RealityScan / Metashape) rotates a second time.
+        img = cv2.imread(path, cv2.IMREAD_IGNORE_ORIENTATION | cv2.IMREAD_COLOR)
+        if img is None:
+            return False, []
+        lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB).astype("float32")
+        flat = lab.reshape(-1, 3)
+        if src_stats is not None:
+            mu, sigma = src_stats
+        else:
+            mu = flat.mean(axis=0)
+            sigma = flat.std(axis=0)
+            sigma = np.where(sigma < 1e-3, 1.0, sigma)
+        normalized = (flat - mu) / sigma
+        mapped = normalized * ref_std + ref_mean
+        if strength < 1.0:
+            # Blend toward the match, preserving each frame's own
+            # local contrast in proportion to (1 - strength).
+            mapped = flat * (1.0 - strength) + mapped * strength
+        # rint before the cast: a bare astype() truncates, biasing every
+        # channel ~0.5 LSB down per pass and worsening banding.
+        mapped = np.rint(np.clip(mapped, 0, 255)).reshape(lab.shape)
+        mapped = mapped.astype("uint8")
+        bgr = cv2.cvtColor(mapped, cv2.COLOR_LAB2BGR)
+        return ExposureEqualizer._write_equalized(
+            out_path, bgr, path, quality, preserve_exif
+        )
 
     def _save_image(self, out_path, bgr, src_path, quality: int, preserve_exif: bool) -> bool:
         """Write *bgr* to *out_path* with minimal re-encode loss.
@@ -321,9 +546,57 @@ class ExposureEqualizer:
         loses EXIF looks identical to a healthy one in the output listing
         but aligns measurably worse.
         """
+        self._warn_tiff(out_path, preserve_exif)
+        ok, losses = self._write_equalized(
+            out_path, bgr, src_path, quality, preserve_exif
+        )
+        self._record_exif_losses(src_path, losses)
+        return ok
+
+    def _warn_tiff(self, path: str, preserve_exif: bool) -> None:
+        """One-time warning that TIFF output drops EXIF and 16-bit depth."""
+        ext = os.path.splitext(path)[1].lower()
+        if ext in (".tif", ".tiff") and preserve_exif and not getattr(
+            self, "_tiff_warned", False
+        ):
+            self._tiff_warned = True
+            logger.warning(
+                "TIFF output is written via cv2: EXIF is not carried over and "
+                "16-bit sources are truncated to 8-bit (pixels are read 8-bit "
+                "for LAB matching). Prefer JPEG/PNG sources for equalization."
+            )
+
+    def _record_exif_losses(self, src_path: str, losses) -> None:
+        """Count a frame written without EXIF (at most once) and log each
+        cause's first occurrence of the run."""
+        if not losses:
+            return
+        self.last_fallback_count += 1
+        for cause, detail in losses:
+            if cause == "exif_read" and not self._exif_loss_warned:
+                self._exif_loss_warned = True
+                logger.error(
+                    f"EXIF read failed ({detail}); frame(s) will be "
+                    f"written without EXIF (first: {src_path})."
+                )
+            elif cause == "cv2_fallback" and not self._cv2_fallback_warned:
+                self._cv2_fallback_warned = True
+                logger.error(
+                    f"PIL save failed ({detail}); falling back to cv2.imwrite "
+                    f"— EXIF/orientation will be dropped for affected "
+                    f"frames (first: {src_path})."
+                )
+
+    @staticmethod
+    def _write_equalized(out_path, bgr, src_path, quality: int, preserve_exif: bool):
+        """The write behind :meth:`_save_image`, free of instance state so a
+        worker process can run it. Returns ``(written, losses)`` where
+        *losses* lists ``(cause, detail)`` for each reason the frame lost its
+        EXIF: ``"exif_read"`` (source EXIF unreadable) and/or
+        ``"cv2_fallback"`` (PIL save failed)."""
+        losses = []
         ext = os.path.splitext(out_path)[1].lower()
         if ext in (".jpg", ".jpeg"):
-            frame_counted = False
             try:
                 from PIL import Image
 
@@ -339,39 +612,15 @@ class ExposureEqualizer:
                         # The frame is still written, but without EXIF — that
                         # is the same loss the cv2 fallback causes, so count
                         # it the same way instead of passing silently.
-                        self.last_fallback_count += 1
-                        frame_counted = True
-                        if not self._exif_loss_warned:
-                            self._exif_loss_warned = True
-                            logger.error(
-                                f"EXIF read failed ({e}); frame(s) will be "
-                                f"written without EXIF (first: {src_path})."
-                            )
+                        losses.append(("exif_read", str(e)))
                 Image.fromarray(rgb).save(out_path, **kw)
-                return True
+                return True, losses
             except Exception as e:
-                if not frame_counted:
-                    self.last_fallback_count += 1
-                if not self._cv2_fallback_warned:
-                    self._cv2_fallback_warned = True
-                    logger.error(
-                        f"PIL save failed ({e}); falling back to cv2.imwrite "
-                        f"— EXIF/orientation will be dropped for affected "
-                        f"frames (first: {src_path})."
-                    )
+                losses.append(("cv2_fallback", str(e)))
                 params = [int(cv2.IMWRITE_JPEG_QUALITY), int(quality)]
                 sf = getattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR", None)
                 sf444 = getattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR_444", None)
                 if sf is not None and sf444 is not None:
                     params += [int(sf), int(sf444)]
-                return bool(cv2.imwrite(out_path, bgr, params))
-        if ext in (".tif", ".tiff") and preserve_exif and not getattr(
-            self, "_tiff_warned", False
-        ):
-            self._tiff_warned = True
-            logger.warning(
-                "TIFF output is written via cv2: EXIF is not carried over and "
-                "16-bit sources are truncated to 8-bit (pixels are read 8-bit "
-                "for LAB matching). Prefer JPEG/PNG sources for equalization."
-            )
-        return bool(cv2.imwrite(out_path, bgr))
+                return bool(cv2.imwrite(out_path, bgr, params)), losses
+        return bool(cv2.imwrite(out_path, bgr)), losses
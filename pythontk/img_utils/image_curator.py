@@ -21,10 +21,12 @@ small-baseline parallax SfM triangulates from, so destructive settings
 belong to the caller: ``5`` catches near-identical frames only,
 ``10–15`` aggressively culls redundant static photo sets.
 """
+import hashlib
+import json
 import logging
 import os
 import shutil
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 try:
     import cv2
@@ -37,11 +39,107 @@ except ImportError:
     CV2_AVAILABLE = False
 
 # From this package:
+from pythontk.core_utils.user_config import UserConfig
 from pythontk.img_utils._img_utils import ImgUtils
 
 logger = logging.getLogger(__name__)
 
 
+class _AnchorIndex:
+    """Near-duplicate lookup over the 64-bit dHash anchors of
+    :meth:`ImageCurator._cluster`.
+
+    ``first_within(h)`` returns the *lowest* anchor id within ``threshold``
+    Hamming distance of ``h`` -- exactly the anchor the greedy scan would
+    have stopped at -- without testing every anchor in Python:
+
+    * ``threshold < 64 // MIN_CHUNK_BITS``: multi-index hashing. The hash is
+      split into ``threshold + 1`` disjoint chunks; by pigeonhole any anchor
+      within ``threshold`` bits matches ``h`` exactly on at least one chunk,
+      so only anchors sharing a chunk value are candidates, and those are
+      verified with one vectorized popcount.
+    * wider thresholds: the chunks get too narrow to be selective, so every
+      anchor is tested in one ``xor`` + popcount over a ``uint64`` array.
+    """
+
+    #: Narrowest chunk worth a table. Below 8 bits a bucket holds 1/128th
+    #: of the anchors or more and the candidate union approaches a scan.
+    MIN_CHUNK_BITS = 8
+    #: Per-byte bit counts for numpy < 2 (no ``bitwise_count``); built on
+    #: first use and shared by every index.
+    _POPCOUNT_TABLE = None
+
+    def __init__(self, threshold: int, bits: int = 64):
+        import numpy
+
+        self._np = numpy
+        self.threshold = threshold
+        self._anchors = numpy.empty(256, dtype=numpy.uint64)
+        self._count = 0
+        chunks = threshold + 1
+        if bits // chunks >= self.MIN_CHUNK_BITS:
+            edges = [bits * i // chunks for i in range(chunks + 1)]
+            self._chunks = [
+                (lo, (1 << (hi - lo)) - 1) for lo, hi in zip(edges, edges[1:])
+            ]
+            self._tables: Optional[List[Dict[int, List[int]]]] = [
+                {} for _ in self._chunks
+            ]
+        else:
+            self._chunks = []
+            self._tables = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _popcount(self, values):
+        np = self._np
+        if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+            return np.bitwise_count(values)
+        table = _AnchorIndex._POPCOUNT_TABLE
+        if table is None:
+            table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+            _AnchorIndex._POPCOUNT_TABLE = table
+        return table[values.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+    def add(self, h: int) -> int:
+        """Append ``h`` as the next anchor; returns its id."""
+        if self._count == len(self._anchors):
+            self._anchors = self._np.concatenate(
+                [self._anchors, self._np.empty_like(self._anchors)]
+            )
+        aid = self._count
+        self._anchors[aid] = h
+        self._count += 1
+        if self._tables is not None:
+            for table, (shift, mask) in zip(self._tables, self._chunks):
+                table.setdefault((h >> shift) & mask, []).append(aid)
+        return aid
+
+    def first_within(self, h: int) -> Optional[int]:
+        """Lowest anchor id within ``threshold`` bits of ``h``, else None."""
+        if not self._count:
+            return None
+        np = self._np
+        if self._tables is None:
+            ids = None
+            values = self._anchors[: self._count]
+        else:
+            found = set()
+            for table, (shift, mask) in zip(self._tables, self._chunks):
+                found.update(table.get((h >> shift) & mask, ()))
+            if not found:
+                return None
+            ids = np.fromiter(found, dtype=np.int64, count=len(found))
+            values = self._anchors[ids]
+        hits = np.flatnonzero(
+            self._popcount(values ^ np.uint64(h)) <= self.threshold
+        )
+        if not len(hits):
+            return None
+        return int(hits[0]) if ids is None else int(ids[hits].min())
+
+
 class ImageCurator:
     """Pre-SfM content-dedup + sharpness culling."""
 
@@ -96,6 +194,7 @@ class ImageCurator:
         suffix: str = "_curated",
         progress: Optional[callable] = None,
         overwrite_output: bool = True,
+        hash_cache: bool = True,
     ) -> List[str]:
         """Curate every image across ``source_dirs`` → write the kept set
         to ``output_root/<stem><suffix>/``, where ``<stem>`` is the source
@@ -129,6 +228,11 @@ class ImageCurator:
         per-source output directory is **emptied** before being
         repopulated. This guards against re-runs at a different
         threshold leaving stale files mixed with new ones.
+
+        ``hash_cache`` (default True) keeps each source dir's dHash and
+        sharpness in a per-user cache file (see :meth:`_hash_cache_path`), so
+        a re-run over unchanged frames skips decoding them; False neither
+        reads nor writes it.
         """
         if not self.is_available():
             logger.error("cv2 not available; cannot curate images.")
@@ -138,7 +242,9 @@ class ImageCurator:
         os.makedirs(output_root, exist_ok=True)
 
         # 1. Scan; 2. cluster; 3. select — shared with :meth:`preview` (DRY).
-        scanned = self._scan_images(source_dirs, progress=progress)
+        scanned = self._scan_images(
+            source_dirs, progress=progress, hash_cache=hash_cache
+        )
         if not scanned:
             logger.warning("No readable images found.")
             return list(source_dirs)
@@ -194,45 +300,157 @@ class ImageCurator:
     # measurable while staying ~14x cheaper than full-res on 4K sources.
     SCAN_WIDTH = 1024
 
-    def _scan_images(self, source_dirs, progress=None):
+    #: Per-directory scan cache file name, used inside the source directory
+    #: only with :attr:`HASH_CACHE_IN_SOURCE`. Hidden and not an image
+    #: extension, so :meth:`ImgUtils.list_image_files` never returns it.
+    HASH_CACHE_NAME = ".image_curator_cache.json"
+    #: Opt-in: write the scan cache into each source directory instead of
+    #: the per-user cache root. Capture folders may be read-only or under
+    #: version control, so the default leaves them untouched.
+    HASH_CACHE_IN_SOURCE = False
+    #: Bump when :meth:`dhash` / :meth:`sharpness` change what they compute.
+    HASH_CACHE_VERSION = 1
+    #: Bounds on the per-user ``image_curator`` cache directory, which gains
+    #: one file per scanned source directory: files untouched for
+    #: :attr:`HASH_CACHE_MAX_AGE_DAYS` go first, then the oldest beyond
+    #: :attr:`HASH_CACHE_MAX_FILES`. ``None`` disables a bound.
+    HASH_CACHE_MAX_FILES = 256
+    HASH_CACHE_MAX_AGE_DAYS = 90
+
+    def _hash_cache_path(self, src_dir: str) -> str:
+        """Scan cache file for *src_dir*: one JSON per source directory under
+        ``UserConfig.user_cache_root()/image_curator``, named by a hash of the
+        directory's absolute path (or :attr:`HASH_CACHE_NAME` inside it with
+        :attr:`HASH_CACHE_IN_SOURCE`)."""
+        if self.HASH_CACHE_IN_SOURCE:
+            return os.path.join(src_dir, self.HASH_CACHE_NAME)
+        key = os.path.normcase(os.path.abspath(src_dir)).encode("utf-8")
+        digest = hashlib.sha1(key).hexdigest()[:16]
+        root = UserConfig.user_cache_root() / "image_curator"
+        return str(root / f"{digest}.json")
+
+    def _load_hash_cache(self, src_dir: str) -> Dict[str, list]:
+        """``{name: [mtime_ns, size, hash_hex, sharpness]}`` from *src_dir*'s
+        cache file, or ``{}`` when absent, unreadable, or written by another
+        :attr:`SCAN_WIDTH` / :attr:`HASH_CACHE_VERSION`."""
+        path = self._hash_cache_path(src_dir)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != self.HASH_CACHE_VERSION
+            or data.get("scan_width") != self.SCAN_WIDTH
+        ):
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_hash_cache(self, src_dir: str, entries: Dict[str, list]) -> None:
+        """Write *entries* to :meth:`_hash_cache_path` (staged, then
+        ``os.replace``) and prune the per-user cache directory to
+        :attr:`HASH_CACHE_MAX_FILES` / :attr:`HASH_CACHE_MAX_AGE_DAYS`. An
+        unwritable cache location just goes uncached."""
+        path = self._hash_cache_path(src_dir)
+        staging = path + ".part"
+        data = {
+            "version": self.HASH_CACHE_VERSION,
+            "scan_width": self.SCAN_WIDTH,
+            "entries": entries,
+        }
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(staging, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(staging, path)
+        except OSError as e:
+            logger.debug(f"Hash cache not written for {src_dir}: {e}")
+            try:
+                os.remove(staging)
+            except OSError:
+                pass
+            return
+        if not self.HASH_CACHE_IN_SOURCE:
+            UserConfig.prune_cache_dir(
+                os.path.dirname(path),
+                max_files=self.HASH_CACHE_MAX_FILES,
+                max_age_days=self.HASH_CACHE_MAX_AGE_DAYS,
+            )
+
+    def _scan_images(self, source_dirs, progress=None, hash_cache=True):
         """Scan every image: dHash + variance-of-Laplacian sharpness on a
         :attr:`SCAN_WIDTH`-wide thumbnail. Returns
         ``[(src_dir, path, hash, sharpness), ...]``. Shared by
-        :meth:`curate` and :meth:`preview`."""
+        :meth:`curate` and :meth:`preview`.
+
+        With *hash_cache*, results persist per directory (see
+        :meth:`_hash_cache_path`), keyed on file name + mtime + size, so
+        re-curating the same captures skips decoding every unchanged
+        frame."""
         scanned: List[Tuple[str, str, int, float]] = []
         for src_dir in source_dirs:
             if not os.path.isdir(src_dir):
                 logger.warning(f"Source dir missing, skipping: {src_dir}")
                 continue
             files = ImgUtils.list_image_files(src_dir)
+            cached = self._load_hash_cache(src_dir) if hash_cache else {}
+            fresh: Dict[str, list] = {}
+            decoded = 0
             for i, name in enumerate(files):
                 path = os.path.join(src_dir, name)
-                img = cv2.imread(path)
-                if img is None:
+                try:
+                    st = os.stat(path)
+                except OSError:
                     continue
-                # Downsize for hash/sharpness speed. INTER_AREA, not the
-                # default INTER_LINEAR: a ~4x+ decimation through a 2x2
-                # linear tap aliases, and that aliasing feeds pseudo-random
-                # high-frequency energy straight into the Laplacian-variance
-                # sharpness ranking (dhash() does its own INTER_AREA resize,
-                # so the hash is safe either way).
-                h, w = img.shape[:2]
-                if w > self.SCAN_WIDTH:
-                    # max(1, ...): an extreme panorama strip (w > 1024*h)
-                    # would otherwise round to height 0 and cv2.resize
-                    # asserts, aborting the whole scan.
-                    img = cv2.resize(
-                        img,
-                        (self.SCAN_WIDTH,
-                         max(1, int(h * (float(self.SCAN_WIDTH) / w)))),
-                        interpolation=cv2.INTER_AREA,
-                    )
-                scanned.append((src_dir, path, self.dhash(img), self.sharpness(img)))
+                entry = cached.get(name)
+                if (
+                    isinstance(entry, list)
+                    and len(entry) == 4
+                    and entry[:2] == [st.st_mtime_ns, st.st_size]
+                ):
+                    scanned.append((src_dir, path, int(entry[2], 16), float(entry[3])))
+                    fresh[name] = entry
+                else:
+                    img = cv2.imread(path)
+                    if img is None:
+                        continue
+                    decoded += 1
+                    # Downsize for hash/sharpness speed. INTER_AREA, not the
+                    # default INTER_LINEAR: a ~4x+ decimation through a 2x2
+                    # linear tap aliases, and that aliasing feeds
+                    # pseudo-random high-frequency energy straight into the
+                    # Laplacian-variance sharpness ranking (dhash() does its
+                    # own INTER_AREA resize, so the hash is safe either way).
+                    h, w = img.shape[:2]
+                    if w > self.SCAN_WIDTH:
+                        # max(1, ...): an extreme panorama strip
+                        # (w > 1024*h) would otherwise round to height 0 and
+                        # cv2.resize asserts, aborting the whole scan.
+                        img = cv2.resize(
+                            img,
+                            (self.SCAN_WIDTH,
+                             max(1, int(h * (float(self.SCAN_WIDTH) / w)))),
+                            interpolation=cv2.INTER_AREA,
+                        )
+                    dh, sharp = self.dhash(img), self.sharpness(img)
+                    scanned.append((src_dir, path, dh, sharp))
+                    fresh[name] = [st.st_mtime_ns, st.st_size, format(dh, "x"), sharp]
                 if progress is not None:
                     try:
                         progress("scan", i + 1, len(files), src_dir)
                     except Exception:
                         pass
+            # Rewritten only when something changed; pruning deleted frames
+            # rides along with the next decode.
+            if hash_cache and (decoded or len(fresh) != len(cached)):
+                self._save_hash_cache(src_dir, fresh)
+            if hash_cache and len(files):
+                logger.debug(
+                    f"{src_dir}: {len(files) - decoded} of {len(files)} "
+                    f"frame(s) from hash cache"
+                )
         return scanned
 
     @staticmethod
@@ -246,10 +464,26 @@ class ImageCurator:
         own cluster). Hamming-0 matching would still merge *bit-identical*
         hashes — routine for consecutive frames of a paused camera on a
         thumbnail-sized dHash — silently contradicting the documented
-        "0 = no dedup, keep all" contract every runner/tooltip states."""
+        "0 = no dedup, keep all" contract every runner/tooltip states.
+
+        Anchor lookup goes through :class:`_AnchorIndex` for 64-bit hashes;
+        the clusters are identical to the linear scan's."""
         if hash_threshold <= 0:
             return [[record] for record in scanned]
         clusters: List[List[Tuple[str, str, int, float]]] = []
+        if scanned and all(0 <= r[2] < (1 << 64) for r in scanned):
+            # The 64-bit dHash :meth:`_scan_images` produces: indexed, so a
+            # 200k-frame capture is not 200k passes over every anchor.
+            index = _AnchorIndex(hash_threshold)
+            for record in scanned:
+                ci = index.first_within(record[2])
+                if ci is None:
+                    index.add(record[2])
+                    clusters.append([record])
+                else:
+                    clusters[ci].append(record)
+            return clusters
+        # Wider hashes (``dhash(size > 8)``): the linear anchor scan.
         anchor_hashes: List[int] = []
         for record in scanned:
             h = record[2]
@@ -315,6 +549,7 @@ class ImageCurator:
         sharpness_floor_percentile=None,
         min_sharpness_fraction_of_median=0.0,
         progress=None,
+        hash_cache=True,
     ):
         """Dry-run curation report — scan **once**, evaluate one or more
         ``hash_thresholds`` *without copying any files*. Use it to tune curation
@@ -325,6 +560,7 @@ class ImageCurator:
         :param hash_thresholds: int, or iterable of dHash Hamming thresholds to sweep.
         :param keep_per_cluster: Representatives kept per cluster (as in curate).
         :param sharpness_floor / sharpness_floor_percentile: Floor controls (as in curate).
+        :param hash_cache: Read/write the per-directory scan cache (as in curate).
         :return: ``{"n_scanned": int, "sharpness": {min,p5,p25,median,p75,max},
                  "thresholds": [{hash_threshold, n_clusters, n_kept, reduction_pct,
                  sharpness_floor}, ...]}``.
@@ -334,7 +570,9 @@ class ImageCurator:
             raise RuntimeError("cv2 not available; cannot preview curation.")
         if isinstance(hash_thresholds, int):
             hash_thresholds = (hash_thresholds,)
-        scanned = self._scan_images(source_dirs, progress=progress)
+        scanned = self._scan_images(
+            source_dirs, progress=progress, hash_cache=hash_cache
+        )
         n = len(scanned)
         report = {"n_scanned": n, "sharpness": {}, "thresholds": []}
         if n == 0:
@@ -30,26 +30,34 @@ Example (publish a GLB and open it):
 
 Served surface:
     ``GET /``                -> the viewer page (materialized into the serve root)
-    ``GET /manifest.json``   -> ``{"version", "asset", "updated", "title", "scripts"}``;
+    ``GET /manifest.json``   -> ``{"version", "asset", "etag", "parts", "updated", "title", "scripts"}``;
                                 also the heartbeat behind :meth:`PreviewServer.has_viewer`
     ``GET /scripts/<name>.js`` -> an active viewer script (see :attr:`PreviewServer.SCRIPTS`)
-    ``GET /<name>``          -> any published asset, by name
+    ``GET /<name>``          -> any published asset, by name -- with a content
+                                ``ETag`` (conditional GET answers ``304``),
+                                byte ``Range`` support, and a precompressed
+                                gzip/brotli sibling when the client accepts one
+    ``GET /parts/<sha256>.bin`` -> a content-addressed part of a delta publish
+                                (:meth:`PreviewServer.publish_parts`), immutable
     ``POST /viewer-closed``  -> the viewer's unload beacon, so a closed tab is
                                 known at once rather than after a timeout
 """
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import os
 import shutil
 import threading
 import time
 import webbrowser
+from collections import deque
 from dataclasses import dataclass, field
 from functools import partial
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Union
 
 from pythontk.core_utils.app_handoff import (
     Deliverer,
@@ -61,12 +69,100 @@ from pythontk.core_utils.logging_mixin import LoggingMixin
 from pythontk.file_utils.temp_artifacts import TempArtifacts
 from pythontk.net_utils._net_utils import NetUtils
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 
 #: Path the viewer beacons on unload, so a closed tab is known immediately
 #: rather than after :attr:`PreviewServer.VIEWER_TIMEOUT`. Shared by the
 #: handler and the served page (which is checked against it by test).
 VIEWER_CLOSED_PATH = "viewer-closed"
 
+#: Bytes per read when streaming an asset (or a range of one) to the socket.
+_STREAM_CHUNK = 1 << 16
+
+
+@dataclass(frozen=True)
+class _PublishedAsset:
+    """What the handler needs to serve one published asset without touching it.
+
+    Recorded by :meth:`PreviewServer.publish` once every file below is in
+    place, and swapped in whole under the server lock -- together with the
+    rename of the identity file -- so a request either sees the previous
+    revision's record and bytes or this one's, never a record naming a
+    sibling that has not been written yet.
+
+    ``variants`` maps a ``Content-Encoding`` token to the served-root filename
+    of the precompressed sibling. Those filenames carry the digest, which is
+    what makes the swap safe: a new publish writes *new* siblings beside the
+    old ones rather than over them, so a request still holding the previous
+    record streams the previous bytes to the end.
+    """
+
+    name: str
+    digest: str
+    size: int
+    variants: Dict[str, str] = field(default_factory=dict)
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        """Strong validator for one representation (each encoding gets its own)."""
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+
+def _parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """``Accept-Encoding`` as ``{token: q}``, dropping anything refused (``q=0``)."""
+    accepted: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted[token] = q
+    return accepted
+
+
+def _parse_range(header: Optional[str], size: int) -> Optional[tuple]:
+    """Resolve a single-range ``Range`` header to an inclusive ``(start, end)``.
+
+    Returns ``None`` when there is nothing to honour -- no header, another
+    unit, a malformed spec (which RFC 9110 says to ignore), or a multi-range
+    request (answered with the whole body, which the RFC permits and which
+    spares a ``multipart/byteranges`` writer no glTF loader would exercise).
+    Raises ``ValueError`` for a well-formed range that cannot be satisfied,
+    which the handler answers with ``416``.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = (text.strip() for text in spec.strip().partition("-"))
+    if not (first or last) or not (first or "0").isdigit() or not (last or "0").isdigit():
+        return None
+    if not first:  # suffix form: the final N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range: {header!r}")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if end < start:
+        return None
+    if start >= size:
+        raise ValueError(f"Unsatisfiable range: {header!r}")
+    return start, min(end, size - 1)
+
 
 def _mesh_convert():
     """The GLB converter, imported on use rather than at module scope.
@@ -97,27 +193,36 @@ class _PreviewHTTPServer(ThreadingHTTPServer):
 
 
 class _PreviewHandler(SimpleHTTPRequestHandler):
-    """Static handler with a live ``/manifest.json`` and caching disabled.
+    """Static handler with a live ``/manifest.json`` and validated asset caching.
 
     It also owns both halves of the viewer-liveness signal the ``"auto"``
     open-a-tab decision reads: each manifest poll marks a viewer present, and
     the page's unload beacon on ``POST /viewer-closed`` marks it gone.
 
-    Caching is off for the whole tree rather than just the manifest: every file
-    under the serve root is republished in place, so a cached response is always
-    the stale one. The viewer additionally appends ``?v=<version>`` to the asset
-    URL, which alone would be enough for well-behaved caches -- this is the
-    belt-and-braces half, and costs nothing on loopback.
+    Two caching postures, split by what can go stale silently:
+
+    - **Published assets** carry a content-hash ``ETag`` and ``no-cache``
+      (store, but revalidate every use). Republishing in place is then safe --
+      a changed file has a different tag -- while an unchanged one costs a
+      ``304`` instead of the whole GLB, which over Wi-Fi to a standalone
+      headset is the difference between a push and a 100 MB download. They
+      also honour a single byte ``Range`` and, when the client accepts it,
+      stream the gzip/brotli sibling :meth:`PreviewServer.publish` wrote.
+    - **Everything else** (the manifest, the page, the scripts) stays
+      ``no-store``: none of it is hashed, and a cached manifest would pin the
+      page to the version it first saw.
     """
 
     server_version = "pythontk-preview"
 
     def __init__(self, *args, owner: "PreviewServer" = None, **kwargs):
         self._owner = owner
+        self._cache_control = "no-store, must-revalidate"
         super().__init__(*args, **kwargs)
 
     def do_GET(self):  # noqa: N802 (BaseHTTPRequestHandler API)
-        if self.path.split("?", 1)[0] == "/manifest.json":
+        route = self.path.split("?", 1)[0]
+        if route == "/manifest.json":
             # Only the manifest counts as proof of life: it is fetched on a
             # timer for as long as a page is open, whereas an asset GET happens
             # once per publish and a stray favicon request proves nothing.
@@ -125,8 +230,124 @@ class _PreviewHandler(SimpleHTTPRequestHandler):
                 self._owner._touch_viewer()
             self._send_json(self._owner.manifest() if self._owner else {})
             return
+        if self._send_asset(route.lstrip("/"), body=True):
+            return
+        if route.startswith(f"/{PreviewServer.PARTS_ROUTE}/"):
+            # Named by their own hash, so a cached copy can never be stale:
+            # this is what lets the browser cache stand in for a part store.
+            self._cache_control = "public, max-age=31536000, immutable"
         super().do_GET()
 
+    def do_HEAD(self):  # noqa: N802 (BaseHTTPRequestHandler API)
+        if self._send_asset(self.path.split("?", 1)[0].lstrip("/"), body=False):
+            return
+        super().do_HEAD()
+
+    def _send_asset(self, name: str, body: bool) -> bool:
+        """Serve published asset *name*: conditional, ranged, or precompressed.
+
+        Returns ``False`` when *name* is not a published asset (the caller
+        falls back to the static handler). The record and the file it names
+        are taken together through :meth:`PreviewServer._open_published`, so
+        a concurrent publish can never pair one revision's ``ETag`` with the
+        other's bytes.
+
+        Precedence follows RFC 9110: a matching ``If-None-Match`` answers
+        ``304`` before anything is read; a ``Range`` is served from the
+        identity bytes (ranges over a *coded* body would address offsets no
+        client can reason about, so a ranged request never gets an encoding);
+        and only a plain full GET negotiates ``Content-Encoding``.
+        """
+        if self._owner is None:
+            return False
+        opened = self._owner._open_published(name, self._representation)
+        if opened is None:
+            return False
+        record, (encoding, ranged), handle = opened
+        self._cache_control = "no-cache"
+        etag = record.etag(encoding)
+
+        matches = {tag.strip() for tag in (self.headers.get("If-None-Match") or "").split(",")}
+        if etag in matches or "*" in matches:
+            if handle is not None:
+                handle.close()
+            self.send_response(304)
+            self._asset_headers(record, etag)
+            self.end_headers()
+            return True
+
+        if handle is None:
+            self.send_error(404, "File not found")
+            return True
+        with handle:
+            size = os.fstat(handle.fileno()).st_size
+            try:
+                span = _parse_range(ranged, size)
+            except ValueError:
+                self.send_response(416)
+                self._asset_headers(record, etag)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, end = span if span else (0, size - 1)
+            self.send_response(206 if span else 200)
+            self._asset_headers(record, etag)
+            self.send_header("Content-Type", self.guess_type(record.name))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            if span:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.send_header("Content-Length", str(max(end - start + 1, 0)))
+            self.end_headers()
+            if body:
+                self._stream(handle, start, end - start + 1)
+        return True
+
+    def _representation(self, record: _PublishedAsset) -> tuple:
+        """``(encoding, range)`` to serve of *record* for this request."""
+        ranged = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if ranged and if_range and if_range.strip() != record.etag():
+            ranged = None  # the client's partial copy is of another revision
+        return (None if ranged else self._negotiate(record)), ranged
+
+    def _asset_headers(self, record: _PublishedAsset, etag: str) -> None:
+        """Validator headers every asset response carries, 304 and 416 included."""
+        self.send_header("ETag", etag)
+        self.send_header("Accept-Ranges", "bytes")
+        if record.variants:
+            # Intermediaries keyed on the URL alone would otherwise hand a
+            # brotli body to a client that only asked for identity.
+            self.send_header("Vary", "Accept-Encoding")
+
+    def _negotiate(self, record: _PublishedAsset) -> Optional[str]:
+        """The best precompressed sibling the client accepts, or ``None`` (identity)."""
+        if not record.variants:
+            return None
+        accepted = _parse_accept_encoding(self.headers.get("Accept-Encoding"))
+        offered = [
+            encoding
+            for encoding in PreviewServer.PRECOMPRESS_ENCODINGS
+            if encoding in record.variants
+            and (encoding in accepted or "*" in accepted)
+        ]
+        if not offered:
+            return None
+        # Stable on ties, so the server's own preference order (smallest
+        # output first) decides between equally weighted tokens.
+        return max(offered, key=lambda token: accepted.get(token, accepted.get("*", 0)))
+
+    def _stream(self, handle, offset: int, length: int) -> None:
+        """Copy *length* bytes from *offset* to the socket in bounded chunks."""
+        handle.seek(offset)
+        while length > 0:
+            chunk = handle.read(min(_STREAM_CHUNK, length))
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            length -= len(chunk)
+
     def do_POST(self):  # noqa: N802 (BaseHTTPRequestHandler API)
         """Accept the viewer's ``sendBeacon`` close notice; 404 anything else."""
         if self.path.split("?", 1)[0] != f"/{VIEWER_CLOSED_PATH}":
@@ -167,7 +388,7 @@ class _PreviewHandler(SimpleHTTPRequestHandler):
         self.wfile.write(body)
 
     def end_headers(self):
-        self.send_header("Cache-Control", "no-store, must-revalidate")
+        self.send_header("Cache-Control", self._cache_control)
         super().end_headers()
 
     def log_message(self, format, *args):  # noqa: A002 (BaseHTTPRequestHandler API)
@@ -291,12 +512,115 @@ class _PreviewServerInternal:
         onto the served path would hand a mid-copy GLB to any poll that lands
         during the write -- routine, since the viewer polls once a second.
         """
+        os.replace(self._stage_asset(src, dst, move), dst)
+
+    @staticmethod
+    def _stage_asset(src: Path, dst: Path, move: bool) -> Path:
+        """Copy (or move) *src* to ``dst``'s ``.part`` sibling; return that path."""
         part = dst.with_name(dst.name + ".part")
         if move:
             shutil.move(str(src), str(part))
         else:
             shutil.copyfile(src, part)
-        os.replace(part, dst)
+        return part
+
+    @staticmethod
+    def _digest_file(path: Path) -> str:
+        """Content hash of *path*, streamed -- the asset's ``ETag`` and variant key."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()[:32]
+
+    def _precompress(
+        self, asset: Path, digest: str, served: Optional[Path] = None
+    ) -> Dict[str, str]:
+        """Write the compressed siblings worth serving; return ``{encoding: filename}``.
+
+        Done once here rather than per request: the compression is the
+        expensive half, a headset re-fetches the same revision on every
+        reload, and a loopback server has no business spending a core on each
+        GET. Already-compressed containers (KTX2 / image payloads) are skipped
+        outright, and an encoding that does not beat
+        :attr:`PRECOMPRESS_MAX_RATIO` is discarded -- a GLB whose bulk is WebP
+        textures barely shrinks, and a sibling that saves nothing is only a
+        decode step on the headset.
+
+        Sibling names carry the digest (see :class:`_PublishedAsset`), and each
+        is written atomically through :meth:`_write_asset`'s ``.part`` rename.
+        *served* is the path the asset will be served from when *asset* is
+        still its staged copy; siblings are named after it.
+        """
+        if not self._precompress_enabled:
+            return {}
+        served = served or asset
+        size = asset.stat().st_size
+        if size < self.PRECOMPRESS_MIN_SIZE or (
+            served.suffix.lower() in self.PRECOMPRESS_SKIP_SUFFIXES
+        ):
+            return {}
+        variants: Dict[str, str] = {}
+        for encoding in self.PRECOMPRESS_ENCODINGS:
+            if encoding == "br" and brotli is None:
+                continue  # optional: `pip install brotli` to enable
+            dst = served.with_name(
+                f"{served.name}.{digest[:16]}.{self._VARIANT_SUFFIX[encoding]}"
+            )
+            part = dst.with_name(dst.name + ".part")
+            try:
+                self._compress(encoding, asset, part)
+                if part.stat().st_size > size * self.PRECOMPRESS_MAX_RATIO:
+                    part.unlink()
+                    continue
+                os.replace(part, dst)
+            except OSError as error:
+                # An asset that cannot be precompressed is still servable as
+                # identity; the publish itself must not fail over it.
+                self.logger.debug("Precompress %s (%s) skipped: %s", asset.name, encoding, error)
+                part.unlink(missing_ok=True)
+                continue
+            variants[encoding] = dst.name
+        return variants
+
+    def _compress(self, encoding: str, src: Path, dst: Path) -> None:
+        """Stream *src* into *dst* under one ``Content-Encoding``."""
+        with open(src, "rb") as reader, open(dst, "wb") as writer:
+            if encoding == "gzip":
+                # mtime=0 keeps the output a pure function of the input.
+                with gzip.GzipFile(
+                    fileobj=writer, mode="wb", compresslevel=self.GZIP_LEVEL, mtime=0
+                ) as stream:
+                    shutil.copyfileobj(reader, stream, 1 << 20)
+                return
+            compressor = brotli.Compressor(quality=self.BROTLI_QUALITY)
+            for chunk in iter(lambda: reader.read(1 << 20), b""):
+                writer.write(compressor.process(chunk))
+            writer.write(compressor.finish())
+
+    def _sweep_variants(self, name: str) -> None:
+        """Remove compressed siblings of *name* that have gone stale.
+
+        A sibling stays until it drops out of the last
+        :attr:`VARIANTS_KEEP_REVISIONS` records of *name*, so a request that
+        took the previous record still finds its sibling and streams it to the
+        end. Only files matching the ``<name>.<digest>.<suffix>`` shape this
+        class writes are candidates, so a caller-supplied root loses nothing
+        of its own. A sibling still open by an in-flight request cannot be
+        removed on Windows; that is left for the next publish to sweep.
+        """
+        with self._lock:
+            history = self._variant_history.get(name, ())
+            current = {filename for variants in history for filename in variants}
+        for suffix in self._VARIANT_SUFFIX.values():
+            for stale in self.root.glob(f"{name}.*.{suffix}"):
+                stem = stale.name[len(name) + 1 : -len(suffix) - 1]
+                if stale.name in current or len(stem) != 16:
+                    continue
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
 
 
 class PreviewServer(LoggingMixin, _PreviewServerInternal):
@@ -313,6 +637,9 @@ class PreviewServer(LoggingMixin, _PreviewServerInternal):
             port must bind or :meth:`start` raises ``OSError``.
         viewer: Materialize the packaged WebXR viewer as ``index.html``.
         title: Label shown in the viewer's status line.
+        precompress: Write gzip (and, with ``brotli`` installed, brotli)
+            siblings of each published asset, served to clients that accept
+            them. Off trades wire size for publish latency.
     """
 
     DEFAULT_PORT = 8118
@@ -323,6 +650,18 @@ class PreviewServer(LoggingMixin, _PreviewServerInternal):
     #: Serve-root subdirectory (and URL prefix) the active scripts live under.
     SCRIPTS_ROUTE = "scripts"
 
+    #: Serve-root subdirectory (and URL prefix) the content-addressed parts of
+    #: a :meth:`publish_parts` revision live under.
+    PARTS_ROUTE = "parts"
+
+    #: How many delta revisions' parts survive the sweep -- the current one
+    #: plus the one a slow page may still be mid-way through loading.
+    PARTS_KEEP_REVISIONS = 2
+
+    #: How many revisions of a published asset keep their precompressed
+    #: siblings -- the current one plus the one an in-flight request holds.
+    VARIANTS_KEEP_REVISIONS = 2
+
     #: Built-in viewer scripts, registered name -> filename in
     #: :attr:`SCRIPTS_DIR`. This is the *extension registry*: the viewer page
     #: itself stays the stable path and gains behaviour by a module being
@@ -347,6 +686,31 @@ class PreviewServer(LoggingMixin, _PreviewServerInternal):
     #: comes from the unload beacon instead, not from shortening this.
     VIEWER_TIMEOUT = 90.0
 
+    #: Content codings :meth:`publish` precompresses into, in server
+    #: preference order (the handler breaks client ``q`` ties with it). ``br``
+    #: is written only when the optional ``brotli`` module is importable.
+    PRECOMPRESS_ENCODINGS = ("br", "gzip")
+
+    #: Suffixes whose payload is already entropy-coded -- compressing them
+    #: again costs publish latency and buys nothing on the wire.
+    PRECOMPRESS_SKIP_SUFFIXES = frozenset(
+        {".ktx2", ".png", ".jpg", ".jpeg", ".webp", ".usdz", ".zip", ".gz", ".br"}
+    )
+
+    #: Below this, a compressed sibling is not worth its extra file.
+    PRECOMPRESS_MIN_SIZE = 1024
+
+    #: A sibling larger than this fraction of the original is discarded.
+    PRECOMPRESS_MAX_RATIO = 0.9
+
+    #: Compression effort. Both are mid-range on purpose: this runs inside
+    #: every publish, so a push-to-headset stays fast and still recovers most
+    #: of the geometry-side savings (brotli 11 is ~10x slower for a few %).
+    GZIP_LEVEL = 6
+    BROTLI_QUALITY = 5
+
+    _VARIANT_SUFFIX = {"br": "br", "gzip": "gz"}
+
     def __init__(
         self,
         root: Optional[Union[str, Path]] = None,
@@ -354,14 +718,25 @@ class PreviewServer(LoggingMixin, _PreviewServerInternal):
         port: Optional[int] = None,
         viewer: bool = True,
         title: str = "Preview",
+        precompress: bool = True,
     ):
         self.host = host
         self.title = title
         self._requested_port = port
         self._viewer = viewer
+        self._precompress_enabled = precompress
         self._lock = threading.Lock()
         self._version = 0
         self._asset: Optional[str] = None
+        #: Publish records by served name -- what the handler validates,
+        #: ranges and negotiates against (see :class:`_PublishedAsset`).
+        self._published: Dict[str, _PublishedAsset] = {}
+        #: Part digests of the current revision (empty for a whole-file
+        #: publish), and of the recent ones the sweep must keep.
+        self._parts: tuple = ()
+        self._part_history: Deque[tuple] = deque(maxlen=self.PARTS_KEEP_REVISIONS)
+        #: Sibling filenames of each name's recent records, newest last.
+        self._variant_history: Dict[str, Deque[tuple]] = {}
         self._updated: Optional[float] = None
         self._httpd: Optional[ThreadingHTTPServer] = None
         self._thread: Optional[threading.Thread] = None
@@ -542,12 +917,49 @@ class PreviewServer(LoggingMixin, _PreviewServerInternal):
         with self._lock:
             return dict(self._scripts)
 
+    def _published_asset(self, name: str) -> Optional[_PublishedAsset]:
+        """The current publish record for served *name*, if it is one."""
+        with self._lock:
+            return self._published.get(name)
+
+    def _open_published(self, name: str, choose) -> Optional[tuple]:
+        """Take the record for *name* and open the file it names, in one step.
+
+        *choose* maps the record to ``(encoding, range)`` for the request.
+        Runs under the lock :meth:`_commit` swaps the identity file and the
+        record under, so the handle always holds the bytes the record
+        describes; an open handle keeps them even once the next publish
+        replaces the path. Returns ``(record, choice, handle)`` -- ``handle``
+        is ``None`` when the file cannot be opened -- or ``None`` when *name*
+        is not a published asset.
+        """
+        with self._lock:
+            record = self._published.get(name)
+            if record is None:
+                return None
+            choice = choose(record)
+            encoding = choice[0]
+            filename = record.variants[encoding] if encoding else record.name
+            try:
+                handle = open(self.root / filename, "rb")
+            except OSError:
+                handle = None
+        return record, choice, handle
+
     def manifest(self) -> Dict[str, Any]:
         """The payload served at ``/manifest.json``."""
         with self._lock:
+            record = self._published.get(self._asset) if self._asset else None
             return {
                 "version": self._version,
                 "asset": self._asset,
+                # The asset's content hash (its ETag, unquoted). The page keys
+                # its asset URL on this rather than on the version, so a push
+                # that changed nothing is a cache hit instead of a download.
+                "etag": record.digest if record else None,
+                # Content addresses of the asset's parts when it was published
+                # by `publish_parts`, else empty -- the whole file is the asset.
+                "parts": list(self._parts),
                 "updated": self._updated,
                 "title": self.title,
                 # URLs rather than names: the page imports these directly, and
@@ -631,15 +1043,134 @@ class PreviewServer(LoggingMixin, _PreviewServerInternal):
         # materialized here, not only at start.
         self._ensure_scripts()
         name = name or f"scene{src.suffix}"
-        self._write_asset(src, self.root / name, move)
+        staged = self._stage_asset(src, self.root / name, move)
+        version = self._commit(name, staged, parts=())
+        self.logger.info("Published %s as %r (v%s)", src.name, name, version)
+        return version
+
+    def publish_parts(
+        self,
+        src: Union[str, Path],
+        name: Optional[str] = None,
+        move: bool = False,
+    ) -> Dict[str, Any]:
+        """Publish a GLB as a ``.gltf`` plus content-addressed parts (delta mode).
+
+        :meth:`publish` ships the whole GLB on every push, so a change to one
+        material's texture costs the full scene over the wire. Here the GLB is
+        split by :meth:`MeshConvert.split_glb` -- one part per ``bufferView``
+        payload, named by its SHA-256 -- and only parts not already on disk are
+        written. Parts are served ``immutable`` (a content address never
+        changes meaning), so the page's ordinary HTTP cache is the part store:
+        a reload fetches the small ``.gltf`` and exactly the parts it has not
+        seen, and push latency scales with the edit rather than the scene.
+
+        Parts referenced by the last :attr:`PARTS_KEEP_REVISIONS` publishes
+        are kept -- a page still loading the previous revision must not 404
+        halfway -- and everything older is swept.
+
+        Parameters:
+            src: The GLB to publish.
+            name: Served document name. Defaults to ``scene.gltf``.
+            move: Delete *src* once split -- for a temp export with no other
+                reader (the parts are written out; nothing else is moved).
+
+        Returns:
+            ``{"version", "asset", "parts", "parts_written", "bytes_written",
+            "bytes_total"}`` -- the counts are what the push actually cost.
+        """
+        src = Path(src)
+        if not src.is_file():
+            raise FileNotFoundError(f"PreviewServer.publish_parts: no such file: {src}")
+        self._ensure_viewer()
+        self._ensure_scripts()
+        name = name or "scene.gltf"
+        directory = self.root / self.PARTS_ROUTE
+        directory.mkdir(parents=True, exist_ok=True)
+
+        gltf, parts = _mesh_convert().split_glb(src, uri_prefix=f"{self.PARTS_ROUTE}/")
+        written = written_bytes = 0
+        for digest, payload in parts.items():
+            dst = directory / f"{digest}.bin"
+            if dst.is_file() and dst.stat().st_size == len(payload):
+                continue  # content-addressed: present means identical
+            part = dst.with_name(dst.name + ".part")
+            part.write_bytes(payload)
+            os.replace(part, dst)
+            written += 1
+            written_bytes += len(payload)
+        total = sum(len(payload) for payload in parts.values())
+        parts = tuple(parts)  # the digests; the payloads are on disk now
+
+        document = self.root / f"{name}.tmp"
+        document.write_text(json.dumps(gltf, separators=(",", ":")), encoding="utf-8")
+        staged = self._stage_asset(document, self.root / name, move=True)
+        if move:
+            src.unlink()
+
+        version = self._commit(name, staged, parts=parts)
+        self._sweep_parts()
+        self.logger.info(
+            "Published %s as %r (v%s): %d/%d part(s) new, %d of %d bytes.",
+            src.name, name, version, written, len(parts), written_bytes, total,
+        )
+        return {
+            "version": version,
+            "asset": name,
+            "parts": len(parts),
+            "parts_written": written,
+            "bytes_written": written_bytes,
+            "bytes_total": total,
+        }
+
+    def _commit(self, name: str, staged: Path, parts: tuple) -> int:
+        """Swap *staged* in as served *name* and record it as the current asset.
+
+        Hashed and precompressed from the staged copy -- the exact bytes the
+        rename then serves -- and renamed into place under the same lock as
+        the record swap, which :meth:`_open_published` also holds: a request
+        gets the old record with the old file or the new record with the new
+        one, never a mix. Returns the new version.
+        """
+        dst = self.root / name
+        digest = self._digest_file(staged)
+        record = _PublishedAsset(
+            name=name,
+            digest=digest,
+            size=staged.stat().st_size,
+            variants=self._precompress(staged, digest, served=dst),
+        )
         with self._lock:
+            os.replace(staged, dst)
+            self._published[name] = record
+            history = self._variant_history.setdefault(
+                name, deque(maxlen=self.VARIANTS_KEEP_REVISIONS)
+            )
+            history.append(tuple(record.variants.values()))
+            self._parts = parts
+            if parts:
+                self._part_history.append(parts)
             self._version += 1
             self._asset = name
             self._updated = time.time()
             version = self._version
-        self.logger.info("Published %s as %r (v%s)", src.name, name, version)
+        self._sweep_variants(name)
         return version
 
+    def _sweep_parts(self) -> None:
+        """Remove parts no recent revision references (see :meth:`publish_parts`)."""
+        directory = self.root / self.PARTS_ROUTE
+        with self._lock:
+            keep = {digest for revision in self._part_history for digest in revision}
+        for stale in directory.glob("*.bin"):
+            stem = stale.name[:-4]
+            if len(stem) != 64 or stem in keep:
+                continue  # not a part this class wrote, or still referenced
+            try:
+                stale.unlink()
+            except OSError:
+                pass  # still open by a reader on Windows; the next sweep retries
+
     def open_in_browser(self) -> bool:
         """Open the viewer in the default browser. Starts the server if needed."""
         self.start()
@@ -739,6 +1270,12 @@ class PreviewDeliverer(Deliverer):
             :attr:`PreviewServer.SCRIPTS`). ``None`` -- the default -- leaves
             whatever the server already has alone, so a script registered
             directly on a long-lived server survives; a list replaces the set.
+        delta: Publish through :meth:`PreviewServer.publish_parts` instead of
+            as one GLB, so a push re-sends only the buffers and textures that
+            changed since the page last loaded. Off by default: the served
+            asset becomes a ``.gltf`` plus parts, which a tool expecting a
+            single ``scene.glb`` in the serve root would not find. A push can
+            override it per request -- ``bridge.send(..., delta=True)``.
     """
 
     #: Post-conversion passes run against **one** open GLB edit session, in
@@ -773,12 +1310,14 @@ class PreviewDeliverer(Deliverer):
         title: str = "Preview",
         texture_format: str = "WEBP",
         scripts: Optional[Union[Dict[str, Any], List[str], tuple]] = None,
+        delta: bool = False,
     ):
         self.server = server
         self.open_browser = open_browser
         self.title = title
         self.texture_format = texture_format
         self.scripts = scripts
+        self.delta = delta
 
     def ensure_server(self) -> PreviewServer:
         """The bridge's server, started, creating it on first use."""
@@ -1000,7 +1539,17 @@ class PreviewDeliverer(Deliverer):
         if scripts is not None:
             server.set_scripts(scripts)
 
-        version = server.publish(glb, move=True)
+        # Request-scoped like `open_browser`: `None` (or absent) inherits the
+        # instance default, and False is a real instruction.
+        delta = request.get("delta")
+        if delta is None:
+            delta = self.delta
+        parts = None
+        if delta:
+            parts = server.publish_parts(glb, move=True)
+            version = parts["version"]
+        else:
+            version = server.publish(glb, move=True)
 
         # Asked after publishing, so the freshest possible poll counts.
         open_browser = request.get("open_browser", self.open_browser)
@@ -1022,6 +1571,9 @@ class PreviewDeliverer(Deliverer):
             # Whether one was *offered* -- the caller cannot infer it from an
             # empty summary, which also means "switched off".
             "sidecar_requested": "scene_sidecar" in extras,
+            # What a delta publish actually shipped (None for a whole-file
+            # one): parts/bytes written against the scene's total.
+            "delta": parts,
         }
 
 
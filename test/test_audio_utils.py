@@ -4,8 +4,9 @@
 Unit tests for pythontk AudioUtils.
 
 Tests cover:
-- build_composite_wav (including the sampwidth bug fix)
+- build_composite_wav (streaming mix, resampling, 24-bit sources)
 - trim_silence
+- compute_waveform_envelope / waveform_peaks
 - resolve_playable_path
 - build_audio_map / build_audio_map_from_files / build_audio_map_from_file_map
 
@@ -20,6 +21,7 @@ import shutil
 import tempfile
 import unittest
 import wave
+from unittest import mock
 
 from pythontk import AudioUtils
 
@@ -179,17 +181,17 @@ class TestBuildCompositeWav(BaseTestCase):
         self.assertEqual(params.sampwidth, 2)
         self.assertEqual(samples[0], 500)
 
-    def test_non_first_24bit_file_skipped(self):
-        """A 24-bit WAV after a valid 16-bit reference is skipped.
+    def test_non_first_24bit_file_mixed(self):
+        """A 24-bit WAV after a 16-bit reference is decoded and mixed in.
 
-        Bug: Previously non-first files never checked sampwidth, silently
-        producing corrupt output via array('h').frombytes on 3-byte data.
-        Fixed: 2026-02-25
+        Originally skipped (array('h') could not read 3-byte frames); the
+        numpy mixer decodes any 8/16/24/32-bit PCM source.
         """
         good_path = self._wav("good.wav", [500] * 100)
 
-        bad_path = os.path.join(self.tmpdir, "bad.wav")
-        buf = array.array("i", [0] * 100)
+        bad_path = os.path.join(self.tmpdir, "deep.wav")
+        # 24-bit value 256 * 300 is 300 at 16-bit full scale.
+        buf = array.array("i", [256 * 300] * 100)
         raw_bytes = buf.tobytes()
         raw_24 = b"".join(raw_bytes[i : i + 3] for i in range(0, len(raw_bytes), 4))
         with wave.open(bad_path, "wb") as wf:
@@ -200,18 +202,19 @@ class TestBuildCompositeWav(BaseTestCase):
 
         out = os.path.join(self.tmpdir, "comp.wav")
         result = AudioUtils.build_composite_wav(
-            events=[(0, "good"), (0, "bad")],
-            audio_map={"good": good_path, "bad": bad_path},
+            events=[(0, "good"), (0, "deep")],
+            audio_map={"good": good_path, "deep": bad_path},
             fps=24.0,
             output_path=out,
             logger=self.logger,
         )
         self.assertIsNotNone(result)
-        params, _ = _read_wav_samples(result)
+        params, samples = _read_wav_samples(result)
         self.assertEqual(params.sampwidth, 2)
+        self.assertEqual(samples[0], 800)
 
-    def test_mismatched_sample_rate_skipped(self):
-        """Files with different sample rates are skipped."""
+    def test_mismatched_sample_rate_resampled(self):
+        """A clip at another sample rate is resampled to the reference rate."""
         path_a = self._wav("a.wav", [100] * 100, sample_rate=44100)
         path_b = self._wav("b.wav", [200] * 100, sample_rate=22050)
 
@@ -224,8 +227,12 @@ class TestBuildCompositeWav(BaseTestCase):
             logger=self.logger,
         )
         self.assertIsNotNone(result)
-        params, _ = _read_wav_samples(result)
+        params, samples = _read_wav_samples(result)
         self.assertEqual(params.framerate, 44100)
+        # b doubles in length at the higher rate.
+        self.assertEqual(params.nframes, 200)
+        self.assertEqual(samples[0], 300)
+        self.assertEqual(samples[150], 200)
 
     def test_mismatched_channels_skipped(self):
         """Files with different channel counts are skipped."""
@@ -343,6 +350,91 @@ class TestBuildCompositeWav(BaseTestCase):
         finally:
             os.chdir(cwd)
 
+    def test_each_source_decoded_once(self):
+        """Repeated events share one decode of their source clip."""
+        path = self._wav("a.wav", [100] * 100)
+        out = os.path.join(self.tmpdir, "comp.wav")
+        with mock.patch.object(
+            AudioUtils, "_load_clip", wraps=AudioUtils._load_clip
+        ) as load:
+            AudioUtils.build_composite_wav(
+                events=[(f, "a") for f in range(0, 48, 2)],
+                audio_map={"a": path},
+                fps=24.0,
+                output_path=out,
+            )
+        self.assertEqual(load.call_count, 1)
+
+    def test_streamed_blocks_match_single_block(self):
+        """Mixing in small blocks gives the same bytes as one large block."""
+        sr = 8000
+        path_a = self._wav("a.wav", [(i * 37) % 2000 - 1000 for i in range(900)], sample_rate=sr)
+        path_b = self._wav("b.wav", [(i * 11) % 3000 - 1500 for i in range(500)], sample_rate=sr)
+        events = [(0, "a"), (1, "b"), (3, "a"), (-1, "b")]
+        audio_map = {"a": path_a, "b": path_b}
+
+        whole = os.path.join(self.tmpdir, "whole.wav")
+        AudioUtils.build_composite_wav(events, audio_map, 24.0, whole)
+        streamed = os.path.join(self.tmpdir, "streamed.wav")
+        with mock.patch.object(AudioUtils, "MIX_BLOCK_FRAMES", 61):
+            AudioUtils.build_composite_wav(events, audio_map, 24.0, streamed)
+
+        self.assertEqual(_read_wav_samples(whole), _read_wav_samples(streamed))
+
+    def test_soft_limit_stays_below_full_scale(self):
+        """The soft limiter bends overs instead of clamping at full scale."""
+        path_a = self._wav("a.wav", [18000] * 10)
+        path_b = self._wav("b.wav", [18000] * 10)
+        out = os.path.join(self.tmpdir, "comp.wav")
+        AudioUtils.build_composite_wav(
+            events=[(0, "a"), (0, "b")],
+            audio_map={"a": path_a, "b": path_b},
+            fps=24.0,
+            output_path=out,
+            limit="soft",
+        )
+        _, samples = _read_wav_samples(out)
+        self.assertGreater(samples[0], 32000)
+        self.assertLess(samples[0], 32767)
+
+    def test_24bit_output(self):
+        """``sampwidth=3`` writes 24-bit frames at the matching scale."""
+        path = self._wav("a.wav", [-1000, 1000] * 5)
+        out = os.path.join(self.tmpdir, "comp.wav")
+        AudioUtils.build_composite_wav(
+            events=[(0, "a")],
+            audio_map={"a": path},
+            fps=24.0,
+            output_path=out,
+            sampwidth=3,
+        )
+        with wave.open(out, "rb") as wf:
+            self.assertEqual(wf.getsampwidth(), 3)
+            raw = wf.readframes(2)
+        values = [
+            int.from_bytes(raw[i : i + 3], "little", signed=True) for i in (0, 3)
+        ]
+        self.assertEqual(values, [-1000 * 256, 1000 * 256])
+
+    def test_32bit_full_scale_does_not_wrap(self):
+        """Full-scale and clipped float32 samples saturate at the 32-bit rails
+        instead of wrapping to the opposite one, and survive a round trip."""
+        import numpy as np
+
+        block = np.array([1.0, -1.0, 1.5, -1.5, 0.5], dtype=np.float32)
+        raw = AudioUtils._encode_pcm(block, 4)
+        ints = np.frombuffer(raw, dtype="<i4").tolist()
+        top = (1 << 31) - 1
+        self.assertEqual(ints, [top, -top - 1, top, -top - 1, 1 << 30])
+        samples, scale = AudioUtils._decode_pcm(raw, 4, 1)
+        np.testing.assert_allclose(
+            samples[:, 0] * scale, [1.0, -1.0, 1.0, -1.0, 0.5], atol=1e-9
+        )
+
+    def test_unknown_limit_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            AudioUtils.build_composite_wav([(0, "a")], {}, 24.0, "x.wav", limit="hard")
+
 
 class TestTrimSilence(BaseTestCase):
     """Tests for AudioUtils.trim_silence."""
@@ -454,6 +546,150 @@ class TestTrimSilence(BaseTestCase):
         self.assertEqual(params.framerate, 22050)
 
 
+class TestTrimSilenceStreaming(BaseTestCase):
+    """trim_silence scanning in chunks smaller than the file."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix="audio_trim_stream_")
+        patcher = mock.patch.object(AudioUtils, "STREAM_CHUNK_FRAMES", 7)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_edges_found_across_chunk_boundaries(self):
+        path = os.path.join(self.tmpdir, "long.wav")
+        body = [500, -600, 0, 0, 700] * 9
+        _write_wav(path, [0] * 23 + body + [0] * 31)
+        AudioUtils.trim_silence(path)
+        _, samples = _read_wav_samples(path)
+        self.assertEqual(list(samples), body)
+
+    def test_stereo_frame_kept_when_one_channel_is_loud(self):
+        path = os.path.join(self.tmpdir, "stereo.wav")
+        _write_wav(path, [0, 0] * 10 + [0, 900] + [0, 0] * 10, channels=2)
+        AudioUtils.trim_silence(path)
+        _, samples = _read_wav_samples(path)
+        self.assertEqual(list(samples), [0, 900])
+
+
+def _reference_envelope(samples, channels, scale, num_bins):
+    """The original per-sample envelope, as the vectorized one's oracle."""
+    mono = [
+        sum(samples[i : i + channels]) / channels
+        for i in range(0, len(samples), channels)
+    ]
+    bin_size = max(1, len(mono) // num_bins)
+    return [
+        (min(mono[i : i + bin_size]) * scale, max(mono[i : i + bin_size]) * scale)
+        for i in range(0, len(mono), bin_size)
+    ][:num_bins]
+
+
+def _write_pcm(path, samples, sampwidth, channels=1, sample_rate=48000):
+    """Write raw little-endian PCM of any width (8-bit is unsigned)."""
+    if sampwidth == 1:
+        raw = bytes(s + 128 for s in samples)
+    else:
+        raw = b"".join(
+            int(s).to_bytes(sampwidth, "little", signed=True) for s in samples
+        )
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(sampwidth)
+        wf.setframerate(sample_rate)
+        wf.writeframes(raw)
+    return path
+
+
+class TestWaveformEnvelope(BaseTestCase):
+    """compute_waveform_envelope and the cached waveform_peaks pyramid."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix="audio_envelope_")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _signal(self, peak, count):
+        return [((i * 7919) % (2 * peak)) - peak for i in range(count)]
+
+    def test_matches_the_reference_for_every_width(self):
+        for sampwidth, peak in ((1, 127), (2, 32767), (3, 8388607), (4, 2**31 - 1)):
+            with self.subTest(bits=sampwidth * 8):
+                samples = self._signal(peak, 2 * 1001)
+                path = _write_pcm(
+                    os.path.join(self.tmpdir, f"w{sampwidth}.wav"),
+                    samples,
+                    sampwidth,
+                    channels=2,
+                )
+                scale = 1.0 / (1 << (sampwidth * 8 - 1))
+                expected = _reference_envelope(samples, 2, scale, 64)
+                result = AudioUtils.compute_waveform_envelope(path, num_bins=64)
+                self.assertEqual(len(result), len(expected))
+                for got, want in zip(result, expected):
+                    self.assertAlmostEqual(got[0], want[0], places=9)
+                    self.assertAlmostEqual(got[1], want[1], places=9)
+
+    def test_24_bit_sign_is_carried_by_the_top_byte(self):
+        path = _write_pcm(
+            os.path.join(self.tmpdir, "s24.wav"), [-8388608, 8388607], 3
+        )
+        (lo, hi), = AudioUtils.compute_waveform_envelope(path, num_bins=1)
+        self.assertEqual(lo, -1.0)
+        self.assertAlmostEqual(hi, 1.0, places=6)
+
+    def test_streamed_reads_do_not_change_the_result(self):
+        samples = self._signal(30000, 4000)
+        path = _write_pcm(os.path.join(self.tmpdir, "s.wav"), samples, 2)
+        whole = AudioUtils.compute_waveform_envelope(path, num_bins=37)
+        with mock.patch.object(AudioUtils, "STREAM_CHUNK_FRAMES", 50):
+            streamed = AudioUtils.compute_waveform_envelope(path, num_bins=37)
+        self.assertEqual(whole, streamed)
+
+    def test_a_window_summarizes_only_its_frames(self):
+        path = _write_pcm(
+            os.path.join(self.tmpdir, "w.wav"), [0] * 100 + [16384] * 100, 2
+        )
+        self.assertEqual(
+            AudioUtils.compute_waveform_envelope(path, 4, start_frame=100),
+            [(0.5, 0.5)] * 4,
+        )
+
+    def test_unreadable_file_is_empty(self):
+        self.assertEqual(
+            AudioUtils.compute_waveform_envelope(os.path.join(self.tmpdir, "no.wav")),
+            [],
+        )
+
+    def test_peaks_are_cached_and_bound_the_direct_envelope(self):
+        samples = self._signal(30000, 48000)
+        path = _write_pcm(os.path.join(self.tmpdir, "p.wav"), samples, 2)
+        cache = os.path.join(self.tmpdir, "cache")
+        peaks = AudioUtils.waveform_peaks(path, num_bins=16, cache_dir=cache)
+        self.assertEqual(len(peaks), 16)
+        self.assertTrue(os.path.isfile(AudioUtils.peak_file_path(path, cache)))
+        overall = AudioUtils.compute_waveform_envelope(path, num_bins=1)[0]
+        self.assertEqual(min(p[0] for p in peaks), overall[0])
+        self.assertEqual(max(p[1] for p in peaks), overall[1])
+
+        # Answered from the pyramid: the WAV is not reopened.
+        with mock.patch.object(wave, "open", side_effect=AssertionError("re-read")):
+            again = AudioUtils.waveform_peaks(path, num_bins=16, cache_dir=cache)
+        self.assertEqual(again, peaks)
+
+    def test_a_deep_zoom_falls_through_to_the_wav(self):
+        samples = self._signal(30000, 48000)
+        path = _write_pcm(os.path.join(self.tmpdir, "z.wav"), samples, 2)
+        cache = os.path.join(self.tmpdir, "cache")
+        self.assertEqual(
+            AudioUtils.waveform_peaks(path, 50, 1000, 1100, cache_dir=cache),
+            AudioUtils.compute_waveform_envelope(path, 50, 1000, 1100),
+        )
+
+
 class TestResolvePlayablePath(BaseTestCase):
     """Tests for AudioUtils.resolve_playable_path."""
 
@@ -9,7 +9,11 @@ import unittest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from pythontk import CancelScope, OperationCancelled  # noqa: E402
+from pythontk import (  # noqa: E402
+    CancelScope,
+    CancellableExecutor,
+    OperationCancelled,
+)
 
 
 class TestCancelScopeBasics(unittest.TestCase):
@@ -379,5 +383,103 @@ class TestConsumed(unittest.TestCase):
         self.assertFalse(scope.cancelled)
 
 
+def _spin_until_cancelled(limit):
+    """Pool-process task: checkpoint until the shared flag stops it."""
+    deadline = time.monotonic() + limit
+    while time.monotonic() < deadline:
+        CancelScope.check()
+        time.sleep(0.005)
+    return "finished"
+
+
+class TestCancellableExecutor(unittest.TestCase):
+    def test_workers_see_the_scope_ambient(self):
+        scope = CancelScope("pool")
+        with CancellableExecutor(scope, max_workers=2) as pool:
+            seen = list(pool.map(lambda _: CancelScope.current(), range(4)))
+        self.assertTrue(all(s is scope for s in seen))
+        self.assertEqual(pool.counts["completed"], 4)
+
+    def test_defaults_to_the_ambient_scope(self):
+        scope = CancelScope("outer")
+        with scope:
+            pool = CancellableExecutor(max_workers=1)
+        pool.shutdown()
+        self.assertIs(pool.scope, scope)
+
+    def test_cancel_drops_queued_tasks_and_stops_running_ones(self):
+        scope = CancelScope("pool")
+        started = threading.Event()
+
+        def work(i):
+            started.set()
+            while True:
+                CancelScope.check()
+                time.sleep(0.005)
+
+        with CancellableExecutor(scope, max_workers=2) as pool:
+            futures = [pool.submit(work, i) for i in range(20)]
+            started.wait(2)
+            scope.cancel("test")
+        counts = pool.counts
+        self.assertEqual(counts["cancelled"], 20)
+        self.assertGreaterEqual(sum(f.cancelled() for f in futures), 18)
+        self.assertEqual(counts["running"], 0)
+
+    def test_owner_source_is_polled_while_waiting(self):
+        pressed = threading.Event()
+        scope = CancelScope("pool", sources=[pressed.is_set], poll_min_interval=0)
+
+        def work(i):
+            while True:
+                CancelScope.check()
+                time.sleep(0.005)
+
+        threading.Timer(0.1, pressed.set).start()  # "Esc" held during the batch
+        began = time.monotonic()
+        with self.assertRaises(OperationCancelled):
+            with CancellableExecutor(scope, max_workers=4, poll_interval=0.01) as pool:
+                for future in pool.as_completed(
+                    [pool.submit(work, i) for i in range(50)]
+                ):
+                    future.result()
+        self.assertLess(time.monotonic() - began, 1.0)
+        self.assertEqual(scope.reason, "source")
+        self.assertEqual(pool.counts["cancelled"], 50)
+
+    def test_map_keeps_order_and_submit_after_cancel_is_cancelled(self):
+        scope = CancelScope("pool")
+        with CancellableExecutor(scope, max_workers=4) as pool:
+            self.assertEqual(
+                list(pool.map(lambda x: x * x, range(6))), [0, 1, 4, 9, 16, 25]
+            )
+            scope.cancel()
+            self.assertTrue(pool.submit(print, "never").cancelled())
+            self.assertFalse(pool.wait())
+        self.assertEqual(pool.counts["completed"], 6)
+        self.assertEqual(pool.counts["cancelled"], 1)
+
+    def test_failures_are_counted_apart_from_cancels(self):
+        with CancellableExecutor(max_workers=2) as pool:
+            pool.submit(lambda: 1 / 0)
+            pool.submit(lambda: "ok")
+            self.assertTrue(pool.wait(2))
+        counts = pool.counts
+        self.assertEqual((counts["failed"], counts["completed"]), (1, 1))
+
+    def test_process_pool_shares_the_flag(self):
+        scope = CancelScope("pool")
+        with CancellableExecutor(scope, max_workers=2, processes=True) as pool:
+            futures = [pool.submit(_spin_until_cancelled, 10.0) for _ in range(6)]
+            time.sleep(0.5)  # let workers start and pick tasks up
+            began = time.monotonic()
+            scope.cancel("test")
+        self.assertLess(time.monotonic() - began, 2.0)
+        for future in futures:
+            if not future.cancelled():
+                self.assertIsInstance(future.exception(), OperationCancelled)
+        self.assertEqual(pool.counts["cancelled"], 6)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -26,6 +26,16 @@ from pythontk import CoreUtils
 from conftest import BaseTestCase
 
 
+@CoreUtils.listify(threading="process")
+def _listify_cube(n):
+    return n**3
+
+
+@CoreUtils.listify(threading="process")
+def _listify_type_name(x):
+    return type(x).__name__
+
+
 class CoreTest(BaseTestCase):
     """CoreUtils test class with comprehensive edge case coverage."""
 
@@ -205,7 +215,9 @@ class CoreTest(BaseTestCase):
         churn aborts the interpreter inside ``Thread.start()`` — it took down
         tentacle's full test suite mid-run, in a ``format_path(one_path)`` under
         the .ui loader. Pinning the batch half too, so this can't be "fixed" by
-        dropping the parallelism the flag asks for.
+        dropping the parallelism the flag asks for. (Batches below
+        ``LISTIFY_SERIAL_THRESHOLD`` run inline as well, so the batch here is
+        sized at the threshold.)
         """
         import threading
 
@@ -221,12 +233,111 @@ class CoreTest(BaseTestCase):
         self.assertEqual(ran_on, [main_thread], "scalar call left the calling thread")
 
         ran_on.clear()
-        self.assertEqual(record([0, 1]), [0, 1])
+        batch = list(range(CoreUtils.LISTIFY_SERIAL_THRESHOLD))
+        self.assertEqual(record(batch), batch)
         self.assertTrue(
             ran_on and all(t is not main_thread for t in ran_on),
             "a multi-item call should still fan out to worker threads",
         )
 
+    def test_listify_threading_small_batch_runs_inline(self):
+        """Batches below the serial threshold skip the pool entirely."""
+        import threading
+
+        ran_on = set()
+
+        @CoreUtils.listify(threading=True)
+        def record(n):
+            ran_on.add(threading.current_thread())
+            return n * 2
+
+        self.assertEqual(record([1, 2, 3]), [2, 4, 6])
+        self.assertEqual(ran_on, {threading.current_thread()})
+
+    def test_listify_serial_threshold_per_decorator(self):
+        """``serial_threshold`` sends small I/O-bound batches to the pool."""
+        import threading
+
+        ran_on = set()
+
+        @CoreUtils.listify(threading=True, serial_threshold=2)
+        def record(n):
+            ran_on.add(threading.current_thread())
+            return n * 2
+
+        self.assertEqual(record([1]), [2])
+        self.assertEqual(ran_on, {threading.current_thread()})
+        self.assertEqual(record([1, 2, 3]), [2, 4, 6])
+        self.assertTrue(any(t.name.startswith("ptk-listify") for t in ran_on), ran_on)
+
+    def test_listify_threading_reuses_shared_pool_in_order(self):
+        """Large batches are chunked over one shared pool, results in order."""
+        import threading
+
+        names = set()
+
+        @CoreUtils.listify(threading=True)
+        def square(n):
+            names.add(threading.current_thread().name)
+            return n * n
+
+        count = CoreUtils.LISTIFY_SERIAL_THRESHOLD * 3 + 7
+        self.assertEqual(square(range(count)), [n * n for n in range(count)])
+        pool = CoreUtils._listify_pools["thread"][0]
+        self.assertEqual(square(iter(range(count))), [n * n for n in range(count)])
+        self.assertIs(CoreUtils._listify_pools["thread"][0], pool)
+        self.assertTrue(all(n.startswith("ptk-listify") for n in names))
+        self.assertLessEqual(len(names), CoreUtils.LISTIFY_MAX_THREADS)
+
+    def test_listify_threading_nested_batch_runs_inline(self):
+        """A batch started on a pool worker runs there instead of re-entering the pool."""
+        threshold = CoreUtils.LISTIFY_SERIAL_THRESHOLD
+
+        @CoreUtils.listify(threading=True)
+        def inner(n):
+            return n + 1
+
+        @CoreUtils.listify(threading=True)
+        def outer(n):
+            return sum(inner([n] * threshold))
+
+        batch = list(range(threshold))
+        self.assertEqual(outer(batch), [(n + 1) * threshold for n in batch])
+
+    def test_listify_threading_propagates_cancel_scope(self):
+        """Chunks check the caller's CancelScope before running."""
+        from pythontk import CancelScope, OperationCancelled
+
+        @CoreUtils.listify(threading=True)
+        def ident(n):
+            return n
+
+        with CancelScope() as scope:
+            scope.cancel()
+            with self.assertRaises(OperationCancelled):
+                ident(list(range(CoreUtils.LISTIFY_SERIAL_THRESHOLD)))
+
+    def test_listify_process_mode(self):
+        """``threading="process"`` maps module-level functions over processes
+        and falls back to threads for anything that cannot be pickled."""
+        batch = list(range(CoreUtils.LISTIFY_SERIAL_THRESHOLD))
+        self.assertEqual(_listify_cube(batch), [n**3 for n in batch])
+
+        @CoreUtils.listify(threading="process")
+        def local_cube(n):
+            return n**3
+
+        self.assertEqual(local_cube(batch), [n**3 for n in batch])
+
+    def test_listify_process_mode_unpicklable_item_falls_back_to_threads(self):
+        """Every item is checked, not just the first."""
+        import threading
+
+        batch = [0] * (CoreUtils.LISTIFY_SERIAL_THRESHOLD - 1) + [threading.Lock()]
+        names = _listify_type_name(batch)
+        self.assertEqual(names[0], "int")
+        self.assertEqual(names[-1], type(batch[-1]).__name__)
+
     def test_listify_function_with_arg_name(self):
         """Test listify with explicit arg_name parameter."""
 
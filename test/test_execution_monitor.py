@@ -7,6 +7,7 @@ import subprocess
 import tempfile
 from unittest.mock import MagicMock, patch
 from pythontk.core_utils.execution_monitor._execution_monitor import ExecutionMonitor
+from pythontk.core_utils.execution_monitor._shared_watchdog import SharedWatchdog
 from pythontk import ExecutionMonitor as PublicExecutionMonitor
 from pythontk import CancelScope
 
@@ -1169,5 +1170,128 @@ class TestExecutionMonitorSpinner(unittest.TestCase):
         self.assertTrue(callback_called[0], "Callback should have been triggered")
 
 
+@unittest.skipIf(sys.platform == "win32", "uses a POSIX dummy host process")
+class TestSharedWatchdog(unittest.TestCase):
+    """The session-wide watchdog, pointed at a disposable stand-in host."""
+
+    def setUp(self):
+        self.host = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(30)"]
+        )
+        self.watchdog = SharedWatchdog(pid=self.host.pid, slots=4, check_interval=0.02)
+
+    def tearDown(self):
+        self.watchdog.stop()
+        if self.host.poll() is None:
+            self.host.kill()
+        self.host.wait()
+
+    def test_stalled_lease_kills_the_host(self):
+        lease = self.watchdog.lease(0.2, kill_tree=False, auto_beat=False)
+        with lease:
+            self.host.wait(timeout=5)
+        self.assertIsNotNone(self.host.returncode)
+
+    def test_beats_keep_the_host_alive_and_release_stops_watching(self):
+        with self.watchdog.lease(0.2, kill_tree=False, auto_beat=False):
+            for _ in range(25):
+                ExecutionMonitor.heartbeat()
+                time.sleep(0.02)
+        with self.watchdog.lease(0.2, kill_tree=False, beat_interval=0.02):
+            time.sleep(0.5)  # auto beats from the shared thread
+        time.sleep(0.4)  # released: no slot is watched any more
+        self.assertIsNone(self.host.poll())
+
+    def test_slots_are_bounded_and_reused(self):
+        leases = [self.watchdog.lease(5.0) for _ in range(4)]
+        self.assertIsNone(self.watchdog.lease(5.0))
+        leases[0].release()
+        self.assertIsNotNone(self.watchdog.lease(5.0))
+
+    def test_lease_spawns_nothing(self):
+        """A lease is map stores only -- no process or thread per call."""
+        with patch.object(subprocess, "Popen") as popen, patch.object(
+            threading.Thread, "start"
+        ) as start:
+            for _ in range(100):
+                with self.watchdog.lease(5.0, auto_beat=False) as lease:
+                    lease.beat()
+        popen.assert_not_called()
+        start.assert_not_called()
+
+    def test_beat_after_stop_is_a_no_op(self):
+        lease = self.watchdog.lease(5.0, auto_beat=False)
+        self.watchdog.stop()
+        lease.beat()
+        SharedWatchdog._push(self.watchdog, lease)
+        try:
+            SharedWatchdog.heartbeat()
+        finally:
+            SharedWatchdog._pop(self.watchdog, lease)
+        lease.release()
+
+    def test_session_warns_on_a_different_check_interval(self):
+        logger = MagicMock()
+        with patch.object(SharedWatchdog, "_session", self.watchdog):
+            self.assertIs(SharedWatchdog.session(0.02, logger=logger), self.watchdog)
+            logger.warning.assert_not_called()
+            SharedWatchdog.session(0.5, logger=logger)
+            SharedWatchdog.session(0.5, logger=logger)
+        logger.warning.assert_called_once()
+        self.assertIn("0.5", logger.warning.call_args[0][0])
+
+    def test_stop_ends_the_watchdog_process(self):
+        self.watchdog.stop()
+        self.assertIsNotNone(self.watchdog.process.poll())
+        self.assertFalse(os.path.exists(self.watchdog.path))
+        self.assertIsNone(self.host.poll())
+
+    def test_external_watchdog_shared_leases_instead_of_spawning(self):
+        with patch.object(
+            SharedWatchdog, "session", return_value=self.watchdog
+        ), patch.object(ExecutionMonitor, "_spawn_watchdog_subprocess") as spawn:
+
+            @ExecutionMonitor.external_watchdog(timeout=5.0, shared=True)
+            def fn():
+                return len(self.watchdog._free)
+
+            self.assertEqual(fn(), 3)  # one slot leased during the call
+            self.assertEqual(len(self.watchdog._free), 4)
+            spawn.assert_not_called()
+
+    def test_shared_default_is_read_at_call_time(self):
+        """Enabling SHARED_WATCHDOG reaches functions decorated before it."""
+
+        @ExecutionMonitor.external_watchdog(timeout=5.0)
+        def fn():
+            return len(self.watchdog._free)
+
+        with patch.object(ExecutionMonitor, "SHARED_WATCHDOG", True):
+            with patch.object(
+                SharedWatchdog, "session", return_value=self.watchdog
+            ), patch.object(ExecutionMonitor, "_spawn_watchdog_subprocess") as spawn:
+                self.assertEqual(fn(), 3)
+                spawn.assert_not_called()
+
+    def test_execution_monitor_forwards_auto_heartbeat(self):
+        with patch.object(
+            SharedWatchdog, "session", return_value=self.watchdog
+        ), patch.object(self.watchdog, "lease", wraps=self.watchdog.lease) as lease:
+
+            @ExecutionMonitor.execution_monitor(
+                threshold=60,
+                message="op",
+                show_dialog=False,
+                watchdog_timeout=5.0,
+                watchdog_shared=True,
+                watchdog_auto_heartbeat=False,
+            )
+            def fn():
+                ExecutionMonitor.heartbeat()
+                return "done"
+
+            self.assertEqual(fn(), "done")
+        self.assertIs(lease.call_args.kwargs["auto_beat"], False)
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,13 +5,23 @@
 Focused regression coverage for argument validation on
 ``FrameExtractor.extract_frames``. These tests do not require cv2 or a
 real video file because the ``step`` guard runs before any cv2 use.
+The decode-loop tests drive ``extract_frames`` through a scripted
+capture object that records which frames were grabbed, retrieved or
+seeked to.
 
 Run with:
     python -m pytest test_frame_extractor.py -v
 """
+import os
+import shutil
+import tempfile
+import threading
+import types
 import unittest
+from unittest import mock
 
 from pythontk import FrameExtractor
+import pythontk.vid_utils.frame_extractor as fe
 
 from conftest import BaseTestCase
 
@@ -43,5 +53,111 @@ class FrameExtractorTest(BaseTestCase):
         self.assertEqual(result, [])
 
 
+
+class _ScriptedCapture:
+    """Minimal ``cv2.VideoCapture`` over ``n`` numbered frames."""
+
+    def __init__(self, n):
+        self.n = n
+        self.pos = 0
+        self.grabbed = []
+        self.retrieved = []
+        self.seeks = []
+
+    def isOpened(self):
+        return True
+
+    def get(self, prop):
+        return {"count": self.n, "fps": 30.0}.get(prop, 0)
+
+    def set(self, prop, value):
+        self.seeks.append(int(value))
+        self.pos = int(value)
+        return True
+
+    def grab(self):
+        if self.pos >= self.n:
+            return False
+        self.grabbed.append(self.pos)
+        self.pos += 1
+        return True
+
+    def retrieve(self):
+        self.retrieved.append(self.pos - 1)
+        return True, self.pos - 1
+
+    def release(self):
+        pass
+
+
+class FrameExtractorDecodeLoopTest(BaseTestCase):
+    """grab/retrieve selection, keyframe seek and the writer pool."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix="frames_")
+        self.video = os.path.join(self.tmpdir, "clip.mp4")
+        open(self.video, "wb").close()
+        self.written = []
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _cv2(self, cap, fail=()):
+        def imwrite(path, frame, params):
+            with self.lock:
+                self.written.append(frame)
+            return frame not in fail
+
+        return types.SimpleNamespace(
+            VideoCapture=lambda _path: cap,
+            CAP_PROP_FRAME_COUNT="count",
+            CAP_PROP_FPS="fps",
+            CAP_PROP_POS_FRAMES="pos",
+            IMWRITE_JPEG_QUALITY=1,
+            imwrite=imwrite,
+        )
+
+    def _extract(self, cap, fail=(), **kwargs):
+        with mock.patch.object(fe, "CV2_AVAILABLE", True), mock.patch.object(
+            fe, "cv2", self._cv2(cap, fail)
+        ):
+            return FrameExtractor().extract_frames(self.video, self.tmpdir, **kwargs)
+
+    def test_only_kept_frames_are_retrieved(self):
+        cap = _ScriptedCapture(23)
+        saved = self._extract(cap, step=5)
+        self.assertEqual(cap.grabbed, list(range(23)))
+        self.assertEqual(cap.retrieved, [0, 5, 10, 15, 20])
+        self.assertEqual(
+            [os.path.basename(p) for p in saved],
+            [f"frame_{i:06d}.jpg" for i in (0, 5, 10, 15, 20)],
+        )
+
+    def test_seek_skips_grabbing_large_gaps(self):
+        cap = _ScriptedCapture(1000)
+        step = FrameExtractor.SEEK_MIN_STEP
+        self._extract(cap, step=step, seek=True)
+        kept = list(range(0, 1000, step))
+        self.assertEqual(cap.retrieved, kept)
+        self.assertEqual(cap.grabbed, kept)
+        self.assertEqual(cap.seeks, kept[1:])
+
+    def test_writer_pool_keeps_order_and_drops_failed_writes(self):
+        cap = _ScriptedCapture(40)
+        saved = self._extract(cap, fail=(6,), step=2, writer_threads=3)
+        self.assertEqual(sorted(self.written), list(range(0, 40, 2)))
+        expected = [i for i in range(0, 40, 2) if i != 6]
+        self.assertEqual(
+            saved, [os.path.join(self.tmpdir, f"frame_{i:06d}.jpg") for i in expected]
+        )
+
+    def test_max_frames_stops_the_decode(self):
+        cap = _ScriptedCapture(100)
+        saved = self._extract(cap, step=3, max_frames=4, writer_threads=0)
+        self.assertEqual(len(saved), 4)
+        self.assertEqual(cap.grabbed[-1], 9)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1407,6 +1407,45 @@ class ImageFormatCapabilityTest(unittest.TestCase):
         ImgUtils.save_image(self.img, p, compression="DXT5")
         self.assertEqual(ImgUtils.load_image(p).size, (8, 8))
 
+    def test_save_to_buffer_matches_file_bytes(self):
+        """A buffer save writes the same bytes the file save does, for the
+        Pillow path, the 16-bit path and Pillow's DDS block writer."""
+        import io
+
+        cases = [("png", {}), ("tga", {}), ("jpg", {"quality": 90}),
+                 ("png", {"bit_depth": 16}), ("dds", {"compression": "DXT5"})]
+        for ext, kwargs in cases:
+            with self.subTest(ext=ext, **kwargs):
+                path = os.path.join(self.tmp, f"buf.{ext}")
+                ImgUtils.save_image(self.img, path, **kwargs)
+                buf = io.BytesIO()
+                ImgUtils.save_image(self.img, buf, ext=ext, **kwargs)
+                with open(path, "rb") as f:
+                    self.assertEqual(buf.getvalue(), f.read())
+
+    def test_save_to_buffer_without_ext_raises(self):
+        import io
+
+        with self.assertRaises(ValueError):
+            ImgUtils.save_image(self.img, io.BytesIO())
+
+    def test_file_only_codec_stages_a_buffer_save(self):
+        """A registered codec that only writes paths still fills a buffer."""
+        import io
+
+        def path_codec(im, name, compression):
+            with open(name, "wb") as f:
+                f.write(b"DDS-" + compression.encode())
+
+        original = ImgUtils._dds_codec
+        try:
+            ImgUtils.register_dds_codec(path_codec)
+            buf = io.BytesIO()
+            ImgUtils.save_image(self.img, buf, ext="dds", compression="BC7")
+            self.assertEqual(buf.getvalue(), b"DDS-BC7")
+        finally:
+            ImgUtils._dds_codec = original
+
     def test_dds_bc7_without_codec_raises_clearly(self):
         with self.assertRaises(ValueError) as ctx:
             ImgUtils.save_image(self.img, os.path.join(self.tmp, "x.dds"), compression="BC7")
@@ -8,9 +8,11 @@ Run with:
     python test_logging_mixin.py
 """
 import io
+import json
 import logging
 import tempfile
 import os
+import threading
 import unittest
 
 from pythontk.core_utils.logging_mixin import (
@@ -18,6 +20,8 @@ from pythontk.core_utils.logging_mixin import (
     LoggerExt,
     LevelAwareFormatter,
     DefaultTextLogHandler,
+    AsyncLogListener,
+    Tracer,
 )
 
 from conftest import BaseTestCase
@@ -1262,5 +1266,331 @@ class LoggingMixinQualityPassRegressionTest(BaseTestCase):
         )
 
 
+class _ListHandler(logging.Handler):
+    """Collects (message, thread name) per record; optional gate blocks emit."""
+
+    def __init__(self, gate=None):
+        super().__init__(logging.DEBUG)
+        self.items = []
+        self.gate = gate
+        self.entered = threading.Event()
+
+    def emit(self, record):
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.items.append((record.getMessage(), threading.current_thread().name))
+
+
+class AsyncLoggingTest(BaseTestCase):
+    """Tests for the opt-in queue-backed async mode (set_async)."""
+
+    def setUp(self):
+        super().setUp()
+        self.logger = logging.Logger("async_test_logger", logging.DEBUG)
+        LoggerExt.patch(self.logger)
+        self.logger.handlers = []
+
+    def tearDown(self):
+        self.logger.set_async(False)
+        super().tearDown()
+
+    def test_records_handled_on_listener_in_order(self):
+        """Per-thread order is kept, raw blocks keep their place, caller
+        threads never run the handler."""
+        handler = _ListHandler()
+        self.logger.addHandler(handler)
+        self.logger.set_async(batch_size=8)
+
+        def work(tag):
+            for i in range(200):
+                self.logger.info("%s-%d", tag, i)
+
+        threads = [threading.Thread(target=work, args=(t,)) for t in "abcd"]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.logger.info("before")
+        self.logger.log_raw("RAW")
+        self.logger.info("after")
+        self.assertTrue(self.logger.flush_async(5))
+
+        messages = [m for m, _ in handler.items]
+        self.assertEqual(len(messages), 803)
+        for tag in "abcd":
+            own = [m for m in messages if m.startswith(tag + "-")]
+            self.assertEqual(own, [f"{tag}-{i}" for i in range(200)])
+        self.assertEqual(messages[-3:], ["before", "RAW", "after"])
+        self.assertTrue(all(name.startswith("async-log:") for _, name in handler.items))
+
+    def test_args_merged_on_caller_thread(self):
+        """Mutable args are rendered at the call, not when the listener runs."""
+        gate = threading.Event()
+        handler = _ListHandler(gate)
+        self.logger.addHandler(handler)
+        self.logger.set_async()
+        payload = ["first"]
+        self.logger.info("value=%s", payload)
+        payload[0] = "mutated"
+        gate.set()
+        self.logger.flush_async(5)
+        self.assertEqual(handler.items[0][0], "value=['first']")
+
+    def test_drop_policy_counts_and_reports(self):
+        """A full queue drops (never blocks) and the loss is reported."""
+        gate = threading.Event()
+        handler = _ListHandler(gate)
+        self.logger.addHandler(handler)
+        listener = self.logger.set_async(capacity=2, policy="drop")
+        for i in range(20):
+            self.logger.info("r%d", i)
+        self.assertGreater(listener.dropped, 0)
+        gate.set()
+        self.assertTrue(self.logger.flush_async(5))
+        self.logger.info("tail")  # the next batch reports the drop
+        self.assertTrue(self.logger.flush_async(5))
+        messages = [m for m, _ in handler.items]
+        self.assertTrue(any("dropped" in m for m in messages), messages)
+        self.assertEqual(messages[-1], "tail")
+
+    def test_block_policy_loses_nothing(self):
+        handler = _ListHandler()
+        self.logger.addHandler(handler)
+        self.logger.set_async(capacity=4, policy="block")
+        for i in range(300):
+            self.logger.info("r%d", i)
+        self.logger.flush_async(5)
+        self.assertEqual(len(handler.items), 300)
+
+    def test_unknown_policy_raises(self):
+        with self.assertRaises(ValueError):
+            self.logger.set_async(policy="spill")
+        self.assertIsNone(getattr(self.logger, "_async_listener", None))
+
+    def test_widget_appends_are_batched(self):
+        """Records queued behind a busy listener reach the widget as one append."""
+        gate = threading.Event()
+        blocker = _ListHandler(gate)
+        self.logger.addHandler(blocker)
+        widget = MockTextWidget()
+        self.logger.addHandler(
+            DefaultTextLogHandler(widget, use_html=False, dispatch=lambda call: call())
+        )
+        self.logger.set_async()
+        self.logger.info("first")
+        self.assertTrue(blocker.entered.wait(5))
+        for i in range(5):
+            self.logger.info("line%d", i)
+        gate.set()
+        self.logger.flush_async(5)
+        self.assertEqual(len(widget.messages), 2)
+        self.assertEqual(widget.messages[1].split("\n"), [f"line{i}" for i in range(5)])
+
+    def test_widget_dispatch_hook_receives_appends(self):
+        widget = MockTextWidget()
+        scheduled = []
+        self.logger.addHandler(
+            DefaultTextLogHandler(widget, use_html=False, dispatch=scheduled.append)
+        )
+        self.logger.info("queued for the ui thread")
+        self.assertEqual(widget.messages, [])
+        for call in scheduled:
+            call()
+        self.assertEqual(widget.messages, ["queued for the ui thread"])
+
+    def test_widget_without_dispatch_stays_on_the_logging_thread(self):
+        """Async mode never touches an undispatched widget from the listener."""
+
+        class ThreadWidget(MockTextWidget):
+            def append(self, text):
+                super().append((text, threading.current_thread().name))
+
+        widget = ThreadWidget()
+        self.logger.add_text_widget_handler(widget, level=logging.DEBUG)
+        self.logger.set_async()
+        self.logger.info("main")
+        self.logger.log_raw("RAW")
+        worker = threading.Thread(
+            target=self.logger.info, args=("worker",), name="worker-thread"
+        )
+        worker.start()
+        worker.join()
+        self.assertTrue(self.logger.flush_async(5))
+        main = threading.current_thread().name
+        self.assertEqual(
+            [(LoggerExt.strip_html(m).split()[-1], t) for m, t in widget.messages],
+            [("main", main), ("RAW", main), ("worker", "worker-thread")],
+        )
+
+    def test_add_text_widget_handler_forwards_dispatch(self):
+        widget = MockTextWidget()
+        scheduled = []
+        self.logger.add_text_widget_handler(
+            widget, level=logging.DEBUG, dispatch=scheduled.append
+        )
+        (handler,) = self.logger.handlers
+        self.assertTrue(handler.listener_safe)
+        self.logger.set_async()
+        self.logger.info("later")
+        self.assertTrue(self.logger.flush_async(5))
+        self.assertEqual(widget.messages, [])
+        for call in scheduled:
+            call()
+        self.assertEqual(len(widget.messages), 1)
+        self.assertIn("later", widget.messages[0])
+
+    def test_disable_drains_and_restores_sync(self):
+        gate = threading.Event()
+        handler = _ListHandler(gate)
+        self.logger.addHandler(handler)
+        self.logger.set_async()
+        self.logger.info("queued")
+        threading.Timer(0.05, gate.set).start()
+        self.logger.set_async(False)
+        self.assertEqual([m for m, _ in handler.items], ["queued"])
+        self.assertNotIn("callHandlers", self.logger.__dict__)
+        self.logger.info("sync")
+        self.assertEqual(handler.items[-1], ("sync", threading.current_thread().name))
+
+    def test_exit_hook_flushes_pending_records(self):
+        gate = threading.Event()
+        handler = _ListHandler(gate)
+        self.logger.addHandler(handler)
+        self.logger.set_async()
+        for i in range(3):
+            self.logger.info("r%d", i)
+        threading.Timer(0.05, gate.set).start()
+        AsyncLogListener._stop_all()
+        self.assertEqual([m for m, _ in handler.items], ["r0", "r1", "r2"])
+
+    def test_mixin_set_log_async_with_file(self):
+        """set_log_file flushes queued records into the old file first."""
+
+        class Foo(LoggingMixin):
+            pass
+
+        fd, path = tempfile.mkstemp(suffix=".log")
+        os.close(fd)
+        try:
+            Foo.set_log_file(path, level="DEBUG")
+            Foo.set_log_async()
+            for i in range(50):
+                Foo.logger.info("async-%d", i)
+            Foo.set_log_file(None)
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+            self.assertIn("async-49", content)
+        finally:
+            Foo.set_log_async(False)
+            Foo.set_log_file(None)
+            os.unlink(path)
+
+
+class TracerTest(BaseTestCase):
+    """Tests for the process-wide span/counter recorder."""
+
+    def setUp(self):
+        super().setUp()
+        Tracer.disable()
+
+    def tearDown(self):
+        Tracer.disable()
+        super().tearDown()
+
+    def test_disabled_records_nothing(self):
+        class Foo(LoggingMixin):
+            @LoggingMixin.traced()
+            def work(self):
+                with self.trace_span("inner"):
+                    return 7
+
+        self.assertIs(Tracer.span("x"), Tracer.span("y"))  # shared no-op
+        self.assertEqual(Foo().work(), 7)
+        Foo.trace_count("hits", n=1)
+        self.assertIsNone(Tracer.buffer)
+        self.assertEqual(LoggingMixin.trace_summary(), {})
+
+    def test_spans_nest_and_summarize(self):
+        class Foo(LoggingMixin):
+            @classmethod
+            @LoggingMixin.traced()
+            def outer(cls):
+                for _ in range(3):
+                    with cls.trace_span("inner", size=4):
+                        pass
+
+        LoggingMixin.enable_tracing()
+        Foo.outer()
+        events = Tracer.buffer.events()
+        self.assertEqual([e[1] for e in events][-1], f"{Foo.__qualname__}.outer")
+        inner = [e for e in events if e[1] == "inner"]
+        self.assertEqual(len(inner), 3)
+        self.assertEqual(inner[0][2], "Foo")
+        self.assertEqual(inner[0][7], {"size": 4, "depth": 1})
+        self.assertEqual(events[-1][7]["depth"], 0)
+        outer_start, outer_dur = events[-1][3], events[-1][4]
+        self.assertTrue(
+            all(outer_start <= e[3] <= outer_start + outer_dur for e in inner)
+        )
+        summary = LoggingMixin.trace_summary()
+        self.assertEqual(summary["inner"]["count"], 3)
+        self.assertGreaterEqual(summary["inner"]["max"], summary["inner"]["mean"])
+
+    def test_error_is_tagged_and_reraised(self):
+        Tracer.enable()
+        with self.assertRaises(KeyError):
+            with Tracer.span("boom"):
+                raise KeyError("x")
+        self.assertEqual(Tracer.buffer.events()[-1][7]["error"], "KeyError")
+        self.assertEqual(Tracer._stack(), [])
+
+    def test_chrome_trace_export_has_thread_lanes(self):
+        Tracer.enable()
+        barrier = threading.Barrier(3)  # overlap, so no thread ident is reused
+
+        def work():
+            with Tracer.span("job", cat="test"):
+                barrier.wait(5)
+                Tracer.count("queue", cat="test", depth=2)
+
+        threads = [threading.Thread(target=work, name=f"w{i}") for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            self.assertEqual(LoggingMixin.export_trace(path), path)
+            with open(path, encoding="utf-8") as f:
+                trace = json.load(f)
+        finally:
+            os.unlink(path)
+        events = trace["traceEvents"]
+        spans = [e for e in events if e["ph"] == "X"]
+        self.assertEqual(len(spans), 3)
+        self.assertEqual(len({e["tid"] for e in spans}), 3)
+        self.assertTrue(all(e["pid"] == os.getpid() for e in spans))
+        lanes = {e["args"]["name"] for e in events if e["ph"] == "M"}
+        self.assertTrue({"w0", "w1", "w2"} <= lanes)
+        counters = [e for e in events if e["ph"] == "C"]
+        self.assertEqual(counters[0]["args"], {"depth": 2})
+
+    def test_buffer_is_capped(self):
+        Tracer.enable(capacity=5)
+        for _ in range(20):
+            with Tracer.span("s"):
+                pass
+        self.assertEqual(len(Tracer.buffer), 5)
+
+    def test_hot_paths_are_instrumented(self):
+        from pythontk.core_utils.engines.textures.map_factory import MapFactory
+
+        Tracer.enable()
+        MapFactory.prepare_maps([])
+        self.assertIn("MapFactory.prepare_maps", Tracer.summary())
+
+
 if __name__ == "__main__":
     unittest.main(exit=False)
@@ -7,8 +7,10 @@ Focus: the dry-run contract. ``assess`` is the read-only twin of
 path, byte count) has to match what a real run then produces — a projection
 that drifts is worse than no projection at all.
 """
+import io
 import os
 import shutil
+import contextlib
 import struct
 import tempfile
 import unittest
@@ -400,6 +402,40 @@ class TestAssessPrediction(_TextureFixture):
         self.assertIsNone(predicted["size_bytes"])
         self.assertIn("size_error", predicted)
 
+    def test_size_probe_stays_off_the_filesystem(self):
+        """The probe encodes into memory: no scratch dir is allocated."""
+        from unittest import mock
+        from pythontk.file_utils.temp_artifacts import TempArtifacts
+
+        path = self.texture(size=(64, 64))
+        with mock.patch.object(
+            TempArtifacts, "__init__", side_effect=AssertionError("scratch dir")
+        ):
+            predicted = MapOptimizer.assess(path, max_size=32, predict_size=True)[
+                "predicted"
+            ]
+        self.assertIsNone(predicted.get("size_error"))
+        self.assertGreater(predicted["size_bytes"], 0)
+
+    def test_large_map_size_is_extrapolated_from_tiles(self):
+        """Above ``probe_max_pixels`` the size is an estimate from
+        full-resolution tiles, close to the real encode and flagged."""
+        rng = np.random.default_rng(3)
+        base = rng.integers(0, 256, (64, 64, 3), dtype=np.uint8)
+        path = os.path.join(self.test_dir, "big_BaseColor.png")
+        Image.fromarray(np.kron(base, np.ones((16, 16, 1), dtype=np.uint8))).save(path)
+
+        exact = MapOptimizer.assess(path, predict_size=True)["predicted"]
+        probed = MapOptimizer.assess(
+            path, predict_size=True, probe_max_pixels=256 * 1024
+        )["predicted"]
+
+        self.assertNotIn("size_estimated", exact)
+        self.assertTrue(probed["size_estimated"])
+        self.assertAlmostEqual(
+            probed["size_bytes"] / exact["size_bytes"], 1.0, delta=0.15
+        )
+
     def test_missing_file_returns_an_empty_predicted_block(self):
         report = MapOptimizer.assess(os.path.join(self.test_dir, "nope.png"))
 
@@ -1491,5 +1527,80 @@ class TestResolveSizeClamp(_TextureFixture):
         )
 
 
+class TestBatchOptimize(_TextureFixture):
+    """batch_optimize_maps — per-map records, sidecar stamps, process pool."""
+
+    def setUp(self):
+        super().setUp()
+        self.out_dir = os.path.join(self.test_dir, "out")
+        self.texture("rock_BaseColor.png", size=(256, 256))
+        self.texture("rock_Roughness.png", size=(128, 128), mode="L")
+
+    def run_batch(self, **kwargs):
+        kwargs.setdefault("output_dir", self.out_dir)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            records = MapOptimizer.batch_optimize_maps(self.test_dir, **kwargs)
+        return records, out.getvalue()
+
+    def test_records_describe_each_map(self):
+        records, text = self.run_batch(max_size=64)
+
+        self.assertEqual(len(records), 2)
+        for record in records:
+            self.assertIsNone(record["skipped"])
+            self.assertTrue(os.path.isfile(record["output"]))
+            self.assertEqual(record["bytes_after"], os.path.getsize(record["output"]))
+            self.assertEqual(record["dims_after"], (64, 64))
+            self.assertTrue(record["ops"])
+        self.assertIn("2 written, 0 skipped", text)
+        self.assertIn("Total:", text)
+
+    def test_second_run_skips_unchanged_maps(self):
+        self.run_batch(max_size=64)
+        records, text = self.run_batch(max_size=64)
+
+        self.assertEqual([r["skipped"] for r in records], ["unchanged"] * 2)
+        self.assertIn("0 written, 2 skipped", text)
+
+    def test_changed_settings_or_source_rerun(self):
+        self.run_batch(max_size=64)
+        records, _ = self.run_batch(max_size=32)
+        self.assertEqual([r["skipped"] for r in records], [None, None])
+
+        # A re-authored source invalidates only its own stamp.
+        source = os.path.join(self.test_dir, "rock_BaseColor.png")
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        records, _ = self.run_batch(max_size=32)
+        self.assertEqual(
+            {os.path.basename(r["source"]): r["skipped"] for r in records},
+            {"rock_BaseColor.png": None, "rock_Roughness.png": "unchanged"},
+        )
+
+    def test_skip_unchanged_off_always_runs(self):
+        self.run_batch(max_size=64)
+        records, _ = self.run_batch(max_size=64, skip_unchanged=False)
+        self.assertEqual([r["skipped"] for r in records], [None, None])
+
+    def test_process_pool_matches_serial(self):
+        serial, _ = self.run_batch(max_size=64, skip_unchanged=False)
+        pooled, _ = self.run_batch(max_size=64, skip_unchanged=False, workers=2)
+
+        def strip(record):
+            return {k: v for k, v in record.items() if k != "warnings"}
+
+        self.assertEqual([strip(r) for r in pooled], [strip(r) for r in serial])
+
+    def test_failing_map_is_recorded_not_raised(self):
+        with open(os.path.join(self.test_dir, "broken_Normal.png"), "wb") as f:
+            f.write(b"not a png")
+        records, text = self.run_batch(max_size=64)
+
+        errors = [r for r in records if r.get("error")]
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0]["source"].endswith("broken_Normal.png"))
+        self.assertIn("1 error(s)", text)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -130,5 +130,26 @@ class TestTextureInfoFormatters(unittest.TestCase):
         self.assertIn("Found 1 valid texture(s)", MatReport.format_texture_info_text(self.INFO))
 
 
+class TestOptimizeBatchFormatter(unittest.TestCase):
+    RECORDS = [
+        {"source": "/t/a.png", "output": "/t/out/a.png", "skipped": None,
+         "bytes_before": 4000, "bytes_after": 1000, "ops": ["resize 256->128"],
+         "warnings": []},
+        {"source": "/t/b.png", "output": "/t/out/b.png", "skipped": "unchanged",
+         "bytes_before": 2000, "bytes_after": 500},
+        {"source": "/t/c.png", "output": None, "skipped": None,
+         "error": "UnidentifiedImageError: bad"},
+    ]
+
+    def test_rows_and_totals(self):
+        text = MatReport.format_optimize_batch_text(self.RECORDS)
+        self.assertIn("3 map(s): 1 written, 1 skipped, 1 error(s)", text)
+        self.assertIn("resize 256->128", text)
+        self.assertIn("skipped (unchanged)", text)
+        self.assertIn("error: UnidentifiedImageError: bad", text)
+        self.assertIn("c.png", text)  # falls back to the source name
+        self.assertIn("Total: 3.9 KB -> 1,000 bytes (-75%)", text)
+
+
 if __name__ == "__main__":
     unittest.main()
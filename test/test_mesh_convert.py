@@ -29,6 +29,11 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from pythontk import ImgUtils, MeshConvert
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestResolveBinary(unittest.TestCase):
     def setUp(self):
@@ -815,6 +820,404 @@ class TestFixGlbPhantomOpaqueAlpha(unittest.TestCase):
         self.assertEqual(open(path, "rb").read(), before)
 
 
+class TestBatchGlb(unittest.TestCase):
+    """batch_glb: one session per file, a chain of passes, a report."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="meshconvert_batch_")
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        fix = TestFixGlbPhantomOpaqueAlpha
+        self.paths = {
+            "opaque": self._write(
+                "a_opaque.glb",
+                "BLEND",
+                [1.0, 1.0, 1.0, 1.0],
+                fix._opaque_alpha_png(),
+            ),
+            "phantom": self._write(
+                "b_phantom.glb",
+                "BLEND",
+                [1.0, 1.0, 1.0, 0.0],
+                fix._varying_alpha_png(),
+            ),
+            "clean": self._write(
+                "c_clean.glb",
+                "OPAQUE",
+                [1.0, 1.0, 1.0, 1.0],
+                fix._opaque_alpha_png(),
+            ),
+        }
+        self.paths["broken"] = os.path.join(self.tmp, "d_broken.glb")
+        with open(self.paths["broken"], "wb") as f:
+            f.write(b"not a glb at all")
+
+    def _write(self, name, alpha_mode, factor, blob):
+        path = os.path.join(self.tmp, name)
+        with open(path, "wb") as f:
+            f.write(
+                TestCheckGlbMaterials._build_glb(
+                    materials=[
+                        {
+                            "name": name,
+                            "alphaMode": alpha_mode,
+                            "pbrMetallicRoughness": {
+                                "baseColorFactor": factor,
+                                "baseColorTexture": {"index": 0},
+                            },
+                        }
+                    ],
+                    images=[{"bufferView": 0, "mimeType": "image/png"}],
+                    textures=[{"source": 0}],
+                    image_blobs=[blob],
+                )
+            )
+        return path
+
+    def _by_name(self, report):
+        return {os.path.basename(r["path"])[2:-4]: r for r in report["files"]}
+
+    def test_the_chain_shares_one_session_per_file(self):
+        real = MeshConvert._read_glb
+        reads = []
+
+        def counting(path):
+            reads.append(path)
+            return real(path)
+
+        with patch.object(MeshConvert, "_read_glb", side_effect=counting):
+            report = MeshConvert.batch_glb(
+                self.tmp, stages=("check_materials", "fix_alpha", "prune_textures")
+            )
+        self.assertEqual(sorted(reads), sorted(self.paths.values()))
+        files = self._by_name(report)
+        self.assertEqual(files["opaque"]["stages"]["check_materials"]["findings"], 1)
+        self.assertFalse(files["opaque"]["ok"])
+        self.assertTrue(files["phantom"]["written"])
+        self.assertEqual(
+            TestFixGlbPhantomOpaqueAlpha._read_alpha_factor(self.paths["phantom"]), 1.0
+        )
+        self.assertTrue(files["clean"]["ok"])
+        self.assertFalse(files["clean"]["written"])
+        self.assertTrue(files["broken"]["error"].startswith("read: ValueError"))
+        for name in ("read", "check_materials", "fix_alpha", "prune_textures", "write"):
+            self.assertIn(name, files["clean"]["stages"])
+        totals = report["totals"]
+        self.assertEqual(
+            (totals["files"], totals["ok"], totals["errors"], totals["written"]),
+            (4, 2, 1, 1),
+        )
+        self.assertIn("fix_alpha", totals["stage_seconds"])
+
+    def test_a_raising_stage_writes_nothing_for_that_file(self):
+        before = open(self.paths["phantom"], "rb").read()
+        with patch.object(
+            MeshConvert,
+            "prune_glb_unreferenced_textures",
+            side_effect=RuntimeError("boom"),
+        ):
+            report = MeshConvert.batch_glb(
+                [self.paths["phantom"]], stages=("fix_alpha", "prune_textures")
+            )
+        record = report["files"][0]
+        self.assertEqual(record["error"], "prune_textures: RuntimeError: boom")
+        self.assertFalse(record["written"])
+        self.assertEqual(open(self.paths["phantom"], "rb").read(), before)
+
+    def test_json_and_csv_reports(self):
+        paths = [self.paths["opaque"], self.paths["clean"]]
+        json_path = os.path.join(self.tmp, "out", "qa.json")
+        csv_path = os.path.join(self.tmp, "out", "qa.csv")
+        report = MeshConvert.batch_glb(
+            paths, stages=("check_materials",), report_path=json_path
+        )
+        with open(json_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["totals"]["files"], 2)
+        MeshConvert.batch_glb(paths, stages=("check_materials",), report_path=csv_path)
+        import csv
+
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([r["path"] for r in rows], paths)
+        self.assertEqual([r["check_materials_findings"] for r in rows], ["1", "0"])
+        self.assertIn("write_seconds", rows[0])
+        self.assertEqual(report["totals"]["ok"], 1)
+
+    def test_process_pool_matches_in_process(self):
+        paths = [self.paths[k] for k in ("opaque", "clean", "broken")]
+        serial = MeshConvert.batch_glb(paths, stages=("check_materials",))
+        pooled = MeshConvert.batch_glb(paths, stages=("check_materials",), workers=2)
+
+        def outcome(report):
+            return [
+                (r["path"], r["ok"], r["error"], r["written"]) for r in report["files"]
+            ]
+
+        self.assertEqual(outcome(pooled), outcome(serial))
+
+    def test_bad_stage_or_report_path_raises(self):
+        with self.assertRaises(ValueError):
+            MeshConvert.batch_glb(self.tmp, stages=("nope",))
+        with self.assertRaises(ValueError):
+            MeshConvert.batch_glb(self.tmp, report_path="qa.txt")
+
+
+class TestOptimizeGlbDelivery(unittest.TestCase):
+    """optimize_glb_delivery: one encode per unique image, shared files, atlases."""
+
+    def setUp(self):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("Pillow unavailable")
+        self.tmp = tempfile.mkdtemp(prefix="meshconvert_delivery_")
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    @staticmethod
+    def _png(size=(64, 64), color=None, seed=0):
+        from PIL import Image
+
+        if color is None:  # noise: re-encodes smaller as WebP
+            import random
+
+            raw = random.Random(seed).randbytes(size[0] * size[1] * 3)
+            pil = Image.frombytes("RGB", size, raw)
+        else:
+            pil = Image.new("RGB", size, color)
+        buffer = io.BytesIO()
+        pil.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def _glb(self, name, blobs, uv=(0.0, 1.0)):
+        """One quad primitive per image, each with its own base-colour material."""
+        bin_chunk = b""
+        views, accessors, meshes, materials, images, textures = [], [], [], [], [], []
+        lo, hi = uv
+        positions = struct.pack("<12f", 0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0)
+        texcoords = struct.pack("<8f", lo, lo, hi, lo, hi, hi, lo, hi)
+        for data, accessor in ((positions, "VEC3"), (texcoords, "VEC2")):
+            views.append(
+                {"buffer": 0, "byteOffset": len(bin_chunk), "byteLength": len(data)}
+            )
+            accessors.append(
+                {
+                    "bufferView": len(views) - 1,
+                    "componentType": 5126,
+                    "count": 4,
+                    "type": accessor,
+                }
+            )
+            bin_chunk += data
+        accessors[0].update(min=[0, 0, 0], max=[1, 1, 0])
+        for index, blob in enumerate(blobs):
+            views.append(
+                {"buffer": 0, "byteOffset": len(bin_chunk), "byteLength": len(blob)}
+            )
+            bin_chunk += blob + b"\x00" * ((4 - len(blob) % 4) % 4)
+            images.append(
+                {"bufferView": len(views) - 1, "mimeType": "image/png", "name": f"i{index}"}
+            )
+            textures.append({"source": index})
+            materials.append(
+                {"pbrMetallicRoughness": {"baseColorTexture": {"index": index}}}
+            )
+            meshes.append(
+                {
+                    "primitives": [
+                        {
+                            "attributes": {"POSITION": 0, "TEXCOORD_0": 1},
+                            "material": index,
+                        }
+                    ]
+                }
+            )
+        gltf = {
+            "asset": {"version": "2.0"},
+            "buffers": [{"byteLength": len(bin_chunk)}],
+            "bufferViews": views,
+            "accessors": accessors,
+            "meshes": meshes,
+            "nodes": [{"mesh": i} for i in range(len(meshes))],
+            "scenes": [{"nodes": list(range(len(meshes)))}],
+            "materials": materials,
+            "images": images,
+            "textures": textures,
+        }
+        return _write_glb_file(os.path.join(self.tmp, name), gltf, bin_chunk)
+
+    def test_a_shared_image_is_encoded_once(self):
+        shared = self._png(seed=1)
+        paths = [
+            self._glb(f"prop{i}.glb", [shared, self._png(seed=10 + i)]) for i in range(3)
+        ]
+        report = MeshConvert.optimize_glb_delivery(paths, image_format="WEBP")
+        totals = report["totals"]
+        self.assertEqual(totals["references"], 6)
+        self.assertEqual(totals["images"], 4)
+        self.assertEqual(totals["encodes"], 4)
+        self.assertEqual(totals["reused"], 2)
+        self.assertEqual(totals["duplicate_bytes"], 2 * len(shared))
+        self.assertLess(totals["bytes_after"], totals["bytes_before"])
+        for record in report["files"]:
+            self.assertIsNone(record["error"])
+            self.assertEqual(record["optimize"]["images"], 2)
+
+    def test_shared_images_are_written_once_and_referenced_by_uri(self):
+        shared = self._png(seed=1)
+        paths = [
+            self._glb(f"prop{i}.glb", [shared, self._png(seed=10 + i)]) for i in range(3)
+        ]
+        shared_dir = os.path.join(self.tmp, "shared")
+        report = MeshConvert.optimize_glb_delivery(paths, shared_dir=shared_dir)
+        self.assertEqual(report["totals"]["shared"], 1)
+        (written,) = os.listdir(shared_dir)
+        self.assertTrue(written.endswith(".webp"))
+        for path in paths:
+            with MeshConvert.open_glb(path) as edit:
+                images = edit.gltf["images"]
+                # The embedded original was pruned with its bufferView.
+                self.assertEqual(len(images), 2)
+                external = [i for i in images if "uri" in i]
+                self.assertEqual(len(external), 1)
+                self.assertEqual(external[0]["uri"], f"shared/{written}")
+                self.assertEqual(external[0]["mimeType"], "image/webp")
+                sources = {
+                    t.get("source") for t in edit.gltf["textures"]
+                } | {
+                    t["extensions"]["EXT_texture_webp"]["source"]
+                    for t in edit.gltf["textures"]
+                }
+                self.assertEqual(sources, {0, 1})
+                # Two geometry views and the unique image's; nothing dead.
+                self.assertEqual(len(edit.gltf["bufferViews"]), 3)
+
+    def test_small_images_pack_into_an_atlas(self):
+        try:
+            import cv2  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("cv2 unavailable")
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        path = self._glb(
+            "room.glb", [self._png(size=(16, 16), color=c) for c in colors]
+        )
+        report = MeshConvert.optimize_glb_delivery(
+            [path], atlas_max_edge=32, image_format="PNG"
+        )
+        self.assertEqual(report["files"][0]["atlas"], {"atlases": 1, "images": 3})
+        from PIL import Image
+
+        with MeshConvert.open_glb(path) as edit:
+            gltf = edit.gltf
+            self.assertEqual(len(gltf["images"]), 1)
+            self.assertIn("KHR_texture_transform", gltf["extensionsUsed"])
+            sampler = gltf["samplers"][gltf["textures"][0]["sampler"]]
+            self.assertEqual(sampler["wrapS"], 33071)
+            atlas = Image.open(
+                io.BytesIO(bytes(edit._image_payload(gltf["images"][0])))
+            ).convert("RGB")
+            for material, color in zip(gltf["materials"], colors):
+                ref = material["pbrMetallicRoughness"]["baseColorTexture"]
+                self.assertEqual(ref["index"], 0)
+                transform = ref["extensions"]["KHR_texture_transform"]
+                # The centre of the item's [0, 1] UVs lands on its own colour.
+                u = 0.5 * transform["scale"][0] + transform["offset"][0]
+                v = 0.5 * transform["scale"][1] + transform["offset"][1]
+                pixel = atlas.getpixel(
+                    (int(u * atlas.width), int(v * atlas.height))
+                )
+                self.assertEqual(pixel, color)
+
+    def test_atlas_tiles_are_inset_and_the_gutter_filled(self):
+        """Each tile keeps ATLAS_GUTTER px of its own edge colour around it, so
+        a bilinear tap or mip texel at a tile border never reads a neighbour."""
+        try:
+            import cv2  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("cv2 unavailable")
+        import numpy as np
+        from PIL import Image
+
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0)]
+        path = self._glb(
+            "tiles.glb", [self._png(size=(16, 16), color=c) for c in colors]
+        )
+        MeshConvert.optimize_glb_delivery([path], atlas_max_edge=32, image_format="PNG")
+        gutter = MeshConvert.ATLAS_GUTTER
+        with MeshConvert.open_glb(path) as edit:
+            gltf = edit.gltf
+            atlas = np.asarray(
+                Image.open(
+                    io.BytesIO(bytes(edit._image_payload(gltf["images"][0])))
+                ).convert("RGB")
+            )
+            edge = atlas.shape[0]
+            self.assertFalse((atlas == 0).all(axis=2).any(), "no background left")
+            for material, color in zip(gltf["materials"], colors):
+                transform = material["pbrMetallicRoughness"]["baseColorTexture"][
+                    "extensions"
+                ]["KHR_texture_transform"]
+                sx, sy = transform["scale"]
+                ox, oy = transform["offset"]
+                self.assertAlmostEqual(sx, (edge // 2 - 2 * gutter) / edge)
+                self.assertAlmostEqual(sy, (edge // 2 - 2 * gutter) / edge)
+                col0, row0 = round(ox * edge), round(oy * edge)
+                col1, row1 = round((ox + sx) * edge), round((oy + sy) * edge)
+                # The ring just outside the tile carries the tile's colour.
+                ring = atlas[
+                    max(row0 - gutter, 0) : row1 + gutter,
+                    max(col0 - gutter, 0) : col1 + gutter,
+                ]
+                self.assertTrue((ring == color).all(axis=2).all())
+
+    def test_ktx2_fallbacks_of_shared_images_are_externalized(self):
+        fake = _FakeKtx2Encoder()
+        ImgUtils.register_ktx2_encoder(fake)
+        self.addCleanup(ImgUtils.register_ktx2_encoder, None)
+        shared = self._png(seed=1)
+        paths = [
+            self._glb(f"prop{i}.glb", [shared, self._png(seed=10 + i)])
+            for i in range(2)
+        ]
+        shared_dir = os.path.join(self.tmp, "shared")
+        MeshConvert.optimize_glb_delivery(
+            paths, shared_dir=shared_dir, image_format="KTX2"
+        )
+        written = sorted(os.listdir(shared_dir))
+        self.assertEqual(len(written), 2, "the KTX2 and its fallback, once each")
+        for path in paths:
+            with MeshConvert.open_glb(path) as edit:
+                images = edit.gltf["images"]
+                texture = next(
+                    t
+                    for t in edit.gltf["textures"]
+                    if "uri" in images[t["extensions"]["KHR_texture_basisu"]["source"]]
+                )
+                fallback = images[texture["source"]]
+                self.assertIn("uri", fallback)
+                self.assertNotIn("bufferView", fallback)
+                self.assertEqual(
+                    {u.rsplit("/", 1)[-1] for u in (i.get("uri") for i in images) if u},
+                    set(written),
+                )
+
+    def test_repeating_uvs_stay_out_of_the_atlas(self):
+        try:
+            import cv2  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("cv2 unavailable")
+        path = self._glb(
+            "tiled.glb",
+            [self._png(size=(16, 16), color=(9, 9, 9 * i)) for i in range(1, 3)],
+            uv=(0.0, 4.0),
+        )
+        report = MeshConvert.optimize_glb_delivery([path], atlas_max_edge=32)
+        self.assertEqual(report["files"][0]["atlas"], {})
+        with MeshConvert.open_glb(path) as edit:
+            self.assertEqual(len(edit.gltf["images"]), 2)
+            self.assertNotIn(
+                "KHR_texture_transform", edit.gltf.get("extensionsUsed") or []
+            )
+
+
 class TestGlbReadGuards(unittest.TestCase):
     """A truncated GLB must fail as a ValueError, not a struct.error.
 
@@ -1205,6 +1608,118 @@ class TestGlbEditSession(unittest.TestCase):
         self.assertIsInstance(edit.bin_data, memoryview)
         self.assertEqual(bytes(edit.bin_data), b"GEOMETRY")
 
+    def test_rest_is_a_mapped_view_released_on_close(self):
+        """The BIN is mapped, not read; closing lets the file go again."""
+        path = self._write_glb({"asset": {"version": "2.0"}}, bin_chunk=b"GEOMETRY")
+        with MeshConvert.open_glb(path) as edit:
+            self.assertEqual(bytes(edit.bin_data), b"GEOMETRY")
+            self.assertIsNotNone(edit._map, "rest should be served from an mmap")
+            mapped = edit._map
+        self.assertTrue(mapped.closed)
+        self.assertIsNone(edit._rest)
+        # A later touch maps the file again rather than failing.
+        self.assertEqual(bytes(edit.bin_data), b"GEOMETRY")
+
+    def test_a_full_rewrite_keeps_the_session_readable(self):
+        """The growing-JSON path swaps a new file in under a live map."""
+        geometry = b"GEOMETRY" * 4
+        path = self._write_glb({"asset": {"version": "2.0"}}, bin_chunk=geometry)
+        edit = MeshConvert._read_glb(path)
+        held = edit.bin_data  # a caller's view outliving the rewrite
+        edit.gltf["extras"] = {"note": "x" * 256}
+        MeshConvert._write_glb(edit)
+        self.assertEqual(bytes(held), geometry)
+        self.assertEqual(bytes(edit.bin_data), geometry)
+        reread = MeshConvert._read_glb(path)
+        self.assertEqual(reread.gltf["extras"]["note"], "x" * 256)
+        self.assertEqual(bytes(reread.bin_data), geometry)
+        self.assertEqual(
+            [n for n in os.listdir(self.tmp) if n.endswith(".tmp")], []
+        )
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_accessor_is_a_typed_strided_view(self):
+        """Interleaved positions come back typed, strided and zero-copy."""
+        vertices = [(0.0, 1.0, 2.0), (3.0, 4.0, 5.0), (6.0, 7.0, 8.0)]
+        interleaved = b"".join(struct.pack("<3fI", *v, 0xFFFFFFFF) for v in vertices)
+        indices = struct.pack("<3H", 2, 1, 0) + b"\x00\x00"
+        path = self._write_glb(
+            {
+                "asset": {"version": "2.0"},
+                "buffers": [{"byteLength": len(interleaved) + len(indices)}],
+                "bufferViews": [
+                    {"buffer": 0, "byteLength": len(interleaved), "byteStride": 16},
+                    {
+                        "buffer": 0,
+                        "byteOffset": len(interleaved),
+                        "byteLength": 6,
+                    },
+                ],
+                "accessors": [
+                    {
+                        "bufferView": 0,
+                        "componentType": 5126,
+                        "count": 3,
+                        "type": "VEC3",
+                    },
+                    {
+                        "bufferView": 1,
+                        "componentType": 5123,
+                        "count": 3,
+                        "type": "SCALAR",
+                    },
+                    {"componentType": 5126, "count": 2, "type": "VEC2"},
+                ],
+            },
+            bin_chunk=interleaved + indices,
+        )
+        edit = MeshConvert._read_glb(path)
+        positions = edit.accessor(0)
+        self.assertEqual(positions.shape, (3, 3))
+        self.assertEqual(positions.dtype, np.float32)
+        self.assertEqual(positions.tolist(), [list(v) for v in vertices])
+        self.assertEqual(positions.strides, (16, 4))
+        self.assertFalse(positions.flags.writeable)
+        self.assertEqual(edit.accessor(1).tolist(), [2, 1, 0])
+        self.assertEqual(edit.accessor(2).tolist(), [[0, 0], [0, 0]])
+        self.assertEqual(bytes(edit.buffer_view(1)), indices[:6])
+        self.assertIsNone(edit.buffer_view(7))
+        with self.assertRaises(ValueError):
+            edit.accessor(9)
+
+    def test_alpha_probe_answers_opaque_headers_without_decoding(self):
+        """An RGB PNG or a JPEG has no alpha to scan; only RGBA is decoded."""
+        from PIL import Image
+
+        payloads = []
+        for mode, fmt in (("RGB", "PNG"), ("RGB", "JPEG"), ("RGBA", "PNG")):
+            buf = io.BytesIO()
+            Image.new(mode, (2, 2), (10, 20, 30, 255)[: len(mode)]).save(buf, fmt)
+            data = buf.getvalue()
+            data += b"\x00" * ((4 - len(data) % 4) % 4)
+            payloads.append(data)
+        views, offset = [], 0
+        for data in payloads:
+            views.append({"buffer": 0, "byteOffset": offset, "byteLength": len(data)})
+            offset += len(data)
+        path = self._write_glb(
+            {
+                "asset": {"version": "2.0"},
+                "buffers": [{"byteLength": offset}],
+                "bufferViews": views,
+                "images": [{"bufferView": i} for i in range(3)],
+            },
+            bin_chunk=b"".join(payloads),
+        )
+        edit = MeshConvert._read_glb(path)
+        real_open = Image.open
+        with patch.object(Image, "open", side_effect=real_open) as opened:
+            self.assertIsNone(edit.alpha_extrema(0))
+            self.assertIsNone(edit.alpha_extrema(1))
+            self.assertEqual(opened.call_count, 0)
+            self.assertEqual(edit.alpha_extrema(2), (255, 255))
+            self.assertEqual(opened.call_count, 1)
+
     def test_a_base_color_texture_neutralises_the_converters_tint(self):
         """A texture with no colour beside it must not stay multiplied by a tint.
 
@@ -2246,6 +2761,91 @@ class TestGlbEditSession(unittest.TestCase):
         self.assertEqual(open(path, "rb").read(), before)
 
 
+class TestSplitGlb(unittest.TestCase):
+    """A GLB split into a .gltf plus one content-addressed buffer per view."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="meshconvert_split_")
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    def _glb(self, texture=b"PNG-A", name="s.glb"):
+        geometry = struct.pack("<9f", *range(9))
+        blob = geometry + texture + b"\x00" * ((4 - len(texture) % 4) % 4) + texture
+        gltf = {
+            "asset": {"version": "2.0"},
+            "buffers": [{"byteLength": len(blob)}],
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": len(geometry)},
+                {"buffer": 0, "byteOffset": len(geometry), "byteLength": len(texture)},
+                {
+                    "buffer": 0,
+                    "byteOffset": len(blob) - len(texture),
+                    "byteLength": len(texture),
+                },
+            ],
+            "accessors": [
+                {"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"}
+            ],
+            "images": [
+                {"bufferView": 1, "mimeType": "image/png"},
+                {"bufferView": 2, "mimeType": "image/png"},
+            ],
+        }
+        return _write_glb_file(os.path.join(self.tmp, name), gltf, blob)
+
+    def test_each_view_becomes_a_buffer_named_by_its_digest(self):
+        gltf, parts = MeshConvert.split_glb(self._glb(), uri_prefix="parts/")
+        geometry = struct.pack("<9f", *range(9))
+        digest = hashlib.sha256(geometry).hexdigest()
+        self.assertEqual(bytes(parts[digest]), geometry)
+        view = gltf["bufferViews"][0]
+        self.assertNotIn("byteOffset", view)
+        self.assertEqual(
+            gltf["buffers"][view["buffer"]],
+            {"byteLength": len(geometry), "uri": f"parts/{digest}.bin"},
+        )
+
+    def test_identical_payloads_share_one_part(self):
+        gltf, parts = MeshConvert.split_glb(self._glb())
+        self.assertEqual(len(parts), 2)
+        self.assertEqual(gltf["bufferViews"][1]["buffer"], gltf["bufferViews"][2]["buffer"])
+
+    def test_image_parts_are_keyed_by_the_session_image_digests(self):
+        path = self._glb()
+        with MeshConvert.open_glb(path) as edit:
+            expected = set(edit.image_digests)
+            _, parts = MeshConvert.split_glb(edit)
+        self.assertTrue(expected <= set(parts))
+
+    def test_a_changed_texture_changes_only_its_own_part(self):
+        _, before = MeshConvert.split_glb(self._glb(b"PNG-A", "a.glb"))
+        _, after = MeshConvert.split_glb(self._glb(b"PNG-B", "b.glb"))
+        self.assertEqual(len(set(before) & set(after)), 1)  # the geometry
+
+    def test_the_source_is_not_modified(self):
+        path = self._glb()
+        before = open(path, "rb").read()
+        MeshConvert.split_glb(path)
+        self.assertEqual(open(path, "rb").read(), before)
+
+    def test_parts_outlive_the_source(self):
+        """Parts are owned bytes, so the mapped source is released on return
+        and can be replaced (as ``publish_parts(move=True)`` does) or
+        removed while they are held."""
+        path = self._glb()
+        with MeshConvert.open_glb(path) as edit:
+            _, parts = MeshConvert.split_glb(edit)
+            mapped = edit._map
+            edit.close()
+        if mapped is not None:  # None: the filesystem could not map it
+            self.assertTrue(mapped.closed)
+        self.assertTrue(all(type(p) is bytes for p in parts.values()))
+        os.replace(self._glb(b"PNG-B", "other.glb"), path)
+        os.remove(path)
+        geometry = struct.pack("<9f", *range(9))
+        self.assertEqual(parts[hashlib.sha256(geometry).hexdigest()], geometry)
+
+
 @unittest.skipUnless(
     os.environ.get("PYTHONTK_INTEGRATION_TESTS") == "1",
     "Set PYTHONTK_INTEGRATION_TESTS=1 to run network/install integration tests.",
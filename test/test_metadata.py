@@ -94,5 +94,34 @@ class TestMetadataBareFilenameWindows(unittest.TestCase):
         self.assertEqual(result, {"Title": "value::Title"})
 
 
+class TestMetadataSidecarMode(unittest.TestCase):
+    """``mode="sidecar"`` reads/writes the JSON sidecar with its JSON types."""
+
+    def setUp(self):
+        self._tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self._tmp, "map.png")
+        with open(self.path, "wb") as f:
+            f.write(b"x")
+
+    def tearDown(self):
+        for name in os.listdir(self._tmp):
+            os.remove(os.path.join(self._tmp, name))
+        os.rmdir(self._tmp)
+
+    def test_round_trip_merges_and_removes(self):
+        stamp = {"settings": "abc", "source": [1, 2]}
+        Metadata.set(self.path, mode="sidecar", Stamp=stamp, Note="keep")
+        self.assertEqual(
+            Metadata.get(self.path, "Stamp", "Note", "Missing", mode="sidecar"),
+            {"Stamp": stamp, "Note": "keep", "Missing": None},
+        )
+        Metadata.set(self.path, mode="sidecar", Note=None)
+        self.assertEqual(
+            Metadata.get(self.path, "Stamp", "Note", mode="sidecar"),
+            {"Stamp": stamp, "Note": None},
+        )
+        self.assertTrue(os.path.isfile(Metadata._get_sidecar_path(self.path)))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,11 +5,13 @@
 Covers the contract the live-preview loop depends on: a loopback-only bind
 (the secure-context guarantee WebXR needs), the ``/manifest.json`` version
 signal a polling viewer watches, republish-in-place semantics, and the
-no-store caching posture that keeps a warm browser cache from pinning a stale
-asset.
+caching posture -- a no-store manifest, ETag-validated assets with byte ranges
+and precompressed siblings -- that keeps a warm browser cache from pinning a
+stale asset without re-downloading an unchanged one.
 """
 
 import base64
+import gzip
 import json
 import os
 import re
@@ -63,6 +65,11 @@ class PreviewServerTestCase(unittest.TestCase):
         with urllib.request.urlopen(self.server.url + path, timeout=5) as response:
             return response.status, response.read(), dict(response.headers)
 
+    def _request(self, path, headers):
+        request = urllib.request.Request(self.server.url + path, headers=headers)
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.read(), dict(response.headers)
+
     def _post(self, path, data=b"", origin=None):
         headers = {"Origin": origin} if origin else {}
         request = urllib.request.Request(
@@ -253,13 +260,143 @@ class PreviewServerTestCase(unittest.TestCase):
 
     # -- caching --------------------------------------------------------
 
-    def test_responses_are_not_cacheable(self):
-        """A cached GLB would pin the preview to whatever was pushed first."""
+    def test_the_manifest_is_not_cacheable(self):
+        """A cached manifest would pin the preview to whatever was pushed first."""
         server = self._serve()
         server.publish(self._asset())
-        for path in ("manifest.json", "scene.glb"):
-            headers = self._get(path)[2]
-            self.assertIn("no-store", headers.get("Cache-Control", ""))
+        headers = self._get("manifest.json")[2]
+        self.assertIn("no-store", headers.get("Cache-Control", ""))
+
+    def test_a_published_asset_must_revalidate_against_its_content_etag(self):
+        """Storable, but never reused unchecked -- the ETag is what keeps it honest."""
+        server = self._serve()
+        server.publish(self._asset(data=b"first"))
+        headers = self._get("scene.glb")[2]
+        self.assertEqual(headers.get("Cache-Control"), "no-cache")
+        first = headers["ETag"]
+        self.assertEqual(first.strip('"'), server.manifest()["etag"])
+
+        server.publish(self._asset(data=b"second"))
+        self.assertNotEqual(self._get("scene.glb")[2]["ETag"], first)
+
+    def test_a_matching_etag_answers_not_modified(self):
+        server = self._serve()
+        server.publish(self._asset(data=b"same"))
+        etag = self._get("scene.glb")[2]["ETag"]
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self._request("scene.glb", {"If-None-Match": etag})
+        self.assertEqual(ctx.exception.code, 304)
+        self.assertEqual(ctx.exception.headers["ETag"], etag)
+
+    def test_republishing_identical_bytes_keeps_the_etag(self):
+        """What lets an unchanged push cost a 304 rather than a download."""
+        server = self._serve()
+        server.publish(self._asset("a.glb", b"same"))
+        etag = self._get("scene.glb")[2]["ETag"]
+        server.publish(self._asset("b.glb", b"same"))
+        self.assertEqual(self._get("scene.glb")[2]["ETag"], etag)
+
+    def test_a_byte_range_is_served_partially(self):
+        server = self._serve()
+        server.publish(self._asset(data=b"0123456789"))
+        status, body, headers = self._request("scene.glb", {"Range": "bytes=2-5"})
+        self.assertEqual((status, body), (206, b"2345"))
+        self.assertEqual(headers["Content-Range"], "bytes 2-5/10")
+        self.assertEqual(headers["Accept-Ranges"], "bytes")
+        self.assertEqual(self._request("scene.glb", {"Range": "bytes=-3"})[1], b"789")
+        self.assertEqual(self._request("scene.glb", {"Range": "bytes=7-"})[1], b"789")
+
+    def test_an_unsatisfiable_range_is_416(self):
+        server = self._serve()
+        server.publish(self._asset(data=b"0123456789"))
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self._request("scene.glb", {"Range": "bytes=50-60"})
+        self.assertEqual(ctx.exception.code, 416)
+        self.assertEqual(ctx.exception.headers["Content-Range"], "bytes */10")
+
+    def test_a_range_for_another_revision_gets_the_whole_asset(self):
+        """``If-Range`` naming a stale ETag must not splice two revisions."""
+        server = self._serve()
+        server.publish(self._asset(data=b"0123456789"))
+        status, body, _ = self._request(
+            "scene.glb", {"Range": "bytes=2-5", "If-Range": '"stale"'}
+        )
+        self.assertEqual((status, body), (200, b"0123456789"))
+
+    def test_a_gzip_sibling_is_served_to_a_client_that_accepts_it(self):
+        server = self._serve()
+        data = b"glTF" + b"\x00" * 8192
+        server.publish(self._asset(data=data))
+        status, body, headers = self._request(
+            "scene.glb", {"Accept-Encoding": "gzip"}
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(headers.get("Content-Encoding"), "gzip")
+        self.assertIn("Accept-Encoding", headers.get("Vary", ""))
+        self.assertLess(len(body), len(data))
+        self.assertEqual(gzip.decompress(body), data)
+        # Identity for a client that did not ask -- and for a ranged request,
+        # whose offsets only make sense against the identity bytes.
+        self.assertEqual(self._get("scene.glb")[1], data)
+        ranged = self._request(
+            "scene.glb", {"Accept-Encoding": "gzip", "Range": "bytes=0-3"}
+        )
+        self.assertEqual(ranged[1], b"glTF")
+        self.assertNotIn("Content-Encoding", ranged[2])
+
+    def test_an_incompressible_or_tiny_asset_gets_no_sibling(self):
+        server = self._serve()
+        server.publish(self._asset(data=b"tiny"))
+        server.publish(self._asset("tex.ktx2", b"\x00" * 8192), name="tex.ktx2")
+        server.publish(self._asset("noise.glb", os.urandom(8192)), name="noise.glb")
+        self.assertEqual(sorted(p.name for p in self.root.glob("*.gz")), [])
+
+    def test_precompression_can_be_switched_off(self):
+        server = self._serve(precompress=False)
+        server.publish(self._asset(data=b"\x00" * 8192))
+        headers = self._request("scene.glb", {"Accept-Encoding": "gzip"})[2]
+        self.assertNotIn("Content-Encoding", headers)
+
+    def test_republishing_sweeps_siblings_older_than_the_previous_revision(self):
+        """The previous revision's sibling survives one publish -- a request
+        holding that record must still find it -- and is swept by the next."""
+        server = self._serve()
+        server.publish(self._asset("a.glb", b"\x00" * 8192))
+        first = server.manifest()["etag"][:16]
+        server.publish(self._asset("b.glb", b"\x01" * 8192))
+        second = server.manifest()["etag"][:16]
+
+        def names():
+            return sorted(p.name for p in self.root.glob("scene.glb.*.gz"))
+
+        self.assertEqual(len(names()), 2)
+        self.assertTrue(any(first in name for name in names()))
+        server.publish(self._asset("c.glb", b"\x02" * 8192))
+        third = server.manifest()["etag"][:16]
+        self.assertEqual(len(names()), 2)
+        self.assertFalse(any(first in name for name in names()))
+        self.assertTrue(all(second in n or third in n for n in names()))
+
+    def test_a_request_during_publish_gets_one_revisions_etag_and_bytes(self):
+        """Until the record swaps, a GET must see the old ETag *and* the old
+        bytes: the identity file is renamed in under the same lock."""
+        server = self._serve()
+        server.publish(self._asset("a.glb", b"old-" * 512))
+        old_etag = self._get("scene.glb")[2]["ETag"]
+        seen = []
+        precompress = server._precompress
+
+        def probe(*args, **kwargs):
+            status, body, headers = self._get("scene.glb")
+            seen.append((headers["ETag"], body))
+            return precompress(*args, **kwargs)
+
+        server._precompress = probe
+        server.publish(self._asset("b.glb", b"new-" * 512))
+        self.assertEqual(seen, [(old_etag, b"old-" * 512)])
+        status, body, headers = self._get("scene.glb")
+        self.assertEqual(body, b"new-" * 512)
+        self.assertEqual(headers["ETag"].strip('"'), server.manifest()["etag"])
 
     def test_unknown_path_is_404(self):
         self._serve()
@@ -267,6 +404,77 @@ class PreviewServerTestCase(unittest.TestCase):
             self._get("missing.glb")
         self.assertEqual(ctx.exception.code, 404)
 
+    # -- delta publish --------------------------------------------------
+
+    def _split_glb(self, name, texture):
+        """A GLB whose BIN holds a geometry view and one texture view."""
+        geometry = b"GEOM" * 64
+        blob = geometry + texture
+        gltf = json.dumps(
+            {
+                "asset": {"version": "2.0"},
+                "buffers": [{"byteLength": len(blob)}],
+                "bufferViews": [
+                    {"buffer": 0, "byteLength": len(geometry)},
+                    {"buffer": 0, "byteOffset": len(geometry), "byteLength": len(texture)},
+                ],
+                "images": [{"bufferView": 1, "mimeType": "image/png"}],
+            }
+        ).encode("utf-8")
+        gltf += b" " * ((4 - len(gltf) % 4) % 4)
+        blob += b"\x00" * ((4 - len(blob) % 4) % 4)
+        path = self.assets / name
+        path.write_bytes(
+            struct.pack("<4sII", b"glTF", 2, 28 + len(gltf) + len(blob))
+            + struct.pack("<I4s", len(gltf), b"JSON")
+            + gltf
+            + struct.pack("<I4s", len(blob), b"BIN\x00")
+            + blob
+        )
+        return path
+
+    def test_publish_parts_serves_a_gltf_whose_parts_resolve(self):
+        server = self._serve()
+        result = server.publish_parts(self._split_glb("a.glb", b"TEX1" * 8))
+        self.assertEqual((result["version"], result["asset"]), (1, "scene.gltf"))
+        self.assertEqual(result["parts_written"], 2)
+
+        manifest = json.loads(self._get("manifest.json")[1])
+        self.assertEqual(manifest["asset"], "scene.gltf")
+        gltf = json.loads(self._get("scene.gltf")[1])
+        uris = [buffer["uri"] for buffer in gltf["buffers"]]
+        self.assertEqual(
+            sorted(uris), sorted(f"parts/{digest}.bin" for digest in manifest["parts"])
+        )
+        status, body, headers = self._get(uris[1])
+        self.assertEqual((status, body), (200, b"TEX1" * 8))
+        self.assertIn("immutable", headers["Cache-Control"])
+
+    def test_a_changed_texture_ships_only_its_own_part(self):
+        server = self._serve()
+        server.publish_parts(self._split_glb("a.glb", b"TEX1" * 8))
+        result = server.publish_parts(self._split_glb("b.glb", b"TEX2" * 8))
+        self.assertEqual(result["parts"], 2)
+        self.assertEqual(result["parts_written"], 1)
+        self.assertEqual(result["bytes_written"], 32)
+
+    def test_parts_older_than_the_kept_revisions_are_swept(self):
+        server = self._serve()
+        for index in range(server.PARTS_KEEP_REVISIONS + 2):
+            server.publish_parts(
+                self._split_glb(f"{index}.glb", b"TEX%d" % index * 8), move=True
+            )
+        on_disk = {path.stem for path in (self.root / "parts").glob("*.bin")}
+        # Geometry (shared) + one texture per kept revision.
+        self.assertEqual(len(on_disk), 1 + server.PARTS_KEEP_REVISIONS)
+        self.assertTrue(set(server.manifest()["parts"]) <= on_disk)
+        self.assertEqual(list(self.assets.glob("*.glb")), [])
+
+    def test_a_whole_file_publish_lists_no_parts(self):
+        server = self._serve()
+        server.publish(self._asset())
+        self.assertEqual(server.manifest()["parts"], [])
+
     # -- viewer liveness ------------------------------------------------
     #
     # What drives the "open a tab or not" decision on every push. Getting it
@@ -1247,6 +1455,18 @@ class PreviewDelivererTestCase(unittest.TestCase):
         self.assertIsNotNone(seen["edit"], "an edit pass got no session")
         self.assertIsNone(seen["after"], "a file pass was handed a closed session")
 
+    def test_a_delta_deliverer_publishes_parts(self):
+        result = self._deliver(delta=True)
+        self.assertEqual(result["asset"], "scene.gltf")
+        self.assertEqual(result["delta"]["version"], result["version"])
+
+    def test_a_push_can_turn_delta_off_for_that_delivery(self):
+        """Request-scoped like ``open_browser``: False is a real instruction."""
+        self._deliver(delta=True)
+        result = self._push(delta=False)
+        self.assertEqual(result["asset"], "scene.glb")
+        self.assertIsNone(result["delta"])
+
     def test_deliver_publishes_and_reports_the_url(self):
         result = self._deliver()
         self.assertEqual(result["version"], 1)
@@ -9,10 +9,11 @@ Pure-Python, DCC-free.  Covers:
   ``test_shot_plan.py``; the assertions are the correctness gate and hold
   unchanged in logic);
 - :class:`ShotBlock` — duration and ``classify_objects``;
-- :class:`ShotStore` — CRUD, observer, gap-locking, snap, ``compute_gap``, and
-  ``to_dict`` / ``from_dict`` round-trip;
+- :class:`ShotStore` — CRUD, observer, gap-locking, snap, ``compute_gap``, the
+  maintained id/name/interval/object indexes, debounced flushes, the JSON
+  journal backend, and ``to_dict`` / ``from_dict`` round-trip;
 - the pure detection math — ``cluster_segments_by_gap`` and
-  ``boundaries_from_key_entries``;
+  ``boundaries_from_key_entries``, and their numpy array forms;
 - the ``shot_apply.apply`` skeleton — bounds-only default plus the three-phase
   writer-backed path (park / ordered / land) and the +INF envelope cap.
 """
@@ -21,6 +22,7 @@ import os
 import sys
 import shutil
 import tempfile
+import time
 import unittest
 
 # Make ``import pythontk`` resolvable when run directly (pytest / unittest) from
@@ -582,6 +584,113 @@ class TestShotStoreCrud(_ShotTest):
         self.assertNotIn("a", s.pinned_objects)
 
 
+class TestShotStoreIndex(_ShotTest):
+    """The maintained lookups agree with a scan through every mutation path."""
+
+    def _random_store(self, n=300, seed=7):
+        import random
+
+        rng = random.Random(seed)
+        s = _store([])
+        for i in range(n):
+            start = rng.randrange(0, 2000)
+            s.define_shot(
+                f"S{i % 50}",
+                start,
+                start + rng.randrange(0, 120),
+                objects=[f"o{rng.randrange(40)}" for _ in range(3)],
+            )
+        return s, rng
+
+    def _assert_consistent(self, s):
+        shots = list(s.shots)
+        self.assertEqual(
+            [id(x) for x in s.sorted_shots()],
+            [id(x) for x in sorted(shots, key=lambda x: x.start)],
+        )
+        for shot in shots:
+            first = next(x for x in shots if x.shot_id == shot.shot_id)
+            self.assertIs(s.shot_by_id(shot.shot_id), first)
+            first = next(x for x in shots if x.name == shot.name)
+            self.assertIs(s.shot_by_name(shot.name), first)
+        for obj in {o for x in shots for o in x.objects}:
+            self.assertEqual(
+                [id(x) for x in s.shots_with_object(obj)],
+                [
+                    id(x)
+                    for x in sorted(shots, key=lambda x: x.start)
+                    if obj in x.objects
+                ],
+            )
+
+    def test_queries_match_a_scan(self):
+        s, rng = self._random_store()
+        for _ in range(100):
+            a = rng.randrange(-50, 2100)
+            b = a + rng.randrange(0, 300)
+            by_start = sorted(s.shots, key=lambda x: x.start)
+            self.assertEqual(
+                s.shots_overlapping(a, b),
+                [x for x in by_start if x.start < b and x.end > a],
+            )
+            self.assertEqual(
+                s.shots_within(a, b),
+                [x for x in by_start if a <= x.start and x.end <= b],
+            )
+
+    def test_index_follows_every_mutation(self):
+        s, rng = self._random_store()
+        with s.batch_update():
+            for shot in list(s.shots)[::7]:
+                s.remove_shot(shot.shot_id)
+            for shot in list(s.shots)[::5]:
+                s.update_shot(shot.shot_id, start=rng.randrange(0, 2000), name="R")
+        self._assert_consistent(s)
+        # Direct field writes (how ShotApply commits a plan) re-key too.
+        for shot in list(s.shots)[::3]:
+            shot.start = shot.start + rng.randrange(-100, 100)
+            shot.objects = ["moved"]
+        s.remove_object_from_shots("o1")
+        self._assert_consistent(s)
+        self.assertFalse(any("o1" in x.objects for x in s.shots))
+        s.rescale_to_fps(s.scene_fps * 2)
+        self._assert_consistent(s)
+
+    def test_next_id_and_duplicate_ids(self):
+        s = ShotStore()
+        a = s.define_shot("A", 0, 10)
+        b = s.define_shot("B", 20, 30)
+        s.remove_shot(b.shot_id)
+        # Same as max(shot_id) + 1 over the survivors.
+        self.assertEqual(s.define_shot("C", 40, 50).shot_id, 1)
+        dup = ShotStore.from_dict(
+            {
+                "shots": [
+                    {"shot_id": 3, "name": "X", "start": 0, "end": 1},
+                    {"shot_id": 3, "name": "Y", "start": 5, "end": 6},
+                ]
+            }
+        )
+        self.assertEqual(dup.shot_by_id(3).name, "X")
+        dup.remove_shot(3)
+        self.assertEqual(dup.shot_by_id(3).name, "Y")
+        self.assertEqual([x.name for x in dup.shots], ["Y"])
+        self.assertIs(s.shot_by_id(a.shot_id), a)
+
+    def test_direct_list_edits_and_copies(self):
+        import copy
+
+        s = _store([])
+        a = s.define_shot("A", 0, 10)
+        s.shots.append(ShotBlock(7, "Z", 50, 60))
+        self.assertEqual(s.shot_by_name("Z").shot_id, 7)
+        self.assertEqual(s.define_shot("B", 70, 80).shot_id, 8)
+        clone = copy.deepcopy(a)
+        clone.start = 100  # a copy belongs to no store
+        self.assertEqual(s.sorted_shots()[0], a)
+        self.assertIs(s.sorted_shots()[0], a)
+
+
 class TestShotStoreObserver(_ShotTest):
     def test_listener_receives_typed_events(self):
         s = ShotStore()
@@ -722,6 +831,166 @@ class TestShotStoreSerialisation(_ShotTest):
         self.assertEqual(view["shot_metadata"]["shots"][0]["objects"], ["hero"])
 
 
+class _CountingPersistence:
+    def __init__(self):
+        self.saves = []
+
+    def save(self, data):
+        self.saves.append(data)
+
+    def load(self):
+        return None
+
+
+class TestShotStoreFlush(_ShotTest):
+    """Debounced saves and the JSON journal backend."""
+
+    def test_debounce_coalesces_a_burst_into_one_write(self):
+        backend = _CountingPersistence()
+        ShotStore.set_persistence(backend)
+        s = _store([])
+        s.flush_delay = 0.05
+        for i in range(5):
+            s.define_shot(f"S{i}", i * 10, i * 10 + 5)
+        self.assertEqual(backend.saves, [])
+        self.assertIn(s, shot_model._PENDING_FLUSHES)
+        for _ in range(200):
+            if backend.saves:
+                break
+            time.sleep(0.01)
+        self.assertEqual(len(backend.saves), 1)
+        self.assertEqual(len(backend.saves[0]["shots"]), 5)
+        self.assertFalse(s._dirty)
+        self.assertNotIn(s, shot_model._PENDING_FLUSHES)
+
+    def test_pending_flush_is_written_at_exit(self):
+        backend = _CountingPersistence()
+        ShotStore.set_persistence(backend)
+        s = _store([])
+        s.flush_delay = 60.0
+        s.define_shot("A", 0, 10)
+        s.update_shot(0, end=20)
+        self.assertEqual(backend.saves, [])
+        shot_model._flush_pending_stores()  # what atexit runs
+        self.assertEqual(len(backend.saves), 1)
+        self.assertEqual(backend.saves[0]["shots"][0]["end"], 20)
+        self.assertFalse(s.flush())  # clean, timer cancelled
+
+    def _journal_store(self, n, **kwargs):
+        tmp = tempfile.mkdtemp(prefix="shots_journal_")
+        self.addCleanup(shutil.rmtree, tmp, True)
+        path = os.path.join(tmp, "shots.json")
+        backend = shot_model.JsonJournalPersistence(path, **kwargs)
+        ShotStore.set_persistence(backend)
+        s = ShotStore.active()
+        with s.batch_update():
+            for i in range(n):
+                s.define_shot(f"S{i}", i * 10, i * 10 + 5, objects=[f"obj{i}"])
+        return s, backend
+
+    def _journal_lines(self, backend):
+        if not os.path.exists(backend.journal_path):
+            return []
+        with open(backend.journal_path) as f:
+            return f.readlines()
+
+    def test_journal_appends_single_shot_deltas(self):
+        s, backend = self._journal_store(50)
+        snapshot_size = os.path.getsize(backend.path)
+        s.update_shot(3, name="Renamed")
+        s.define_shot("New", 600, 610)
+        s.remove_shot(7)
+        # Three edits -> three journal lines; the snapshot is untouched.
+        self.assertEqual(os.path.getsize(backend.path), snapshot_size)
+        lines = self._journal_lines(backend)
+        self.assertEqual(len(lines), 3)
+        self.assertIn('"op":"del"', lines[-1])
+
+        ShotStore._active = None
+        reloaded = ShotStore.active()
+        self.assertEqual(reloaded.to_dict(), s.to_dict())
+        self.assertEqual(reloaded.shot_by_id(3).name, "Renamed")
+        self.assertIsNone(reloaded.shot_by_id(7))
+        # A store loaded from the backend keeps journaling.
+        reloaded.update_shot(4, end=9)
+        self.assertEqual(len(self._journal_lines(backend)), 4)
+
+    def test_journal_compacts_and_settings_force_a_snapshot(self):
+        s, backend = self._journal_store(50, compact_after=3)
+        for i in range(4):
+            s.update_shot(i, name=f"N{i}")
+        self.assertEqual(len(self._journal_lines(backend)), 4)
+        s.update_shot(5, name="N5")  # over compact_after -> snapshot
+        self.assertEqual(self._journal_lines(backend), [])
+        s.update_shot(6, name="N6")
+        self.assertEqual(len(self._journal_lines(backend)), 1)
+        s.set_object_hidden("x")  # not a per-shot change
+        self.assertEqual(self._journal_lines(backend), [])
+        self.assertEqual(backend.load(), s.to_dict())
+
+    def test_journal_ignores_a_torn_final_line(self):
+        tmp = tempfile.mkdtemp(prefix="shots_journal_")
+        self.addCleanup(shutil.rmtree, tmp, True)
+        path = os.path.join(tmp, "shots.json")
+        ShotStore.set_persistence(shot_model.JsonJournalPersistence(path))
+        s = ShotStore.active()
+        s.define_shot("A", 0, 10)
+        s.define_shot("B", 20, 30)
+        with open(path + ".journal", "a") as f:
+            f.write('{"op":"put","shot":{"shot_id":9')
+        data = shot_model.JsonJournalPersistence(path).load()
+        self.assertEqual([d["name"] for d in data["shots"]], ["A", "B"])
+
+    def test_append_after_a_torn_line_keeps_the_new_record(self):
+        s, backend = self._journal_store(3)
+        s.update_shot(0, name="First")
+        with open(backend.journal_path, "a") as f:
+            f.write('{"op":"put","shot":{"shot_id":9')
+        ShotStore._active = None
+        ShotStore.set_persistence(shot_model.JsonJournalPersistence(backend.path))
+        reloaded = ShotStore.active()
+        reloaded.update_shot(1, name="Second")
+        data = shot_model.JsonJournalPersistence(backend.path).load()
+        names = {d["shot_id"]: d["name"] for d in data["shots"]}
+        self.assertEqual((names[0], names[1]), ("First", "Second"))
+        self.assertEqual(len(self._journal_lines(backend)), 2)
+
+    def test_journal_left_behind_by_a_snapshot_is_not_replayed(self):
+        s, backend = self._journal_store(3)
+        s.update_shot(0, name="Old")
+        with open(backend.journal_path) as f:
+            stale = f.read()
+        with s.batch_update():
+            s.update_shot(0, name="New")
+            s.set_object_hidden("x")  # full snapshot, journal dropped
+        # A crash between the snapshot write and the journal removal.
+        with open(backend.journal_path, "w") as f:
+            f.write(stale)
+        data = shot_model.JsonJournalPersistence(backend.path).load()
+        self.assertEqual(data, s.to_dict())
+
+    def test_deferred_flush_waits_for_a_batch_in_progress(self):
+        backend = _CountingPersistence()
+        ShotStore.set_persistence(backend)
+        s = _store([])
+        s.flush_delay = 0.01
+        s.define_shot("A", 0, 10)
+        with s.batch_update():
+            s.shots[0].name = "Half"
+            time.sleep(0.1)  # the timer fires meanwhile
+            self.assertEqual(backend.saves, [])
+            s.shots[0].name = "Done"
+            s.mark_dirty()
+        for _ in range(100):
+            if s._flush_timer is None:
+                break
+            time.sleep(0.01)
+        self.assertTrue(backend.saves)
+        self.assertEqual(
+            {d["name"] for save in backend.saves for d in save["shots"]}, {"Done"}
+        )
+
+
 class TestUserPrefs(_ShotTest):
     """Cross-scene prefs persist to the zero-dep JSON file (no Qt) and restore."""
 
@@ -972,6 +1241,74 @@ class TestBoundariesFromKeyEntries(_ShotTest):
         self.assertEqual(ShotDetection.boundaries_from_key_entries([]), [])
 
 
+class TestDetectionArrays(_ShotTest):
+    """The numpy array forms agree with the sequential-scan fallbacks."""
+
+    def setUp(self):
+        super().setUp()
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy not installed")
+
+    def test_cluster_segments_match_the_scan(self):
+        import random
+
+        rng = random.Random(7)
+        for _ in range(30):
+            segments = []
+            for _ in range(rng.randint(1, 60)):
+                start = rng.randint(0, 400)
+                segments.append(
+                    {
+                        "start": start,
+                        "end": start + rng.randint(0, 12),
+                        "obj": f"obj{rng.randint(0, 9)}",
+                    }
+                )
+            self.assertEqual(
+                ShotDetection.cluster_segments_by_gap(segments, 5, 2),
+                ShotDetection._cluster_segments_loop(segments, 5, 2),
+            )
+
+    def test_key_boundaries_match_the_scan(self):
+        import random
+
+        rng = random.Random(11)
+        for mode in ("all", "skip_zero", "zero_as_end"):
+            for _ in range(30):
+                entries = [
+                    (
+                        rng.randint(0, 300),
+                        rng.choice([0, 0.0, 1, 2.5, None]),
+                        f"obj{rng.randint(0, 5)}",
+                    )
+                    for _ in range(rng.randint(1, 50))
+                ]
+                self.assertEqual(
+                    ShotDetection.boundaries_from_key_entries(entries, 4, mode),
+                    ShotDetection._boundaries_loop(entries, 4, mode),
+                    mode,
+                )
+
+    def test_cluster_segment_arrays_csr_output(self):
+        import numpy as np
+
+        start, end, offsets, objects = ShotDetection.cluster_segment_arrays(
+            np.array([40.0, 0.0, 12.0, 100.0]),
+            np.array([50.0, 10.0, 20.0, 100.5]),
+            np.array([2, 0, 1, 0]),
+            gap_threshold=5,
+            min_duration=2,
+        )
+        self.assertEqual(start.tolist(), [0.0, 40.0])
+        self.assertEqual(end.tolist(), [20.0, 50.0])
+        self.assertEqual(objects[offsets[0] : offsets[1]].tolist(), [0, 1])
+        self.assertEqual(objects[offsets[1] : offsets[2]].tolist(), [2])
+        empty = ShotDetection.cluster_segment_arrays([], [], [])
+        self.assertEqual((empty[0].size, empty[2].tolist()), (0, [0]))
+
+
 class TestDetectionConstants(_ShotTest):
     def test_standard_transform_attrs(self):
         self.assertIn("translateX", STANDARD_TRANSFORM_ATTRS)
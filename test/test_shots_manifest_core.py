@@ -25,6 +25,9 @@ from pythontk.core_utils.engines.shots.manifest.manifest_model import (
     StepStatus,
     ObjectStatus,
 )
+from pythontk.core_utils.engines.shots.manifest import (
+    manifest_model as manifest_model_mod,
+)
 from pythontk.core_utils.engines.shots.manifest import mapping as mapping_mod
 from pythontk.core_utils.engines.shots.manifest import behaviors as beh
 from pythontk.core_utils.engines.shots.manifest import range_resolver as rr
@@ -85,6 +88,48 @@ class TestManifestParse(unittest.TestCase):
         self.assertEqual(steps[0]._pass_through.get("priority"), "high")
         self.assertEqual(steps[1]._pass_through.get("priority"), "low")
 
+    def test_cp1252_byte_past_the_first_rows_restarts_the_parse(self):
+        rows = "".join(f"A{i:02d}.),Step {i},obj{i},,\n" for i in range(1, 60))
+        text = "SECTION A: CAF\u00c9\nStep,Step Contents,Asset Names,Voice Support\n"
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        body = text + rows + "A60.),Caf\u00e9,obj60,,\n"
+        os.write(fd, b"\xef\xbb\xbf" + body.encode("cp1252"))
+        os.close(fd)
+        try:
+            steps = ManifestModel.parse_csv(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(len(steps), 60)
+        self.assertEqual(steps[0].section_title, "CAF\u00c9")
+        self.assertEqual(steps[-1].description, "Caf\u00e9")
+
+    def test_retried_parse_warns_once(self):
+        """A duplicate step seen before the undecodable byte is reported by
+        the attempt that succeeds, not once per encoding tried."""
+        rows = "".join(f"A{i:03d}.),Step {i},obj{i},,\n" for i in range(1, 600))
+        body = (
+            "SECTION A: RIG\nStep,Step Contents,Asset Names,Voice Support\n"
+            "A001.),Dup,dup,,\n" + rows + "A600.),Caf\u00e9,obj600,,\n"
+        )
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        os.write(fd, body.encode("cp1252"))
+        os.close(fd)
+        try:
+            with self.assertLogs(manifest_model_mod.log, "WARNING") as logs:
+                steps = ManifestModel.parse_csv(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(len(steps), 600)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Duplicate step_id 'A001'", logs.output[0])
+
+    def test_rows_stream_from_the_file(self):
+        rows = ManifestModel._iter_csv_rows(self.path)
+        self.assertNotIsInstance(rows, list)
+        self.assertEqual(next(rows), ["SECTION A: AILERON RIGGING"])
+        self.assertEqual(next(rows)[0], "Step")
+        rows.close()
+
     def test_missing_header_yields_zero_steps(self):
         path = _write_csv("just,some,data\nwith,no,header\n")
         try:
@@ -420,6 +465,57 @@ class TestManifestEngine(unittest.TestCase):
         self.assertEqual(actions["A01"], "patched")
         self.assertIn("new_geo", self.store.shot_by_name("A01").objects)
 
+    def test_incremental_resync_plans_only_edited_steps(self):
+        steps = self._steps(["A01", "A02", "A03"])
+        self.mani.update(steps, initial_shot_length=100)
+        actions = self.mani.update(steps, initial_shot_length=100, incremental=True)
+        self.assertEqual(set(actions.values()), {"skipped"})
+        self.assertEqual(self.mani.last_sync_report["planned"], [])
+        self.assertEqual(len(self.mani.last_sync_report["reused"]), 3)
+
+        steps = self._steps(["A01", "A02", "A03", "A04"])
+        steps[1].objects.append(BuilderObject("extra_geo"))
+        actions = self.mani.update(steps[1:], initial_shot_length=100, incremental=True)
+        report = self.mani.last_sync_report
+        self.assertEqual(report["planned"], ["A02", "A04"])
+        self.assertEqual(report["reused"], ["A03"])
+        self.assertEqual(report["removed"], ["A01"])
+        self.assertEqual(actions["A02"], "patched")
+        self.assertEqual(actions["A04"], "created")
+        self.assertIn("extra_geo", self.store.shot_by_name("A02").objects)
+
+    def test_incremental_replans_rippled_and_store_edited_shots(self):
+        measured = {"v": 100.0}
+
+        class AudioMani(ShotManifest):
+            def _measure_audio(self, obj):
+                return measured["v"]
+
+        store = ShotStore()
+        mani = AudioMani(store)
+        steps = [
+            BuilderStep(
+                "V01",
+                "V",
+                "t",
+                "",
+                [BuilderObject("vo", kind="audio", source_path="x")],
+            )
+        ] + self._steps(["A02", "A03"])
+        mani.update(steps, initial_shot_length=50)
+        a03_end = store.shot_by_name("A03").end
+        # An edited V01 row grows its shot; the ripple replans everything after.
+        measured["v"] = 300.0
+        steps[0].description = "edited"
+        mani.update(steps, initial_shot_length=50, incremental=True)
+        self.assertEqual(mani.last_sync_report["planned"], ["V01", "A02", "A03"])
+        self.assertAlmostEqual(store.shot_by_name("A03").end, a03_end + 200.0)
+        # A shot locked in the store since the last sync is replanned too.
+        store.update_shot(store.shot_by_name("A02").shot_id, locked=True)
+        actions = mani.update(steps, initial_shot_length=50, incremental=True)
+        self.assertEqual(mani.last_sync_report["planned"], ["A02"])
+        self.assertEqual(actions["A02"], "locked")
+
     def test_existing_audio_shot_regrows_when_clip_lengthens(self):
         measured = {"v": 100.0}
 
@@ -530,5 +626,72 @@ class TestManifestEngine(unittest.TestCase):
         self.assertGreaterEqual(dur, 0.0)
 
 
+@unittest.skipUnless(
+    os.environ.get("PYTHONTK_BENCHMARKS") == "1",
+    "set PYTHONTK_BENCHMARKS=1 to run the manifest-sync benchmark",
+)
+class TestManifestSyncBenchmark(unittest.TestCase):
+    """Manifest sync at long-form scale: 5k shots, 50k tracked objects.
+
+    Prints the timings; the bounds are loose ceilings that only a quadratic
+    regression in the store lookups would cross.
+    """
+
+    SHOTS = 5000
+    OBJECTS_PER_SHOT = 10
+
+    def setUp(self):
+        self._prefs = tempfile.mkdtemp(prefix="mani_bench_")
+        ShotStore._prefs_dir_override = self._prefs
+
+    def tearDown(self):
+        ShotStore._prefs_dir_override = None
+
+    def test_sync_at_scale(self):
+        import time
+
+        steps = [
+            BuilderStep(
+                f"S{i:05d}",
+                "A",
+                "t",
+                "",
+                [
+                    BuilderObject(f"S{i:05d}_geo{j}")
+                    for j in range(self.OBJECTS_PER_SHOT)
+                ],
+            )
+            for i in range(self.SHOTS)
+        ]
+        store = ShotStore()
+        mani = ShotManifest(store)
+        timings = {}
+        started = time.perf_counter()
+        mani.update(steps, initial_shot_length=100)
+        timings["create"] = time.perf_counter() - started
+        started = time.perf_counter()
+        mani.update(steps, initial_shot_length=100)
+        timings["resync"] = time.perf_counter() - started
+        steps[self.SHOTS // 2].objects.append(BuilderObject("edited_geo"))
+        started = time.perf_counter()
+        mani.update(steps, initial_shot_length=100, incremental=True)
+        timings["incremental_1_edit"] = time.perf_counter() - started
+        self.assertEqual(
+            mani.last_sync_report["planned"], [steps[self.SHOTS // 2].step_id]
+        )
+        started = time.perf_counter()
+        mani.update(steps[: -self.SHOTS // 10], initial_shot_length=100)
+        timings["remove_10pct"] = time.perf_counter() - started
+        print(
+            "manifest sync, %d shots: %s"
+            % (
+                self.SHOTS,
+                ", ".join(f"{k} {v:.2f}s" for k, v in timings.items()),
+            )
+        )
+        self.assertEqual(len(store.shots), self.SHOTS - self.SHOTS // 10)
+        self.assertLess(max(timings.values()), 10.0)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -6,6 +6,8 @@ scene exporters (their ``TaskManager`` subclasses it). The dispatch / ordering /
 revert / check contract is pinned here once, DCC-free; the DCC suites cover the
 concrete ``task_*`` / ``check_*`` methods each supplies.
 """
+
+import threading
 import unittest
 from unittest.mock import MagicMock
 
@@ -315,5 +317,123 @@ class CheckCountTest(unittest.TestCase):
         self.assertEqual(r._last_task_count, 1)
 
 
+class _Graph(TaskFactory):
+    """Checks declared via task_spec: three independent thread-safe checks
+    that only pass if they overlap, one dependent check, one main-thread one."""
+
+    MAX_WORKERS = 4
+
+    def __init__(self):
+        super().__init__(MagicMock())
+        self.barrier = threading.Barrier(3, timeout=5)
+        self.threads = {}
+        self.order = []
+        self.lock = threading.Lock()
+
+    def _note(self, name):
+        with self.lock:
+            self.order.append(name)
+            self.threads[name] = threading.current_thread()
+
+    def _overlap(self, name):
+        self._note(name)
+        try:
+            self.barrier.wait()
+        except threading.BrokenBarrierError:
+            return (False, [f"{name} ran alone"])
+        return True
+
+    @TaskFactory.task_spec(thread_safe=True)
+    def check_a(self, value):
+        return self._overlap("check_a")
+
+    @TaskFactory.task_spec(thread_safe=True)
+    def check_b(self, value):
+        return self._overlap("check_b")
+
+    @TaskFactory.task_spec(thread_safe=True)
+    def check_c(self, value):
+        return self._overlap("check_c")
+
+    @TaskFactory.task_spec(thread_safe=True, depends_on=["check_a", "check_b"])
+    def check_d(self, value):
+        self._note("check_d")
+        return True
+
+    def check_main(self, value):
+        self._note("check_main")
+        return True
+
+    @TaskFactory.task_spec(thread_safe=True)
+    def set_x(self, value):
+        self._note("set_x")
+        return "X"
+
+    def revert_x(self, original):
+        self._note("revert_x")
+
+    @TaskFactory.task_spec(thread_safe=True, depends_on=["set_x"])
+    def task_fail(self, value):
+        raise RuntimeError("worker boom")
+
+    @TaskFactory.task_spec(depends_on=["check_loop_b"])
+    def check_loop_a(self, value):
+        return True
+
+    @TaskFactory.task_spec(depends_on=["check_loop_a"])
+    def check_loop_b(self, value):
+        return True
+
+
+class TaskGraphTest(unittest.TestCase):
+    CHECKS = {n: True for n in ("check_a", "check_b", "check_c", "check_d")}
+
+    def test_thread_safe_checks_run_concurrently(self):
+        g = _Graph()
+        self.assertTrue(g.run_tasks(dict(self.CHECKS, check_main=True)))
+        caller = threading.current_thread()
+        self.assertIs(g.threads["check_main"], caller)
+        self.assertTrue(all(g.threads[n] is not caller for n in self.CHECKS))
+
+    def test_dependencies_finish_first(self):
+        g = _Graph()
+        g.run_tasks(self.CHECKS)
+        d = g.order.index("check_d")
+        self.assertLess(g.order.index("check_a"), d)
+        self.assertLess(g.order.index("check_b"), d)
+
+    def test_results_keep_the_given_order(self):
+        g = _Graph()
+        with g._manage_context(dict(self.CHECKS, check_main=True)) as results:
+            pass
+        self.assertEqual(list(results), [*self.CHECKS, "check_main"])
+
+    def test_single_worker_stays_on_the_caller(self):
+        g = _Graph()
+        g.MAX_WORKERS = 1
+        g.barrier = threading.Barrier(1)
+        self.assertTrue(g.run_tasks(dict(self.CHECKS, check_main=True)))
+        caller = threading.current_thread()
+        self.assertTrue(all(t is caller for t in g.threads.values()))
+
+    def test_worker_failure_raises_and_reverts(self):
+        g = _Graph()
+        with self.assertRaises(RuntimeError):
+            g.run_tasks({"set_x": True, "task_fail": True})
+        self.assertEqual(g.order, ["set_x", "revert_x"])
+
+    def test_dependency_cycle_is_rejected_before_running(self):
+        with self.assertRaises(ValueError):
+            _Graph().run_tasks({"check_loop_a": True, "check_loop_b": True})
+
+    def test_summary_reports_per_task_timings(self):
+        g = _Graph()
+        g.run_tasks(self.CHECKS)
+        self.assertEqual(set(g._last_task_timings), set(self.CHECKS))
+        title, items = g.logger.log_group.call_args[0]
+        self.assertIn("4 task(s)", title)
+        self.assertEqual(len(items), 4)
+
+
 if __name__ == "__main__":
     unittest.main()
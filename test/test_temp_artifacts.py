@@ -16,6 +16,8 @@ Covers (CachedArtifact):
 - hit / miss, scratch-then-atomic-promote, sidecar promotion + stale-sidecar drop
 - failure keeps the partial and leaves the cache slot untouched
 - use_cache=False bypass
+- max_bytes LRU eviction (hit re-stamps, sidecars, locked slots spared)
+- per-slot lock: concurrent misses produce once, stale/timed-out locks, stats
 
 Run with:
     python -m pytest test_temp_artifacts.py -v
@@ -352,6 +354,111 @@ class TestCachedArtifactGet(CachedArtifactBase):
             CachedArtifact("", extension=".out")
 
 
+class TestCachedArtifactBudget(CachedArtifactBase):
+    """max_bytes — LRU eviction ordered by the access stamp a hit re-writes."""
+
+    def stamp(self, path, seconds_ago):
+        t = time.time() - seconds_ago
+        os.utime(path, (t, t))
+
+    def test_oldest_slot_is_evicted_to_fit_the_budget(self):
+        cache = CachedArtifact("ca", extension=".out", dir=self.dir, max_bytes=20)
+        a = cache.get("k1", self.produce).path  # 8 bytes each
+        self.stamp(a, 30)
+        b = cache.get("k2", self.produce).path
+        self.stamp(b, 20)
+        c = cache.get("k3", self.produce).path
+        self.assertFalse(os.path.exists(a))
+        self.assertTrue(os.path.isfile(b) and os.path.isfile(c))
+        self.assertEqual(cache.stats["evicted"], 1)
+        self.assertEqual(cache.stats["bytes_evicted"], 8)
+
+    def test_a_hit_refreshes_the_slot_so_the_unused_one_goes(self):
+        cache = CachedArtifact("ca", extension=".out", dir=self.dir, max_bytes=20)
+        a = cache.get("k1", self.produce).path
+        self.stamp(a, 30)
+        b = cache.get("k2", self.produce).path
+        self.stamp(b, 20)
+        self.assertTrue(cache.get("k1", self.produce).hit)  # k1 is now the newest
+        cache.get("k3", self.produce)
+        self.assertTrue(os.path.isfile(a))
+        self.assertFalse(os.path.exists(b))
+
+    def test_sidecars_count_and_go_with_their_slot(self):
+        cache = CachedArtifact("ca", extension=".out", dir=self.dir, max_bytes=12)
+        a = cache.get("k1", self.produce_with_sidecar, sidecars=(".manifest.json",)).path
+        self.stamp(a, 30)
+        cache.get("k2", self.produce)
+        self.assertFalse(os.path.exists(a + ".manifest.json"))
+        self.assertEqual(cache.stats["bytes_evicted"], 10)
+
+    def test_locked_slot_is_never_evicted(self):
+        cache = CachedArtifact("ca", extension=".out", dir=self.dir)
+        a = cache.get("k1", self.produce).path
+        self.touch(a + ".lock")
+        b = cache.get("k2", self.produce).path
+        self.assertEqual(cache.evict(max_bytes=0), [b])
+        self.assertTrue(os.path.isfile(a))
+
+
+class TestCachedArtifactConcurrency(CachedArtifactBase):
+    """The per-slot lock — concurrent misses of one key produce it once."""
+
+    def test_concurrent_misses_wait_for_the_first_producer(self):
+        def slow(out):
+            time.sleep(0.3)
+            self.produce(out)
+
+        caches = [CachedArtifact("ca", extension=".out", dir=self.dir) for _ in range(3)]
+        results = []
+        threads = [
+            threading.Thread(target=lambda c=c: results.append(c.get("k1", slow)))
+            for c in caches
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(self.produced), 1)
+        self.assertEqual(sorted(r.hit for r in results), [False, True, True])
+        self.assertEqual(sum(c.stats["waited"] for c in caches), 2)
+        self.assertFalse(os.path.exists(results[0].path + ".lock"))
+
+    def test_a_dead_holders_stale_lock_is_broken(self):
+        cache = CachedArtifact("ca", extension=".out", dir=self.dir, lock_stale_seconds=5)
+        slot = os.path.join(self.dir, "ca_cache_k1.out")
+        self.touch(slot + ".lock")
+        old = time.time() - 60
+        os.utime(slot + ".lock", (old, old))
+        got = cache.get("k1", self.produce)
+        self.assertFalse(got.hit)
+        self.assertEqual(got.path, slot)
+
+    def test_lock_timeout_produces_anyway(self):
+        cache = CachedArtifact("ca", extension=".out", dir=self.dir, lock_timeout=0.3)
+        slot = os.path.join(self.dir, "ca_cache_k1.out")
+        self.touch(slot + ".lock")  # a live holder that never finishes
+        got = cache.get("k1", self.produce)
+        self.assertFalse(got.hit)
+        self.assertTrue(os.path.isfile(slot))
+
+    def test_failed_production_releases_the_lock(self):
+        def boom(out):
+            raise RuntimeError("conversion died")
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get("k1", boom)
+        self.assertFalse(os.path.exists(os.path.join(self.dir, "ca_cache_k1.out.lock")))
+
+    def test_stats_count_hits_misses_and_bytes_saved(self):
+        self.cache.get("k1", self.produce)
+        self.cache.get("k1", self.produce)
+        self.cache.get("k1", self.produce)
+        self.assertEqual(self.cache.stats["misses"], 1)
+        self.assertEqual(self.cache.stats["hits"], 2)
+        self.assertEqual(self.cache.stats["bytes_saved"], 16)
+
+
 class TestRootExport(unittest.TestCase):
     def test_registered_on_package_root(self):
         import pythontk as ptk
@@ -14,6 +14,7 @@ import shutil
 import tempfile
 import unittest
 import zipfile
+from unittest import mock
 
 from pythontk.file_utils.usd import USD_EXTENSIONS, UsdFile, UsdMeshWriter, UsdzPackager
 
@@ -72,6 +73,17 @@ class UsdTestCase(unittest.TestCase):
     def path(self, name):
         return os.path.join(self.tmp, name)
 
+    def _write_obj(self):
+        obj = self.path("quad.obj")
+        with open(obj, "w") as fh:
+            fh.write(OBJ_TEXT)
+        with open(self.path("quad.mtl"), "w") as fh:
+            fh.write(MTL_TEXT)
+        for tex in ("quad_diffuse.png", "quad_rough.png"):
+            with open(self.path(tex), "wb") as fh:
+                fh.write(PNG_BYTES)
+        return obj
+
 
 class TestSniffing(UsdTestCase):
     def test_usda_by_magic(self):
@@ -330,17 +342,6 @@ class TestUsdMeshWriter(UsdTestCase):
 
 
 class TestObjConverters(UsdTestCase):
-    def _write_obj(self):
-        obj = self.path("quad.obj")
-        with open(obj, "w") as fh:
-            fh.write(OBJ_TEXT)
-        with open(self.path("quad.mtl"), "w") as fh:
-            fh.write(MTL_TEXT)
-        for tex in ("quad_diffuse.png", "quad_rough.png"):
-            with open(self.path(tex), "wb") as fh:
-                fh.write(PNG_BYTES)
-        return obj
-
     def test_from_obj_parses_geometry_and_mtl(self):
         data = UsdMeshWriter.from_obj(self._write_obj())
         self.assertEqual(len(data["points"]), 4)
@@ -422,6 +423,149 @@ class TestObjConverters(UsdTestCase):
         self.assertTrue(stage.GetDefaultPrim().IsValid())
 
 
+class TestObjArrays(UsdTestCase):
+    """``from_obj(arrays=True)`` — the chunked numpy reader must agree with
+    the line-by-line one exactly, and ``write`` must format either the same."""
+
+    # Vertex colors, an indented record, CRLF, a quad n-gon, negative indices
+    # and records interleaved after faces.
+    OBJ = (
+        "mtllib none.mtl\n"
+        "v 0 0 0 1 0 0\nv 1 0 0 0 1 0\r\nv 1 1 0\n  v 0 1 0\n"
+        "vt 0 0\nvt 1 0\nvt 1 1\nvt 0 1\n"
+        "vn 0 0 1\n"
+        "f 1/1/1 2/2/1 3/3/1 4/4/1\n"
+        "v 2 0 0\nvt 0.5 0.5\n"
+        "f -3/-3/-1 -1/-1/-1 -4/-2/1\n"
+    )
+
+    def _obj(self, text):
+        obj = self.path("m.obj")
+        with open(obj, "w", newline="") as fh:
+            fh.write(text)
+        return obj
+
+    def assertSameMesh(self, lists, arrays):
+        for key in ("points", "face_vertex_counts", "face_vertex_indices", "uvs", "normals"):
+            if lists[key] is None:
+                self.assertIsNone(arrays[key], key)
+                continue
+            expected = [list(x) if isinstance(x, tuple) else x for x in lists[key]]
+            self.assertEqual(arrays[key].tolist(), expected, key)
+
+    def test_arrays_match_line_parser(self):
+        obj = self._obj(self.OBJ)
+        arrays = UsdMeshWriter.from_obj(obj, arrays=True)
+        self.assertEqual(arrays["points"].shape, (5, 3))
+        self.assertEqual(arrays["face_vertex_indices"].tolist(), [0, 1, 2, 3, 2, 4, 1])
+        self.assertSameMesh(UsdMeshWriter.from_obj(obj), arrays)
+
+    def test_chunk_boundaries_do_not_change_the_result(self):
+        obj = self._obj(self.OBJ * 3)
+        whole = UsdMeshWriter.from_obj(obj, arrays=True)
+        for size in (7, 64):
+            with mock.patch.object(UsdMeshWriter, "_OBJ_CHUNK_BYTES", size):
+                chunked = UsdMeshWriter.from_obj(obj, arrays=True)
+            for key in ("points", "face_vertex_indices", "uvs", "normals"):
+                self.assertEqual(chunked[key].tolist(), whole[key].tolist(), (size, key))
+
+    def test_mixed_corner_layouts_drop_uvs(self):
+        obj = self._obj("v 0 0 0\nv 1 0 0\nv 0 1 0\nvt 0 0\nf 1/1 2/1 3\nf 1 2 3\n")
+        arrays = UsdMeshWriter.from_obj(obj, arrays=True)
+        self.assertIsNone(arrays["uvs"])
+        self.assertSameMesh(UsdMeshWriter.from_obj(obj), arrays)
+
+    def test_malformed_number_raises(self):
+        obj = self._obj("v 0 0 zero\nv 1 0 0\nv 0 1 0\nf 1 2 3\n")
+        with self.assertRaises(ValueError):
+            UsdMeshWriter.from_obj(obj, arrays=True)
+
+    def test_write_formats_arrays_like_lists(self):
+        obj = self._obj(self.OBJ)
+        lists = UsdMeshWriter.from_obj(obj)
+        arrays = UsdMeshWriter.from_obj(obj, arrays=True)
+        a = UsdMeshWriter.write(self.path("lists"), **lists)
+        b = UsdMeshWriter.write(self.path("arrays"), **arrays)
+        with open(a, encoding="utf-8") as fa, open(b, encoding="utf-8") as fb:
+            self.assertEqual(fa.read(), fb.read())
+
+
+class TestUsdcCrate(UsdTestCase):
+    def _grid(self, n=24):
+        points = [
+            (x, y, (x * y) % 7 * 0.25) for y in range(n + 1) for x in range(n + 1)
+        ]
+        indices = []
+        for y in range(n):
+            for x in range(n):
+                i = y * (n + 1) + x
+                indices += [i, i + 1, i + n + 2, i + n + 1]
+        uvs = [(p[0] / n, p[1] / n) for p in points]
+        return dict(
+            points=points,
+            face_vertex_counts=[4] * (n * n),
+            face_vertex_indices=indices,
+            uvs=uvs,
+            textures={"diffuse": "d.png", "normal": "n.png"},
+        )
+
+    def test_usdc_extension_writes_crate(self):
+        out = UsdMeshWriter.write(self.path("grid.usdc"), **self._grid())
+        self.assertTrue(out.endswith("grid.usdc"))
+        self.assertEqual(UsdFile.sniff(out), "usdc")
+        with open(out, "rb") as fh:
+            self.assertEqual(fh.read(11), b"PXR-USDC\x00\x08\x00")
+        text = UsdMeshWriter.write(self.path("grid.usda"), **self._grid())
+        self.assertLess(os.path.getsize(out), os.path.getsize(text) // 2)
+
+    def test_usd_extension_is_crate(self):
+        out = UsdMeshWriter.write(self.path("quad.usd"), **QUAD)
+        self.assertTrue(out.endswith("quad.usd"))
+        self.assertEqual(UsdFile.sniff(out), "usdc")
+
+    def test_pure_python_encoding_matches_numpy(self):
+        import pythontk.file_utils.usd as usd_mod
+
+        if usd_mod.np is None:
+            self.skipTest("numpy not installed")
+        a = UsdMeshWriter.write(self.path("np.usdc"), **self._grid())
+        with mock.patch.object(usd_mod, "np", None):
+            b = UsdMeshWriter.write(self.path("py.usdc"), **self._grid())
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            self.assertEqual(fa.read(), fb.read())
+
+    def test_obj_to_usdz_packages_crate_layer(self):
+        out = UsdMeshWriter.obj_to_usdz(self._write_obj(), layer_format="usdc")
+        report = UsdzPackager.verify(out)
+        self.assertTrue(report["valid"], report["issues"])
+        names = UsdFile.list_package(out)
+        self.assertEqual(names[0], "quad.usdc")
+        self.assertIn("textures/quad_diffuse.png", names)
+        with zipfile.ZipFile(out) as zf:
+            self.assertTrue(zf.read("quad.usdc").startswith(b"PXR-USDC"))
+        with self.assertRaises(ValueError):
+            UsdMeshWriter.obj_to_usdz(self._write_obj(), layer_format="usdz")
+
+    @unittest.skipUnless(HAS_PXR, "usd-core not installed")
+    def test_pxr_reads_crate_same_as_text(self):
+        from pxr import Sdf
+
+        kw = dict(self._grid(6), meters_per_unit=0.01, up_axis="Z")
+        kw["textures"]["roughness"] = "r.png"
+        kw["normals"] = [(0, 0, 1)] * len(kw["points"])
+        crate = UsdMeshWriter.write(self.path("eq.usdc"), double_sided=True, **kw)
+        text = UsdMeshWriter.write(self.path("eq.usda"), double_sided=True, **kw)
+        self.assertEqual(
+            Sdf.Layer.FindOrOpen(crate).ExportToString(),
+            Sdf.Layer.FindOrOpen(text).ExportToString(),
+        )
+        stage = Usd.Stage.Open(crate)
+        mesh = UsdGeom.Mesh(stage.GetPrimAtPath("/Model/Geom"))
+        self.assertEqual(
+            list(mesh.GetFaceVertexIndicesAttr().Get()), kw["face_vertex_indices"]
+        )
+
+
 class TestRootRegistration(unittest.TestCase):
     def test_symbols_resolve_from_package_root(self):
         import pythontk as ptk
@@ -6,10 +6,15 @@ import json
 import os
 import shutil
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
-from pythontk.core_utils.user_config import UserConfig, CONFIG_ROOT_ENV_VAR
+from pythontk.core_utils.user_config import (
+    UserConfig,
+    CACHE_ROOT_ENV_VAR,
+    CONFIG_ROOT_ENV_VAR,
+)
 
 
 class UserConfigRootTest(unittest.TestCase):
@@ -35,6 +40,51 @@ class UserConfigRootTest(unittest.TestCase):
         self.assertTrue(UserConfig.user_config_root().is_absolute())
 
 
+class UserCacheRootTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self._prev = os.environ.get(CACHE_ROOT_ENV_VAR)
+
+    def tearDown(self):
+        if self._prev is None:
+            os.environ.pop(CACHE_ROOT_ENV_VAR, None)
+        else:
+            os.environ[CACHE_ROOT_ENV_VAR] = self._prev
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_override_env_used_as_given(self):
+        os.environ[CACHE_ROOT_ENV_VAR] = self.tmp
+        self.assertEqual(UserConfig.user_cache_root(), Path(self.tmp))
+
+    def test_default_root_is_separate_from_config_root(self):
+        os.environ.pop(CACHE_ROOT_ENV_VAR, None)
+        root = UserConfig.user_cache_root()
+        self.assertTrue(root.is_absolute())
+        self.assertIn("uitk", root.parts)
+        self.assertNotEqual(root, UserConfig.user_config_root())
+
+    def test_prune_cache_dir_drops_expired_then_oldest(self):
+        now = time.time()
+        for i, age_days in enumerate((0, 1, 2, 3, 200)):
+            p = Path(self.tmp) / f"{i}.json"
+            p.write_text("{}")
+            mtime = now - age_days * 86400
+            os.utime(p, (mtime, mtime))
+        (Path(self.tmp) / "keep.txt").write_text("")
+
+        removed = UserConfig.prune_cache_dir(self.tmp, max_files=3, max_age_days=90)
+        self.assertEqual(removed, 2)
+        self.assertEqual(
+            sorted(p.name for p in Path(self.tmp).iterdir()),
+            ["0.json", "1.json", "2.json", "keep.txt"],
+        )
+        self.assertEqual(UserConfig.prune_cache_dir(self.tmp), 0)
+
+    def test_prune_cache_dir_missing_directory(self):
+        missing = Path(self.tmp) / "absent"
+        self.assertEqual(UserConfig.prune_cache_dir(missing, max_files=0), 0)
+
+
 class UserConfigResolveTest(unittest.TestCase):
     DEFAULT = {
         "graphics_root": "${TEMP}/photogrammetry",
@@ -481,10 +481,17 @@ class ImageCuratorTest(BaseTestCase):
 
     @classmethod
     def setUpClass(cls):
+        from unittest import mock
+
         cls.temp_dir = tempfile.mkdtemp()
+        # Keep scan caches out of the real per-user cache root.
+        cls.cache_root = os.path.join(cls.temp_dir, "_user_cache")
+        cls._env = mock.patch.dict(os.environ, {"UITK_CACHE_ROOT": cls.cache_root})
+        cls._env.start()
 
     @classmethod
     def tearDownClass(cls):
+        cls._env.stop()
         if os.path.exists(cls.temp_dir):
             shutil.rmtree(cls.temp_dir)
 
@@ -756,16 +763,167 @@ class ImageCuratorTest(BaseTestCase):
         )
         self.assertEqual(n_curated, kept_t10)
 
+    def test_indexed_cluster_matches_linear_anchor_scan(self) -> None:
+        """The anchor index reproduces greedy-by-anchor clustering exactly,
+        on both the multi-index (narrow) and full-scan (wide) paths."""
+        import random
+        from pythontk.img_utils.image_curator import ImageCurator
+
+        def linear(scanned, threshold):
+            clusters, anchors = [], []
+            for record in scanned:
+                for ci, a in enumerate(anchors):
+                    if bin(record[2] ^ a).count("1") <= threshold:
+                        clusters[ci].append(record)
+                        break
+                else:
+                    clusters.append([record])
+                    anchors.append(record[2])
+            return clusters
+
+        rng = random.Random(7)
+        seeds = [rng.getrandbits(64) for _ in range(40)]
+        scanned = []
+        for i in range(1500):
+            h = rng.choice(seeds)
+            for _ in range(rng.randint(0, 12)):
+                h ^= 1 << rng.randrange(64)
+            scanned.append(("src", f"f{i}.jpg", h, float(i)))
+        for threshold in (1, 3, 5, 7, 10, 15):
+            with self.subTest(threshold=threshold):
+                self.assertEqual(
+                    ImageCurator._cluster(scanned, threshold),
+                    linear(scanned, threshold),
+                )
+
+    def test_popcount_fallback_table_is_built_once(self) -> None:
+        """Without ``numpy.bitwise_count`` (numpy < 2) the per-byte table is
+        built on first use and shared, not rebuilt per lookup."""
+        from unittest import mock
+        import numpy as np
+        from pythontk.img_utils.image_curator import _AnchorIndex
+
+        class _Numpy1:
+            def __getattr__(self, name):
+                if name == "bitwise_count":
+                    raise AttributeError(name)
+                return getattr(np, name)
+
+        idx = _AnchorIndex(threshold=3)
+        idx._np = _Numpy1()
+        values = np.array([0, 1, 0xFF, 2**64 - 1], dtype=np.uint64)
+        with mock.patch.object(_AnchorIndex, "_POPCOUNT_TABLE", None):
+            self.assertEqual(idx._popcount(values).tolist(), [0, 1, 8, 64])
+            table = _AnchorIndex._POPCOUNT_TABLE
+            self.assertIsNotNone(table)
+            idx._popcount(values)
+            self.assertIs(_AnchorIndex._POPCOUNT_TABLE, table)
+
+    @unittest.skipUnless(
+        __import__("importlib").util.find_spec("cv2"),
+        "cv2 not available",
+    )
+    def test_rescan_reads_hashes_from_cache(self) -> None:
+        """A second scan of unchanged frames decodes nothing; a touched frame
+        is decoded again; ``hash_cache=False`` bypasses the cache."""
+        from unittest import mock
+        import numpy as np
+        import cv2 as _cv2
+        import pythontk.img_utils.image_curator as ic
+
+        src = os.path.join(self.temp_dir, "cache_src")
+        os.makedirs(src, exist_ok=True)
+        for i in range(4):
+            arr = np.full((64, 64, 3), 40 + i * 50, dtype=np.uint8)
+            arr[::3, :] = 255
+            _cv2.imwrite(os.path.join(src, f"c_{i}.png"), arr)
+
+        cur = ic.ImageCurator()
+        first = cur._scan_images([src])
+        cache = cur._hash_cache_path(src)
+        self.assertTrue(cache.startswith(self.cache_root))
+        self.assertTrue(os.path.isfile(cache))
+        self.assertFalse(
+            os.path.exists(os.path.join(src, ic.ImageCurator.HASH_CACHE_NAME))
+        )
+        with mock.patch.object(ic.cv2, "imread", wraps=_cv2.imread) as imread:
+            self.assertEqual(cur._scan_images([src]), first)
+            self.assertEqual(imread.call_count, 0)
+            touched = os.path.join(src, "c_0.png")
+            st = os.stat(touched)
+            os.utime(touched, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            self.assertEqual(cur._scan_images([src]), first)
+            self.assertEqual(imread.call_count, 1)
+            cur._scan_images([src], hash_cache=False)
+            self.assertEqual(imread.call_count, 5)
+
+    @unittest.skipUnless(
+        __import__("importlib").util.find_spec("cv2"),
+        "cv2 not available",
+    )
+    def test_hash_cache_in_source_is_opt_in(self) -> None:
+        """``HASH_CACHE_IN_SOURCE`` writes the cache beside the frames."""
+        import numpy as np
+        import cv2 as _cv2
+        import pythontk.img_utils.image_curator as ic
+
+        src = os.path.join(self.temp_dir, "cache_in_src")
+        os.makedirs(src, exist_ok=True)
+        _cv2.imwrite(os.path.join(src, "c.png"), np.zeros((16, 16, 3), np.uint8))
+        cur = ic.ImageCurator()
+        cur.HASH_CACHE_IN_SOURCE = True
+        cur._scan_images([src])
+        self.assertTrue(
+            os.path.isfile(os.path.join(src, ic.ImageCurator.HASH_CACHE_NAME))
+        )
+
+    def test_hash_cache_dir_is_pruned_on_write(self) -> None:
+        """The per-user cache gains a file per source directory; writes drop
+        expired files, then the oldest beyond ``HASH_CACHE_MAX_FILES``."""
+        from unittest import mock
+        import pythontk.img_utils.image_curator as ic
+
+        root = os.path.join(self.temp_dir, "_pruned_cache")
+        with mock.patch.dict(os.environ, {"UITK_CACHE_ROOT": root}):
+            cur = ic.ImageCurator()
+            cur.HASH_CACHE_MAX_FILES = 2
+            paths = []
+            for i in range(3):
+                src = os.path.join(self.temp_dir, f"prune_src_{i}")
+                cur._save_hash_cache(src, {})
+                path = cur._hash_cache_path(src)
+                os.utime(path, (1000 + i, 1000 + i))  # file age order = i
+                paths.append(path)
+            # The next write prunes: everything is older than 90 days.
+            cur._save_hash_cache(self.temp_dir, {})
+            kept = cur._hash_cache_path(self.temp_dir)
+            self.assertEqual(
+                sorted(os.listdir(os.path.dirname(kept))),
+                [os.path.basename(kept)],
+            )
+
+            cur.HASH_CACHE_MAX_AGE_DAYS = None
+            for path in paths:
+                cur._save_hash_cache(os.path.dirname(path), {})
+            self.assertEqual(len(os.listdir(os.path.dirname(kept))), 2)
+
 
 class ExposureEqualizerTest(BaseTestCase):
     """ExposureEqualizer strength blend + reference strategy."""
 
     @classmethod
     def setUpClass(cls):
+        from unittest import mock
+
         cls.temp_dir = tempfile.mkdtemp()
+        # Keep stats caches out of the real per-user cache root.
+        cls.cache_root = os.path.join(cls.temp_dir, "_user_cache")
+        cls._env = mock.patch.dict(os.environ, {"UITK_CACHE_ROOT": cls.cache_root})
+        cls._env.start()
 
     @classmethod
     def tearDownClass(cls):
+        cls._env.stop()
         if os.path.exists(cls.temp_dir):
             shutil.rmtree(cls.temp_dir)
 
@@ -911,6 +1069,147 @@ class ExposureEqualizerTest(BaseTestCase):
         b_l = eq._sample_stats(bright, 4)[0][0]
         self.assertAlmostEqual(g_mean[0], (d_l + b_l) / 2.0, delta=1.0)
 
+    @unittest.skipUnless(
+        __import__("importlib").util.find_spec("cv2"),
+        "cv2 not available",
+    )
+    def test_sampled_stats_persist_across_runs(self) -> None:
+        """A fresh equalizer re-reads sampled stats from the per-file cache
+        instead of decoding; ``use_stats_cache=False`` decodes again."""
+        from unittest import mock
+        import cv2 as _cv2
+        import pythontk.img_utils.exposure_equalizer as ee
+
+        d = self._make_dir("cache_stats", 90)
+        first = ee.ExposureEqualizer()._sample_stats(d, 4)
+        cache = ee.ExposureEqualizer()._stats_cache_path(d)
+        self.assertTrue(cache.startswith(self.cache_root))
+        self.assertTrue(os.path.isfile(cache))
+        self.assertFalse(
+            os.path.exists(os.path.join(d, ee.ExposureEqualizer.STATS_CACHE_NAME))
+        )
+        with mock.patch.object(ee.cv2, "imread", wraps=_cv2.imread) as imread:
+            again = ee.ExposureEqualizer()._sample_stats(d, 4)
+            self.assertEqual(imread.call_count, 0)
+            eq = ee.ExposureEqualizer()
+            eq.use_stats_cache = False
+            eq._sample_stats(d, 4)
+            self.assertEqual(imread.call_count, 4)
+        for a, b in zip(first, again):
+            self.assertTrue((abs(a - b) < 1e-3).all())
+
+    @unittest.skipUnless(
+        __import__("importlib").util.find_spec("cv2"),
+        "cv2 not available",
+    )
+    def test_stats_cache_in_source_is_opt_in(self) -> None:
+        """``STATS_CACHE_IN_SOURCE`` writes the cache beside the frames."""
+        from pythontk import ExposureEqualizer
+
+        d = self._make_dir("cache_in_src", 90)
+        eq = ExposureEqualizer()
+        eq.STATS_CACHE_IN_SOURCE = True
+        eq._sample_stats(d, 4)
+        self.assertTrue(
+            os.path.isfile(os.path.join(d, ExposureEqualizer.STATS_CACHE_NAME))
+        )
+
+    def test_stats_cache_dir_is_pruned_on_write(self) -> None:
+        """Each write drops stats caches older than
+        ``STATS_CACHE_MAX_AGE_DAYS``, then the oldest beyond
+        ``STATS_CACHE_MAX_FILES``; the file just written survives."""
+        from unittest import mock
+        import pythontk.img_utils.exposure_equalizer as ee
+
+        root = os.path.join(self.temp_dir, "_pruned_cache")
+        with mock.patch.dict(os.environ, {"UITK_CACHE_ROOT": root}):
+            eq = ee.ExposureEqualizer()
+            eq.STATS_CACHE_MAX_FILES = 2
+            eq.STATS_CACHE_MAX_AGE_DAYS = None
+            paths = []
+            for i in range(3):
+                capture = os.path.join(self.temp_dir, f"prune_cap_{i}")
+                eq._save_stats_cache(capture, {})
+                paths.append(eq._stats_cache_path(capture))
+                os.utime(paths[-1], (1000 + i, 1000 + i))
+            self.assertFalse(os.path.exists(paths[0]))
+            self.assertTrue(os.path.isfile(paths[2]))
+
+            eq.STATS_CACHE_MAX_AGE_DAYS = 90
+            eq._save_stats_cache(self.temp_dir, {})
+            self.assertEqual(
+                os.listdir(os.path.dirname(paths[0])),
+                [os.path.basename(eq._stats_cache_path(self.temp_dir))],
+            )
+
+    @unittest.skipUnless(
+        __import__("importlib").util.find_spec("cv2"),
+        "cv2 not available",
+    )
+    def test_process_pool_matches_serial_pass(self) -> None:
+        """workers>0 writes the same pixels as the in-process pass and fills
+        the throughput report and progress callback."""
+        import cv2 as _cv2
+        from pythontk import ExposureEqualizer
+
+        dark = self._make_dir("pool_dark", 50)
+        bright = self._make_dir("pool_bright", 190)
+        calls = []
+        serial = ExposureEqualizer().equalize_directories(
+            [dark, bright], os.path.join(self.temp_dir, "pool_serial"),
+            reference_dir=bright, suffix="_s",
+        )
+        eq = ExposureEqualizer()
+        pooled = eq.equalize_directories(
+            [dark, bright], os.path.join(self.temp_dir, "pool_procs"),
+            reference_dir=bright, suffix="_p", workers=2,
+            progress=lambda *a: calls.append(a),
+        )
+        for s_dir, p_dir in zip(serial, pooled):
+            for name in sorted(os.listdir(s_dir)):
+                a = _cv2.imread(os.path.join(s_dir, name))
+                b = _cv2.imread(os.path.join(p_dir, name))
+                self.assertTrue((a == b).all(), name)
+        self.assertEqual([r["images"] for r in eq.last_report], [4, 4])
+        self.assertEqual(calls[-1], ("equalize", 4, 4, bright))
+
+    @unittest.skipUnless(
+        __import__("importlib").util.find_spec("cv2"),
+        "cv2 not available",
+    )
+    def test_in_place_equalize_drops_stats_cache(self) -> None:
+        """Output resolving onto the source dir rewrites every frame, so the
+        stats cache the run just wrote is stale and must not be left behind."""
+        from pythontk import ExposureEqualizer
+
+        d = self._make_dir("in_place_src", 80)
+        eq = ExposureEqualizer()
+        cache = eq._stats_cache_path(d)
+        eq._sample_stats(d, 4)
+        self.assertTrue(os.path.isfile(cache))
+        dirs = eq.equalize_directories(
+            [d], self.temp_dir, reference_dir=d, suffix="", sample_count=4
+        )
+        self.assertEqual(os.path.normcase(dirs[0]), os.path.normcase(d))
+        self.assertEqual(len([f for f in os.listdir(d) if f.endswith(".jpg")]), 4)
+        self.assertFalse(os.path.exists(cache))
+
+    def test_exif_loss_counts_each_frame_once(self) -> None:
+        """A frame that hit both EXIF-loss causes counts once, and each
+        cause logs only its first occurrence. Needs no cv2."""
+        from pythontk import ExposureEqualizer
+
+        eq = ExposureEqualizer()
+        eq.last_fallback_count = 0
+        with self.assertLogs(
+            "pythontk.img_utils.exposure_equalizer", level="ERROR"
+        ) as logs:
+            eq._record_exif_losses("a.jpg", [("exif_read", "x"), ("cv2_fallback", "y")])
+            eq._record_exif_losses("b.jpg", [("cv2_fallback", "y")])
+            eq._record_exif_losses("c.jpg", [])
+        self.assertEqual(eq.last_fallback_count, 2)
+        self.assertEqual(len(logs.records), 2)
+
     def test_invalid_reference_strategy_raises(self) -> None:
         """A shared library should fail fast on a bad enum, not silently
         fall back. Validation precedes any cv2 use, so this needs no cv2."""
@@ -925,7 +1224,17 @@ class PrepRegressionTest(BaseTestCase):
     (see CHANGELOG 2026-07-10)."""
 
     def setUp(self):
+        from unittest import mock
+
         self.temp_dir = tempfile.mkdtemp()
+        # Curator scan caches and equalizer stats caches go to the per-user
+        # cache root; keep them out of the real one.
+        env = mock.patch.dict(
+            os.environ,
+            {"UITK_CACHE_ROOT": os.path.join(self.temp_dir, "_user_cache")},
+        )
+        env.start()
+        self.addCleanup(env.stop)
 
     def tearDown(self):
         shutil.rmtree(self.temp_dir, ignore_errors=True)